@@ -1 +1,2 @@
 from .version import __version__
+from .utils.profiling import profile
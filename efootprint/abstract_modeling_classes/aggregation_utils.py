@@ -1,4 +1,5 @@
 """Shared utilities for timeseries aggregation strategies."""
+from functools import lru_cache
 
 from pint import Unit, Quantity
 
@@ -32,6 +33,11 @@ def get_plot_aggregation_strategy(unit: Unit) -> str:
     return "sum"
 
 
+@lru_cache(maxsize=None)
+def _is_named_dimensionless(unit: Unit) -> bool:
+    return str(unit) == "dimensionless"
+
+
 def validate_timeseries_unit(value: Quantity, label: str = None):
     """
     Validate that a timeseries value does not use dimensionless unit.
@@ -46,10 +52,10 @@ def validate_timeseries_unit(value: Quantity, label: str = None):
     # Allow dimensionless for unlabeled intermediate calculations (e.g., during division operations);
     # those will be converted to occurrence/concurrent before being assigned. Most call sites pass
     # label=None or "", so label is checked first to skip the unit comparison entirely.
-    # `str(value.units) == "dimensionless"` is faster than `value.units == u.dimensionless` and
-    # preserves the original semantics: occurrence and concurrent are dimensionally dimensionless
-    # but distinct units, and remain allowed.
-    if label and str(value.units) == "dimensionless":
+    # Comparing the unit name (memoized per unit) rather than `value.units == u.dimensionless` preserves the
+    # original semantics: occurrence and concurrent are dimensionally dimensionless but distinct units, and remain
+    # allowed.
+    if label and _is_named_dimensionless(value.units):
         raise ValueError(
             f"Timeseries cannot use dimensionless unit. "
             f"Use 'occurrence' (for discrete occurrences, aggregated by sum) or "
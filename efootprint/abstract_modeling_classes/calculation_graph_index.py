@@ -0,0 +1,118 @@
+from collections import deque
+from typing import Iterable, List
+
+# Incremented on every calculation graph mutation (link, unlink, container change), so that transitive closures
+# cached on ExplainableObjects can be checked for freshness in O(1).
+_calculation_graph_version = 0
+
+
+def calculation_graph_version() -> int:
+    return _calculation_graph_version
+
+
+def invalidate_calculation_graph_closures():
+    global _calculation_graph_version
+    _calculation_graph_version += 1
+
+
+def ancestors_of(values: Iterable) -> List:
+    """Union of the ancestors of all values, in the order of a depth-first pre-order walk from each value in turn.
+
+    Each node is walked at most once thanks to a shared visited set, so the cost is linear in the size of the
+    explored graph, whereas concatenating and deduplicating the ancestors of each value is quadratic. The order is
+    the one the concatenation followed by a first-occurrence deduplication would give."""
+    all_ancestors = []
+    visited_ids = set()
+
+    for value in values:
+        # Stack of iterators over direct ancestors, to walk in pre-order without recursion
+        stack = [iter(value.direct_ancestors_with_id)]
+        while stack:
+            ancestor = next(stack[-1], None)
+            if ancestor is None:
+                stack.pop()
+                continue
+            ancestor_id = ancestor.id
+            if ancestor_id not in visited_ids:
+                visited_ids.add(ancestor_id)
+                all_ancestors.append(ancestor)
+                stack.append(iter(ancestor.direct_ancestors_with_id))
+
+    return all_ancestors
+
+
+def descendants_of(value) -> List:
+    all_descendants = []
+    visited_ids = set()
+    stack = [value]
+
+    while stack:
+        parent = stack.pop()
+        for child in parent.direct_children_with_id:
+            child_id = child.id
+            if child_id not in visited_ids:
+                visited_ids.add(child_id)
+                all_descendants.append(child)
+                stack.append(child)
+
+    return all_descendants
+
+
+class CalculationGraphIndex:
+    """Integer-indexed adjacency of a set of calculation graph nodes, deduplicated by id.
+
+    Traversals on the index compare and mark plain integers instead of hashing string ids at every edge."""
+    def __init__(self, nodes: Iterable):
+        self.nodes = []
+        self.index_by_id = {}
+        for node in nodes:
+            node_id = node.id
+            if node_id not in self.index_by_id:
+                self.index_by_id[node_id] = len(self.nodes)
+                self.nodes.append(node)
+        self.children = [self._indexes_of(node.direct_children_with_id) for node in self.nodes]
+        self.ancestors = [self._indexes_of(node.direct_ancestors_with_id) for node in self.nodes]
+
+    def _indexes_of(self, linked_nodes: Iterable) -> List[int]:
+        index_by_id = self.index_by_id
+        return [index_by_id[node.id] for node in linked_nodes if node.id in index_by_id]
+
+    @classmethod
+    def from_descendants_of(cls, value, descendants: List = None) -> "CalculationGraphIndex":
+        """Index of value (at index 0) and all its descendants."""
+        if descendants is None:
+            descendants = descendants_of(value)
+        return cls([value] + list(descendants))
+
+    def updates_chain(self, root_index: int = 0) -> List:
+        """Nodes reachable from the root, ordered so that every node comes after all its indexed ancestors (the
+        root excepted): parents are walked level by level and a child joins the chain as soon as all its ancestors
+        that also need to be updated are in it, parents with children left behind being retried at next level."""
+        children = self.children
+        in_chain = bytearray(len(self.nodes))
+        ancestors_to_wait_for = [
+            [ancestor_index for ancestor_index in node_ancestors if ancestor_index != root_index]
+            for node_ancestors in self.ancestors]
+        chain = []
+        parents_with_children_to_add = deque([root_index])
+
+        while parents_with_children_to_add:
+            next_parents = deque()
+            while parents_with_children_to_add:
+                parent_index = parents_with_children_to_add.popleft()
+                keep_for_next_iteration = False
+                for child_index in children[parent_index]:
+                    if in_chain[child_index]:
+                        continue
+                    if all(in_chain[ancestor_index] for ancestor_index in ancestors_to_wait_for[child_index]):
+                        chain.append(child_index)
+                        in_chain[child_index] = 1
+                        if children[child_index]:
+                            next_parents.append(child_index)
+                    else:
+                        keep_for_next_iteration = True
+                if keep_for_next_iteration:
+                    next_parents.append(parent_index)
+            parents_with_children_to_add = next_parents
+
+        return [self.nodes[node_index] for node_index in chain]
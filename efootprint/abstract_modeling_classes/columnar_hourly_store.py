@@ -0,0 +1,238 @@
+import weakref
+from datetime import datetime, timedelta
+from typing import Iterable, List
+
+import numpy as np
+import pytz
+from pint import Quantity
+
+from efootprint.logger import logger
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=pytz.utc)
+_STORES_BY_MATRIX_ID = weakref.WeakValueDictionary()
+
+
+def utc_hour_index(start_date: datetime) -> int:
+    """Number of whole hours between the Unix epoch and ``start_date``. Naive dates are read as UTC, the same
+    reading ExplainableHourlyQuantities.convert_to_utc applies to them."""
+    if start_date.tzinfo is None:
+        start_date = start_date.replace(tzinfo=pytz.utc)
+    return int((start_date - _UNIX_EPOCH).total_seconds() // 3600)
+
+
+def store_owning_array(array: np.ndarray):
+    base = getattr(array, "base", None)
+    if base is None:
+        return None
+    store = _STORES_BY_MATRIX_ID.get(id(base))
+    if store is not None and store.matrix is base:
+        return store
+    return None
+
+
+def align_store_backed_arrays(
+        first_array: np.ndarray, first_start_date: datetime, second_array: np.ndarray, second_start_date: datetime):
+    """Offset-lookup alignment of two arrays that are row views of the same ColumnarHourlyStore: rows span the
+    whole shared axis and are zero outside their series window, so the aligned arrays are plain views of both
+    rows over the union window — no padded copies. Returns None when the arrays don't qualify, including when one
+    of them is a sub-slice of its row, since the row holds values outside the slice."""
+    store = store_owning_array(first_array)
+    if store is None or store_owning_array(second_array) is not store:
+        return None
+    first_row, first_col = store.locate(first_array)
+    second_row, second_col = store.locate(second_array)
+    if not (store.covers_row_window(first_array, first_row, first_col)
+            and store.covers_row_window(second_array, second_row, second_col)):
+        return None
+    if second_col - first_col != utc_hour_index(second_start_date) - utc_hour_index(first_start_date):
+        return None
+    window_start = min(first_col, second_col)
+    window_end = max(first_col + len(first_array), second_col + len(second_array))
+    common_start = min(first_start_date, second_start_date)
+
+    return store.matrix[first_row, window_start:window_end], store.matrix[second_row, window_start:window_end], \
+        common_start
+
+
+class ColumnarHourlyStore:
+    """Contiguous float32 matrix holding the hourly series of a system on one shared UTC hour axis.
+
+    Each registered ExplainableHourlyQuantities gets its own row (keyed by its id in the calculation graph) and
+    is re-pointed to a view of that row, so the system's hourly data lives in a single allocation. Rows are
+    zero outside their series window, which makes temporal alignment between two registered series an offset
+    lookup and turns whole-system reductions into one masked ``sum(axis=0)``.
+
+    Rows are never overwritten once handed out: values derived from a registered series (e.g. ``series + 0``)
+    may still share its view, so re-registering a key retires the old row and allocates a fresh one. Retired
+    rows are reclaimed by rebuilding the matrix, which leaves stray views pointing at the previous allocation.
+    """
+
+    def __init__(self, start_date: datetime, nb_hours: int, nb_rows: int = 64):
+        self.start_hour = utc_hour_index(start_date)
+        self.matrix = np.zeros((nb_rows, nb_hours), dtype=np.float32)
+        self.row_by_key = {}
+        self.owners = [None] * nb_rows
+        self.views = [None] * nb_rows
+        self.units = [None] * nb_rows
+        self.windows = [None] * nb_rows
+        self.nb_used_rows = 0
+        self.nb_retired_rows = 0
+        _STORES_BY_MATRIX_ID[id(self.matrix)] = self
+
+    @classmethod
+    def from_hourly_quantities(cls, hourly_quantities: Iterable["ExplainableHourlyQuantities"]):
+        hourly_quantities = list(hourly_quantities)
+        if not hourly_quantities:
+            raise ValueError("Can't size a ColumnarHourlyStore axis without any hourly quantities.")
+        start_hour = min(utc_hour_index(hourly.start_date) for hourly in hourly_quantities)
+        end_hour = max(utc_hour_index(hourly.start_date) + len(hourly.magnitude) for hourly in hourly_quantities)
+        store = cls(_UNIX_EPOCH + timedelta(hours=start_hour), end_hour - start_hour,
+                    nb_rows=max(64, 2 * len(hourly_quantities)))
+        store.ingest_all(hourly_quantities)
+
+        return store
+
+    @property
+    def nb_hours(self) -> int:
+        return self.matrix.shape[1]
+
+    @property
+    def nb_live_rows(self) -> int:
+        return self.nb_used_rows - self.nb_retired_rows
+
+    def locate(self, array: np.ndarray):
+        byte_offset = array.__array_interface__["data"][0] - self.matrix.__array_interface__["data"][0]
+        return divmod(byte_offset // self.matrix.itemsize, self.nb_hours)
+
+    def covers_row_window(self, array: np.ndarray, row: int, col: int) -> bool:
+        """Whether ``array``, located at (row, col), spans exactly the series window registered for its row."""
+        return (array.strides[0] == self.matrix.itemsize
+                and self.windows[row] == (col, col + len(array)))
+
+    def _is_viewing(self, hourly, row: int) -> bool:
+        value = hourly._value
+        return isinstance(value, Quantity) and value.magnitude is self.views[row]
+
+    def is_registered(self, hourly) -> bool:
+        row = self.row_by_key.get(hourly.id)
+        return row is not None and self.owners[row] is hourly and self._is_viewing(hourly, row)
+
+    def ingest(self, hourly: "ExplainableHourlyQuantities") -> int:
+        """Register ``hourly`` in its own row and re-point it to a view of that row. Returns the row index."""
+        if hourly.modeling_obj_container is None:
+            raise ValueError(
+                f"Only hourly quantities linked to a ModelingObject can be stored columnarly, {hourly.label} isn't.")
+        key = hourly.id
+        previous_row = self.row_by_key.get(key)
+        if previous_row is not None:
+            if self.owners[previous_row] is hourly and self._is_viewing(hourly, previous_row):
+                return previous_row
+            self._retire(previous_row)
+        magnitude = hourly.magnitude
+        col_start = utc_hour_index(hourly.start_date) - self.start_hour
+        col_end = col_start + len(magnitude)
+        if col_start < 0 or col_end > self.nb_hours:
+            self._rebuild(self.matrix.shape[0], min(0, col_start), max(self.nb_hours, col_end))
+            col_start = utc_hour_index(hourly.start_date) - self.start_hour
+            col_end = col_start + len(magnitude)
+        if self.nb_used_rows == self.matrix.shape[0]:
+            nb_rows = self.matrix.shape[0] if self.nb_retired_rows >= self.nb_used_rows // 2 \
+                else 2 * self.matrix.shape[0]
+            self._rebuild(nb_rows, 0, self.nb_hours)
+        row = self.nb_used_rows
+        self.nb_used_rows += 1
+        self.matrix[row, col_start:col_end] = magnitude
+        self._assign(row, key, hourly, hourly.unit, (col_start, col_end))
+
+        return row
+
+    def ingest_all(self, values: Iterable) -> None:
+        from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+        for value in values:
+            if isinstance(value, dict):
+                self.ingest_all(value.values())
+            elif isinstance(value, ExplainableHourlyQuantities) and value.modeling_obj_container is not None:
+                self.ingest(value)
+
+    def _assign(self, row: int, key: str, hourly, unit, window) -> None:
+        col_start, col_end = window
+        view = self.matrix[row, col_start:col_end]
+        self.row_by_key[key] = row
+        self.owners[row] = hourly
+        self.views[row] = view
+        self.units[row] = unit
+        self.windows[row] = window
+        hourly.value = Quantity(view, unit)
+
+    def _retire(self, row: int) -> None:
+        self.owners[row] = None
+        self.views[row] = None
+        self.nb_retired_rows += 1
+
+    def _rebuild(self, nb_rows: int, first_col: int, end_col: int) -> None:
+        """Copy live rows into a fresh matrix covering columns [first_col, end_col) of the current axis and
+        re-point their owners. Views handed out before stay valid on the previous allocation."""
+        live_rows = [row for row in range(self.nb_used_rows)
+                     if self.owners[row] is not None and self.owners[row].modeling_obj_container is not None
+                     and self._is_viewing(self.owners[row], row)]
+        nb_rows = max(nb_rows, 2 * len(live_rows), 64)
+        new_matrix = np.zeros((nb_rows, end_col - first_col), dtype=np.float32)
+        previous_owners = [(self.owners[row], self.units[row], self.windows[row]) for row in live_rows]
+        for new_row, row in enumerate(live_rows):
+            col_start, col_end = self.windows[row]
+            new_matrix[new_row, col_start - first_col:col_end - first_col] = self.matrix[row, col_start:col_end]
+        logger.debug(f"Rebuilding columnar hourly store: {len(live_rows)} live rows out of {self.nb_used_rows}, "
+                     f"{new_matrix.shape[1]} hours.")
+        self.start_hour += first_col
+        self.matrix = new_matrix
+        _STORES_BY_MATRIX_ID[id(self.matrix)] = self
+        self.row_by_key = {}
+        self.owners = [None] * nb_rows
+        self.views = [None] * nb_rows
+        self.units = [None] * nb_rows
+        self.windows = [None] * nb_rows
+        self.nb_used_rows = len(live_rows)
+        self.nb_retired_rows = 0
+        for new_row, (owner, unit, (col_start, col_end)) in enumerate(previous_owners):
+            self._assign(new_row, owner.id, owner, unit, (col_start - first_col, col_end - first_col))
+
+    def compact(self) -> None:
+        self._rebuild(self.matrix.shape[0], 0, self.nb_hours)
+
+    def sum(self, hourly_quantities: List["ExplainableHourlyQuantities"]):
+        """Sum of the given hourly quantities as ``(Quantity array, start_date)`` in the first one's unit, computed
+        as one masked reduction over their rows. Unregistered quantities are ingested first."""
+        rows = [self.ingest(hourly) for hourly in hourly_quantities]
+        unit = self.units[rows[0]]
+        window_start = min(self.windows[row][0] for row in rows)
+        window_end = max(self.windows[row][1] for row in rows)
+        result = np.zeros(window_end - window_start, dtype=np.float64)
+        for row_unit in dict.fromkeys(self.units[row] for row in rows):
+            mask = np.zeros(self.matrix.shape[0], dtype=bool)
+            mask[[row for row in rows if self.units[row] == row_unit]] = True
+            unit_sum = self.matrix[:, window_start:window_end].sum(axis=0, dtype=np.float64, where=mask[:, None])
+            if row_unit != unit:
+                unit_sum *= Quantity(1, row_unit).to(unit).magnitude
+            result += unit_sum
+        start_date = min(hourly.start_date for hourly in hourly_quantities)
+
+        return Quantity(result.astype(np.float32), unit), start_date
+
+    def explainable_sum(self, values: list, label: str = None):
+        """Explainable equivalent of ``sum(values, start=EmptyExplainableObject())``: same calculation-graph ancestry
+        (every value becomes a direct ancestor), but the hourly arithmetic is a single store reduction instead of
+        one aligned, padded addition per value."""
+        from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
+        from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+        from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+        hourly_values = [value for value in values if isinstance(value, ExplainableHourlyQuantities)]
+        if len(values) < 2 or not hourly_values:
+            return sum(values, start=EmptyExplainableObject()).set_label(label)
+        left_parent = values[0]
+        for value in values[1:-1]:
+            left_parent = ExplainableObject(None, left_parent=left_parent, right_parent=value, operator="+")
+        summed_quantity, start_date = self.sum(hourly_values)
+
+        return ExplainableHourlyQuantities(
+            summed_quantity, start_date=start_date, label=label, left_parent=left_parent, right_parent=values[-1],
+            operator="+")
@@ -0,0 +1,349 @@
+"""Compact representations of structurally simple hourly series, that ExplainableHourlyQuantities can hold instead of
+a full hourly float32 array:
+
+- ConstantHourlyQuantities: one value repeated over every hour (fixed numbers of instances…),
+- PeriodicHourlyQuantities: a pattern repeated with a period (weekly recurring quantities expanded over a timespan),
+  with the first and last hours optionally overridden (circular timezone shifts only differ from the pattern there),
+- RunLengthHourlyQuantities: values held over runs of hours (daily-step series generated from form inputs).
+
+Operations between two compact series of a same hourly grid are computed symbolically when their kinds allow it
+(constant × weekly stays weekly), and return None otherwise so that callers fall back to dense arrays."""
+from abc import ABC, abstractmethod
+from math import lcm
+
+import numpy as np
+from pint import Quantity, Unit
+
+from efootprint.abstract_modeling_classes.resolved_units import conversion_factor
+
+WEEK_IN_HOURS = 7 * 24
+# Periodic series whose combined period would exceed this are combined densely
+MAX_COMPACT_PERIOD = WEEK_IN_HOURS
+# Run-length series whose combination would have runs shorter than this on average are combined densely
+MIN_AVERAGE_RUN_LENGTH = 4
+
+
+def as_float32_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float32)
+
+
+class CompactHourlyQuantities(ABC):
+    __slots__ = ("length", "units", "_dense_array")
+
+    def __init__(self, length: int, units: Unit):
+        self.length = int(length)
+        self.units = units
+        self._dense_array = None
+
+    def __len__(self):
+        return self.length
+
+    @abstractmethod
+    def values_at(self, hours: np.ndarray) -> np.ndarray:
+        """float32 values at the given hour indexes."""
+
+    @abstractmethod
+    def apply(self, func, units: Unit = None) -> "CompactHourlyQuantities":
+        """Series of the same kind with the elementwise function func applied to every value."""
+
+    @abstractmethod
+    def sum(self) -> float:
+        pass
+
+    @abstractmethod
+    def max(self) -> float:
+        pass
+
+    @abstractmethod
+    def min(self) -> float:
+        pass
+
+    @abstractmethod
+    def any_zero(self) -> bool:
+        pass
+
+    @abstractmethod
+    def roll(self, nb_hours: int) -> "CompactHourlyQuantities | None":
+        """Compact equivalent of np.roll(values, -nb_hours), or None if there is none."""
+
+    @abstractmethod
+    def window(self, start: int, stop: int) -> "CompactHourlyQuantities":
+        """Compact equivalent of values[start:stop], with 0 <= start < stop <= length."""
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        pass
+
+    def to_array(self) -> np.ndarray:
+        return self.values_at(np.arange(self.length))
+
+    def to_quantity(self) -> Quantity:
+        return Quantity(self.to_array(), self.units)
+
+    def dense_quantity(self) -> Quantity:
+        """Read-only dense values, expanded on first call and kept with the series, so that a compact series used in
+        several dense operations is only expanded once."""
+        if self._dense_array is None:
+            dense_array = self.to_array()
+            dense_array.flags.writeable = False
+            self._dense_array = dense_array
+
+        return Quantity(self._dense_array, self.units)
+
+    def to(self, units: Unit) -> "CompactHourlyQuantities":
+        if units == self.units:
+            return self
+        factor = conversion_factor(self.units, units)
+        if factor is None:
+            factor = Quantity(1, self.units).to(units).magnitude
+        factor = np.float32(factor)
+
+        return self.apply(lambda values: values * factor, units)
+
+    def combine(self, other: "CompactHourlyQuantities", func, units: Unit) -> "CompactHourlyQuantities | None":
+        """func(self, other) computed elementwise on two series of same length, or None if it can't stay compact."""
+        assert self.length == other.length, f"Can't combine series of lengths {self.length} and {other.length}"
+        if isinstance(other, ConstantHourlyQuantities):
+            return self.apply(lambda values: func(values, other.value), units)
+        if isinstance(self, ConstantHourlyQuantities):
+            return other.apply(lambda values: func(self.value, values), units)
+        if type(self) is type(other):
+            return self._combine_same_kind(other, func, units)
+
+        return None
+
+    def _combine_same_kind(self, other, func, units):
+        return None
+
+
+class ConstantHourlyQuantities(CompactHourlyQuantities):
+    __slots__ = ("value",)
+
+    def __init__(self, value, length: int, units: Unit):
+        super().__init__(length, units)
+        self.value = np.float32(value)
+
+    def values_at(self, hours):
+        return np.full(len(hours), self.value, dtype=np.float32)
+
+    def apply(self, func, units=None):
+        return ConstantHourlyQuantities(
+            as_float32_array(func(as_float32_array([self.value])))[0], self.length, units or self.units)
+
+    def sum(self):
+        return float(self.value) * self.length
+
+    def max(self):
+        return float(self.value)
+
+    def min(self):
+        return float(self.value)
+
+    def any_zero(self):
+        return self.length > 0 and self.value == 0
+
+    def roll(self, nb_hours):
+        return self
+
+    def window(self, start, stop):
+        return ConstantHourlyQuantities(self.value, stop - start, self.units)
+
+    @property
+    def nbytes(self):
+        return self.value.nbytes
+
+    def __repr__(self):
+        return f"ConstantHourlyQuantities({self.value} {self.units} over {self.length} hours)"
+
+
+class PeriodicHourlyQuantities(CompactHourlyQuantities):
+    """Value at hour h is pattern[(phase + h) % period], except over the first len(head) and last len(tail) hours
+    whose values are head and tail."""
+    __slots__ = ("pattern", "phase", "head", "tail")
+
+    def __init__(self, pattern, phase: int, length: int, units: Unit, head=None, tail=None):
+        super().__init__(length, units)
+        self.pattern = as_float32_array(pattern)
+        self.phase = int(phase) % len(self.pattern)
+        self.head = as_float32_array(head if head is not None else [])
+        self.tail = as_float32_array(tail if tail is not None else [])
+        assert len(self.head) + len(self.tail) <= self.length
+
+    @property
+    def period(self):
+        return len(self.pattern)
+
+    def values_at(self, hours):
+        hours = np.asarray(hours)
+        values = self.pattern[(self.phase + hours) % self.period]
+        if len(self.head):
+            in_head = hours < len(self.head)
+            values[in_head] = self.head[hours[in_head]]
+        if len(self.tail):
+            tail_start = self.length - len(self.tail)
+            in_tail = hours >= tail_start
+            values[in_tail] = self.tail[hours[in_tail] - tail_start]
+
+        return values
+
+    def apply(self, func, units=None):
+        return PeriodicHourlyQuantities(
+            func(self.pattern), self.phase, self.length, units or self.units,
+            head=func(self.head) if len(self.head) else None, tail=func(self.tail) if len(self.tail) else None)
+
+    def _pattern_counts(self):
+        """Number of occurrences of each pattern value between head and tail."""
+        nb_core_hours = self.length - len(self.head) - len(self.tail)
+        nb_full_periods, nb_remaining_hours = divmod(nb_core_hours, self.period)
+        counts = np.full(self.period, nb_full_periods, dtype=np.int64)
+        first_core_index = (self.phase + len(self.head)) % self.period
+        counts[(first_core_index + np.arange(nb_remaining_hours)) % self.period] += 1
+
+        return counts
+
+    def _occurring_values(self):
+        return np.concatenate([self.pattern[self._pattern_counts() > 0], self.head, self.tail])
+
+    def sum(self):
+        return float(np.dot(self._pattern_counts(), self.pattern.astype(np.float64))
+                     + self.head.sum(dtype=np.float64) + self.tail.sum(dtype=np.float64))
+
+    def max(self):
+        return float(self._occurring_values().max())
+
+    def min(self):
+        return float(self._occurring_values().min())
+
+    def any_zero(self):
+        return bool((self._occurring_values() == 0).any())
+
+    def roll(self, nb_hours):
+        shift = nb_hours % self.length if self.length else 0
+        if shift > self.length // 2:
+            shift -= self.length
+        head_length, tail_length = len(self.head), len(self.tail)
+        if shift >= 0:
+            new_head_length, new_tail_length = max(0, head_length - shift), min(self.length, tail_length + shift)
+        else:
+            new_head_length, new_tail_length = min(self.length, head_length - shift), max(0, tail_length + shift)
+        if new_head_length + new_tail_length > self.length:
+            return None
+        new_head_hours = np.arange(new_head_length)
+        new_tail_hours = np.arange(self.length - new_tail_length, self.length)
+
+        return PeriodicHourlyQuantities(
+            self.pattern, self.phase + shift, self.length, self.units,
+            head=self.values_at((new_head_hours + shift) % self.length),
+            tail=self.values_at((new_tail_hours + shift) % self.length))
+
+    def window(self, start, stop):
+        head_hours = np.arange(start, min(len(self.head), stop))
+        tail_hours = np.arange(max(start, self.length - len(self.tail)), stop)
+
+        return PeriodicHourlyQuantities(
+            self.pattern, self.phase + start, stop - start, self.units,
+            head=self.values_at(head_hours), tail=self.values_at(tail_hours))
+
+    def _combine_same_kind(self, other, func, units):
+        period = lcm(self.period, other.period)
+        head_length = max(len(self.head), len(other.head))
+        tail_length = max(len(self.tail), len(other.tail))
+        if period > MAX_COMPACT_PERIOD or head_length + tail_length > self.length:
+            return None
+        period_hours = np.arange(period)
+        head_hours = np.arange(head_length)
+        tail_hours = np.arange(self.length - tail_length, self.length)
+
+        return PeriodicHourlyQuantities(
+            func(self.pattern[(self.phase + period_hours) % self.period],
+                 other.pattern[(other.phase + period_hours) % other.period]),
+            0, self.length, units,
+            head=func(self.values_at(head_hours), other.values_at(head_hours)),
+            tail=func(self.values_at(tail_hours), other.values_at(tail_hours)))
+
+    @property
+    def nbytes(self):
+        return self.pattern.nbytes + self.head.nbytes + self.tail.nbytes
+
+    def __repr__(self):
+        return (f"PeriodicHourlyQuantities(period of {self.period} hours in {self.units} over {self.length} hours, "
+                f"{len(self.head)} head and {len(self.tail)} tail hours)")
+
+
+class RunLengthHourlyQuantities(CompactHourlyQuantities):
+    """values[i] held for run_lengths[i] consecutive hours."""
+    __slots__ = ("values", "run_lengths", "run_ends")
+
+    def __init__(self, values, run_lengths, units: Unit):
+        self.values = as_float32_array(values)
+        self.run_lengths = np.asarray(run_lengths, dtype=np.int64)
+        self.run_ends = np.cumsum(self.run_lengths)
+        super().__init__(self.run_ends[-1] if len(self.run_ends) else 0, units)
+
+    @classmethod
+    def daily_steps(cls, daily_values, units: Unit) -> "RunLengthHourlyQuantities":
+        return cls(daily_values, np.full(len(daily_values), 24), units)
+
+    def values_at(self, hours):
+        return self.values[np.searchsorted(self.run_ends, hours, side="right")]
+
+    def apply(self, func, units=None):
+        return RunLengthHourlyQuantities(func(self.values), self.run_lengths, units or self.units)
+
+    def _non_empty_values(self):
+        return self.values[self.run_lengths > 0]
+
+    def sum(self):
+        return float(np.dot(self.run_lengths, self.values.astype(np.float64)))
+
+    def max(self):
+        return float(self._non_empty_values().max())
+
+    def min(self):
+        return float(self._non_empty_values().min())
+
+    def any_zero(self):
+        return bool((self._non_empty_values() == 0).any())
+
+    def roll(self, nb_hours):
+        shift = nb_hours % self.length if self.length else 0
+        if shift == 0:
+            return self
+        split_run = int(np.searchsorted(self.run_ends, shift, side="right"))
+        run_starts = self.run_ends - self.run_lengths
+        nb_hours_of_split_run_after_shift = self.run_ends[split_run] - shift
+        nb_hours_of_split_run_before_shift = shift - run_starts[split_run]
+
+        return RunLengthHourlyQuantities(
+            np.concatenate([self.values[split_run:], self.values[:split_run + 1]]),
+            np.concatenate([[nb_hours_of_split_run_after_shift], self.run_lengths[split_run + 1:],
+                            self.run_lengths[:split_run], [nb_hours_of_split_run_before_shift]]),
+            self.units)
+
+    def window(self, start, stop):
+        first_run = int(np.searchsorted(self.run_ends, start, side="right"))
+        last_run = int(np.searchsorted(self.run_ends, stop, side="left"))
+        run_lengths = self.run_lengths[first_run:last_run + 1].copy()
+        run_lengths[0] = min(self.run_ends[first_run], stop) - start
+        if last_run > first_run:
+            run_lengths[-1] = stop - (self.run_ends[last_run] - self.run_lengths[last_run])
+
+        return RunLengthHourlyQuantities(self.values[first_run:last_run + 1], run_lengths, self.units)
+
+    def _combine_same_kind(self, other, func, units):
+        run_ends = np.union1d(self.run_ends, other.run_ends)
+        if len(run_ends) * MIN_AVERAGE_RUN_LENGTH > self.length:
+            return None
+        run_first_hours = np.concatenate([[0], run_ends[:-1]])
+
+        return RunLengthHourlyQuantities(
+            func(self.values_at(run_first_hours), other.values_at(run_first_hours)), np.diff(run_ends, prepend=0),
+            units)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.run_lengths.nbytes + self.run_ends.nbytes
+
+    def __repr__(self):
+        return f"RunLengthHourlyQuantities({len(self.values)} runs in {self.units} over {self.length} hours)"
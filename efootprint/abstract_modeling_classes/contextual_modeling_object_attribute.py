@@ -1,4 +1,5 @@
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.abstract_modeling_classes.modeling_object_topology import invalidate_topology_memos
 from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import ObjectLinkedToModelingObj
 
 
@@ -21,6 +22,10 @@ class ContextualModelingObjectAttribute(ObjectLinkedToModelingObj):
     def id(self):
         return self._value.id
 
+    def set_modeling_obj_container(self, new_parent_modeling_object: ModelingObject | None, attr_name: str | None):
+        super().set_modeling_obj_container(new_parent_modeling_object, attr_name)
+        invalidate_topology_memos()
+
     def __getattr__(self, attr):
         return getattr(self._value, attr)  # Use `getattr` instead of `__getattr__`
 
@@ -12,7 +12,11 @@ import zstandard as zstd
 import ciso8601
 
 from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject, Source
+from efootprint.abstract_modeling_classes.columnar_hourly_store import align_store_backed_arrays
+from efootprint.abstract_modeling_classes.compact_hourly_quantities import CompactHourlyQuantities
 from efootprint.abstract_modeling_classes.explainable_timezone import ExplainableTimezone
+from efootprint.abstract_modeling_classes.resolved_units import (
+    converted, product_units, quantity_from_magnitude, quotient_units, sum_or_difference, units_of)
 from efootprint.constants.units import u, get_unit
 from efootprint.logger import logger
 from efootprint.utils.display import best_display_unit, format_display_number, format_quantity_for_display, human_readable_unit
@@ -28,7 +32,7 @@ def align_temporally_quantity_arrays(
         first_quantity: Quantity, first_start_date: datetime, second_quantity: Quantity, second_start_date: datetime,
         equalize_units: bool = True):
     if equalize_units and first_quantity.units != second_quantity.units:
-        second_quantity = second_quantity.to(first_quantity.units)
+        second_quantity = converted(second_quantity, first_quantity.units)
 
     first_quantity_array = first_quantity.magnitude
     second_quantity_array = second_quantity.magnitude
@@ -43,6 +47,13 @@ def align_temporally_quantity_arrays(
             second_quantity_array = second_quantity_array.astype(np.float32)
         return first_quantity_array, second_quantity_array, first_start_date
 
+    # Both operands are rows of the same columnar store: rows are zero-padded on a shared axis, so slicing them
+    # over the union window is the alignment.
+    store_aligned_arrays = align_store_backed_arrays(
+        first_quantity_array, first_start_date, second_quantity_array, second_start_date)
+    if store_aligned_arrays is not None:
+        return store_aligned_arrays
+
     first_quantity_array = first_quantity_array.astype(np.float32)
     second_quantity_array = second_quantity_array.astype(np.float32)
 
@@ -70,13 +81,30 @@ def align_temporally_quantity_arrays(
     return aligned_first_array, aligned_second_array, common_start
 
 
-@ExplainableObject.register_subclass(lambda d: ("values" in d or "compressed_values" in d) and "unit" in d)
+# Start dates of hourly quantities temporarily restricted to an hour window (see
+# temporal_footprint.restricted_to_hour_window), by object id. Local to UTC conversions keep using the UTC offset at
+# the start of the whole series, so that restricted conversions match whole ones.
+window_origin_start_dates = {}
+
+
+def read_only_view(quantity: Quantity) -> Quantity:
+    """Quantity over a non-writeable view of the magnitude array of ``quantity``, so that the array can be shared
+    without risk of being modified through the view."""
+    magnitude_view = quantity.magnitude.view()
+    magnitude_view.flags.writeable = False
+
+    return Quantity(magnitude_view, quantity.units)
+
+
+@ExplainableObject.register_subclass(
+    lambda d: ("values" in d or "compressed_values" in d or "snapshot_values" in d) and "unit" in d)
 class ExplainableHourlyQuantities(ExplainableObject):
     __slots__ = (
         '_ExplainableQuantity',
         '_EmptyExplainableObject',
         'start_date',
         'json_compressed_value_data',
+        'compact_value',
     )
 
     @classmethod
@@ -86,6 +114,9 @@ class ExplainableHourlyQuantities(ExplainableObject):
         elif "compressed_values" in d:
             # start_date and timezone are included to facilitate json dumping if object doesn’t rehydrate
             value = {k: d[k] for k in ["compressed_values", "unit", "start_date", "timezone"]}
+        elif "snapshot_values" in d:
+            # Memory-mapped view into a binary system snapshot, only paged in when the value is read
+            value = {k: d[k] for k in ["snapshot_values", "unit", "start_date", "timezone"]}
         else:
             raise ValueError("Invalid hourly quantity format")
         start_date = ciso8601.parse_datetime(d["start_date"])
@@ -95,7 +126,7 @@ class ExplainableHourlyQuantities(ExplainableObject):
         return cls(value, start_date=start_date, label=d["label"])
 
     def __init__(
-            self, value: Quantity | dict, start_date: datetime, label: str = None,
+            self, value: Quantity | dict | CompactHourlyQuantities, start_date: datetime, label: str = None,
             left_parent: ExplainableObject = None, right_parent: ExplainableObject = None, operator: str = None,
             source: Source = None, confidence: Literal["low", "medium", "high"] | None = None, comment: str = None):
         from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
@@ -104,6 +135,7 @@ class ExplainableHourlyQuantities(ExplainableObject):
         self._EmptyExplainableObject = EmptyExplainableObject
         self.start_date = start_date
         self.json_compressed_value_data = None
+        self.compact_value = None
         if isinstance(value, Quantity):
             validate_timeseries_unit(value, label)
             if value.magnitude.dtype != np.float32:
@@ -115,16 +147,28 @@ class ExplainableHourlyQuantities(ExplainableObject):
         elif isinstance(value, dict):
             self.json_compressed_value_data = value
             super().__init__(None, label, left_parent, right_parent, operator, source, confidence, comment)
+        elif isinstance(value, CompactHourlyQuantities):
+            validate_timeseries_unit(value, label)
+            self.compact_value = value
+            super().__init__(None, label, left_parent, right_parent, operator, source, confidence, comment)
         else:
             raise ValueError(
-                f"ExplainableHourlyQuantities values must be Pint Quantities of numpy arrays or dict, got {type(value)}"
+                f"ExplainableHourlyQuantities values must be Pint Quantities of numpy arrays, dict or "
+                f"CompactHourlyQuantities, got {type(value)}"
             )
 
     @property
     def value(self):
-        if self._value is None and self.json_compressed_value_data is not None:
-            decompressed_values = self.decompress_values(self.json_compressed_value_data["compressed_values"])
-            self._value = Quantity(decompressed_values, get_unit(self.json_compressed_value_data["unit"]))
+        if self.is_compact:
+            # Materialized values are handed out as writeable arrays, so the compact form is dropped not to go stale
+            self._value = self.compact_value.to_quantity()
+            self.compact_value = None
+        elif self._value is None and self.json_compressed_value_data is not None:
+            if "snapshot_values" in self.json_compressed_value_data:
+                values = np.asarray(self.json_compressed_value_data["snapshot_values"])
+            else:
+                values = self.decompress_values(self.json_compressed_value_data["compressed_values"])
+            self._value = Quantity(values, get_unit(self.json_compressed_value_data["unit"]))
 
         return self._value
 
@@ -132,43 +176,93 @@ class ExplainableHourlyQuantities(ExplainableObject):
     def value(self, new_value):
         self._value = new_value
         self.json_compressed_value_data = None
+        self.compact_value = None
 
     @value.deleter
     def value(self):
         self._value = None
         self.json_compressed_value_data = None
+        self.compact_value = None
+
+    @property
+    def is_compact(self) -> bool:
+        return self._value is None and self.compact_value is not None
+
+    @property
+    def operand_value(self) -> Quantity:
+        """Value to compute with: compact values stay compact in self, and are expanded once into read-only dense
+        values shared by the operations using them."""
+        if self.is_compact:
+            return self.compact_value.dense_quantity()
+
+        return self.value
 
     @property
     def end_date(self):
-        return self.start_date + timedelta(hours=len(self.value))
+        return self.start_date + timedelta(hours=len(self))
 
     def to(self, unit_to_convert_to: Unit):
-        self.value = self.value.to(unit_to_convert_to)
+        if self.is_compact:
+            self.compact_value = self.compact_value.to(unit_to_convert_to)
+            validate_timeseries_unit(self.compact_value, self.label)
+            return self
+        self.value = converted(self.value, unit_to_convert_to)
         validate_timeseries_unit(self.value, self.label)
 
         return self
 
+    def _compact_or_value(self):
+        return self.compact_value if self.is_compact else self.value
+
+    def _compact_combination(self, other: "ExplainableHourlyQuantities", func, unit: Unit, equalize_units=True):
+        """Compact result of func applied to self and other if both are compact on the same hourly grid and their
+        kinds combine compactly, None otherwise."""
+        if (not self.is_compact or not other.is_compact or self.start_date != other.start_date
+                or len(self.compact_value) != len(other.compact_value)):
+            return None
+        other_compact_value = other.compact_value
+        if equalize_units:
+            other_compact_value = other_compact_value.to(self.compact_value.units)
+
+        return self.compact_value.combine(other_compact_value, func, unit)
+
+    def _compact_apply(self, func, unit: Unit = None):
+        """Compact result of the elementwise function func applied to self if self is compact, None otherwise."""
+        if not self.is_compact:
+            return None
+
+        return self.compact_value.apply(func, unit)
+
     def generate_explainable_object_with_logical_dependency(self, explainable_condition: "ExplainableObject"):
         return self.__class__(
-            value=self.value, start_date=self.start_date, label=self.label, left_parent=self,
+            value=self._compact_or_value(), start_date=self.start_date, label=self.label, left_parent=self,
             right_parent=explainable_condition, operator="logically dependent on")
 
     def __round__(self, round_level):
+        compact_value = self._compact_apply(lambda values: np.round(values, round_level))
+        rounded_value = compact_value if compact_value is not None \
+            else np.round(self.value, round_level).astype(np.float32, copy=False)
         return ExplainableHourlyQuantities(
-            np.round(self.value, round_level).astype(np.float32, copy=False), start_date=self.start_date, label=self.label,
+            rounded_value, start_date=self.start_date, label=self.label,
             left_parent=self, operator=f"rounded to {round_level} decimals", source=self.source
         )
 
     def round(self, round_level):
+        compact_value = self._compact_apply(lambda values: np.round(values, round_level))
+        if compact_value is not None:
+            self.compact_value = compact_value
+            return self
         self.value = np.round(self.value, round_level).astype(np.float32, copy=False)
 
         return self
 
     def return_shifted_hourly_quantities(self, shift_duration: "ExplainableQuantity"):
         shift_hours = math.floor(shift_duration.to(u.hour).magnitude)
+        # Compact values are immutable so they can be shared, dense ones are copied to avoid modifying the original
+        shifted_value = self.compact_value if self.is_compact else copy(self.value)
 
         return ExplainableHourlyQuantities(
-            copy(self.value),  # Use copy to avoid modifying the original value
+            shifted_value,
             start_date=self.start_date + timedelta(hours=shift_hours),
             label=f"{self.label} shifted by {shift_hours}h" if self.label else None,
             left_parent=self,
@@ -178,7 +272,9 @@ class ExplainableHourlyQuantities(ExplainableObject):
 
     @property
     def unit(self):
-        return self.value.units
+        if self.is_compact:
+            return self.compact_value.units
+        return units_of(self.value)
 
     @property
     def display_quantity(self):
@@ -207,12 +303,16 @@ class ExplainableHourlyQuantities(ExplainableObject):
             # Treat naive start_date as UTC midnight. Local usage dynamics are expressed in local clock time,
             # so shift the data array instead of shifting the anchor, preserving the UTC-midnight invariant.
             # The shift is circular in both directions to conserve both series length and total modeled volume.
-            utc_offset_seconds = local_timezone.value.localize(self.start_date).utcoffset().total_seconds()
+            utc_offset_seconds = local_timezone.value.localize(
+                window_origin_start_dates.get(id(self), self.start_date)).utcoffset().total_seconds()
             offset_hours = round(utc_offset_seconds / 3600)
-            if offset_hours != 0:
-                shifted_value = Quantity(np.roll(self.value.magnitude, -offset_hours), self.value.units)
-            else:
-                shifted_value = self.value
+            shifted_value = None
+            if offset_hours == 0:
+                shifted_value = self._compact_or_value()
+            elif self.is_compact:
+                shifted_value = self.compact_value.roll(offset_hours)
+            if shifted_value is None:
+                shifted_value = Quantity(np.roll(self.operand_value.magnitude, -offset_hours), self.unit)
             utc_start = self.start_date.replace(tzinfo=pytz.utc)
         else:
             assert self.start_date.tzinfo == pytz.utc, (
@@ -220,58 +320,84 @@ class ExplainableHourlyQuantities(ExplainableObject):
                 f"got {self.start_date.tzinfo}. Timezone handling is managed by e-footprint; "
                 f"do not set a non-UTC timezone on ExplainableHourlyQuantities.start_date directly."
             )
-            shifted_value = self.value
+            shifted_value = self._compact_or_value()
             utc_start = self.start_date
 
         return ExplainableHourlyQuantities(
             shifted_value, start_date=utc_start,
             left_parent=self, right_parent=local_timezone, operator="converted to UTC from")
 
+    def _reduce(self, compact_reduction, dense_reduction) -> Quantity:
+        if self.is_compact:
+            return Quantity(np.float32(compact_reduction(self.compact_value)), self.compact_value.units)
+
+        return dense_reduction(self.value)
+
+    def _elementwise(self, func):
+        compact_value = self._compact_apply(func)
+
+        return compact_value if compact_value is not None else func(self.value)
+
     def sum(self):
-        return self._ExplainableQuantity(np.sum(self.value, dtype=np.float32), left_parent=self, operator="sum")
+        return self._ExplainableQuantity(
+            self._reduce(lambda compact_value: compact_value.sum(), lambda value: np.sum(value, dtype=np.float32)),
+            left_parent=self, operator="sum")
 
     def mean(self):
-        return self._ExplainableQuantity(np.mean(self.value, dtype=np.float32), left_parent=self, operator="mean")
+        return self._ExplainableQuantity(
+            self._reduce(lambda compact_value: compact_value.sum() / len(compact_value),
+                         lambda value: np.mean(value, dtype=np.float32)),
+            left_parent=self, operator="mean")
 
     def max(self):
-        return self._ExplainableQuantity(np.max(self.value), left_parent=self, operator="max")
+        return self._ExplainableQuantity(
+            self._reduce(lambda compact_value: compact_value.max(), np.max), left_parent=self, operator="max")
 
     def min(self):
-        return self._ExplainableQuantity(np.min(self.value), left_parent=self, operator="min")
+        return self._ExplainableQuantity(
+            self._reduce(lambda compact_value: compact_value.min(), np.min), left_parent=self, operator="min")
 
     def abs(self):
         return ExplainableHourlyQuantities(
-            np.abs(self.value), start_date=self.start_date, left_parent=self, operator="abs")
+            self._elementwise(np.abs), start_date=self.start_date, left_parent=self, operator="abs")
 
     def ceil(self):
         return ExplainableHourlyQuantities(
-            np.ceil(self.value), start_date=self.start_date, left_parent=self, operator="ceil")
+            self._elementwise(np.ceil), start_date=self.start_date, left_parent=self, operator="ceil")
 
     def __neg__(self):
-        return ExplainableHourlyQuantities(-self.value, start_date=self.start_date, left_parent=self, operator="negate")
+        return ExplainableHourlyQuantities(
+            self._elementwise(np.negative), start_date=self.start_date, left_parent=self, operator="negate")
 
     def np_compared_with(self, compared_object, comparator):
+        if comparator == "max":
+            comparison_func = np.maximum
+        elif comparator == "min":
+            comparison_func = np.minimum
+        else:
+            raise ValueError(f"Comparator {comparator} not implemented in np_compared_with method")
+
         if isinstance(compared_object, self._EmptyExplainableObject):
-            compared_values = np.full(len(self.value), fill_value=np.float32(0))
+            result_comparison = self._compact_apply(lambda values: comparison_func(values, np.float32(0)))
+            if result_comparison is None:
+                result_comparison = Quantity(
+                    comparison_func(self.value, np.full(len(self), fill_value=np.float32(0))), self.unit)
         elif isinstance(compared_object, ExplainableHourlyQuantities):
             assert compared_object.unit == self.unit, f"{compared_object.unit} != {self.unit}"
-            compared_values = compared_object.value
             assert self.start_date == compared_object.start_date, \
                 f"Cannot compare ExplainableHourlyQuantities with different start dates: " \
                 f"{self.start_date} and {compared_object.start_date}"
+            result_comparison = self._compact_combination(
+                compared_object, comparison_func, self.unit, equalize_units=False)
+            if result_comparison is None:
+                result_comparison = Quantity(
+                    comparison_func(self.operand_value, compared_object.operand_value), self.unit)
         else:
             raise ValueError(f"Can only compare ExplainableHourlyQuantities with ExplainableHourlyQuantities or "
                              f"EmptyExplainableObjects, not {type(compared_object)}")
 
-        if comparator == "max":
-            result_comparison_np = np.maximum(self.value, compared_values)
-        elif comparator == "min":
-            result_comparison_np = np.minimum(self.value, compared_values)
-        else:
-            raise ValueError(f"Comparator {comparator} not implemented in np_compared_with method")
-
         return ExplainableHourlyQuantities(
-            Quantity(result_comparison_np, self.unit),
+            result_comparison,
             start_date=self.start_date,
             label=f"{self.label} compared with {compared_object.label}",
             left_parent=self,
@@ -279,14 +405,30 @@ class ExplainableHourlyQuantities(ExplainableObject):
             operator=f"{comparator} compared with"
         )
 
+    def _copied_value(self):
+        # Compact values are immutable and can be shared
+        if self.is_compact:
+            return self.compact_value
+
+        return self.value.copy()
+
     def __copy__(self):
         return ExplainableHourlyQuantities(
-            self.value.copy(), copy(self.start_date), label=copy(self.label), source=copy(self.source),
+            self._copied_value(), copy(self.start_date), label=copy(self.label), source=copy(self.source),
             confidence=self.confidence, comment=self.comment)
 
     def copy(self):
         return ExplainableHourlyQuantities(
-            self.value.copy(), copy(self.start_date), label=self.label, left_parent=self, operator="duplicate")
+            self._copied_value(), copy(self.start_date), label=self.label, left_parent=self, operator="duplicate")
+
+    def copy_sharing_value(self):
+        value_copy = self.__class__.__new__(self.__class__)
+        shared_value = self.compact_value if self.is_compact else read_only_view(self.value)
+        ExplainableHourlyQuantities.__init__(
+            value_copy, shared_value, copy(self.start_date), label=copy(self.label),
+            source=copy(self.source), confidence=self.confidence, comment=self.comment)
+
+        return value_copy
 
     def __eq__(self, other):
         if isinstance(other, numbers.Number) and other == 0:
@@ -295,38 +437,54 @@ class ExplainableHourlyQuantities(ExplainableObject):
             return False
         if isinstance(other, ExplainableHourlyQuantities):
             aligned_first_array, aligned_second_array, common_start = align_temporally_quantity_arrays(
-                self.value, self.start_date, other.value, other.start_date)
+                self.operand_value, self.start_date, other.operand_value, other.start_date)
 
             return np.allclose(aligned_first_array, aligned_second_array, atol=10**-3, rtol=10**-6)
 
         return False
 
     def __len__(self):
+        if self.is_compact:
+            return len(self.compact_value)
         return len(self.value)
 
+    def _scalar_operation(self, other: "ExplainableQuantity", func, unit: Unit, scalar_unit: Unit = None):
+        """Compact result of func applied to self magnitudes and to the float32 magnitude of other (converted to
+        scalar_unit if given) if self is compact, None otherwise."""
+        other_value = other.value if scalar_unit is None else converted(other.value, scalar_unit)
+        other_magnitude = np.float32(other_value.magnitude)
+
+        return self._compact_apply(lambda values: func(values, other_magnitude), unit)
+
     def __add__(self, other):
         if isinstance(other, numbers.Number) and other == 0:
             return ExplainableHourlyQuantities(
-                self.value, start_date=self.start_date, label=self.label,
+                self._compact_or_value(), start_date=self.start_date, label=self.label,
                 left_parent=self, operator=""
             )
         elif isinstance(other, self._EmptyExplainableObject):
             return ExplainableHourlyQuantities(
-                self.value, start_date=self.start_date, label=self.label,
+                self._compact_or_value(), start_date=self.start_date, label=self.label,
                 left_parent=self, right_parent=other, operator="+"
             )
         elif isinstance(other, ExplainableHourlyQuantities):
+            compact_result = self._compact_combination(other, np.add, self.unit)
+            if compact_result is not None:
+                return ExplainableHourlyQuantities(
+                    compact_result, start_date=self.start_date, label=None,
+                    left_parent=self, right_parent=other, operator="+")
             aligned_self, aligned_other, common_start = align_temporally_quantity_arrays(
-                self.value, self.start_date, other.value, other.start_date)
+                self.operand_value, self.start_date, other.operand_value, other.start_date)
             result_array = aligned_self + aligned_other
 
             return ExplainableHourlyQuantities(
                 Quantity(result_array, self.unit), start_date=common_start, label=None,
                 left_parent=self, right_parent=other, operator="+")
         elif isinstance(other, self._ExplainableQuantity):
+            compact_result = self._scalar_operation(other, np.add, self.unit, scalar_unit=self.unit)
             return ExplainableHourlyQuantities(
-                self.value + other.value, start_date=self.start_date, label=None,
-                left_parent=self, right_parent=other, operator="+")
+                compact_result if compact_result is not None else sum_or_difference(self.value, other.value),
+                start_date=self.start_date, label=None, left_parent=self, right_parent=other, operator="+")
         else:
             raise ValueError(f"Can only add another ExplainableHourlyQuantities or scalar 0 or ExplainableQuantity, "
                              f"not {type(other)}")
@@ -337,26 +495,32 @@ class ExplainableHourlyQuantities(ExplainableObject):
     def __sub__(self, other):
         if isinstance(other, numbers.Number) and other == 0:
             return ExplainableHourlyQuantities(
-                self.value, start_date=self.start_date, label=self.label,
+                self._compact_or_value(), start_date=self.start_date, label=self.label,
                 left_parent=self, operator=""
             )
         elif isinstance(other, self._EmptyExplainableObject):
             return ExplainableHourlyQuantities(
-                self.value, start_date=self.start_date, label=self.label,
+                self._compact_or_value(), start_date=self.start_date, label=self.label,
                 left_parent=self, right_parent=other, operator="-"
             )
         elif isinstance(other, ExplainableHourlyQuantities):
+            compact_result = self._compact_combination(other, np.subtract, self.unit)
+            if compact_result is not None:
+                return ExplainableHourlyQuantities(
+                    compact_result, start_date=self.start_date, label=None,
+                    left_parent=self, right_parent=other, operator="-")
             aligned_self, aligned_other, common_start = align_temporally_quantity_arrays(
-                self.value, self.start_date, other.value, other.start_date)
+                self.operand_value, self.start_date, other.operand_value, other.start_date)
             result_array = aligned_self - aligned_other
 
             return ExplainableHourlyQuantities(
                 Quantity(result_array, self.unit), start_date=common_start, label=None,
                 left_parent=self, right_parent=other, operator="-")
         elif isinstance(other, self._ExplainableQuantity):
+            compact_result = self._scalar_operation(other, np.subtract, self.unit, scalar_unit=self.unit)
             return ExplainableHourlyQuantities(
-                self.value - other.value, start_date=self.start_date, label=None,
-                left_parent=self, right_parent=other, operator="-")
+                compact_result if compact_result is not None else sum_or_difference(self.value, other.value, -1),
+                start_date=self.start_date, label=None, left_parent=self, right_parent=other, operator="-")
         else:
             raise ValueError(f"Can only subtract another ExplainableHourlyQuantities or scalar 0 or ExplainableQuantity,"
                              f" not {type(other)}")
@@ -365,9 +529,15 @@ class ExplainableHourlyQuantities(ExplainableObject):
         if isinstance(other, ExplainableHourlyQuantities):
             return other.__sub__(self)
         elif isinstance(other, self._ExplainableQuantity):
+            # Like pint, the result is expressed in the unit of the left operand
+            compact_result = None
+            if self.is_compact:
+                other_magnitude = np.float32(other.value.magnitude)
+                compact_result = self.compact_value.to(other.value.units).apply(
+                    lambda values: other_magnitude - values)
             return ExplainableHourlyQuantities(
-                other.value - self.value, start_date=self.start_date, label=None,
-                left_parent=other, right_parent=self, operator="-")
+                compact_result if compact_result is not None else other.value - self.value,
+                start_date=self.start_date, label=None, left_parent=other, right_parent=self, operator="-")
         else:
             raise ValueError(f"Can only make operation with another ExplainableHourlyUsage or ExplainableQuantity, "
                              f"not with {type(other)}")
@@ -378,20 +548,30 @@ class ExplainableHourlyQuantities(ExplainableObject):
         elif isinstance(other, self._EmptyExplainableObject):
             return self._EmptyExplainableObject(left_parent=self, right_parent=other, operator="*")
         elif isinstance(other, self._ExplainableQuantity):
+            result_unit = product_units(self.unit, other.unit)
+            compact_result = self._scalar_operation(other, np.multiply, result_unit)
+            if compact_result is not None:
+                return ExplainableHourlyQuantities(compact_result, self.start_date, "", self, other, "*")
             other_magnitude_to_multiply = other.magnitude
             if not isinstance(other_magnitude_to_multiply, np.float32):
                 other_magnitude_to_multiply = np.float32(other_magnitude_to_multiply)
             result_magnitude = self.value.magnitude * other_magnitude_to_multiply
-            result_quantity = Quantity(result_magnitude, self.unit * other.value.units)
+            result_quantity = quantity_from_magnitude(result_magnitude, result_unit)
             return ExplainableHourlyQuantities(
                 result_quantity, self.start_date, "", self, other, "*")
         elif isinstance(other, ExplainableHourlyQuantities):
+            result_unit = product_units(self.unit, other.unit)
+            compact_result = self._compact_combination(other, np.multiply, result_unit, equalize_units=False)
+            if compact_result is not None:
+                return ExplainableHourlyQuantities(
+                    compact_result, start_date=self.start_date, label=None,
+                    left_parent=self, right_parent=other, operator="*")
             aligned_self, aligned_other, common_start = align_temporally_quantity_arrays(
-                self.value, self.start_date, other.value, other.start_date, equalize_units=False)
+                self.operand_value, self.start_date, other.operand_value, other.start_date, equalize_units=False)
             result_array = aligned_self * aligned_other
 
             return ExplainableHourlyQuantities(
-                Quantity(result_array, self.unit * other.unit), start_date=common_start, label=None,
+                quantity_from_magnitude(result_array, result_unit), start_date=common_start, label=None,
                 left_parent=self, right_parent=other, operator="*")
         else:
             raise ValueError(
@@ -411,10 +591,16 @@ class ExplainableHourlyQuantities(ExplainableObject):
         # factor to the magnitudes while leaving the label as the raw ratio, producing values off by the
         # unit-conversion factor (e.g. `kg·s / kg·min` ending up 60x smaller than physical reality).
         return align_temporally_quantity_arrays(
-            self.value, self.start_date, other.value, other.start_date, equalize_units=False)
+            self.operand_value, self.start_date, other.operand_value, other.start_date, equalize_units=False)
 
     def __truediv__(self, other):
         if isinstance(other, ExplainableHourlyQuantities):
+            result_unit = quotient_units(self.unit, other.unit)
+            # Zero denominators are left to the dense path, which raises
+            if not other.is_compact or not other.compact_value.any_zero():
+                compact_result = self._compact_combination(other, np.divide, result_unit, equalize_units=False)
+                if compact_result is not None:
+                    return ExplainableHourlyQuantities(compact_result, self.start_date, "", self, other, "/")
             aligned_first_array, aligned_second_array, common_start = self._align_for_division(other)
             zero_denominator_mask = aligned_second_array == 0
             if zero_denominator_mask.any():
@@ -424,8 +610,11 @@ class ExplainableHourlyQuantities(ExplainableObject):
                     "hours mean 'no contribution', 1 when they mean 'equal share fallback').")
             result_array = aligned_first_array / aligned_second_array
             return ExplainableHourlyQuantities(
-                Quantity(result_array, self.unit / other.unit), common_start, "", self, other, "/")
+                quantity_from_magnitude(result_array, result_unit), common_start, "", self, other, "/")
         elif isinstance(other, self._ExplainableQuantity):
+            compact_result = self._scalar_operation(other, np.divide, quotient_units(self.unit, other.unit))
+            if compact_result is not None:
+                return ExplainableHourlyQuantities(compact_result, self.start_date, "", self, other, "/")
             other_value_to_divide = other.value
             if not isinstance(other_value_to_divide.magnitude, np.float32):
                 other_value_to_divide = np.float32(other_value_to_divide.magnitude) * other_value_to_divide.units
@@ -458,7 +647,8 @@ class ExplainableHourlyQuantities(ExplainableObject):
         result_array.fill(nan_replacement)
         np.divide(aligned_first_array, aligned_second_array, out=result_array, where=~zero_denominator_mask)
         return ExplainableHourlyQuantities(
-            Quantity(result_array, self.unit / other.unit), common_start, "", self, other, "/")
+            quantity_from_magnitude(result_array, quotient_units(self.unit, other.unit)), common_start, "", self, other,
+            "/")
 
     def __rtruediv__(self, other):
         if isinstance(other, ExplainableHourlyQuantities):
@@ -467,7 +657,11 @@ class ExplainableHourlyQuantities(ExplainableObject):
             other_value_to_divide = other.value
             if not isinstance(other_value_to_divide.magnitude, np.float32):
                 other_value_to_divide = np.float32(other_value_to_divide.magnitude) * other_value_to_divide.units
-            return ExplainableHourlyQuantities(other_value_to_divide / self.value, self.start_date,"", other, self, "/")
+            compact_result = self._compact_apply(
+                lambda values: other_value_to_divide.magnitude / values, other_value_to_divide.units / self.unit)
+            return ExplainableHourlyQuantities(
+                compact_result if compact_result is not None else other_value_to_divide / self.value,
+                self.start_date, "", other, self, "/")
         else:
             raise ValueError(
                 f"Can only make operation with another ExplainableHourlyUsage or ExplainableQuantity,"
@@ -489,11 +683,11 @@ class ExplainableHourlyQuantities(ExplainableObject):
         return np.frombuffer(decompressed, dtype=np.float32)
 
     def to_json(self, save_calculated_attributes=False):
-        if self.json_compressed_value_data is not None:
+        if self.json_compressed_value_data is not None and "compressed_values" in self.json_compressed_value_data:
             output_dict = deepcopy(self.json_compressed_value_data)
         else:
             output_dict = {
-                    "compressed_values": self.compress_values(self.magnitude),
+                    "compressed_values": self.compress_values(self.operand_value.magnitude),
                     "unit": str(self.unit),
                     "start_date": self.start_date.strftime("%Y-%m-%d %H:%M:%S"),
                     "timezone": str(self.start_date.tzinfo) if self.start_date.tzinfo is not None else None,
@@ -507,9 +701,9 @@ class ExplainableHourlyQuantities(ExplainableObject):
         return str(self)
 
     def __str__(self):
-        display_quantity = format_quantity_for_display(self.value)
+        display_quantity = format_quantity_for_display(self.operand_value)
         compact_unit = human_readable_unit(display_quantity.units)
-        nb_of_values = len(self.value)
+        nb_of_values = len(self)
         if nb_of_values < 30:
             formatted_values = [format_display_number(value) for value in display_quantity.magnitude]
             str_rounded_values = "[" + ", ".join(formatted_values) + "]"
@@ -520,7 +714,7 @@ class ExplainableHourlyQuantities(ExplainableObject):
                                  + "],\n    last 10 vals [" + ", ".join(last_vals) + "]"
 
         return f"{nb_of_values} values from {self.start_date} " \
-               f"to {self.start_date + timedelta(hours=len(self.value))} in {compact_unit}:\n    {str_rounded_values}"
+               f"to {self.end_date} in {compact_unit}:\n    {str_rounded_values}"
 
     def plot(self, figsize=(10, 4), filepath=None, plt_show=False, xlims=None, cumsum=False):
         import matplotlib.pyplot as plt
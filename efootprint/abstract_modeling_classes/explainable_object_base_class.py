@@ -1,10 +1,13 @@
 import uuid
-from collections import deque
 from copy import copy
 from typing import Literal, Type, Optional, TYPE_CHECKING
 import os
 
-from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import ObjectLinkedToModelingObj
+from efootprint.abstract_modeling_classes.calculation_graph_index import (
+    CalculationGraphIndex, ancestors_of, calculation_graph_version, descendants_of,
+    invalidate_calculation_graph_closures)
+from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import (
+    ObjectLinkedToModelingObj, get_attribute_without_evaluation)
 from efootprint.constants.units import u
 from efootprint.logger import logger
 from efootprint.abstract_modeling_classes.utils import css_escape
@@ -129,13 +132,17 @@ def optimize_attr_updates_chain(attr_updates_chain):
     return optimized_chain
 
 
-def get_attribute_from_flat_obj_dict(attr_key: str, flat_obj_dict: dict):
-    modeling_obj_container_id, attr_name_in_mod_obj_container, key_in_dict = eval(attr_key)
+def get_attribute_from_flat_obj_dict(attr_key: str | tuple, flat_obj_dict: dict):
+    # Binary system snapshots store keys already parsed into (container id, attribute name, key in dict) tuples
+    if isinstance(attr_key, str):
+        attr_key = eval(attr_key)
+    modeling_obj_container_id, attr_name_in_mod_obj_container, key_in_dict = attr_key
+    attr_value = get_attribute_without_evaluation(
+        flat_obj_dict[modeling_obj_container_id], attr_name_in_mod_obj_container)
     if key_in_dict:
-        return getattr(flat_obj_dict[modeling_obj_container_id], attr_name_in_mod_obj_container)[
-            flat_obj_dict[key_in_dict]]
+        return attr_value[flat_obj_dict[key_in_dict]]
     else:
-        return getattr(flat_obj_dict[modeling_obj_container_id], attr_name_in_mod_obj_container)
+        return attr_value
 
 
 class ExplainableObject(ObjectLinkedToModelingObj):
@@ -161,6 +168,8 @@ class ExplainableObject(ObjectLinkedToModelingObj):
         '_direct_children_with_id',
         'explain_nested_tuples_from_json',
         '_explain_nested_tuples',
+        '_cached_all_ancestors_with_id',
+        '_cached_all_descendants_with_id',
     )
     _registry = []
 
@@ -223,6 +232,9 @@ class ExplainableObject(ObjectLinkedToModelingObj):
         self._direct_children_with_id = []
         self.explain_nested_tuples_from_json = None
         self._explain_nested_tuples = None
+        # (calculation graph version, closure) pairs
+        self._cached_all_ancestors_with_id = None
+        self._cached_all_descendants_with_id = None
 
         for parent in (self.left_parent, self.right_parent):
             if parent is not None:
@@ -298,6 +310,7 @@ class ExplainableObject(ObjectLinkedToModelingObj):
     def direct_ancestors_with_id(self, value):
         self._direct_ancestors_with_id = value
         self._keys_of_direct_ancestors_with_id_loaded_from_json = None
+        invalidate_calculation_graph_closures()
 
     @property
     def direct_children_with_id(self):
@@ -309,6 +322,7 @@ class ExplainableObject(ObjectLinkedToModelingObj):
     def direct_children_with_id(self, value):
         self._direct_children_with_id = value
         self._keys_of_direct_children_with_id_loaded_from_json = None
+        invalidate_calculation_graph_closures()
 
     def __copy__(self):
         cls = self.__class__
@@ -319,6 +333,11 @@ class ExplainableObject(ObjectLinkedToModelingObj):
 
         return new_instance
 
+    def copy_sharing_value(self):
+        """Copy without calculation graph links that shares the value of self when it is costly to copy. Scalar
+        values are cheap to copy, so by default this is a plain copy."""
+        return copy(self)
+
     def set_label(self, new_label):
         self.label = new_label
 
@@ -371,6 +390,8 @@ class ExplainableObject(ObjectLinkedToModelingObj):
                 child.load_ancestors_and_children_from_json()
 
         super().set_modeling_obj_container(new_modeling_obj_container, attr_name)
+        # Node ids change with the container
+        invalidate_calculation_graph_closures()
 
         if new_modeling_obj_container is not None:
             if self.initial_modeling_obj_container is None:
@@ -394,6 +415,7 @@ class ExplainableObject(ObjectLinkedToModelingObj):
     def add_child_to_direct_children_with_id(self, direct_child):
         if direct_child.id not in self.direct_child_ids:
             self.direct_children_with_id.append(direct_child)
+            invalidate_calculation_graph_closures()
 
     def remove_child_from_direct_children_with_id(self, direct_child):
         self.direct_children_with_id = [
@@ -401,76 +423,28 @@ class ExplainableObject(ObjectLinkedToModelingObj):
 
     @property
     def all_descendants_with_id(self):
-        all_descendants = []
-        visited_ids = set()
-        stack = [self]
-
-        while stack:
-            parent = stack.pop()
-            for child in parent.direct_children_with_id:
-                cid = child.id
-                if cid not in visited_ids:
-                    visited_ids.add(cid)
-                    all_descendants.append(child)
-                    stack.append(child)
+        graph_version = calculation_graph_version()
+        cached = self._cached_all_descendants_with_id
+        if cached is None or cached[0] != graph_version:
+            cached = (graph_version, descendants_of(self))
+            self._cached_all_descendants_with_id = cached
 
-        return all_descendants
+        return list(cached[1])
 
     @property
     def all_ancestors_with_id(self):
-        all_ancestors = []
-
-        def retrieve_ancestors(expl_obj: ExplainableObject, ancestors_list):
-            for parent in expl_obj.direct_ancestors_with_id:
-                if parent.id not in [elt.id for elt in ancestors_list]:
-                    ancestors_list.append(parent)
-                retrieve_ancestors(parent, ancestors_list)
+        graph_version = calculation_graph_version()
+        cached = self._cached_all_ancestors_with_id
+        if cached is None or cached[0] != graph_version:
+            cached = (graph_version, ancestors_of([self]))
+            self._cached_all_ancestors_with_id = cached
 
-        retrieve_ancestors(self, all_ancestors)
-
-        return all_ancestors
+        return list(cached[1])
 
     @property
     def attr_updates_chain(self):
-        attr_updates_chain = []
-        descendants = self.all_descendants_with_id
-        descendant_ids = {desc.id for desc in descendants if desc.id != self.id}
-        has_been_added_to_chain_dict = {desc.id: False for desc in descendants if desc.id != self.id}
-
-        # Use deque for efficient pops and removals
-        parents_with_children_to_add = deque([self])
-
-        # Precompute ancestor ids for each child
-        ancestor_ids_map = {
-            child.id: [ancestor.id for ancestor in child.direct_ancestors_with_id]
-            for child in descendants
-        }
-
-        while parents_with_children_to_add:
-            next_parents = deque()
-            while parents_with_children_to_add:
-                parent = parents_with_children_to_add.popleft()
-                keep_for_next_iteration = False
-
-                for child in parent.direct_children_with_id:
-                    if not has_been_added_to_chain_dict[child.id]:
-                        child_ancestor_ids = ancestor_ids_map.get(child.id, [])
-                        all_child_ancestors_that_need_to_be_updated_are_already_in_chain = all(
-                            has_been_added_to_chain_dict[ancestor_id] for ancestor_id in child_ancestor_ids if
-                               ancestor_id in descendant_ids)
-                        if all_child_ancestors_that_need_to_be_updated_are_already_in_chain:
-                            attr_updates_chain.append(child)
-                            has_been_added_to_chain_dict[child.id] = True
-
-                            if child.direct_children_with_id:
-                                next_parents.append(child)
-                        else:
-                            keep_for_next_iteration = True
-
-                if keep_for_next_iteration:
-                    next_parents.append(parent)
-
-            parents_with_children_to_add = next_parents
+        attr_updates_chain = CalculationGraphIndex.from_descendants_of(
+            self, self.all_descendants_with_id).updates_chain()
 
         optimized_chain = optimize_attr_updates_chain(attr_updates_chain)
         return optimized_chain
@@ -720,8 +694,12 @@ class ExplainableObject(ObjectLinkedToModelingObj):
 
         if save_calculated_attributes:
             if self._keys_of_direct_ancestors_with_id_loaded_from_json is not None:
-                output_dict["direct_ancestors_with_id"] = self._keys_of_direct_ancestors_with_id_loaded_from_json
-                output_dict["direct_children_with_id"] = self._keys_of_direct_children_with_id_loaded_from_json
+                output_dict["direct_ancestors_with_id"] = [
+                    str(key) if isinstance(key, tuple) else key
+                    for key in self._keys_of_direct_ancestors_with_id_loaded_from_json]
+                output_dict["direct_children_with_id"] = [
+                    str(key) if isinstance(key, tuple) else key
+                    for key in self._keys_of_direct_children_with_id_loaded_from_json]
             else:
                 output_dict["direct_ancestors_with_id"] = [
                     ancestor.full_str_tuple_id for ancestor in self.direct_ancestors_with_id]
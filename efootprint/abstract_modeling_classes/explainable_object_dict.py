@@ -5,7 +5,8 @@ from efootprint.abstract_modeling_classes.explainable_object_base_class import (
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.contextual_modeling_object_attribute import ContextualModelingObjectDictKey
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
-from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import ObjectLinkedToModelingObjBase
+from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import (
+    ObjectLinkedToModelingObjBase, calculation_graph_lock)
 
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 
@@ -83,11 +84,12 @@ class ExplainableObjectDict(ObjectLinkedToModelingObjBase, dict):
     @property
     def all_ancestors_with_id(self):
         all_ancestors_with_id = []
+        all_ancestor_ids = set()
 
         for value in self.values():
-            all_ancestor_ids = [ancestor.id for ancestor in all_ancestors_with_id]
             for ancestor in value.all_ancestors_with_id:
                 if ancestor.id not in all_ancestor_ids:
+                    all_ancestor_ids.add(ancestor.id)
                     all_ancestors_with_id.append(ancestor)
 
         return all_ancestors_with_id
@@ -132,14 +134,16 @@ class ExplainableObjectDict(ObjectLinkedToModelingObjBase, dict):
             return
 
         # Original passive logic (unchanged)
-        if key in self and self.modeling_obj_container is not None:
-            self[key].set_modeling_obj_container(None, None)
-        super().__setitem__(key, value)
-        if self.modeling_obj_container is not None:
-            value.set_modeling_obj_container(
-                new_modeling_obj_container=self.modeling_obj_container, attr_name=self.attr_name_in_mod_obj_container)
-        self._add_self_to_key_containers(key)
-        self._add_self_to_key_contextual_containers(key)
+        with calculation_graph_lock:
+            if key in self and self.modeling_obj_container is not None:
+                self[key].set_modeling_obj_container(None, None)
+            super().__setitem__(key, value)
+            if self.modeling_obj_container is not None:
+                value.set_modeling_obj_container(
+                    new_modeling_obj_container=self.modeling_obj_container,
+                    attr_name=self.attr_name_in_mod_obj_container)
+            self._add_self_to_key_containers(key)
+            self._add_self_to_key_contextual_containers(key)
 
     def __delitem__(self, key):
         if self.trigger_modeling_updates:
@@ -224,7 +228,7 @@ class ExplainableObjectDict(ObjectLinkedToModelingObjBase, dict):
             return
         modeling_obj_container = modeling_obj_container or self.modeling_obj_container
         attr_name = attr_name or self.attr_name_in_mod_obj_container
-        key.contextual_modeling_obj_containers = [
+        remaining_contextual_containers = [
             container for container in key.contextual_modeling_obj_containers
             if not (
                 isinstance(container, ContextualModelingObjectDictKey)
@@ -233,6 +237,9 @@ class ExplainableObjectDict(ObjectLinkedToModelingObjBase, dict):
                 and container.dict_container is self
             )
         ]
+        # Calculated attribute dicts keyed by modeling objects get here on every replacement without being links
+        if len(remaining_contextual_containers) != len(key.contextual_modeling_obj_containers):
+            key.contextual_modeling_obj_containers = remaining_contextual_containers
 
     def to_json(self, save_calculated_attributes=False):
         output_dict = {}
@@ -6,6 +6,8 @@ import numpy as np
 from pint import Quantity
 
 from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject, Source
+from efootprint.abstract_modeling_classes.resolved_units import (
+    converted, product_or_quotient, quantity_from_magnitude, sum_or_difference, units_of)
 from efootprint.constants.units import get_unit
 from efootprint.utils.display import best_display_unit, format_display_number, format_quantity_for_display, human_readable_unit
 
@@ -34,7 +36,7 @@ class ExplainableQuantity(ExplainableObject):
         self.json_value_data = None
         if isinstance(value, Quantity):
             if not isinstance(value.magnitude, float):
-                value = float(value.magnitude) * value.units
+                value = quantity_from_magnitude(float(value.magnitude), units_of(value))
             super().__init__(value, label, left_parent, right_parent, operator, source, confidence, comment)
         elif isinstance(value, dict):
             self.json_value_data = value
@@ -62,10 +64,10 @@ class ExplainableQuantity(ExplainableObject):
 
     @property
     def unit(self):
-        return self.value.units
+        return units_of(self.value)
 
     def to(self, unit_to_convert_to):
-        self.value = self.value.to(unit_to_convert_to)
+        self.value = converted(self.value, unit_to_convert_to)
 
         return self
 
@@ -132,7 +134,7 @@ class ExplainableQuantity(ExplainableObject):
         elif isinstance(other, self._EmptyExplainableObject):
             return ExplainableQuantity(self.value, left_parent=self, right_parent=other, operator="+")
         elif isinstance(other, ExplainableQuantity):
-            return ExplainableQuantity(self.value + other.value, "", self, other, "+")
+            return ExplainableQuantity(sum_or_difference(self.value, other.value), "", self, other, "+")
         elif isinstance(other, self._ExplainableHourlyQuantities):
             return other.__add__(self)
         else:
@@ -146,7 +148,7 @@ class ExplainableQuantity(ExplainableObject):
         elif isinstance(other, self._EmptyExplainableObject):
             return ExplainableQuantity(self.value, left_parent=self, right_parent=other, operator="-")
         elif isinstance(other, ExplainableQuantity):
-            return ExplainableQuantity(self.value - other.value, "", self, other, "-")
+            return ExplainableQuantity(sum_or_difference(self.value, other.value, -1), "", self, other, "-")
         elif isinstance(other, self._ExplainableHourlyQuantities):
             return other.__rsub__(self)
         else:
@@ -158,7 +160,7 @@ class ExplainableQuantity(ExplainableObject):
         elif isinstance(other, self._EmptyExplainableObject):
             return self._EmptyExplainableObject(left_parent=self, right_parent=other, operator="*")
         elif isinstance(other, ExplainableQuantity):
-            return ExplainableQuantity(self.value * other.value, "", self, other, "*")
+            return ExplainableQuantity(product_or_quotient(self.value, other.value), "", self, other, "*")
         elif isinstance(other, self._ExplainableHourlyQuantities):
             return other.__mul__(self)
         else:
@@ -166,7 +168,7 @@ class ExplainableQuantity(ExplainableObject):
 
     def __truediv__(self, other):
         if isinstance(other, ExplainableQuantity):
-            return ExplainableQuantity(self.value / other.value, "", self, other, "/")
+            return ExplainableQuantity(product_or_quotient(self.value, other.value, divide=True), "", self, other, "/")
         elif isinstance(other, self._ExplainableHourlyQuantities):
             return other.__rtruediv__(self)
         else:
@@ -177,7 +179,7 @@ class ExplainableQuantity(ExplainableObject):
 
     def __rsub__(self, other):
         if isinstance(other, ExplainableQuantity):
-            return ExplainableQuantity(other.value - self.value, "", other, self, "-")
+            return ExplainableQuantity(sum_or_difference(other.value, self.value, -1), "", other, self, "-")
         elif isinstance(other, self._ExplainableHourlyQuantities):
             return other.__sub__(self)
         else:
@@ -193,7 +195,7 @@ class ExplainableQuantity(ExplainableObject):
         elif isinstance(other, self._EmptyExplainableObject):
             return self._EmptyExplainableObject(left_parent=other, right_parent=self, operator="/")
         elif isinstance(other, ExplainableQuantity):
-            return ExplainableQuantity(other.value / self.value, "", other, self, "/")
+            return ExplainableQuantity(product_or_quotient(other.value, self.value, divide=True), "", other, self, "/")
         elif isinstance(other, self._ExplainableHourlyQuantities):
             return other.__truediv__(self)
         else:
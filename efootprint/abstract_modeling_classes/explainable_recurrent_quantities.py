@@ -1,3 +1,4 @@
+import json
 from datetime import timezone
 from typing import Literal, TYPE_CHECKING
 
@@ -5,6 +6,7 @@ import pytz
 from pint import Unit, Quantity
 import numpy as np
 
+from efootprint.abstract_modeling_classes.compact_hourly_quantities import PeriodicHourlyQuantities
 from efootprint.abstract_modeling_classes.explainable_object_base_class import (
     ExplainableObject, Source)
 from efootprint.constants.units import u, get_unit
@@ -19,7 +21,19 @@ if TYPE_CHECKING:
     from efootprint.abstract_modeling_classes.explainable_timezone import ExplainableTimezone
 
 
-@ExplainableObject.register_subclass(lambda d: "recurring_values" in d and "unit" in d)
+def parse_recurring_values(recurring_values: str) -> np.ndarray:
+    """Recurring values saved as str(list of floats). It is valid JSON and much faster to parse than eval, unless it
+    holds nan or inf values, which Python writes as nan, inf and -inf, and which float() parses."""
+    try:
+        values = json.loads(recurring_values)
+    except ValueError:
+        values = [float(value) for value in recurring_values.strip().strip("[]").split(",") if value.strip()]
+
+    return np.array(values, dtype=np.float32)
+
+
+@ExplainableObject.register_subclass(
+    lambda d: ("recurring_values" in d or "snapshot_recurring_values" in d) and "unit" in d)
 class ExplainableRecurrentQuantities(ExplainableObject):
     __slots__ = (
         '_ExplainableQuantity',
@@ -28,7 +42,11 @@ class ExplainableRecurrentQuantities(ExplainableObject):
 
     @classmethod
     def from_json_dict(cls, d):
-        value = Quantity(np.array(eval(d["recurring_values"]), dtype=np.float32), get_unit(d["unit"]))
+        if "snapshot_recurring_values" in d:
+            # View into a binary system snapshot, copied because recurring values are small
+            value = Quantity(np.array(d["snapshot_recurring_values"], dtype=np.float32), get_unit(d["unit"]))
+        else:
+            value = Quantity(parse_recurring_values(d["recurring_values"]), get_unit(d["unit"]))
 
         return cls(value, label=d["label"])
 
@@ -160,17 +178,13 @@ class ExplainableRecurrentQuantities(ExplainableObject):
         # Treat it as naive for convert_to_utc.
         assert timespan_hourly_quantities.start_date.tzinfo in [pytz.utc, timezone.utc]
         naive_utc_start = timespan_hourly_quantities.start_date.replace(tzinfo=None)
-        timespan_length = len(timespan_hourly_quantities.value)
+        timespan_length = len(timespan_hourly_quantities)
         start_offset_in_week = naive_utc_start.weekday() * 24 + naive_utc_start.hour
 
-        # Vectorized index mapping into canonical week (168 hours), aligned with UTC weekday
-        indices = (start_offset_in_week + np.arange(timespan_length)) % 168
-
-        # Vectorized extraction of values
-        week_values = self.value.magnitude  # is numpy array
-        output_values = np.take(week_values, indices)
-
-        result_quantity = Quantity(output_values.astype(np.float32), self.unit)
+        # Weekly pattern repeated over the timespan, aligned with UTC weekday, kept compact until combined with a
+        # dense series
+        result_quantity = PeriodicHourlyQuantities(
+            self.value.magnitude, phase=start_offset_in_week, length=timespan_length, units=self.unit)
 
         local_timezone_expanded = ExplainableHourlyQuantities(
             result_quantity,
@@ -0,0 +1,269 @@
+"""In-memory cloning of modeling object graphs, e.g. to branch a scenario off a system without serializing it.
+
+The cloner walks modeling objects, their attributes and the calculation graph of their explainable objects
+directly, and gives every object of the graph a copy wired to the copies of the objects it references. Calculated
+attributes are cloned along with their calculation graph links, so clones don't need to be recomputed. Numeric
+buffers aren't copied: clones hold read-only views of the hourly arrays of the originals, so that writing to them
+in place raises instead of silently changing the original, and modeling updates of either side replace values
+rather than mutate them. Read-time projections (cached properties, render_cache memos, topology memos) aren't
+cloned and are recomputed on first read."""
+from functools import cached_property, lru_cache
+from typing import Dict, Iterable, List
+
+import numpy as np
+from pint import Quantity
+
+from efootprint.abstract_modeling_classes.calculation_graph_index import invalidate_calculation_graph_closures
+from efootprint.abstract_modeling_classes.columnar_hourly_store import store_owning_array
+from efootprint.abstract_modeling_classes.contextual_modeling_object_attribute import \
+    ContextualModelingObjectAttribute
+from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.abstract_modeling_classes.modeling_object_topology import invalidate_topology_memos
+from efootprint.abstract_modeling_classes.projection_reads import unwrapped_modeling_object
+from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import (
+    ObjectLinkedToModelingObjBase, _NOT_CACHED)
+
+# Stands for references to objects outside of the cloned graph, which are left out of the clones
+_DROPPED = object()
+
+_NOT_CLONED_MODELING_OBJECT_ATTRIBUTES = {"projection_reads", "topology_memos"}
+# Values of these attributes depend on the identity of the objects they are read from and are reset in clones
+_RESET_ATTRIBUTES = {
+    "_cached_id": None, "_cached_full_str_tuple_id": None, "_cached_attribute_id": None,
+    "_cached_dict_container": _NOT_CACHED, "_cached_key_in_dict": None, "_cached_list_container": _NOT_CACHED,
+    "_cached_indexes_in_list": None, "simulation_twin": None, "baseline_twin": None, "simulation": None,
+    "_cached_all_ancestors_with_id": None, "_cached_all_descendants_with_id": None,
+}
+
+
+# Kinds of values, by how they are cloned
+_SHARED, _MODELING_OBJECT, _WRAPPER, _LINKED, _LIST, _DICT, _TUPLE, _SET, _QUANTITY, _ARRAY = range(10)
+
+
+@lru_cache(maxsize=None)
+def _kind_of(value_type) -> int:
+    # Relationship wrappers pass isinstance checks for the modeling object they wrap, so they are matched first
+    if issubclass(value_type, ContextualModelingObjectAttribute):
+        return _WRAPPER
+    if issubclass(value_type, ObjectLinkedToModelingObjBase):
+        return _LINKED
+    for kind, kind_type in ((_MODELING_OBJECT, ModelingObject), (_LIST, list), (_DICT, dict), (_TUPLE, tuple),
+                            (_SET, (set, frozenset)), (_QUANTITY, Quantity), (_ARRAY, np.ndarray)):
+        if issubclass(value_type, kind_type):
+            return kind
+    # Scalars, strings, units, dates, sources and other values that modeling updates replace rather than mutate
+    return _SHARED
+
+
+@lru_cache(maxsize=None)
+def _cloned_and_reset_slots(cls) -> tuple[tuple, tuple]:
+    """Names of the slots of cls to clone, and (name, value) pairs of the slots to reset."""
+    slot_names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        slot_names += [slots] if isinstance(slots, str) else [
+            slot for slot in slots if slot not in ("__dict__", "__weakref__")]
+    if issubclass(cls, ContextualModelingObjectAttribute):
+        slot_names.remove("_value")
+    slot_names = list(dict.fromkeys(slot_names))
+
+    return (tuple(slot_name for slot_name in slot_names if slot_name not in _RESET_ATTRIBUTES),
+            tuple((slot_name, _RESET_ATTRIBUTES[slot_name]) for slot_name in slot_names
+                  if slot_name in _RESET_ATTRIBUTES))
+
+
+@lru_cache(maxsize=None)
+def _not_cloned_attribute_names(cls) -> frozenset:
+    return frozenset({"id"} | _NOT_CLONED_MODELING_OBJECT_ATTRIBUTES | {
+        attr_name for klass in cls.__mro__ for attr_name, attr in klass.__dict__.items()
+        if isinstance(attr, cached_property)})
+
+
+def _shared_array(array: np.ndarray) -> np.ndarray:
+    """Read-only view of array, or a copy if it is a row of a ColumnarHourlyStore, whose rows are rewritten in
+    place by the modeling updates of the system owning the store."""
+    if store_owning_array(array) is not None:
+        return array.copy()
+    shared_array = array.view()
+    shared_array.flags.writeable = False
+
+    return shared_array
+
+
+class ModelingObjectGraphCloner:
+    """Clones modeling objects and everything they hold, memoized so that objects referenced several times (by
+    attributes, dict keys and calculation graph links) are cloned once.
+
+    Only the modeling objects of ``mod_objs`` are cloned: explainable objects, relationship wrappers and calculation
+    graph links attached to other modeling objects are left out of the clones. ``id_map`` gives new ids to some of
+    the cloned modeling objects, the others keep their ids."""
+
+    def __init__(self, mod_objs: Iterable[ModelingObject], id_map: Dict[str, str] | None = None):
+        self.mod_objs = [unwrapped_modeling_object(mod_obj) for mod_obj in mod_objs]
+        self._ids_of_cloned_mod_objs = {id(mod_obj) for mod_obj in self.mod_objs}
+        self.id_map = id_map or {}
+        self._clones_by_id = {}
+        self._to_fill = []
+
+    def clone_all(self) -> Dict[str, ModelingObject]:
+        """Clone every modeling object of the graph and return the clones by id of their original."""
+        clones = {mod_obj.id: self.clone(mod_obj) for mod_obj in self.mod_objs}
+        while self._to_fill:
+            original, clone = self._to_fill.pop()
+            self._fill(original, clone)
+        invalidate_topology_memos()
+        invalidate_calculation_graph_closures()
+
+        return clones
+
+    def _is_cloned(self, obj) -> bool:
+        return obj is None or id(obj) in self._ids_of_cloned_mod_objs
+
+    def clone(self, value):
+        kind = _kind_of(type(value))
+        if kind == _SHARED:
+            return value
+        clone = self._clones_by_id.get(id(value))
+        if clone is not None:
+            return clone
+
+        if kind == _MODELING_OBJECT:
+            if not self._is_cloned(value):
+                return _DROPPED
+            clone = type(value).__new__(type(value))
+            # Ids are set before anything else because modeling objects are hashed by id as dict keys
+            clone.__dict__["id"] = self.id_map.get(value.id, value.id)
+            self._to_fill.append((value, clone))
+        elif kind == _WRAPPER or kind == _LINKED:
+            if not self._is_cloned(value.modeling_obj_container):
+                return _DROPPED
+            clone = type(value).__new__(type(value))
+            if kind == _WRAPPER:
+                wrapped_clone = self.clone(value._value)
+                if wrapped_clone is _DROPPED:
+                    return _DROPPED
+                # Wrappers are hashed like the object they wrap, so it is set before they are used as dict keys
+                object.__setattr__(clone, "_value", wrapped_clone)
+            self._to_fill.append((value, clone))
+        elif kind == _LIST:
+            clone = []
+            self._clones_by_id[id(value)] = clone
+            clone.extend(self._cloned_elements(value))
+            return clone
+        elif kind == _DICT:
+            clone = {}
+            self._clones_by_id[id(value)] = clone
+            self._fill_dict(value, clone, dict.__setitem__)
+            return clone
+        elif kind == _TUPLE:
+            return tuple(None if element_clone is _DROPPED else element_clone for element_clone in map(self.clone, value))
+        elif kind == _SET:
+            return type(value)(self._cloned_elements(value))
+        elif kind == _QUANTITY:
+            if not isinstance(value.magnitude, np.ndarray):
+                return value
+            clone = Quantity(_shared_array(value.magnitude), value.units)
+        else:
+            clone = _shared_array(value)
+        self._clones_by_id[id(value)] = clone
+
+        return clone
+
+    def _cloned_elements(self, values: Iterable) -> list:
+        return [element_clone for element_clone in map(self.clone, values) if element_clone is not _DROPPED]
+
+    def _fill_dict(self, original: dict, clone: dict, setitem):
+        for key, element in dict.items(original):
+            key_clone, element_clone = self.clone(key), self.clone(element)
+            if key_clone is not _DROPPED and element_clone is not _DROPPED:
+                setitem(clone, key_clone, element_clone)
+
+    def _cloned_attribute(self, attr_name: str, attr_value):
+        if attr_name in _RESET_ATTRIBUTES:
+            return _RESET_ATTRIBUTES[attr_name]
+        attr_clone = self.clone(attr_value)
+
+        return None if attr_clone is _DROPPED else attr_clone
+
+    def _fill(self, original, clone):
+        kind = _kind_of(type(original))
+        if kind == _MODELING_OBJECT:
+            not_cloned_attribute_names = _not_cloned_attribute_names(type(original))
+            clone_dict = clone.__dict__
+            for attr_name, attr_value in original.__dict__.items():
+                if attr_name in not_cloned_attribute_names:
+                    continue
+                attr_clone = self.clone(attr_value)
+                if attr_clone is _DROPPED:
+                    raise ValueError(
+                        f"{attr_name} of {original.name} is {attr_value}, which isn't part of the cloned modeling "
+                        f"objects.")
+                clone_dict[attr_name] = _RESET_ATTRIBUTES.get(attr_name, attr_clone)
+            return
+
+        cloned_slots, reset_slots = _cloned_and_reset_slots(type(original))
+        for slot_name in cloned_slots:
+            try:
+                slot_value = object.__getattribute__(original, slot_name)
+            except AttributeError:
+                continue
+            if _kind_of(type(slot_value)) != _SHARED:
+                slot_value = self.clone(slot_value)
+                if slot_value is _DROPPED:
+                    slot_value = None
+            object.__setattr__(clone, slot_name, slot_value)
+        for slot_name, reset_value in reset_slots:
+            object.__setattr__(clone, slot_name, reset_value)
+        if kind == _WRAPPER:
+            return
+        original_dict = getattr(original, "__dict__", None)
+        if original_dict:
+            clone_dict = clone.__dict__
+            for attr_name, attr_value in original_dict.items():
+                clone_dict[attr_name] = self._cloned_attribute(attr_name, attr_value)
+
+        # Elements are set through the builtin methods, the linking logic of the overridden ones being already
+        # reflected in the cloned attributes
+        if isinstance(original, dict):
+            self._fill_dict(original, clone, dict.__setitem__)
+        elif isinstance(original, list):
+            list.extend(clone, self._cloned_elements(list.__iter__(original)))
+
+
+def clone_modeling_objects(
+        mod_objs: Iterable[ModelingObject], id_map: Dict[str, str] | None = None) -> Dict[str, ModelingObject]:
+    """Clone mod_objs in memory, with their calculated attributes and calculation graph, and return the clones by id
+    of their original. See ModelingObjectGraphCloner."""
+    return ModelingObjectGraphCloner(mod_objs, id_map).clone_all()
+
+
+def reset_system_history(system):
+    """Start the modeling history of a cloned system afresh, as json_to_system does for loaded systems."""
+    system.__dict__.pop("columnar_hourly_store", None)
+    system.simulation = None
+    system.set_initial_and_previous_footprints()
+    if system.lazy_evaluation:
+        system.initial_total_energy_footprints_sum_over_period = None
+        system.initial_total_fabrication_footprints_sum_over_period = None
+    else:
+        system.initial_total_energy_footprints_sum_over_period = system.total_energy_footprint_sum_over_period
+        system.initial_total_fabrication_footprints_sum_over_period = \
+            system.total_fabrication_footprint_sum_over_period
+
+
+def objects_saved_with(mod_obj: ModelingObject) -> List[ModelingObject]:
+    """mod_obj and the modeling objects system_to_json saves along with it."""
+    from efootprint.api_utils.system_to_json import recursively_write_json_dict
+    objects_by_class = recursively_write_json_dict({}, mod_obj, save_calculated_attributes=False,
+                                                   serialize_objects=False)
+
+    return [obj for class_objects in objects_by_class.values() for obj in class_objects.values()]
+
+
+def clone_system(system, id_map: Dict[str, str] | None = None):
+    """In-memory copy of system and of the objects it links to, computed like the original."""
+    clones = clone_modeling_objects(objects_saved_with(system), id_map)
+    cloned_system = clones[system.id]
+    reset_system_history(cloned_system)
+
+    return cloned_system
@@ -4,10 +4,6 @@ from copy import copy
 from functools import cache, cached_property
 from typing import List, Type, get_origin, get_args, TYPE_CHECKING
 import os
-import time
-from collections import defaultdict
-
-from IPython.display import HTML
 
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
@@ -15,11 +11,15 @@ from efootprint.abstract_modeling_classes.utils import css_escape
 from efootprint.logger import logger
 from efootprint.abstract_modeling_classes.explainable_object_base_class import (
     retrieve_update_function_from_mod_obj_and_attr_name, ExplainableObject)
+from efootprint.abstract_modeling_classes.modeling_object_topology import (
+    invalidate_topology_memos, topology_memoized)
 from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import (
-    ObjectLinkedToModelingObj, ObjectLinkedToModelingObjBase)
+    ObjectLinkedToModelingObj, ObjectLinkedToModelingObjBase, calculation_graph_lock)
+from efootprint.abstract_modeling_classes.projection_reads import RecordedCachedProperty, unwrapped_modeling_object
 from efootprint.utils.graph_tools import WIDTH, HEIGHT, add_unique_id_to_mynetwork
 from efootprint.utils.object_relationships_graphs import build_object_relationships_graph, \
     USAGE_PATTERN_VIEW_CLASSES_TO_IGNORE
+from efootprint.utils import profiling
 from efootprint.utils.tools import get_init_signature_params
 from efootprint.constants.units import u
 
@@ -27,9 +27,6 @@ if TYPE_CHECKING:
     from efootprint.abstract_modeling_classes.contextual_modeling_object_attribute import ContextualModelingObjectAttribute
     from efootprint.abstract_modeling_classes.explainable_object_dict import ExplainableObjectDict
 
-compute_times = defaultdict(float)
-
-
 @cache
 def class_cached_property_names(cls: type) -> tuple:
     """Names of every functools.cached_property in the class MRO, memoized per class.
@@ -41,17 +38,110 @@ def class_cached_property_names(cls: type) -> tuple:
         name for klass in cls.__mro__ for name, attr in vars(klass).items() if isinstance(attr, cached_property)))
 
 
+def objects_linked_to_systems_of(mod_objs: list) -> list:
+    """The given objects plus every object linked to their systems, deduplicated."""
+    linked_objs = list(mod_objs)
+    for system in dict.fromkeys(sum([mod_obj.systems for mod_obj in mod_objs], start=[])):
+        linked_objs += system.all_linked_objects + [system]
+
+    return list(dict.fromkeys(linked_objs))
+
+
 def flush_cached_properties_system_wide(mod_objs: list):
     """Flat, system-wide flush of every cached property: the given objects plus every object linked to their
-    systems. Runs after every ModelingUpdate and after the initial build, keeping lazy read-time projections
-    (attribution memos and the like) consistent with the recomputed calculated-attribute graph."""
-    objs_to_flush = list(mod_objs)
-    for system in dict.fromkeys(sum([mod_obj.systems for mod_obj in mod_objs], start=[])):
-        objs_to_flush += system.all_linked_objects + [system]
-    for mod_obj in dict.fromkeys(objs_to_flush):
+    systems. Runs after the initial build and after ModelingUpdates that change links between modeling objects,
+    keeping lazy read-time projections (attribution memos and the like) consistent with the recomputed
+    calculated-attribute graph."""
+    for mod_obj in objects_linked_to_systems_of(mod_objs):
         mod_obj.flush_cached_properties()
 
 
+def flush_projections_reading(mod_objs: list, replaced_attributes: list):
+    """Flush the read-time projections (cached properties and render_cache memos) of the given objects and of every
+    object linked to their systems that read one of the replaced (modeling object, attribute name) pairs, then the
+    projections that read a flushed one, and so on. Projections that read nothing replaced stay warm."""
+    linked_objs = dict.fromkeys(
+        unwrapped_modeling_object(mod_obj) for mod_obj in objects_linked_to_systems_of(mod_objs))
+    projections = [
+        (mod_obj, projection_key, reads) for mod_obj in linked_objs
+        for projection_key, reads in (mod_obj.__dict__.get("projection_reads") or {}).items()]
+    dirty_reads = {(id(mod_obj), attr_name) for mod_obj, attr_name in replaced_attributes}
+    while projections:
+        remaining_projections = []
+        for mod_obj, projection_key, reads in projections:
+            if reads.isdisjoint(dirty_reads):
+                remaining_projections.append((mod_obj, projection_key, reads))
+            else:
+                mod_obj.flush_projection(projection_key)
+                dirty_reads.add((id(mod_obj), projection_key))
+        if len(remaining_projections) == len(projections):
+            break
+        projections = remaining_projections
+
+
+def mark_calculated_values_as_stale(values: List["ObjectLinkedToModelingObjBase"]):
+    """Mark the calculated attributes holding ``values`` as stale, along with every calculated attribute downstream
+    of them in the calculation graph. Staleness is tracked per attribute, so a stale dict element makes its whole
+    dict stale, and the descendants of its sibling elements are marked too: once recomputed, the siblings are new
+    objects that their current descendants don't point to anymore. Returns the (modeling object, attribute name,
+    stale value) triplets of all visited attributes, including the ones that were already stale."""
+    values_to_visit = list(values)
+    visited_attributes = set()
+    stale_attributes = []
+    while values_to_visit:
+        value = values_to_visit.pop()
+        mod_obj = value.modeling_obj_container
+        if mod_obj is None:
+            continue
+        attr_name = value.attr_name_in_mod_obj_container
+        if (id(mod_obj), attr_name) in visited_attributes or attr_name not in mod_obj.calculated_attributes:
+            continue
+        visited_attributes.add((id(mod_obj), attr_name))
+        mod_obj.hydrate_calculated_attribute_if_pending(attr_name)
+        if attr_name not in mod_obj.__dict__:
+            # Already stale, so its descendants already are too
+            stale_attributes.append((mod_obj, attr_name, mod_obj.__dict__["stale_calculated_attributes"][attr_name]))
+            continue
+        attr_value = mod_obj.__dict__[attr_name]
+        mod_obj.mark_calculated_attribute_as_stale(attr_name)
+        stale_attributes.append((mod_obj, attr_name, attr_value))
+        values_to_visit += direct_children_of_attribute_value(attr_value)
+
+    return stale_attributes
+
+
+def direct_children_of_attribute_value(attr_value) -> list:
+    direct_children = []
+    for attr_element in (attr_value.values() if isinstance(attr_value, dict) else [attr_value]):
+        direct_children += getattr(attr_element, "direct_children_with_id", [])
+
+    return direct_children
+
+
+def hand_over_direct_children(stale_value, evaluated_value):
+    """Move the children of a value replaced in the calculation graph to the value replacing it. Eager recomputation
+    doesn't need this since it recomputes the children right after, but lazily evaluated children may stay stale
+    for a while and must not keep an ancestor that has left the calculation graph."""
+    if stale_value is None:
+        return
+    stale_elements = stale_value.items() if isinstance(stale_value, dict) else [(None, stale_value)]
+    evaluated_elements = evaluated_value if isinstance(evaluated_value, dict) else {None: evaluated_value}
+    for key, stale_element in stale_elements:
+        if not getattr(stale_element, "direct_children_with_id", None):
+            continue
+        evaluated_element = evaluated_elements.get(key)
+        children = stale_element.direct_children_with_id
+        stale_element.direct_children_with_id = []
+        for child in children:
+            if child.modeling_obj_container is None:
+                continue
+            child_ancestors = [ancestor for ancestor in child.direct_ancestors_with_id if ancestor is not stale_element]
+            if evaluated_element is not None and evaluated_element.modeling_obj_container is not None:
+                child_ancestors.append(evaluated_element)
+                evaluated_element.add_child_to_direct_children_with_id(direct_child=child)
+            child.direct_ancestors_with_id = child_ancestors
+
+
 def get_instance_attributes(obj, target_class):
     return {attr_name: attr_value for attr_name, attr_value in obj.__dict__.items()
             if isinstance(attr_value, target_class)}
@@ -156,9 +246,20 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
     classes_outside_init_params_needed_for_generating_from_json = []
     _use_name_as_id: bool = False
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Cached properties of modeling objects are read-time projections, which record what they read so that
+        # modeling updates only flush the ones reading recomputed attributes.
+        for attr_name, attr in list(vars(cls).items()):
+            if type(attr) is cached_property:
+                recorded_cached_property = RecordedCachedProperty(attr.func)
+                recorded_cached_property.__set_name__(cls, attr_name)
+                setattr(cls, attr_name, recorded_cached_property)
+
     @classmethod
     def from_json_dict(cls, object_json_dict: dict, flat_obj_dict: dict, set_trigger_modeling_updates_to_true=False,
-                       is_loaded_from_system_with_calculated_attributes=False, sources_dict: dict | None = None):
+                       is_loaded_from_system_with_calculated_attributes=False, sources_dict: dict | None = None,
+                       lazy_hydration=False):
         from efootprint.abstract_modeling_classes.explainable_object_dict import ExplainableObjectDict
         from efootprint.abstract_modeling_classes.explainable_object_base_class import explainable_object_from_json
         new_obj = cls.__new__(cls)
@@ -166,8 +267,17 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
         new_obj.__dict__["explainable_object_dicts_containers"] = []
         new_obj.trigger_modeling_updates = False
         explainable_object_dicts_to_create_after_objects_creation = {}
+        # Saved calculated attributes are only built from their JSON when first read, which needs all of them to be
+        # saved, else they are recomputed at load anyway
+        hydrate_calculated_attributes_lazily = lazy_hydration and all(
+            calculated_attribute_name in object_json_dict for calculated_attribute_name in cls.calculated_attributes)
+        if hydrate_calculated_attributes_lazily:
+            new_obj.__dict__["calculated_attributes_to_hydrate"] = {}
         for attr_key, attr_value in object_json_dict.items():
-            if isinstance(attr_value, dict) and "label" in attr_value:
+            if hydrate_calculated_attributes_lazily and attr_key in cls.calculated_attributes:
+                new_obj.__dict__["calculated_attributes_to_hydrate"][attr_key] = (
+                    attr_value, flat_obj_dict, sources_dict)
+            elif isinstance(attr_value, dict) and "label" in attr_value:
                 new_value = explainable_object_from_json(attr_value, sources_dict)
                 new_obj.__setattr__(attr_key, new_value, check_input_validity=False)
                 # Calculus graph data is added after setting as new_obj attribute to not interfere
@@ -187,7 +297,7 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
             else:
                 new_obj.__setattr__(attr_key, attr_value)
 
-        if not is_loaded_from_system_with_calculated_attributes:
+        if not (is_loaded_from_system_with_calculated_attributes or hydrate_calculated_attributes_lazily):
             for calculated_attribute_name in new_obj.calculated_attributes:
                 if getattr(new_obj, calculated_attribute_name, None) is None:
                     if hasattr(new_obj, f"update_dict_element_in_{calculated_attribute_name}"):
@@ -408,6 +518,7 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
                     )
 
     @property
+    @topology_memoized
     def modeling_obj_containers(self):
         return list(dict.fromkeys(
             [contextual_mod_obj_container.modeling_obj_container
@@ -431,6 +542,7 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
 
     def add_to_contextual_modeling_obj_containers(self, contextual_mod_obj_container):
         self.contextual_modeling_obj_containers.append(contextual_mod_obj_container)
+        invalidate_topology_memos()
 
     def is_structural_input_dict_attribute(self, attr_name: str, attr_value=None) -> bool:
         from efootprint.abstract_modeling_classes.explainable_object_dict import ExplainableObjectDict
@@ -463,21 +575,89 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
         return [attr for attr in self.calculated_attributes if not attr.endswith("_validation")]
 
     @property
+    @topology_memoized
     def systems(self) -> List:
         return list(dict.fromkeys(sum([mod_obj.systems for mod_obj in self.modeling_obj_containers], start=[])))
 
+    def __getattr__(self, name):
+        # Only reached when regular attribute lookup fails, so eagerly computed attributes pay nothing: this is
+        # where stale calculated attributes of lazily evaluated systems get computed on first read.
+        stale_calculated_attributes = self.__dict__.get("stale_calculated_attributes")
+        if stale_calculated_attributes and name in stale_calculated_attributes:
+            self.evaluate_stale_calculated_attribute(name)
+            return self.__dict__[name]
+        calculated_attributes_to_hydrate = self.__dict__.get("calculated_attributes_to_hydrate")
+        if calculated_attributes_to_hydrate and name in calculated_attributes_to_hydrate:
+            self.hydrate_calculated_attribute(name)
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def calculated_attribute_names_to_hydrate(self) -> List[str]:
+        return list(self.__dict__.get("calculated_attributes_to_hydrate") or ())
+
+    def hydrate_calculated_attribute(self, attr_name: str):
+        """Build a calculated attribute of a system loaded with lazy hydration from its saved JSON. Its calculation
+        graph links are themselves only resolved when read, so neighbouring attributes stay unhydrated."""
+        from efootprint.abstract_modeling_classes.explainable_object_dict import ExplainableObjectDict
+        from efootprint.abstract_modeling_classes.explainable_object_base_class import explainable_object_from_json
+        attr_json, flat_obj_dict, sources_dict = self.__dict__["calculated_attributes_to_hydrate"].pop(attr_name)
+        if "label" in attr_json:
+            new_value = explainable_object_from_json(attr_json, sources_dict)
+            self.__setattr__(attr_name, new_value, check_input_validity=False)
+            new_value.initialize_calculus_graph_data_from_json(attr_json, flat_obj_dict, sources_dict)
+        else:
+            new_value = ExplainableObjectDict(
+                {flat_obj_dict[key]: explainable_object_from_json(value_json, sources_dict)
+                 for key, value_json in attr_json.items()})
+            self.__setattr__(attr_name, new_value, check_input_validity=False)
+            for explainable_object_item, explainable_object_json in zip(new_value.values(), attr_json.values()):
+                explainable_object_item.initialize_calculus_graph_data_from_json(
+                    explainable_object_json, flat_obj_dict, sources_dict)
+
+    def hydrate_calculated_attribute_if_pending(self, attr_name: str):
+        calculated_attributes_to_hydrate = self.__dict__.get("calculated_attributes_to_hydrate")
+        if calculated_attributes_to_hydrate and attr_name in calculated_attributes_to_hydrate:
+            self.hydrate_calculated_attribute(attr_name)
+
+    def hydrate_calculated_attributes(self):
+        for attr_name in self.calculated_attribute_names_to_hydrate:
+            self.hydrate_calculated_attribute(attr_name)
+
+    @property
+    def stale_calculated_attribute_names(self) -> List[str]:
+        return list(self.__dict__.get("stale_calculated_attributes") or ())
+
+    def mark_calculated_attribute_as_stale(self, attr_name: str):
+        """Move the current value of a calculated attribute aside so that its next read recomputes it through its
+        update function. The stale value stays linked in the calculation graph until then."""
+        self.hydrate_calculated_attribute_if_pending(attr_name)
+        stale_calculated_attributes = self.__dict__.setdefault("stale_calculated_attributes", {})
+        if attr_name not in stale_calculated_attributes:
+            stale_calculated_attributes[attr_name] = self.__dict__.pop(attr_name, None)
+
+    def mark_calculated_attributes_as_stale(self):
+        for attr_name in self.calculated_attributes:
+            self.mark_calculated_attribute_as_stale(attr_name)
+
+    def evaluate_stale_calculated_attribute(self, attr_name: str):
+        # The stale value is put back while the update function runs, as in eager recomputation: the update
+        # function may read it, and __setattr__ must find it to unlink it from the calculation graph.
+        stale_value = self.__dict__["stale_calculated_attributes"].pop(attr_name)
+        self.__dict__[attr_name] = stale_value
+        try:
+            profiling.call_update_function(
+                retrieve_update_function_from_mod_obj_and_attr_name(self, attr_name), self, attr_name)
+        except Exception:
+            self.mark_calculated_attribute_as_stale(attr_name)
+            raise
+        hand_over_direct_children(stale_value, self.__dict__[attr_name])
+
     def compute_calculated_attributes(self):
         logger.info(f"Computing calculated attributes for {type(self).__name__} {self.name}")
         for attr_name in self.calculated_attributes:
-            start = time.perf_counter()
             update_func = retrieve_update_function_from_mod_obj_and_attr_name(self, attr_name)
-            update_func()
-            duration = time.perf_counter() - start
-            if attr_name in compute_times:
-                compute_times[attr_name]["total_duration"] += duration
-                compute_times[attr_name]["nb_calls"] += 1
-            else:
-                compute_times[attr_name] = {"total_duration": duration, "nb_calls": 1}
+            profiling.call_update_function(update_func, self, attr_name)
 
     @property
     def mod_objs_computation_chain(self) -> List[Type["ModelingObject"]]:
@@ -507,12 +687,21 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
         recomputes from the fresh calculated-attribute graph."""
         for cached_property_name in class_cached_property_names(type(self)):
             self.__dict__.pop(cached_property_name, None)
+        self.__dict__.pop("projection_reads", None)
+
+    def flush_projection(self, projection_key):
+        """Pop a single cached property (projection_key being its name) or render_cache memo."""
+        self.__dict__.get("projection_reads", {}).pop(projection_key, None)
+        if isinstance(projection_key, str):
+            self.__dict__.pop(projection_key, None)
+        else:
+            self.__dict__.get("render_cache", {}).pop(projection_key, None)
 
     @cached_property
     def render_cache(self) -> dict:
         """Scratch store for lazy, query-time memos (e.g. the attribution layer's atom lists and fold
         results). Being itself a cached property, it is wiped wholesale by flush_cached_properties and is
-        never serialized."""
+        never serialized. Memos recording their reads are flushed one by one by flush_projections_reading."""
         return {}
 
     def after_init(self):
@@ -540,12 +729,16 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
     @property
     def attributes_that_shouldnt_trigger_update_logic(self):
         return ["name", "id", "trigger_modeling_updates", "contextual_modeling_obj_containers",
-                "explainable_object_dicts_containers"] + list(class_cached_property_names(type(self)))
+                "explainable_object_dicts_containers", "stale_calculated_attributes",
+                "calculated_attributes_to_hydrate", "topology_memos", "projection_reads"] + list(
+            class_cached_property_names(type(self)))
 
     def __setattr__(self, name, input_value, check_input_validity=True):
         current_attr = getattr(self, name, None)
         if name in self.attributes_that_shouldnt_trigger_update_logic:
             super().__setattr__(name, input_value)
+            if name == "contextual_modeling_obj_containers":
+                invalidate_topology_memos()
         elif name in self.calculated_attributes or not self.trigger_modeling_updates:
             if check_input_validity and name not in self.calculated_attributes:
                 self.check_input_value_type_positivity_and_unit(name, input_value)
@@ -562,13 +755,15 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
                 value_to_set = current_attr.__class__(value_to_set)
             assert isinstance(value_to_set, ObjectLinkedToModelingObjBase) or value_to_set is None, \
                     f"input {name} of value {value_to_set} should be an ObjectLinkedToModelingObjBase or None but is of type {type(value_to_set)}"
-            if isinstance(current_attr, ObjectLinkedToModelingObjBase):
-                current_attr.set_modeling_obj_container(None, None)
-            if isinstance(value_to_set, ObjectLinkedToModelingObjBase):
-                value_to_set.set_modeling_obj_container(self, name)
-            # attribute setting must be done after setting modeling_obj_container because if system has been loaded
-            # with calculated attributes from json, the calculation graph must be loaded before the attribute setting.
-            super().__setattr__(name, value_to_set)
+            with calculation_graph_lock:
+                if isinstance(current_attr, ObjectLinkedToModelingObjBase):
+                    current_attr.set_modeling_obj_container(None, None)
+                if isinstance(value_to_set, ObjectLinkedToModelingObjBase):
+                    value_to_set.set_modeling_obj_container(self, name)
+                # attribute setting must be done after setting modeling_obj_container because if system has been
+                # loaded with calculated attributes from json, the calculation graph must be loaded before the
+                # attribute setting.
+                super().__setattr__(name, value_to_set)
         else:
             from efootprint.abstract_modeling_classes.modeling_update import ModelingUpdate
             logger.debug(f"Updating {name} in {self.name}")
@@ -673,6 +868,8 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
         add_unique_id_to_mynetwork(filename)
 
         if notebook:
+            from IPython.display import HTML
+
             return HTML(filename)
 
     def self_delete(self):
@@ -686,6 +883,9 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
 
         mod_objs_computation_chain = [elt for elt in self.mod_objs_computation_chain if elt != self]
 
+        # Stale and unhydrated calculated values are still linked in the calculation graph and must be unlinked too
+        self.hydrate_calculated_attributes()
+        self.__dict__.update(self.__dict__.pop("stale_calculated_attributes", None) or {})
         for contextual_attr in self.mod_obj_attributes:
             contextual_attr.set_modeling_obj_container(None, None)
         # ObjectLinkedToModelingObjBase also covers ExplainableObjectDicts, whose unlinking removes the
@@ -700,30 +900,34 @@ class ModelingObject(metaclass=ABCAfterInitMeta):
         del self
 
     def to_json(self, save_calculated_attributes=False) -> dict:
+        return dict(self.json_items(save_calculated_attributes))
+
+    def json_items(self, save_calculated_attributes=False):
+        """Yield the (key, json value) pairs of to_json one attribute at a time, so that streaming writers only hold
+        the json of one attribute in memory."""
         from efootprint.abstract_modeling_classes.modeling_update import ModelingUpdate
-        output_dict = {}
+        if save_calculated_attributes:
+            self.hydrate_calculated_attributes()
 
         for key, value in self.__dict__.items():
-            if key in ["name", "id", "short_name", "impact_url"]:
-                output_dict[key] = value
             if (
                     (key in self.calculated_attributes and not save_calculated_attributes)
                     or key in self.attributes_that_shouldnt_trigger_update_logic
             ):
+                if key in ["name", "id", "short_name", "impact_url"]:
+                    yield key, value
                 continue
             elif value is None or isinstance(value, str):
-                output_dict[key] = value
+                yield key, value
             elif isinstance(value, ModelingObject):
-                output_dict[key] = value.id
+                yield key, value.id
             elif isinstance(value, ModelingUpdate):
                 continue
             elif getattr(value, "to_json", None) is not None:
-                output_dict[key] = value.to_json(save_calculated_attributes)
+                yield key, value.to_json(save_calculated_attributes)
             else:
                 raise ValueError(f"Attribute {key} of {self.name} {type(value)}) is not handled in to_json")
 
-        return output_dict
-
     @property
     def class_as_simple_str(self):
         return type(self).__name__
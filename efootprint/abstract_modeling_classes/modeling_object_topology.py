@@ -0,0 +1,45 @@
+from functools import wraps
+
+# Incremented on every change of the links between modeling objects (an object linked to or unlinked from a container
+# attribute, list or dict key), so that containment queries memoized on modeling objects (systems, containers, the
+# objects of a system by class) can be checked for freshness in O(1).
+_topology_version = 0
+
+
+def topology_version() -> int:
+    return _topology_version
+
+
+def invalidate_topology_memos():
+    global _topology_version
+    _topology_version += 1
+
+
+def topology_memoized(query=None, *, copy=list):
+    """Memoize a containment query method of a modeling object until the next modeling object link change.
+
+    Memos are kept in the topology_memos entry of the object's __dict__, and callers get a copy of the memoized
+    result so that they can't alter it."""
+    def decorator(query):
+        query_name = query.__name__
+
+        @wraps(query)
+        def memoized_query(self):
+            memos = self.__dict__.get("topology_memos")
+            if memos is None:
+                memos = {}
+                self.__dict__["topology_memos"] = memos
+            version = _topology_version
+            memo = memos.get(query_name)
+            if memo is None or memo[0] != version:
+                memo = (version, query(self))
+                memos[query_name] = memo
+
+            return copy(memo[1])
+
+        return memoized_query
+
+    if query is not None:
+        return decorator(query)
+
+    return decorator
@@ -1,5 +1,5 @@
 import math
-from copy import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from time import perf_counter
 from typing import List
@@ -9,42 +9,99 @@ from efootprint.abstract_modeling_classes.explainable_object_base_class import E
     optimize_attr_updates_chain
 from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import (
     ObjectLinkedToModelingObj, ObjectLinkedToModelingObjBase)
-from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import (
+    ExplainableHourlyQuantities, read_only_view)
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.modeling_object import (
-    ModelingObject, flush_cached_properties_system_wide, optimize_mod_objs_computation_chain)
+    ModelingObject, flush_cached_properties_system_wide, flush_projections_reading, mark_calculated_values_as_stale,
+    direct_children_of_attribute_value, hand_over_direct_children, optimize_mod_objs_computation_chain)
+from efootprint.abstract_modeling_classes.modeling_object_topology import topology_version
+from efootprint.abstract_modeling_classes.simulation_overlay import SimulationOverlay
+from efootprint.abstract_modeling_classes.temporal_footprint import (
+    dirty_hour_window, footprint_of, hour_span, restricted_to_hour_window, splice_hour_window, union_of_hour_windows,
+    window_is_covered_by)
 from efootprint.logger import logger
+from efootprint.utils import profiling
 
 
 def compute_attr_updates_chain_from_mod_objs_computation_chain(mod_objs_computation_chain: List[ModelingObject]):
     attr_updates_chain = []
     for mod_obj in mod_objs_computation_chain:
+        stale_calculated_attribute_names = mod_obj.stale_calculated_attribute_names
         for calculated_attribute in mod_obj.calculated_attributes:
-            attr_updates_chain.append(getattr(mod_obj, calculated_attribute))
+            # Stale attributes will be computed on read with the up-to-date object links anyway
+            if calculated_attribute not in stale_calculated_attribute_names:
+                attr_updates_chain.append(getattr(mod_obj, calculated_attribute))
 
     return attr_updates_chain
 
 
+def level_attr_updates_chain(attr_updates_chain: List[ExplainableObject]) -> List[List[int]] | None:
+    """Group the indexes of an ordered attribute updates chain into levels: every value only depends on values of
+    previous levels, so the values of a level can be recomputed in any order. A value depends on its in-chain
+    direct ancestors and, since update functions freely read their own object's attributes, on the values of its
+    own modeling object that precede it in the chain.
+
+    Returns None when the chain contains values that don't expose their ancestors (whole dicts), in which case
+    only the sequential order is known to be safe."""
+    level_by_value_id = {}
+    last_level_by_mod_obj_id = {}
+    levels = []
+    for index, value in enumerate(attr_updates_chain):
+        if not isinstance(value, ExplainableObject):
+            return None
+        mod_obj_id = value.modeling_obj_container.id
+        level = last_level_by_mod_obj_id.get(mod_obj_id, -1) + 1
+        for ancestor in value.direct_ancestors_with_id:
+            # Replaced source values are already unlinked and can't be in the chain
+            if ancestor.modeling_obj_container is None:
+                continue
+            ancestor_level = level_by_value_id.get(ancestor.id)
+            if ancestor_level is not None:
+                level = max(level, ancestor_level + 1)
+        level_by_value_id[value.id] = level
+        last_level_by_mod_obj_id[mod_obj_id] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(index)
+
+    return levels
+
+
 class ModelingUpdate:
+    # Number of threads used to recompute independent attributes of a same level. numpy releases the GIL on the
+    # big hourly array operations, so interactive edits on large systems scale with cores. 1 keeps the historical
+    # strictly sequential recomputation.
+    nb_recompute_workers: int = 1
+    # When changes only replace hourly values by hourly values over the same hours, values whose update function
+    # declares its temporal footprint are only recomputed over the hours the changes can influence.
+    incremental_hourly_recompute: bool = True
+    # Above this share of its hours, a value is recomputed over its whole period.
+    max_incrementally_recomputed_share: float = 0.5
+    # When no link between modeling objects changes, only the read-time projections (attribution cached properties
+    # and memos) that read a replaced attribute are flushed, instead of every projection of the system.
+    targeted_projection_flush: bool = True
+
+    @profiling.profiled(profiling.MODELING_UPDATE)
     def __init__(
             self, changes_list: List[List[ObjectLinkedToModelingObj | list | dict]], simulation_date: datetime = None,
             compute_previous_system_footprints=True):
         start = perf_counter()
+        self.topology_version_at_start = topology_version()
         self.system = None
         for change in changes_list:
             changed_val = change[0]
             if isinstance(changed_val, ObjectLinkedToModelingObjBase) and changed_val.modeling_obj_container.systems:
                 self.system = changed_val.modeling_obj_container.systems[0]
                 break
+        if simulation_date is not None and self.system is not None and self.system.lazy_evaluation:
+            # Simulations recompute eagerly against the baseline values, so these must all be evaluated first
+            self.system.materialize()
         self.changes_list = changes_list
         self.parse_changes_list()
+        self.lazy_evaluation = simulation_date is None and self.system is not None and self.system.lazy_evaluation
         if self.changes_list and self.system and compute_previous_system_footprints:
-            self.system.previous_total_energy_footprints_sum_over_period = (
-                self.system.total_energy_footprint_sum_over_period)
-            self.system.previous_total_fabrication_footprints_sum_over_period = \
-                self.system.total_fabrication_footprint_sum_over_period
-            self.system.previous_change = changes_list
-            self.system.all_changes += changes_list
+            self.system.snapshot_footprints_before_change(changes_list)
 
         self.simulation_date = simulation_date
         if simulation_date is not None:
@@ -63,6 +120,11 @@ class ModelingUpdate:
         self.attr_updates_chain_from_mod_objs_computation_chains = (
             compute_attr_updates_chain_from_mod_objs_computation_chain(self.mod_objs_computation_chain))
         self.values_to_recompute = self.generate_optimized_attr_updates_chain()
+        # Replaced values get unlinked from their modeling objects, so their attributes are kept beforehand
+        self.replaced_attributes = [
+            (value.modeling_obj_container, value.attr_name_in_mod_obj_container)
+            for value in [change[0] for change in self.changes_list] + self.values_to_recompute
+            if isinstance(value, ObjectLinkedToModelingObjBase) and value.modeling_obj_container is not None]
 
         self.ancestors_not_in_computation_chain = []
         self.hourly_quantities_to_filter = []
@@ -70,6 +132,8 @@ class ModelingUpdate:
         self.ancestors_to_replace_by_copies = []
         self.replaced_ancestors_copies = []
         self.recomputed_values = []
+        self.stale_marked_attributes = []
+        self.overlay = SimulationOverlay(self)
         if self.simulation_date is not None:
             self.make_simulation_specific_operations()
             logger.info("Simulation specific operations done.")
@@ -82,7 +146,12 @@ class ModelingUpdate:
                     new_sourcevalue.attr_name_in_mod_obj_container, new_sourcevalue,
                     mod_obj_container.attributes_with_depending_values())
 
-            self.recompute_attributes()
+            if self.lazy_evaluation:
+                for old_value, new_value in self.changes_list:
+                    hand_over_direct_children(old_value, new_value)
+                self.stale_marked_attributes = mark_calculated_values_as_stale(self.values_to_recompute)
+            else:
+                self.recompute_attributes()
         except Exception as e:
             logger.error("An error occurred during attribute recomputation. Resetting to previous values.")
             self.reset_values()
@@ -95,8 +164,9 @@ class ModelingUpdate:
 
         if simulation_date is not None:
             self.reset_values()
-        flush_cached_properties_system_wide(
-            self.mod_objs_computation_chain + ([self.system] if self.system is not None else []))
+        elif self.system is not None and self.system.columnar_hourly_store is not None:
+            self.system.columnar_hourly_store.ingest_all(self.recomputed_values)
+        self.flush_projections()
         compute_time_ms = round(1000 * (perf_counter() - start), 1)
         avg_compute_time_per_value = round(compute_time_ms / len(self.values_to_recompute), 2)\
             if self.values_to_recompute else 0
@@ -240,23 +310,148 @@ class ModelingUpdate:
             self.replaced_ancestors_copies = self.replace_ancestors_not_in_computation_chain_by_copies()
         self.filter_hourly_quantities_to_filter()
 
+    @staticmethod
+    def recompute_value(value_to_recompute):
+        attr_name_in_mod_obj_container = value_to_recompute.attr_name_in_mod_obj_container
+        modeling_obj_container = value_to_recompute.modeling_obj_container
+        key_in_dict = None
+        if value_to_recompute.dict_container is not None:
+            key_in_dict = value_to_recompute.key_in_dict
+        if not key_in_dict:
+            logger.debug(f"Recomputing {attr_name_in_mod_obj_container} in {modeling_obj_container.id}")
+            profiling.call_update_function(
+                value_to_recompute.update_function, modeling_obj_container, attr_name_in_mod_obj_container)
+            recomputed_value = getattr(modeling_obj_container, attr_name_in_mod_obj_container)
+        else:
+            logger.debug(f"Recomputing {attr_name_in_mod_obj_container} in {modeling_obj_container.id} "
+                         f"with key {key_in_dict.id}")
+            profiling.call_update_function(
+                value_to_recompute.update_function, modeling_obj_container, attr_name_in_mod_obj_container,
+                key_in_dict)
+            recomputed_value = getattr(modeling_obj_container, attr_name_in_mod_obj_container)[key_in_dict]
+
+        return recomputed_value
+
     def recompute_attributes(self):
-        for value_to_recompute in self.values_to_recompute:
-            attr_name_in_mod_obj_container = value_to_recompute.attr_name_in_mod_obj_container
-            modeling_obj_container = value_to_recompute.modeling_obj_container
-            key_in_dict = None
-            if value_to_recompute.dict_container is not None:
-                key_in_dict = value_to_recompute.key_in_dict
-            if not key_in_dict:
-                logger.debug(f"Recomputing {attr_name_in_mod_obj_container} in {modeling_obj_container.id}")
-                value_to_recompute.update_function()
-                recomputed_value = getattr(modeling_obj_container, attr_name_in_mod_obj_container)
-            else:
-                logger.debug(f"Recomputing {attr_name_in_mod_obj_container} in {modeling_obj_container.id} "
-                             f"with key {key_in_dict.id}")
-                value_to_recompute.update_function(key_in_dict)
-                recomputed_value = getattr(modeling_obj_container, attr_name_in_mod_obj_container)[key_in_dict]
+        dirty_hour_windows = self.compute_changes_dirty_hour_windows()
+        if dirty_hour_windows is not None:
+            self.recompute_attributes_over_dirty_hour_windows(dirty_hour_windows)
+            return
+        levels = None
+        # Levels are derived from the current calculation graph, which only stays valid when no modeling object
+        # link changes.
+        if self.nb_recompute_workers > 1 and not self.mod_objs_computation_chain:
+            levels = level_attr_updates_chain(self.values_to_recompute)
+        if levels is None or len(levels) == len(self.values_to_recompute):
+            for value_to_recompute in self.values_to_recompute:
+                self.recomputed_values.append(self.recompute_value(value_to_recompute))
+        else:
+            self.recompute_attributes_level_by_level(levels)
+
+    def compute_changes_dirty_hour_windows(self) -> dict | None:
+        """Hour windows outside which changed values are unchanged, by python id of old and new changed values. None
+        when the update isn't eligible to incremental recomputation."""
+        if (not self.incremental_hourly_recompute or self.simulation_date is not None
+                or self.mod_objs_computation_chain or self.nb_recompute_workers > 1
+                or (self.system is not None and self.system.columnar_hourly_store is not None)
+                or not all(isinstance(value, ExplainableObject) for value in self.values_to_recompute)):
+            return None
+        dirty_hour_windows = {}
+        for old_value, new_value in self.changes_list:
+            if not (isinstance(old_value, ExplainableHourlyQuantities)
+                    and isinstance(new_value, ExplainableHourlyQuantities)):
+                return None
+            window = dirty_hour_window(old_value, new_value)
+            if window is None:
+                return None
+            dirty_hour_windows[id(old_value)] = window
+            dirty_hour_windows[id(new_value)] = window
+
+        return dirty_hour_windows
+
+    def recompute_attributes_over_dirty_hour_windows(self, dirty_hour_windows: dict):
+        """Sequentially recompute values_to_recompute, each over the hours its ancestors' changes can influence
+        given the temporal footprint of its update function, or over its whole period when these hours can't be
+        bounded. Windowed results are spliced into a copy of the previous values, which stay untouched for
+        reset_values."""
+        # Ancestors are read from the calculation graph before it gets updated by recomputations
+        old_ancestors_per_value = [list(value.direct_ancestors_with_id) for value in self.values_to_recompute]
+        live_values = {id(old_value): new_value for old_value, new_value in self.changes_list}
+        for value_to_recompute, old_ancestors in zip(self.values_to_recompute, old_ancestors_per_value):
+            recomputed_value, output_window = self.recompute_value_over_dirty_hours(
+                value_to_recompute, old_ancestors, dirty_hour_windows, live_values)
             self.recomputed_values.append(recomputed_value)
+            live_values[id(value_to_recompute)] = recomputed_value
+            dirty_hour_windows[id(value_to_recompute)] = output_window
+            dirty_hour_windows[id(recomputed_value)] = output_window
+
+    def recompute_value_over_dirty_hours(
+            self, value_to_recompute, old_ancestors, dirty_hour_windows: dict, live_values: dict):
+        """Recompute value_to_recompute and return it with the hour window outside which it is unchanged, None
+        meaning its whole period."""
+        ancestors_windows = []
+        for ancestor in old_ancestors:
+            if id(ancestor) in dirty_hour_windows:
+                if dirty_hour_windows[id(ancestor)] is None:
+                    return self.recompute_value(value_to_recompute), None
+                ancestors_windows.append(dirty_hour_windows[id(ancestor)])
+        changed_hours = union_of_hour_windows(ancestors_windows)
+        footprint = footprint_of(value_to_recompute.update_function)
+        if changed_hours is None or footprint is None or not isinstance(
+                value_to_recompute, ExplainableHourlyQuantities):
+            return self.recompute_value(value_to_recompute), None
+        args = (value_to_recompute.key_in_dict,) if value_to_recompute.dict_container is not None else ()
+        lookback_and_lookahead = footprint.resolve(value_to_recompute.modeling_obj_container, *args)
+        if lookback_and_lookahead is None:
+            return self.recompute_value(value_to_recompute), None
+        lookback, lookahead = lookback_and_lookahead
+        span = hour_span(value_to_recompute)
+        output_window = (max(changed_hours[0] - lookahead, span[0]), min(changed_hours[1] + lookback, span[1]))
+        if output_window[0] >= output_window[1] or (
+                output_window[1] - output_window[0] > self.max_incrementally_recomputed_share * (span[1] - span[0])):
+            return self.recompute_value(value_to_recompute), None
+        input_window = (output_window[0] - lookback, output_window[1] + lookahead)
+        hourly_ancestors = [
+            live_values.get(id(ancestor), ancestor) for ancestor in old_ancestors
+            if isinstance(live_values.get(id(ancestor), ancestor), ExplainableHourlyQuantities)]
+        if footprint.circular and not window_is_covered_by(input_window, hourly_ancestors):
+            return self.recompute_value(value_to_recompute), None
+
+        with restricted_to_hour_window(hourly_ancestors, input_window):
+            windowed_value = self.recompute_value(value_to_recompute)
+        if not (isinstance(windowed_value, ExplainableHourlyQuantities)
+                and window_is_covered_by(output_window, [windowed_value])):
+            # value_to_recompute has been replaced in its container by windowed_value
+            return self.recompute_value(windowed_value), None
+        windowed_value.value = splice_hour_window(value_to_recompute, windowed_value, output_window)
+        windowed_value.start_date = value_to_recompute.start_date
+
+        return windowed_value, output_window
+
+    def recompute_attributes_level_by_level(self, levels: List[List[int]]):
+        # Level order is also a valid topological order. Adopting it keeps recomputed_values index-aligned with
+        # values_to_recompute, which reset_values and simulation twin linking rely on.
+        values_by_level = [[self.values_to_recompute[index] for index in level] for level in levels]
+        self.values_to_recompute = [value for values in values_by_level for value in values]
+        with ThreadPoolExecutor(max_workers=self.nb_recompute_workers) as executor:
+            for values in values_by_level:
+                if len(values) == 1:
+                    self.recomputed_values.append(self.recompute_value(values[0]))
+                    continue
+                futures = [executor.submit(self.recompute_value, value) for value in values]
+                first_error = None
+                for value, future in zip(values, futures):
+                    error = future.exception()
+                    if first_error is None and error is None:
+                        self.recomputed_values.append(future.result())
+                    elif first_error is None:
+                        first_error = error
+                    elif error is None:
+                        # recomputed_values must stay a prefix of values_to_recompute for reset_values, so
+                        # values recomputed after the failing one in chain order are rolled back right away.
+                        future.result().replace_in_mod_obj_container_without_recomputation(value)
+                if first_error is not None:
+                    raise first_error
 
     @property
     def old_sourcevalues(self):
@@ -282,19 +477,19 @@ class ModelingUpdate:
         return optimized_chain_without_previous_nor_initial_values
 
     def compute_ancestors_not_in_computation_chain(self):
-        all_ancestors_of_values_to_recompute = sum(
-            [value.all_ancestors_with_id for value in self.values_to_recompute], start=[])
-        deduplicated_all_ancestors_of_values_to_recompute = []
-        for ancestor in all_ancestors_of_values_to_recompute:
-            if ancestor.id not in [elt.id for elt in deduplicated_all_ancestors_of_values_to_recompute]:
-                deduplicated_all_ancestors_of_values_to_recompute.append(ancestor)
-        values_to_recompute_attribute_ids = [elt.attribute_id for elt in self.values_to_recompute]
-        old_sourcevalues_attribute_ids = [old_value.attribute_id for old_value in self.old_sourcevalues]
-        ancestors_not_in_computation_chain = [
-            ancestor for ancestor in deduplicated_all_ancestors_of_values_to_recompute
-            if ancestor.attribute_id not in values_to_recompute_attribute_ids + old_sourcevalues_attribute_ids]
-
-        return ancestors_not_in_computation_chain
+        """Direct ancestors of the recomputed values that aren't recomputed themselves. Update functions only read
+        these, so they are the only baseline values a simulation has to filter or copy: the rest of the baseline
+        calculation graph is shared as is."""
+        excluded_attribute_ids = {elt.attribute_id for elt in self.values_to_recompute}
+        excluded_attribute_ids.update(old_value.attribute_id for old_value in self.old_sourcevalues)
+        ancestors_not_in_computation_chain_by_id = {}
+        for value in self.values_to_recompute:
+            for element in (value.values() if isinstance(value, dict) else [value]):
+                for ancestor in element.direct_ancestors_with_id:
+                    if ancestor.attribute_id not in excluded_attribute_ids:
+                        ancestors_not_in_computation_chain_by_id.setdefault(ancestor.id, ancestor)
+
+        return list(ancestors_not_in_computation_chain_by_id.values())
 
     def compute_hourly_quantities_to_filter(self):
         hourly_quantities_ancestors_not_in_computation_chain = [
@@ -352,7 +547,8 @@ class ModelingUpdate:
             # is ceil((simulation_date - start) / 1h). Closed-form avoids an O(N) tz-aware datetime loop.
             delta_hours = (self.simulation_date - start).total_seconds() / 3600
             first_idx = max(0, math.ceil(delta_hours))
-            filtered_values = hourly_quantities.value[first_idx:]
+            # A read-only view: the filtered quantity shares its array with the baseline instead of copying it
+            filtered_values = read_only_view(hourly_quantities.value)[first_idx:]
 
             if len(filtered_values) == 0:
                 new_value = EmptyExplainableObject()
@@ -374,8 +570,8 @@ class ModelingUpdate:
         copies = []
         for ancestor_to_replace_by_copy in self.ancestors_to_replace_by_copies:
             # Replace all ancestors not in computation chain by their copy so that the original calculation graph
-            # will remain unchanged when the simulation is over
-            ancestor_copy = copy(ancestor_to_replace_by_copy)
+            # will remain unchanged when the simulation is over. Copies share their arrays with the baseline.
+            ancestor_copy = ancestor_to_replace_by_copy.copy_sharing_value()
             ancestor_copy.left_parent = None
             ancestor_copy.right_parent = None
             ancestor_copy.operator = None
@@ -384,6 +580,16 @@ class ModelingUpdate:
 
         return copies
 
+    def flush_projections(self):
+        mod_objs = self.mod_objs_computation_chain + ([self.system] if self.system is not None else [])
+        if not self.targeted_projection_flush or topology_version() != self.topology_version_at_start:
+            flush_cached_properties_system_wide(mod_objs)
+            return
+        replaced_attributes = self.replaced_attributes + [
+            (mod_obj, attr_name) for mod_obj, attr_name, stale_value in self.stale_marked_attributes]
+        flush_projections_reading(
+            mod_objs + [mod_obj for mod_obj, attr_name in replaced_attributes], replaced_attributes)
+
     def reset_values(self):
         if self.updated_values_set:
             for section_name, previous_values, new_values in self.previous_and_new_objects_organized_in_sections:
@@ -391,6 +597,9 @@ class ModelingUpdate:
                 for new_value, previous_value in zip(new_values, previous_values):
                     new_value.replace_in_mod_obj_container_without_recomputation(previous_value)
                 self.updated_values_set = False
+            if self.lazy_evaluation:
+                self.mark_lazily_evaluated_attributes_as_stale_again(
+                    [change[1] for change in self.changes_list], [change[0] for change in self.changes_list])
 
     def set_updated_values(self):
         if not self.updated_values_set:
@@ -399,11 +608,47 @@ class ModelingUpdate:
                 for new_value, previous_value in zip(new_values, previous_values):
                     previous_value.replace_in_mod_obj_container_without_recomputation(new_value)
                 self.updated_values_set = True
+            if self.lazy_evaluation:
+                self.mark_lazily_evaluated_attributes_as_stale_again(
+                    [change[0] for change in self.changes_list], [change[1] for change in self.changes_list])
+
+    def mark_lazily_evaluated_attributes_as_stale_again(self, replaced_values: List, restored_values: List):
+        """Attributes read since the update have been evaluated against the values that just got swapped out: put
+        their stale values back, as eager reset would with recomputed values, and mark them stale again along with
+        the descendants of their evaluated values."""
+        for replaced_value, restored_value in zip(replaced_values, restored_values):
+            hand_over_direct_children(replaced_value, restored_value)
+        values_to_mark_as_stale = []
+        for mod_obj, attr_name, stale_value in self.stale_marked_attributes:
+            evaluated_value = mod_obj.__dict__.get(attr_name, stale_value)
+            if evaluated_value is stale_value:
+                continue
+            values_to_mark_as_stale += direct_children_of_attribute_value(evaluated_value)
+            if stale_value is None:
+                values_to_mark_as_stale.append(evaluated_value)
+            else:
+                evaluated_value.replace_in_mod_obj_container_without_recomputation(stale_value)
+                hand_over_direct_children(evaluated_value, stale_value)
+                values_to_mark_as_stale.append(stale_value)
+        mark_calculated_values_as_stale(values_to_mark_as_stale)
 
     def link_simulated_and_baseline_twins(self):
         assert self.simulation_date is not None
         for value_to_recompute, recomputed_value in zip(self.values_to_recompute, self.recomputed_values):
-            value_to_recompute.simulation_twin = recomputed_value
-            recomputed_value.baseline_twin = value_to_recompute
-            value_to_recompute.simulation = self
-            recomputed_value.simulation = self
+            self.overlay.add(value_to_recompute, recomputed_value)
+
+    def drop(self):
+        """Reset a simulation and release everything it holds: its recomputed values, its ancestor copies and its
+        filtered hourly quantities. Other simulations of the system are left untouched. The simulation can’t be set
+        again afterwards."""
+        assert self.simulation_date is not None, "Only simulations can be dropped."
+        self.reset_values()
+        self.overlay.drop()
+        if self.system is not None and self.system.simulation is self:
+            self.system.simulation = None
+        self.hourly_quantities_to_filter = []
+        self.filtered_hourly_quantities = []
+        self.ancestors_to_replace_by_copies = []
+        self.replaced_ancestors_copies = []
+        self.values_to_recompute = []
+        self.recomputed_values = []
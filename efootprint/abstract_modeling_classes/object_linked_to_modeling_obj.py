@@ -1,7 +1,22 @@
+import threading
 from typing import Type
 
+# Serializes calculation graph (re)linking when ModelingUpdate recomputes independent attributes on worker threads:
+# linking mutates shared ancestors' children lists and dict keys' container lists.
+calculation_graph_lock = threading.RLock()
+
 _NOT_CACHED = object()  # Sentinel for distinguishing "not cached" from "cached as None"
 
+
+def get_attribute_without_evaluation(modeling_obj, attr_name: str):
+    """Current value of a ModelingObject attribute, returning the stale value of a lazily evaluated calculated
+    attribute instead of evaluating it: calculation graph bookkeeping must never trigger computations."""
+    stale_calculated_attributes = modeling_obj.__dict__.get("stale_calculated_attributes") or {}
+    if attr_name in stale_calculated_attributes:
+        return stale_calculated_attributes[attr_name]
+    return getattr(modeling_obj, attr_name)
+
+
 # Attributes that ObjectLinkedToModelingObj instances need
 _OBJECT_LINKED_SLOTS = (
     'modeling_obj_container',
@@ -107,12 +122,10 @@ class ObjectLinkedToModelingObjBase:
         if self._cached_dict_container is not _NOT_CACHED:
             return self._cached_dict_container
         output = None
-        if (
-                self.modeling_obj_container is not None
-                and isinstance(getattr(self.modeling_obj_container, self.attr_name_in_mod_obj_container), dict)
-                and id(getattr(self.modeling_obj_container, self.attr_name_in_mod_obj_container)) != id(self)
-        ):
-            output = getattr(self.modeling_obj_container, self.attr_name_in_mod_obj_container)
+        attr_value = None if self.modeling_obj_container is None else get_attribute_without_evaluation(
+            self.modeling_obj_container, self.attr_name_in_mod_obj_container)
+        if isinstance(attr_value, dict) and id(attr_value) != id(self):
+            output = attr_value
         self._cached_dict_container = output
         return output
 
@@ -139,12 +152,11 @@ class ObjectLinkedToModelingObjBase:
         if self._cached_list_container is not _NOT_CACHED:
             return self._cached_list_container
         output = None
-        if (
-                not isinstance(self, list)
-                and self.modeling_obj_container is not None
-                and isinstance(getattr(self.modeling_obj_container, self.attr_name_in_mod_obj_container), list)
-        ):
-            output = getattr(self.modeling_obj_container, self.attr_name_in_mod_obj_container)
+        if not isinstance(self, list) and self.modeling_obj_container is not None:
+            attr_value = get_attribute_without_evaluation(
+                self.modeling_obj_container, self.attr_name_in_mod_obj_container)
+            if isinstance(attr_value, list):
+                output = attr_value
         self._cached_list_container = output
         return output
 
@@ -0,0 +1,80 @@
+"""Recording of the modeling object attributes read by read-time projections (cached properties of modeling objects
+and render_cache memos), so that modeling updates only flush the projections that read a replaced attribute.
+
+While a projection is computed, ModelingObject attribute lookups go through a recording __getattribute__, which is
+only installed for the time of recordings so that regular attribute reads don't pay for it. Reads are recorded as
+(id of the modeling object, attribute name) keys, and memos read by other projections as (id of their owner, memo
+key) keys."""
+import threading
+from contextlib import contextmanager
+from functools import cached_property
+
+_thread_recorders = threading.local()
+_nb_active_recordings = 0
+_recordings_lock = threading.Lock()
+
+
+def _recording_getattribute(self, name):
+    recorders = getattr(_thread_recorders, "stack", None)
+    if recorders:
+        recorders[-1].add((id(self), name))
+    return object.__getattribute__(self, name)
+
+
+@contextmanager
+def recording_attribute_reads():
+    """Record into the yielded set the modeling object attributes read by the current thread within the block.
+    Projections read within the block are recorded as single reads, whatever they read themselves."""
+    global _nb_active_recordings
+    from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+    recorders = _thread_recorders.__dict__.setdefault("stack", [])
+    reads = set()
+    with _recordings_lock:
+        if _nb_active_recordings == 0:
+            ModelingObject.__getattribute__ = _recording_getattribute
+        _nb_active_recordings += 1
+    recorders.append(reads)
+    try:
+        yield reads
+    finally:
+        recorders.pop()
+        with _recordings_lock:
+            _nb_active_recordings -= 1
+            if _nb_active_recordings == 0:
+                del ModelingObject.__getattribute__
+
+
+def unwrapped_modeling_object(mod_obj):
+    """Modeling objects held by attributes, lists and dicts are ContextualModelingObjectAttribute wrappers, whose
+    reads are recorded as reads of the wrapped object."""
+    from efootprint.abstract_modeling_classes.contextual_modeling_object_attribute import \
+        ContextualModelingObjectAttribute
+    if isinstance(mod_obj, ContextualModelingObjectAttribute):
+        return mod_obj._value
+
+    return mod_obj
+
+
+def note_projection_read(owner, projection_key):
+    """Record a read of a projection that isn't an attribute lookup (e.g. a render_cache memo) by the current
+    recording, if any."""
+    recorders = getattr(_thread_recorders, "stack", None)
+    if recorders:
+        recorders[-1].add((id(unwrapped_modeling_object(owner)), projection_key))
+
+
+def store_projection_reads(owner, projection_key, reads: set):
+    owner.__dict__.setdefault("projection_reads", {})[projection_key] = reads
+
+
+class RecordedCachedProperty(cached_property):
+    """cached_property that records the attributes its computation reads. Cached properties of ModelingObject
+    subclasses are turned into RecordedCachedProperty at class creation."""
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with recording_attribute_reads() as reads:
+            value = super().__get__(instance, owner)
+        store_projection_reads(instance, self.attrname, reads)
+
+        return value
@@ -0,0 +1,105 @@
+"""Unit algebra resolved once per combination of units, so that explainable quantity arithmetic runs on magnitudes.
+
+pint resolves units on every operation: a conversion looks up the dimensionality and conversion factor of both
+units, adding two quantities converts one of them first, and reading the units of a quantity builds a new Unit.
+Update functions combine a small, fixed set of units over and over (e.g. W × hour to kWh, kWh × kg/kWh to kg) on many
+short series and scalars, so the conversion factor between two units and the product and quotient of two units are
+resolved through pint the first time they are met and memoized. Explainable quantity operations then scale and
+combine raw magnitudes, and attach the resolved unit to their result once.
+
+Resolved units are memoized Unit objects, and the quantities built from them share their unit containers, so that
+memo lookups mostly succeed on identity rather than on pint unit comparisons. Units with an offset (e.g. degrees
+Celsius) aren't resolved and are left to pint.
+
+Going through pint's Quantity constructor would cost more than the arithmetic it wraps, so quantities are built
+from pint's private Quantity fields, which is why pint is pinned to its 0.25 releases in pyproject.toml."""
+from functools import lru_cache
+
+from pint import Quantity, Unit
+
+from efootprint.constants.units import u
+
+
+@lru_cache(maxsize=None)
+def _unit_from_container(units_container) -> Unit:
+    return u.Unit(units_container)
+
+
+def units_of(quantity: Quantity) -> Unit:
+    """quantity.units, memoized per unit."""
+    return _unit_from_container(quantity._units)
+
+
+def quantity_from_magnitude(magnitude, units: Unit) -> Quantity:
+    """Quantity(magnitude, units) for a float or numpy magnitude and a Unit, without pint's argument parsing."""
+    quantity = object.__new__(Quantity)
+    quantity._REGISTRY = u
+    quantity._magnitude = magnitude
+    quantity._units = units._units
+
+    return quantity
+
+
+@lru_cache(maxsize=None)
+def conversion_factor(from_units: Unit, to_units: Unit) -> float | None:
+    """Factor converting magnitudes in from_units to magnitudes in to_units, None if either unit has an offset. Raises
+    pint's DimensionalityError if the units aren't compatible."""
+    from_quantity = Quantity(1.0, from_units)
+    if not (from_quantity._is_multiplicative and Quantity(1.0, to_units)._is_multiplicative):
+        return None
+
+    return float(from_quantity.to(to_units).magnitude)
+
+
+@lru_cache(maxsize=None)
+def is_multiplicative(units: Unit) -> bool:
+    return Quantity(1.0, units)._is_multiplicative
+
+
+@lru_cache(maxsize=None)
+def product_units(first_units: Unit, second_units: Unit) -> Unit:
+    return units_of(Quantity(1.0, first_units * second_units))
+
+
+@lru_cache(maxsize=None)
+def quotient_units(first_units: Unit, second_units: Unit) -> Unit:
+    return units_of(Quantity(1.0, first_units / second_units))
+
+
+def converted(quantity: Quantity, to_units: Unit) -> Quantity:
+    """quantity.to(to_units), with a memoized conversion factor."""
+    if not isinstance(to_units, Unit):
+        return quantity.to(to_units)
+    from_units = units_of(quantity)
+    factor = conversion_factor(from_units, to_units)
+    if factor is None:
+        return quantity.to(to_units)
+    if factor == 1.0 and from_units == to_units:
+        return quantity
+
+    return quantity_from_magnitude(quantity.magnitude * factor, to_units)
+
+
+def sum_or_difference(first_value: Quantity, second_value: Quantity, sign: int = 1) -> Quantity:
+    """first_value + sign * second_value, expressed in the unit of first_value as pint does."""
+    first_units = units_of(first_value)
+    factor = conversion_factor(units_of(second_value), first_units)
+    if factor is None:
+        return first_value + second_value if sign == 1 else first_value - second_value
+    second_magnitude = second_value.magnitude * factor
+
+    return quantity_from_magnitude(
+        first_value.magnitude + second_magnitude if sign == 1 else first_value.magnitude - second_magnitude,
+        first_units)
+
+
+def product_or_quotient(first_value: Quantity, second_value: Quantity, divide: bool = False) -> Quantity:
+    first_units, second_units = units_of(first_value), units_of(second_value)
+    if not (is_multiplicative(first_units) and is_multiplicative(second_units)):
+        return first_value / second_value if divide else first_value * second_value
+    if divide:
+        return quantity_from_magnitude(
+            first_value.magnitude / second_value.magnitude, quotient_units(first_units, second_units))
+
+    return quantity_from_magnitude(
+        first_value.magnitude * second_value.magnitude, product_units(first_units, second_units))
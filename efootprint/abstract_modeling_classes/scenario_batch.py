@@ -0,0 +1,109 @@
+from time import perf_counter
+from typing import Callable, List
+
+from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject, \
+    optimize_attr_updates_chain
+from efootprint.abstract_modeling_classes.modeling_object import flush_cached_properties_system_wide
+from efootprint.abstract_modeling_classes.modeling_update import ModelingUpdate
+from efootprint.logger import logger
+
+
+class ScenarioBatch:
+    """Evaluate many variants of one or several input values without leaving any change in the modeled system.
+
+    ``variants_list`` pairs each input with its list of variant values, in the spirit of ModelingUpdate changes
+    lists: ``[[server.power, [SourceValue(100 * u.W), SourceValue(200 * u.W)]], ...]``. Variant lists are read
+    together, the i-th variant setting every input to the i-th value of its list (use itertools.product to build
+    full grids). The attribute updates chain of the inputs is computed once, then each variant only replays its
+    update functions, and the original values are put back once all variants have been evaluated."""
+
+    def __init__(self, variants_list: List[List[ExplainableObject | List[ExplainableObject]]]):
+        if not variants_list:
+            raise ValueError("A scenario batch needs at least one input to vary.")
+        self.inputs = [input_value for input_value, _ in variants_list]
+        self.variants_per_input = [list(variant_values) for _, variant_values in variants_list]
+        self.nb_variants = len(self.variants_per_input[0])
+        for input_value, variant_values in zip(self.inputs, self.variants_per_input):
+            self.check_input_and_variant_values(input_value, variant_values)
+        if len(set(input_value.id for input_value in self.inputs)) != len(self.inputs):
+            raise ValueError("Each input of a scenario batch should only be listed once.")
+
+        self.system = None
+        for input_value in self.inputs:
+            if input_value.modeling_obj_container.systems:
+                self.system = input_value.modeling_obj_container.systems[0]
+                break
+        if self.system is not None and self.system.lazy_evaluation:
+            # Variants are recomputed eagerly against the current values, so these must all be evaluated first
+            self.system.materialize()
+
+        self.values_to_recompute = self.generate_optimized_attr_updates_chain()
+        self.mod_objs_to_flush = list(dict.fromkeys(
+            [value.modeling_obj_container for value in self.inputs + self.values_to_recompute]))
+
+    def check_input_and_variant_values(self, input_value: ExplainableObject, variant_values: List[ExplainableObject]):
+        if not isinstance(input_value, ExplainableObject) or input_value.modeling_obj_container is None:
+            raise ValueError(
+                f"Scenario batch inputs should be ExplainableObjects linked to a ModelingObject, got {input_value} "
+                f"of type {type(input_value)}")
+        mod_obj_container = input_value.modeling_obj_container
+        attr_name = input_value.attr_name_in_mod_obj_container
+        if attr_name in mod_obj_container.calculated_attributes:
+            raise ValueError(
+                f"{attr_name} of {mod_obj_container.name} is a calculated attribute and can’t be varied directly.")
+        if len(variant_values) != self.nb_variants:
+            raise ValueError(
+                f"All inputs should have the same number of variants, got {len(variant_values)} variants for "
+                f"{attr_name} of {mod_obj_container.name} and {self.nb_variants} for the first input.")
+        for variant_value in variant_values:
+            if not isinstance(variant_value, ExplainableObject):
+                raise ValueError(
+                    f"Variant values should be ExplainableObjects, got {variant_value} of type {type(variant_value)} "
+                    f"for {attr_name} of {mod_obj_container.name}")
+            if input_value.dict_container is None:
+                mod_obj_container.check_input_value_type_positivity_and_unit(attr_name, variant_value)
+            mod_obj_container.check_belonging_to_authorized_values(
+                attr_name, variant_value, mod_obj_container.attributes_with_depending_values())
+
+    def generate_optimized_attr_updates_chain(self):
+        optimized_chain = optimize_attr_updates_chain(
+            sum([input_value.attr_updates_chain for input_value in self.inputs], start=[]))
+
+        return [attr for attr in optimized_chain if not attr.attr_name_in_mod_obj_container.startswith("previous_")
+                and not attr.attr_name_in_mod_obj_container.startswith("initial_")]
+
+    def evaluate(self, read_results: Callable) -> List:
+        """Set each variant in turn, recompute its chain and return the list of ``read_results()`` outputs, one per
+        variant. Whatever happens, the system is left with its original values."""
+        start = perf_counter()
+        current_inputs = list(self.inputs)
+        current_values = list(self.values_to_recompute)
+        results = []
+        try:
+            for variant_index in range(self.nb_variants):
+                for input_index, current_input in enumerate(current_inputs):
+                    variant_value = self.variants_per_input[input_index][variant_index]
+                    current_input.replace_in_mod_obj_container_without_recomputation(variant_value)
+                    current_inputs[input_index] = variant_value
+                for value_index, value_to_recompute in enumerate(current_values):
+                    current_values[value_index] = ModelingUpdate.recompute_value(value_to_recompute)
+                if self.system is not None and self.system.columnar_hourly_store is not None:
+                    self.system.columnar_hourly_store.ingest_all(current_values)
+                flush_cached_properties_system_wide(self.mod_objs_to_flush)
+                results.append(read_results())
+        finally:
+            for current_input, original_input in zip(current_inputs, self.inputs):
+                if current_input is not original_input:
+                    current_input.replace_in_mod_obj_container_without_recomputation(original_input)
+            for current_value, original_value in zip(current_values, self.values_to_recompute):
+                if current_value is not original_value:
+                    current_value.replace_in_mod_obj_container_without_recomputation(original_value)
+            if self.system is not None and self.system.columnar_hourly_store is not None:
+                self.system.columnar_hourly_store.ingest_all(self.values_to_recompute)
+            flush_cached_properties_system_wide(self.mod_objs_to_flush)
+
+        compute_time_ms = round(1000 * (perf_counter() - start), 1)
+        logger.info(f"{self.nb_variants} variants of {len(self.inputs)} inputs lead to "
+                    f"{len(self.values_to_recompute)} update computations each, done in {compute_time_ms} ms.")
+
+        return results
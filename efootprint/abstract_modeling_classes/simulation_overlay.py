@@ -0,0 +1,74 @@
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
+
+
+class SimulationOverlay:
+    """Values recomputed by a simulation, keyed by the id of the baseline value they stand in for.
+
+    Baseline values are never copied: the simulation only holds its recomputed values, and the copies of baseline
+    ancestors it needs to keep the baseline calculation graph untouched share their arrays with the baseline through
+    read-only views. Several simulations of a same system can therefore coexist, and dropping one only frees the
+    values it recomputed."""
+
+    def __init__(self, simulation):
+        self.simulation = simulation
+        self.baseline_values = {}
+        self.simulated_values = {}
+
+    def __len__(self):
+        return len(self.simulated_values)
+
+    def __contains__(self, baseline_value: ExplainableObject) -> bool:
+        return baseline_value.id in self.simulated_values
+
+    def __getitem__(self, baseline_value: ExplainableObject) -> ExplainableObject:
+        return self.simulated_values[baseline_value.id]
+
+    def items(self) -> Iterator[Tuple[ExplainableObject, ExplainableObject]]:
+        for value_id, simulated_value in self.simulated_values.items():
+            yield self.baseline_values[value_id], simulated_value
+
+    def add(self, baseline_value: ExplainableObject, simulated_value: ExplainableObject):
+        # Ids are read on the simulated value, that sits in the modeling object container while the simulation is set
+        value_id = simulated_value.id
+        self.baseline_values[value_id] = baseline_value
+        self.simulated_values[value_id] = simulated_value
+        baseline_value.simulation_twin = simulated_value
+        simulated_value.baseline_twin = baseline_value
+        baseline_value.simulation = self.simulation
+        simulated_value.simulation = self.simulation
+
+    def value_of(self, baseline_value: ExplainableObject) -> ExplainableObject:
+        """Simulated value standing in for ``baseline_value``, or ``baseline_value`` itself when the simulation
+        didn't change it."""
+        return self.simulated_values.get(baseline_value.id, baseline_value)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of hourly arrays held by the simulation only, not shared with baseline values."""
+        nbytes = 0
+        for baseline_value, simulated_value in self.items():
+            simulated_array = getattr(getattr(simulated_value, "value", None), "magnitude", None)
+            if not isinstance(simulated_array, np.ndarray):
+                continue
+            baseline_array = getattr(getattr(baseline_value, "value", None), "magnitude", None)
+            if isinstance(baseline_array, np.ndarray) and np.shares_memory(simulated_array, baseline_array):
+                continue
+            nbytes += simulated_array.nbytes
+
+        return nbytes
+
+    def drop(self):
+        """Unlink the simulated values from their baseline twins, unless a more recent simulation has linked its own
+        twins since, and forget them."""
+        for baseline_value, simulated_value in self.items():
+            if baseline_value.simulation_twin is simulated_value:
+                baseline_value.simulation_twin = None
+                baseline_value.simulation = None
+            simulated_value.baseline_twin = None
+            simulated_value.simulation = None
+        self.baseline_values = {}
+        self.simulated_values = {}
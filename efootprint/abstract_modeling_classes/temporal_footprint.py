@@ -0,0 +1,162 @@
+"""Temporal footprints of update functions, used by ModelingUpdate to only recompute hourly values over the hours that
+edited hourly inputs can influence.
+
+Hour windows are (start, stop) pairs of UTC hour indexes (see columnar_hourly_store.utc_hour_index), stop excluded."""
+import math
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Callable, Iterable, List, Tuple
+
+import numpy as np
+from pint import Quantity
+
+from efootprint.abstract_modeling_classes.columnar_hourly_store import utc_hour_index
+from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import (
+    ExplainableHourlyQuantities, read_only_view, window_origin_start_dates)
+from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
+from efootprint.constants.units import u
+
+HourWindow = Tuple[int, int]
+
+
+def _as_nb_of_hours(hours, mod_obj, args) -> int | None:
+    if callable(hours):
+        hours = hours(mod_obj, *args)
+    if hours is None:
+        return None
+    if isinstance(hours, EmptyExplainableObject):
+        return 0
+    if isinstance(hours, ExplainableQuantity):
+        hours = hours.value
+    if isinstance(hours, Quantity):
+        # Durations are floored or ceiled to whole hours depending on the operator, so one more hour is kept
+        return math.ceil(hours.to(u.hour).magnitude) + 1
+
+    return int(hours)
+
+
+class TemporalFootprint:
+    """Hour t of the output of an update function only depends on hours t - lookback_hours to t + lookahead_hours of
+    its hourly inputs. Hours can be given as callables of the modeling object and of the update function arguments,
+    returning a number of hours, a duration, or None when the output depends on whole inputs. Circular footprints
+    wrap around input bounds, so that they only hold for input windows that don't reach these bounds."""
+    __slots__ = ("lookback_hours", "lookahead_hours", "circular", "applies")
+
+    def __init__(self, lookback_hours: int | Callable = 0, lookahead_hours: int | Callable = 0, circular=False,
+                 applies: Callable = None):
+        self.lookback_hours = lookback_hours
+        self.lookahead_hours = lookahead_hours
+        self.circular = circular
+        self.applies = applies
+
+    def resolve(self, mod_obj, *args) -> Tuple[int, int] | None:
+        """(lookback, lookahead) hours of the update function called on mod_obj with args, or None if its output
+        depends on whole inputs."""
+        if self.applies is not None and not self.applies(mod_obj, *args):
+            return None
+        lookback = _as_nb_of_hours(self.lookback_hours, mod_obj, args)
+        lookahead = _as_nb_of_hours(self.lookahead_hours, mod_obj, args)
+        if lookback is None or lookahead is None:
+            return None
+
+        return lookback, lookahead
+
+
+def temporal_footprint(lookback_hours: int | Callable = 0, lookahead_hours: int | Callable = 0, circular=False,
+                       applies: Callable = None):
+    """Declare the temporal footprint of an update function (see TemporalFootprint). The default footprint is the
+    one of elementwise hourly operations. Update functions without declaration are always recomputed over whole
+    periods, and so are overrides of declared update functions, which have to be declared again."""
+    def decorator(update_function):
+        update_function.temporal_footprint = TemporalFootprint(lookback_hours, lookahead_hours, circular, applies)
+        return update_function
+
+    return decorator
+
+
+def footprint_of(update_function) -> TemporalFootprint | None:
+    return getattr(update_function, "temporal_footprint", None)
+
+
+def hour_span(hourly_quantities: ExplainableHourlyQuantities) -> HourWindow:
+    start = utc_hour_index(hourly_quantities.start_date)
+
+    return start, start + len(hourly_quantities)
+
+
+def dirty_hour_window(
+        previous: ExplainableHourlyQuantities, new: ExplainableHourlyQuantities) -> HourWindow | None:
+    """Smallest hour window outside which previous and new values are equal, or None if they don't cover the same
+    hours."""
+    if previous.start_date != new.start_date or len(previous) != len(new):
+        return None
+    previous_values = previous.operand_value.magnitude
+    new_values = new.operand_value.to(previous.unit).magnitude
+    changed_indexes = np.flatnonzero(previous_values != new_values)
+    start = hour_span(previous)[0]
+    if len(changed_indexes) == 0:
+        return start, start
+
+    return start + int(changed_indexes[0]), start + int(changed_indexes[-1]) + 1
+
+
+def union_of_hour_windows(windows: Iterable[HourWindow]) -> HourWindow | None:
+    """Smallest hour window containing all non empty windows, None if there are none."""
+    non_empty_windows = [window for window in windows if window[0] < window[1]]
+    if not non_empty_windows:
+        return None
+
+    return min(window[0] for window in non_empty_windows), max(window[1] for window in non_empty_windows)
+
+
+def window_is_covered_by(window: HourWindow, hourly_quantities_list: List[ExplainableHourlyQuantities]) -> bool:
+    for hourly_quantities in hourly_quantities_list:
+        span = hour_span(hourly_quantities)
+        if not (span[0] <= window[0] and window[1] <= span[1]):
+            return False
+
+    return True
+
+
+@contextmanager
+def restricted_to_hour_window(hourly_quantities_list: List[ExplainableHourlyQuantities], window: HourWindow):
+    """Temporarily restrict hourly quantities to their hours within window, without copying their values. Objects
+    are modified in place so that update functions read them through the usual modeling object attributes."""
+    saved_states = []
+    try:
+        for hourly_quantities in {id(hourly): hourly for hourly in hourly_quantities_list}.values():
+            span = hour_span(hourly_quantities)
+            first_index = max(window[0], span[0]) - span[0]
+            last_index = max(min(window[1], span[1]) - span[0], first_index)
+            if hourly_quantities.is_compact:
+                windowed_value, windowed_compact_value = None, hourly_quantities.compact_value.window(
+                    first_index, last_index)
+            else:
+                windowed_value, windowed_compact_value = (
+                    read_only_view(hourly_quantities.value)[first_index:last_index], None)
+            saved_states.append((hourly_quantities, hourly_quantities._value, hourly_quantities.compact_value,
+                                 hourly_quantities.start_date))
+            window_origin_start_dates[id(hourly_quantities)] = hourly_quantities.start_date
+            hourly_quantities._value = windowed_value
+            hourly_quantities.compact_value = windowed_compact_value
+            hourly_quantities.start_date = hourly_quantities.start_date + timedelta(hours=first_index)
+        yield
+    finally:
+        for hourly_quantities, value, compact_value, start_date in reversed(saved_states):
+            hourly_quantities._value = value
+            hourly_quantities.compact_value = compact_value
+            hourly_quantities.start_date = start_date
+            del window_origin_start_dates[id(hourly_quantities)]
+
+
+def splice_hour_window(
+        previous: ExplainableHourlyQuantities, windowed: ExplainableHourlyQuantities, window: HourWindow) -> Quantity:
+    """Values of previous with the hours of window taken from windowed, in the unit of windowed."""
+    values = np.array(previous.operand_value.to(windowed.unit).magnitude, dtype=np.float32)
+    previous_start = hour_span(previous)[0]
+    windowed_start = hour_span(windowed)[0]
+    values[window[0] - previous_start:window[1] - previous_start] = windowed.operand_value.magnitude[
+        window[0] - windowed_start:window[1] - windowed_start]
+
+    return Quantity(values, windowed.unit)
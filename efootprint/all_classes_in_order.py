@@ -1,6 +1,6 @@
 from copy import copy
 
-from efootprint.builders.hardware.boavizta_cloud_server import BoaviztaCloudServer
+from efootprint.builders.external_apis.external_api_base_class import ExternalAPI, ExternalAPIServer
 from efootprint.builders.services.service_base_class import Service
 from efootprint.core.hardware.edge.edge_device import EdgeDevice
 from efootprint.core.hardware.edge.edge_device_group import EdgeDeviceGroup
@@ -8,21 +8,15 @@ from efootprint.core.hardware.edge.edge_component import EdgeComponent
 from efootprint.core.hardware.edge.edge_ram_component import EdgeRAMComponent
 from efootprint.core.hardware.edge.edge_cpu_component import EdgeCPUComponent
 from efootprint.core.hardware.edge.edge_workload_component import EdgeWorkloadComponent
-from efootprint.builders.hardware.edge.edge_appliance import EdgeAppliance, EdgeApplianceComponent
-from efootprint.builders.hardware.edge.edge_computer import EdgeComputer, EdgeComputerRAMComponent, EdgeComputerCPUComponent
 from efootprint.core.hardware.edge.edge_storage import EdgeStorage
 from efootprint.core.hardware.server_base import ServerBase
 from efootprint.core.usage.edge.edge_function import EdgeFunction
 from efootprint.core.usage.edge.recurrent_edge_component_need import RecurrentEdgeComponentNeed
 from efootprint.core.usage.edge.recurrent_edge_storage_need import RecurrentEdgeStorageNeed
-from efootprint.builders.usage.edge.recurrent_edge_process import (
-    RecurrentEdgeProcess, RecurrentEdgeProcessRAMNeed, RecurrentEdgeProcessCPUNeed,
-    RecurrentEdgeProcessStorageNeed)
 from efootprint.core.usage.edge.edge_usage_journey import EdgeUsageJourney
 from efootprint.core.usage.edge.edge_usage_pattern import EdgeUsagePattern
 from efootprint.core.usage.edge.recurrent_edge_device_need import RecurrentEdgeDeviceNeed
 from efootprint.core.usage.edge.recurrent_server_need import RecurrentServerNeed
-from efootprint.builders.usage.edge.recurrent_edge_workload import RecurrentEdgeWorkload, RecurrentEdgeWorkloadNeed
 from efootprint.core.usage.usage_journey_step import UsageJourneyStep
 from efootprint.core.usage.usage_journey import UsageJourney
 from efootprint.core.hardware.device import Device
@@ -31,43 +25,14 @@ from efootprint.core.usage.usage_pattern import UsagePattern
 from efootprint.core.hardware.storage import Storage
 from efootprint.core.hardware.gpu_server import GPUServer
 from efootprint.core.hardware.server import Server
-from efootprint.builders.services.video_streaming import VideoStreaming, VideoStreamingJob
-from efootprint.core.usage.job import Job, JobBase, GPUJob
+from efootprint.core.usage.job import JobBase
 from efootprint.core.hardware.network import Network
 from efootprint.core.system import System
-from efootprint.builders.external_apis.external_api_base_class import ExternalAPI, ExternalAPIServer
-from efootprint.builders.external_apis.ecologits.ecologits_external_api import (
-    EcoLogitsGenAIExternalAPIJob, EcoLogitsGenAIExternalAPI, EcoLogitsGenAIExternalAPIServer)
-from efootprint.builders.external_apis.ecologits.ecologits_video_external_api import (
-    EcoLogitsVideoGenExternalAPIJob, EcoLogitsVideoGenExternalAPI, EcoLogitsVideoGenExternalAPIServer)
-# Import timeseries so they get registered in ExplainableObject registry and can be parsed from json
-from efootprint.builders import timeseries
-
-
-SERVICE_CLASSES = [VideoStreaming]
-SERVICE_JOB_CLASSES = [VideoStreamingJob]
-EXTERNAL_API_SERVER_CLASSES = [EcoLogitsGenAIExternalAPIServer, EcoLogitsVideoGenExternalAPIServer]
-EXTERNAL_API_CLASSES = [EcoLogitsGenAIExternalAPI, EcoLogitsVideoGenExternalAPI]
-EXTERNAL_API_JOB_CLASSES = [EcoLogitsGenAIExternalAPIJob, EcoLogitsVideoGenExternalAPIJob]
+from efootprint.efootprint_class_registry import efootprint_classes_dict_from_class_names
+
+
 SERVER_CLASSES = [Server, GPUServer]
-SERVER_BUILDER_CLASSES = [BoaviztaCloudServer]
 EDGE_COMPONENT_CLASSES = [EdgeRAMComponent, EdgeCPUComponent, EdgeWorkloadComponent, EdgeStorage]
-EDGE_COMPUTER_COMPONENT_CLASSES = [EdgeComputerRAMComponent, EdgeComputerCPUComponent, EdgeApplianceComponent]
-RECURRENT_EDGE_COMPONENT_NEED_CLASSES = [
-    RecurrentEdgeComponentNeed, RecurrentEdgeProcessRAMNeed, RecurrentEdgeProcessCPUNeed,
-    RecurrentEdgeProcessStorageNeed, RecurrentEdgeWorkloadNeed]
-RECURRENT_EDGE_DEVICE_NEED_BUILDER_CLASSES = [RecurrentEdgeProcess, RecurrentEdgeWorkload]
-EDGE_DEVICE_BUILDER_CLASSES = [EdgeAppliance, EdgeComputer]
-
-
-ALL_EFOOTPRINT_CLASSES = (
-        [UsageJourneyStep, UsageJourney, Device, Country, UsagePattern]
-        + [EdgeUsageJourney, EdgeFunction, EdgeUsagePattern, RecurrentEdgeStorageNeed]
-        + EDGE_COMPONENT_CLASSES + EDGE_COMPUTER_COMPONENT_CLASSES + [EdgeDevice, EdgeDeviceGroup] + EDGE_DEVICE_BUILDER_CLASSES
-        + SERVICE_CLASSES + SERVER_BUILDER_CLASSES + EXTERNAL_API_CLASSES
-        + [Job, GPUJob] + [RecurrentEdgeDeviceNeed, RecurrentServerNeed] + RECURRENT_EDGE_COMPONENT_NEED_CLASSES
-        + RECURRENT_EDGE_DEVICE_NEED_BUILDER_CLASSES + SERVICE_JOB_CLASSES + EXTERNAL_API_JOB_CLASSES
-        + [Network] + SERVER_CLASSES + EXTERNAL_API_SERVER_CLASSES + [Storage, System])
 
 CANONICAL_COMPUTATION_ORDER = [
     Country,
@@ -78,9 +43,6 @@ CANONICAL_COMPUTATION_ORDER = [
     EdgeDeviceGroup, EdgeDevice, Service, JobBase, Network, ExternalAPI, ServerBase, ExternalAPIServer, Storage, System]
 
 ALL_CANONICAL_CLASSES_DICT = {cls.__name__: cls for cls in CANONICAL_COMPUTATION_ORDER}
-ALL_CONCRETE_EFOOTPRINT_CLASSES_DICT = {cls.__name__: cls for cls in ALL_EFOOTPRINT_CLASSES}
-ALL_EFOOTPRINT_CLASSES_DICT = copy(ALL_CONCRETE_EFOOTPRINT_CLASSES_DICT)
-ALL_EFOOTPRINT_CLASSES_DICT.update(ALL_CANONICAL_CLASSES_DICT)
 
 SANKEY_COLUMNS = [
     [System],
@@ -104,3 +66,51 @@ OBJECT_CATEGORIES = {
     "Devices": [Device],
     "EdgeDevices": [EdgeDevice],
 }
+
+
+def builder_class_lists():
+    """Class lists holding builder classes, which import EcoLogits, the Boavizta catalog… They are only built when
+    first accessed as module attributes (see __getattr__), so that importing this module stays cheap."""
+    all_efootprint_classes_dict = efootprint_classes_dict_from_class_names()
+
+    def classes(*class_names):
+        return [all_efootprint_classes_dict[class_name] for class_name in class_names]
+
+    all_concrete_efootprint_classes_dict = copy(all_efootprint_classes_dict)
+    all_efootprint_classes_dict_with_canonical_classes = copy(all_concrete_efootprint_classes_dict)
+    all_efootprint_classes_dict_with_canonical_classes.update(ALL_CANONICAL_CLASSES_DICT)
+
+    return {
+        "SERVICE_CLASSES": classes("VideoStreaming"),
+        "SERVICE_JOB_CLASSES": classes("VideoStreamingJob"),
+        "EXTERNAL_API_SERVER_CLASSES": classes(
+            "EcoLogitsGenAIExternalAPIServer", "EcoLogitsVideoGenExternalAPIServer"),
+        "EXTERNAL_API_CLASSES": classes("EcoLogitsGenAIExternalAPI", "EcoLogitsVideoGenExternalAPI"),
+        "EXTERNAL_API_JOB_CLASSES": classes("EcoLogitsGenAIExternalAPIJob", "EcoLogitsVideoGenExternalAPIJob"),
+        "SERVER_BUILDER_CLASSES": classes("BoaviztaCloudServer"),
+        "EDGE_COMPUTER_COMPONENT_CLASSES": classes(
+            "EdgeComputerRAMComponent", "EdgeComputerCPUComponent", "EdgeApplianceComponent"),
+        "RECURRENT_EDGE_COMPONENT_NEED_CLASSES": classes(
+            "RecurrentEdgeComponentNeed", "RecurrentEdgeProcessRAMNeed", "RecurrentEdgeProcessCPUNeed",
+            "RecurrentEdgeProcessStorageNeed", "RecurrentEdgeWorkloadNeed"),
+        "RECURRENT_EDGE_DEVICE_NEED_BUILDER_CLASSES": classes("RecurrentEdgeProcess", "RecurrentEdgeWorkload"),
+        "EDGE_DEVICE_BUILDER_CLASSES": classes("EdgeAppliance", "EdgeComputer"),
+        "ALL_EFOOTPRINT_CLASSES": list(all_efootprint_classes_dict.values()),
+        "ALL_CONCRETE_EFOOTPRINT_CLASSES_DICT": all_concrete_efootprint_classes_dict,
+        "ALL_EFOOTPRINT_CLASSES_DICT": all_efootprint_classes_dict_with_canonical_classes,
+    }
+
+
+BUILDER_CLASS_LIST_NAMES = [
+    "SERVICE_CLASSES", "SERVICE_JOB_CLASSES", "EXTERNAL_API_SERVER_CLASSES", "EXTERNAL_API_CLASSES",
+    "EXTERNAL_API_JOB_CLASSES", "SERVER_BUILDER_CLASSES", "EDGE_COMPUTER_COMPONENT_CLASSES",
+    "RECURRENT_EDGE_COMPONENT_NEED_CLASSES", "RECURRENT_EDGE_DEVICE_NEED_BUILDER_CLASSES",
+    "EDGE_DEVICE_BUILDER_CLASSES", "ALL_EFOOTPRINT_CLASSES", "ALL_CONCRETE_EFOOTPRINT_CLASSES_DICT",
+    "ALL_EFOOTPRINT_CLASSES_DICT"]
+
+
+def __getattr__(name):
+    if name in BUILDER_CLASS_LIST_NAMES:
+        globals().update(builder_class_lists())
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,5 @@
 from copy import copy
+from functools import lru_cache
 from inspect import _empty as empty_annotation, isabstract
 from types import UnionType
 from typing import List, get_origin, get_args
@@ -8,10 +9,14 @@ from efootprint.abstract_modeling_classes.explainable_object_dict import Explain
 
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
 from efootprint.abstract_modeling_classes.explainable_object_base_class import Source, explainable_object_from_json
-from efootprint.all_classes_in_order import ALL_EFOOTPRINT_CLASSES
+# Imported so that timeseries builders are registered in the ExplainableObject registry and can be parsed from json
+import efootprint.builders.timeseries
 from efootprint.api_utils.suppressed_efootprint_classes import ALL_SUPPRESSED_EFOOTPRINT_CLASSES_DICT
 from efootprint.constants.sources import Sources
+from efootprint.efootprint_class_registry import (
+    EFOOTPRINT_CLASS_IMPORT_PATHS, efootprint_classes_dict_from_class_names)
 from efootprint.logger import logger
+from efootprint.utils import profiling
 from efootprint.utils.tools import get_init_signature_params
 
 
@@ -54,13 +59,12 @@ def compute_classes_generation_order(efootprint_classes_dict):
     classes_generation_order = []
 
     def get_all_subclasses_names(efootprint_class, efootprint_classes_dict):
-        if isabstract(efootprint_class):
-            output = []
-            for efootprint_class_name_to_check, efootprint_class_to_check in efootprint_classes_dict.items():
-                if issubclass(efootprint_class_to_check, efootprint_class):
-                    output.append(efootprint_class_name_to_check)
-        else:
-            output = [efootprint_class.__name__]
+        # Concrete classes also count their subclasses, since an attribute annotated Server can hold a GPUServer
+        output = [] if isabstract(efootprint_class) else [efootprint_class.__name__]
+        for efootprint_class_name_to_check, efootprint_class_to_check in efootprint_classes_dict.items():
+            if (efootprint_class_to_check is not efootprint_class
+                    and issubclass(efootprint_class_to_check, efootprint_class)):
+                output.append(efootprint_class_name_to_check)
 
         return output
 
@@ -100,9 +104,10 @@ def compute_classes_generation_order(efootprint_classes_dict):
                 if issubclass(param_type, ModelingObject):
                     classes_needed_to_generate_current_class += (
                         get_all_subclasses_names(param_type, efootprint_classes_dict))
+            # Classes outside of efootprint_classes_dict have no object to generate first
             append_to_classes_generation_order = True
             for class_needed in classes_needed_to_generate_current_class:
-                if class_needed not in classes_generation_order:
+                if class_needed in classes_to_order_dict:
                     append_to_classes_generation_order = False
 
             if append_to_classes_generation_order:
@@ -113,7 +118,19 @@ def compute_classes_generation_order(efootprint_classes_dict):
 
     return classes_generation_order
 
-def upgrade_system_dict_to_current_version(system_dict, efootprint_classes_dict=None):
+
+@lru_cache(maxsize=None)
+def registered_classes_generation_order(class_names: frozenset) -> tuple:
+    """compute_classes_generation_order of the registered classes of class_names, memoized since systems of a same
+    kind hold the same classes."""
+    return tuple(compute_classes_generation_order(efootprint_classes_dict_from_class_names(class_names)))
+
+
+def upgrade_system_dict_to_current_version(system_dict, efootprint_classes_dict=None, in_place=False):
+    """Upgrade a system dict saved by an older major version of efootprint, and mark it with the current version.
+
+    The upgrade handlers run on a copy of system_dict that shares its hourly values with it (see copy_for_upgrade),
+    or on system_dict itself with in_place, for callers that don't use system_dict afterwards."""
     efootprint_version_key = "efootprint_version"
     json_efootprint_version = system_dict.get(efootprint_version_key, None)
     if json_efootprint_version is None:
@@ -123,13 +140,14 @@ def upgrade_system_dict_to_current_version(system_dict, efootprint_classes_dict=
     json_major_version = int(json_efootprint_version.split(".")[0])
     efootprint_major_version = int(efootprint.__version__.split(".")[0])
     if (json_major_version < efootprint_major_version) and json_major_version >= 9:
-        from copy import deepcopy
-        from efootprint.api_utils.version_upgrade_handlers import VERSION_UPGRADE_HANDLERS
+        from efootprint.api_utils.version_upgrade_handlers import VERSION_UPGRADE_HANDLERS, copy_for_upgrade
         if efootprint_classes_dict is None:
-            efootprint_classes_dict = {cls.__name__: cls for cls in ALL_EFOOTPRINT_CLASSES}
-        system_dict = deepcopy(system_dict)
+            efootprint_classes_dict = efootprint_classes_dict_from_class_names()
+        if not in_place:
+            system_dict = copy_for_upgrade(system_dict)
         for version in range(json_major_version, efootprint_major_version):
             system_dict = VERSION_UPGRADE_HANDLERS[version](system_dict, efootprint_classes_dict)
+        system_dict[efootprint_version_key] = efootprint.__version__
     elif json_major_version != efootprint_major_version:
         logger.warning(
             f"Warning: the version of the efootprint library used to generate the JSON file is "
@@ -139,6 +157,23 @@ def upgrade_system_dict_to_current_version(system_dict, efootprint_classes_dict=
     return system_dict
 
 
+def upgrade_system_json_file(input_filepath, output_filepath=None):
+    """Save the system saved in input_filepath upgraded to the current version of efootprint, to output_filepath
+    (input_filepath by default), so that later loads skip the upgrade. Returns whether the system needed an
+    upgrade; files already at the current version aren't rewritten."""
+    import json
+    with open(input_filepath, "rb") as file:
+        system_dict = json.load(file)
+    saved_version = system_dict.get("efootprint_version")
+    system_dict = upgrade_system_dict_to_current_version(system_dict, in_place=True)
+    needed_upgrade = system_dict.get("efootprint_version") != saved_version
+    if needed_upgrade or (output_filepath is not None and output_filepath != input_filepath):
+        with open(output_filepath or input_filepath, "w") as file:
+            json.dump(system_dict, file, indent=4)
+
+    return needed_upgrade
+
+
 def build_sources_dict_from_system_dict(system_dict):
     raw_sources = system_dict.get("Sources", {}) or {}
     sources_dict = {}
@@ -151,17 +186,31 @@ def build_sources_dict_from_system_dict(system_dict):
     return sources_dict
 
 
+@profiling.profiled(profiling.JSON_LOAD)
 def json_to_system(
-        system_dict, launch_system_computations=True, efootprint_classes_dict=None):
-    if efootprint_classes_dict is None:
-        efootprint_classes_dict = {modeling_object_class.__name__: modeling_object_class
-                                   for modeling_object_class in ALL_EFOOTPRINT_CLASSES}
-    classes_generation_order = compute_classes_generation_order(efootprint_classes_dict)
-    valid_class_keys = set(classes_generation_order) | set(ALL_SUPPRESSED_EFOOTPRINT_CLASSES_DICT)
+        system_dict, launch_system_computations=True, efootprint_classes_dict=None, lazy_hydration=False,
+        upgrade_in_place=False):
+    """Build the modeling objects of a system dict saved by system_to_json.
+
+    With lazy_hydration, the saved calculated attributes of systems saved with calculated attributes are only built
+    from their JSON the first time they are read, so that loading time scales with what is viewed rather than with
+    system size. Modeling objects and their inputs are still built at load.
+
+    Only the classes of the objects in system_dict are imported, unless efootprint_classes_dict is given. Systems saved
+    by older versions of efootprint are upgraded in place with upgrade_in_place, which saves a copy of system_dict when
+    the caller doesn't use it afterwards."""
+    valid_class_keys = set(efootprint_classes_dict or EFOOTPRINT_CLASS_IMPORT_PATHS) | set(
+        ALL_SUPPRESSED_EFOOTPRINT_CLASSES_DICT)
 
     validate_system_dict_structure(system_dict, valid_class_keys)
 
-    system_dict = upgrade_system_dict_to_current_version(system_dict, efootprint_classes_dict)
+    system_dict = upgrade_system_dict_to_current_version(
+        system_dict, efootprint_classes_dict, in_place=upgrade_in_place)
+    if efootprint_classes_dict is None:
+        efootprint_classes_dict = efootprint_classes_dict_from_class_names(system_dict.keys())
+        classes_generation_order = registered_classes_generation_order(frozenset(efootprint_classes_dict))
+    else:
+        classes_generation_order = compute_classes_generation_order(efootprint_classes_dict)
 
     sources_dict = build_sources_dict_from_system_dict(system_dict)
 
@@ -181,7 +230,7 @@ def json_to_system(
             new_obj, new_obj_expl_obj_dicts_to_create_after_objects_creation = current_class.from_json_dict(
                 system_dict[class_key][class_instance_key], flat_obj_dict, set_trigger_modeling_updates_to_true=False,
                 is_loaded_from_system_with_calculated_attributes=is_loaded_from_system_with_calculated_attributes,
-                sources_dict=sources_dict)
+                sources_dict=sources_dict, lazy_hydration=lazy_hydration)
 
             explainable_object_dicts_to_create_after_objects_creation.update(
                 new_obj_expl_obj_dicts_to_create_after_objects_creation)
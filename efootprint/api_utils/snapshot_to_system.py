@@ -0,0 +1,56 @@
+import json
+
+import numpy as np
+
+import efootprint
+from efootprint.api_utils.json_to_system import json_to_system
+from efootprint.api_utils.system_to_snapshot import (
+    SNAPSHOT_MAGIC, SNAPSHOT_HEADER_LENGTH_NB_BYTES, snapshot_blob_offset)
+
+
+def snapshot_to_system(snapshot_filepath, efootprint_classes_dict=None, lazy_hydration=False):
+    """Load a system written by system_to_snapshot, with the same outputs as json_to_system.
+
+    Hourly values are copy-on-write memory-mapped views into the snapshot file, only paged in when read, and
+    calculation graph keys come pre-parsed from the header node table. See json_to_system for lazy_hydration."""
+    with open(snapshot_filepath, "rb") as file:
+        magic = file.read(len(SNAPSHOT_MAGIC))
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{snapshot_filepath} is not an e-footprint system snapshot.")
+        header_length = int.from_bytes(file.read(SNAPSHOT_HEADER_LENGTH_NB_BYTES), "little")
+        header = json.loads(file.read(header_length))
+
+    snapshot_major_version = int(header["efootprint_version"].split(".")[0])
+    efootprint_major_version = int(efootprint.__version__.split(".")[0])
+    if snapshot_major_version != efootprint_major_version:
+        raise ValueError(
+            f"{snapshot_filepath} was written with efootprint {header['efootprint_version']} while the current "
+            f"version is {efootprint.__version__}. Snapshots aren’t upgraded across major versions, please "
+            f"regenerate it from a JSON export.")
+
+    hourly_values_offset_table = header["hourly_values_offset_table"]
+    nb_values_in_blob = sum(length for _, length in hourly_values_offset_table)
+    if nb_values_in_blob > 0:
+        blob = np.memmap(snapshot_filepath, dtype="<f4", mode="c", offset=snapshot_blob_offset(header_length),
+                         shape=(nb_values_in_blob,))
+    else:
+        blob = np.zeros(0, dtype=np.float32)
+    calculus_graph_nodes = [tuple(node) for node in header["calculus_graph_nodes"]]
+
+    def put_arrays_and_graph_keys_back_into_json(json_dict: dict):
+        for value in json_dict.values():
+            if isinstance(value, dict):
+                put_arrays_and_graph_keys_back_into_json(value)
+        for snapshot_key in ("snapshot_values", "snapshot_recurring_values"):
+            if snapshot_key in json_dict:
+                offset, length = hourly_values_offset_table[json_dict[snapshot_key]]
+                json_dict[snapshot_key] = blob[offset:offset + length]
+        for graph_key in ("direct_ancestors_with_id", "direct_children_with_id"):
+            if graph_key in json_dict:
+                json_dict[graph_key] = [calculus_graph_nodes[node_index] for node_index in json_dict[graph_key]]
+
+    system_dict = header["system_dict"]
+    put_arrays_and_graph_keys_back_into_json(system_dict)
+
+    return json_to_system(system_dict, launch_system_computations=False,
+                          efootprint_classes_dict=efootprint_classes_dict, lazy_hydration=lazy_hydration)
@@ -1,14 +1,21 @@
 import json
+from types import GeneratorType
+
+import orjson
 
 import efootprint
 from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
 from efootprint.abstract_modeling_classes.explainable_object_dict import ExplainableObjectDict
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.utils import profiling
 
 
 def recursively_write_json_dict(
         output_dict, mod_obj, save_calculated_attributes, deferred_linked_objects=None,
-        deferred_linked_object_ids=None, is_processing_deferred_links=False, sources_by_id=None):
+        deferred_linked_object_ids=None, is_processing_deferred_links=False, sources_by_id=None,
+        serialize_objects=True):
+    """Fill output_dict with the json of mod_obj and of the objects linked to it, by class. With serialize_objects set to
+    False, the objects themselves are stored instead of their json, in the same order."""
     owns_deferred_queue = deferred_linked_objects is None
     if deferred_linked_objects is None:
         deferred_linked_objects = []
@@ -17,7 +24,11 @@ def recursively_write_json_dict(
     if mod_obj_class not in output_dict:
         output_dict[mod_obj_class] = {}
     if mod_obj.id not in output_dict[mod_obj_class]:
-        output_dict[mod_obj_class][mod_obj.id] = mod_obj.to_json(save_calculated_attributes)
+        output_dict[mod_obj_class][mod_obj.id] = (
+            mod_obj.to_json(save_calculated_attributes) if serialize_objects else mod_obj)
+        if not serialize_objects and save_calculated_attributes:
+            # Hydrated calculated attributes can hold sources and link objects, as they do when serialized.
+            mod_obj.hydrate_calculated_attributes()
 
         def add_deferred_linked_object(candidate):
             if (
@@ -38,12 +49,13 @@ def recursively_write_json_dict(
                             sources_by_id.setdefault(elt.source.id, elt.source)
             if isinstance(value, ModelingObject):
                 recursively_write_json_dict(output_dict, value, save_calculated_attributes, deferred_linked_objects,
-                                            deferred_linked_object_ids, sources_by_id=sources_by_id)
+                                            deferred_linked_object_ids, sources_by_id=sources_by_id,
+                                            serialize_objects=serialize_objects)
             elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], ModelingObject):
                 for mod_obj_elt in value:
                     recursively_write_json_dict(output_dict, mod_obj_elt, save_calculated_attributes,
                                                 deferred_linked_objects, deferred_linked_object_ids,
-                                                sources_by_id=sources_by_id)
+                                                sources_by_id=sources_by_id, serialize_objects=serialize_objects)
             elif isinstance(value, ExplainableObjectDict):
                 for dict_key in value:
                     add_deferred_linked_object(dict_key)
@@ -56,12 +68,17 @@ def recursively_write_json_dict(
                 deferred_linked_object_ids.discard(next_obj.id)
                 recursively_write_json_dict(
                     output_dict, next_obj, save_calculated_attributes, deferred_linked_objects,
-                    deferred_linked_object_ids, is_processing_deferred_links=True, sources_by_id=sources_by_id)
+                    deferred_linked_object_ids, is_processing_deferred_links=True, sources_by_id=sources_by_id,
+                    serialize_objects=serialize_objects)
 
     return output_dict
 
 
+@profiling.profiled(profiling.JSON_SAVE, first_arg_is_profiled_object=True)
 def system_to_json(input_system, save_calculated_attributes, output_filepath=None, indent=4):
+    from efootprint.core.system import System
+    if save_calculated_attributes and isinstance(input_system, System):
+        input_system.materialize()
     output_dict = {"efootprint_version": efootprint.__version__}
     sources_by_id = {}
     recursively_write_json_dict(output_dict, input_system, save_calculated_attributes, sources_by_id=sources_by_id)
@@ -77,3 +94,63 @@ def system_to_json(input_system, save_calculated_attributes, output_filepath=Non
             file.write(json.dumps(output_dict, indent=indent))
 
     return output_dict
+
+
+def _write_json_object(write, items, encode, indent, separators, depth=1):
+    """Write the json object of the (key, value) pairs of items, values being either json serializable or generators of
+    (key, value) pairs written as nested objects."""
+    item_separator, key_separator = separators
+    newline = "" if indent is None else "\n"
+    padding = "" if indent is None else " " * (indent * depth)
+    nb_items = 0
+    write("{")
+    for key, value in items:
+        write((item_separator if nb_items else "") + newline + padding + encode(key) + key_separator)
+        if isinstance(value, GeneratorType):
+            _write_json_object(write, value, encode, indent, separators, depth + 1)
+        else:
+            write(encode(value).replace("\n", "\n" + padding) if newline else encode(value))
+        nb_items += 1
+    if nb_items:
+        write(newline + " " * (indent * (depth - 1)) if newline else "")
+    write("}")
+
+
+@profiling.profiled(profiling.JSON_SAVE, first_arg_is_profiled_object=True)
+def stream_system_to_json(input_system, save_calculated_attributes, output_filepath, indent=4,
+                          compatibility_mode=True):
+    """Write the json of system_to_json to output_filepath without building it in memory: objects are serialized
+    attribute by attribute (each hourly values array being compressed right before being written) and written
+    straight to the file, so that only the json of one attribute is held at a time.
+
+    In compatibility mode the file is identical to the one system_to_json writes with the same indent. Otherwise
+    values are encoded with orjson and without indentation, which is several times faster on systems with calculated
+    attributes. orjson writes NaN and infinite floats as null."""
+    from efootprint.core.system import System
+    if save_calculated_attributes and isinstance(input_system, System):
+        input_system.materialize()
+    objects_by_class = {}
+    sources_by_id = {}
+    recursively_write_json_dict(objects_by_class, input_system, save_calculated_attributes,
+                                sources_by_id=sources_by_id, serialize_objects=False)
+
+    def system_items():
+        yield "efootprint_version", efootprint.__version__
+        if sources_by_id:
+            yield "Sources", {sid: src.to_json() for sid, src in sorted(sources_by_id.items())}
+        for mod_obj_class, objects_by_id in objects_by_class.items():
+            yield mod_obj_class, (
+                (mod_obj_id, mod_obj.json_items(save_calculated_attributes))
+                for mod_obj_id, mod_obj in objects_by_id.items())
+
+    if compatibility_mode:
+        def encode(value):
+            return json.dumps(value, indent=indent)
+        indent_used, separators = indent, ((",", ": ") if indent is not None else (", ", ": "))
+    else:
+        def encode(value):
+            return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        indent_used, separators = None, (",", ":")
+
+    with open(output_filepath, "w") as file:
+        _write_json_object(file.write, system_items(), encode, indent_used, separators)
@@ -0,0 +1,81 @@
+import json
+from ast import literal_eval
+
+import numpy as np
+
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+from efootprint.abstract_modeling_classes.explainable_recurrent_quantities import parse_recurring_values
+from efootprint.api_utils.system_to_json import system_to_json
+
+# Snapshot layout: magic, header length (uint64 little-endian), compact JSON header, zero padding up to a
+# SNAPSHOT_BLOB_ALIGNMENT boundary, then all hourly values as one contiguous little-endian float32 blob.
+SNAPSHOT_MAGIC = b"EFPSNAP\x01"
+SNAPSHOT_HEADER_LENGTH_NB_BYTES = 8
+SNAPSHOT_BLOB_ALIGNMENT = 64
+
+
+def snapshot_blob_offset(header_length: int) -> int:
+    header_end = len(SNAPSHOT_MAGIC) + SNAPSHOT_HEADER_LENGTH_NB_BYTES + header_length
+    return -(-header_end // SNAPSHOT_BLOB_ALIGNMENT) * SNAPSHOT_BLOB_ALIGNMENT
+
+
+def system_to_snapshot(input_system, output_filepath):
+    """Write a system with its calculated attributes as a binary snapshot, to be loaded with snapshot_to_system.
+
+    The header is the system_to_json output saved with calculated attributes, where every hourly and recurring
+    values array is replaced by its index in an offset table into the float32 blob, and every calculation graph key
+    by its index in a table of (modeling object id, attribute name, key in dict) nodes."""
+    system_dict = system_to_json(input_system, save_calculated_attributes=True)
+    hourly_arrays = []
+    hourly_values_offset_table = []
+    calculus_graph_nodes = []
+    calculus_graph_node_indexes = {}
+    nb_values_in_blob = 0
+
+    def calculus_graph_node_index(key: str) -> int:
+        if key not in calculus_graph_node_indexes:
+            calculus_graph_node_indexes[key] = len(calculus_graph_nodes)
+            calculus_graph_nodes.append(list(literal_eval(key)))
+        return calculus_graph_node_indexes[key]
+
+    def move_array_to_blob(json_dict: dict, json_key: str, snapshot_key: str, array: np.ndarray):
+        nonlocal nb_values_in_blob
+        del json_dict[json_key]
+        json_dict[snapshot_key] = len(hourly_values_offset_table)
+        hourly_values_offset_table.append([nb_values_in_blob, len(array)])
+        hourly_arrays.append(array)
+        nb_values_in_blob += len(array)
+
+    def move_arrays_and_graph_keys_out_of_json(json_dict: dict):
+        for value in json_dict.values():
+            if isinstance(value, dict):
+                move_arrays_and_graph_keys_out_of_json(value)
+        if "compressed_values" in json_dict and "unit" in json_dict:
+            move_array_to_blob(json_dict, "compressed_values", "snapshot_values",
+                               ExplainableHourlyQuantities.decompress_values(json_dict["compressed_values"]))
+        elif "recurring_values" in json_dict and "unit" in json_dict:
+            move_array_to_blob(json_dict, "recurring_values", "snapshot_recurring_values",
+                               parse_recurring_values(json_dict["recurring_values"]))
+        for graph_key in ("direct_ancestors_with_id", "direct_children_with_id"):
+            if graph_key in json_dict:
+                json_dict[graph_key] = [calculus_graph_node_index(key) for key in json_dict[graph_key]]
+
+    move_arrays_and_graph_keys_out_of_json(system_dict)
+    header = {
+        "efootprint_version": system_dict["efootprint_version"],
+        "hourly_values_offset_table": hourly_values_offset_table,
+        "calculus_graph_nodes": calculus_graph_nodes,
+        "system_dict": system_dict,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    blob_offset = snapshot_blob_offset(len(header_bytes))
+
+    with open(output_filepath, "wb") as file:
+        file.write(SNAPSHOT_MAGIC)
+        file.write(len(header_bytes).to_bytes(SNAPSHOT_HEADER_LENGTH_NB_BYTES, "little"))
+        file.write(header_bytes)
+        file.write(b"\x00" * (blob_offset - file.tell()))
+        for hourly_array in hourly_arrays:
+            file.write(hourly_array.astype("<f4", copy=False).tobytes())
+
+    return output_filepath
@@ -7,6 +7,25 @@ from efootprint.constants.units import u
 from efootprint.logger import logger
 
 
+def _is_scalar_list(node):
+    return not node or not isinstance(node[0], (dict, list))
+
+
+def copy_for_upgrade(system_dict):
+    """Copy of system_dict that upgrade handlers can modify without modifying system_dict.
+
+    Handlers modify dicts in place but only ever replace lists of scalars (ids, hourly values), so dicts are copied
+    while lists of scalars are shared with system_dict. Hourly values, the bulk of saved systems, aren't copied."""
+    def _copy(node):
+        if isinstance(node, dict):
+            return {key: _copy(value) for key, value in node.items()}
+        if isinstance(node, list) and not _is_scalar_list(node):
+            return [_copy(item) for item in node]
+        return node
+
+    return _copy(system_dict)
+
+
 def rename_dict_key(d, old_key, new_key):
     if old_key not in d:
         raise KeyError(f"{old_key} not found in dictionary")
@@ -675,7 +694,7 @@ def upgrade_version_20_to_21(system_dict, efootprint_classes_dict=None):
                 node["source"] = _ensure_source_id(source_field["name"], source_field.get("link"))
             for value in node.values():
                 _walk(value)
-        elif isinstance(node, list):
+        elif isinstance(node, list) and not _is_scalar_list(node):
             for item in node:
                 _walk(item)
 
@@ -0,0 +1,134 @@
+"""Evaluation of many saved systems at once, e.g. nightly runs over a portfolio of customer models.
+
+``evaluate_many`` fans the system files out over a pool of worker processes, warmed once (classes imported, unit
+registry and Boavizta catalog loaded) before the pool forks them, and yields the result of each system as soon as it
+is computed. Each system is evaluated with the module-level state of the library reset to the state the worker
+started with, so that systems don't see each other's ids or memoized queries."""
+import gc
+import json
+import multiprocessing
+import os
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, Optional
+
+_initial_use_name_as_id_flags = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of the evaluation of one system file. Footprints are summed over the modeling period, in kg."""
+    path: str
+    system_name: Optional[str] = None
+    total_footprint: Optional[float] = None
+    energy_footprint_by_category: Dict[str, float] = field(default_factory=dict)
+    fabrication_footprint_by_category: Dict[str, float] = field(default_factory=dict)
+    saved_json_path: Optional[str] = None
+    duration: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def warm_worker():
+    """Load once what every system evaluation needs, so that forked workers share it and tasks don't pay for it."""
+    global _initial_use_name_as_id_flags
+    from efootprint.abstract_modeling_classes.explainable_object_base_class import Source
+    from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+    from efootprint.builders.hardware.boaviztapi_utils import boaviztapi_catalog_responses
+    from efootprint.constants.units import u
+    from efootprint.efootprint_class_registry import efootprint_classes_dict_from_class_names
+    import efootprint.api_utils.json_to_system
+    import efootprint.api_utils.system_to_json
+
+    efootprint_classes_dict_from_class_names()
+    boaviztapi_catalog_responses()
+    u.kg
+    _initial_use_name_as_id_flags = (ModelingObject._use_name_as_id, Source._use_name_as_id)
+
+
+def reset_global_state():
+    """Put the module-level state of the library back to the state it had when the worker was warmed."""
+    from efootprint.abstract_modeling_classes.calculation_graph_index import invalidate_calculation_graph_closures
+    from efootprint.abstract_modeling_classes.explainable_object_base_class import Source
+    from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+    from efootprint.abstract_modeling_classes.modeling_object_topology import invalidate_topology_memos
+    if _initial_use_name_as_id_flags is None:
+        warm_worker()
+    ModelingObject._use_name_as_id, Source._use_name_as_id = _initial_use_name_as_id_flags
+    invalidate_topology_memos()
+    invalidate_calculation_graph_closures()
+
+
+def evaluate_system_file(path: str, output_dir: Optional[str] = None) -> BatchResult:
+    """Load the system saved in path, compute it and read its footprints. With output_dir, the system is also saved
+    with its calculated attributes to output_dir, under the name of path."""
+    from efootprint.api_utils.json_to_system import json_to_system
+    from efootprint.api_utils.system_to_json import stream_system_to_json
+    from efootprint.constants.units import u
+    start = perf_counter()
+    reset_global_state()
+    try:
+        with open(path, "rb") as file:
+            system_dict = json.load(file)
+        class_obj_dict, _, _ = json_to_system(system_dict, upgrade_in_place=True)
+        system = next(iter(class_obj_dict["System"].values()))
+        energy_footprints = {category: footprint.to(u.kg).magnitude
+                             for category, footprint in system.total_energy_footprint_sum_over_period.items()}
+        fabrication_footprints = {category: footprint.to(u.kg).magnitude
+                                  for category, footprint in system.total_fabrication_footprint_sum_over_period.items()}
+        saved_json_path = None
+        if output_dir is not None:
+            saved_json_path = os.path.join(output_dir, os.path.basename(path))
+            stream_system_to_json(system, save_calculated_attributes=True, output_filepath=saved_json_path)
+        result = BatchResult(
+            path=path, system_name=system.name,
+            total_footprint=float(sum(energy_footprints.values()) + sum(fabrication_footprints.values())),
+            energy_footprint_by_category=energy_footprints,
+            fabrication_footprint_by_category=fabrication_footprints,
+            saved_json_path=saved_json_path, duration=perf_counter() - start)
+    except Exception:
+        result = BatchResult(path=path, duration=perf_counter() - start, error=traceback.format_exc())
+    finally:
+        reset_global_state()
+        gc.collect()
+
+    return result
+
+
+def evaluate_many(paths: Iterable[str], workers: Optional[int] = None,
+                  output_dir: Optional[str] = None) -> Iterator[BatchResult]:
+    """Evaluate the systems saved in paths and yield their BatchResult as they complete, in completion order.
+
+    workers defaults to the number of CPUs. With a single worker, systems are evaluated one after another in the
+    current process. Systems that fail to load or compute yield a BatchResult holding the traceback in error instead
+    of stopping the batch. See evaluate_system_file for output_dir, under which paths must have distinct file
+    names."""
+    paths = [str(path) for path in paths]
+    if output_dir is not None:
+        file_name_counts = Counter(os.path.basename(path) for path in paths)
+        duplicate_file_names = sorted(file_name for file_name, count in file_name_counts.items() if count > 1)
+        if duplicate_file_names:
+            raise ValueError(
+                f"Systems saved to {output_dir} are named after their input file, so inputs must have distinct file "
+                f"names, but {duplicate_file_names} appear several times.")
+        os.makedirs(output_dir, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    if workers == 1:
+        for path in paths:
+            yield evaluate_system_file(path, output_dir)
+        return
+
+    # Warming up the parent process before forking lets every worker inherit loaded classes and catalogs.
+    warm_worker()
+    mp_context = multiprocessing.get_context(
+        "fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=warm_worker) as executor:
+        futures = [executor.submit(evaluate_system_file, path, output_dir) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from typing import List
 
 from ecologits.electricity_mix_repository import electricity_mixes
@@ -21,8 +22,28 @@ from efootprint.builders.external_apis.external_api_base_class import ExternalAP
 from efootprint.builders.external_apis.external_api_job_base_class import ExternalAPIJob
 from efootprint.constants.units import u
 from efootprint.core.lifecycle_phases import LifeCyclePhases
+from efootprint.utils.tools import lazy_class_attribute
+
+
+@lru_cache(maxsize=1)
+def ecologits_models() -> ModelRepository:
+    """EcoLogits model repository, parsed from its JSON on first use rather than at import."""
+    return ModelRepository.from_json()
+
+
+@lru_cache(maxsize=4096)
+def _llm_impacts_dag_evaluation(**dag_inputs) -> dict:
+    return compute_llm_impacts_dag(**dag_inputs)
+
+
+def memoized_llm_impacts_dag(**dag_inputs) -> dict:
+    """compute_llm_impacts_dag results, evaluated once for every evaluation with the same numeric inputs (e.g. jobs
+    of different systems calling the same model with the same output token count). The model record only enters the
+    DAG through its parameter counts, throughput and time to first token, which are part of the inputs, so edits of
+    external API or job inputs give new keys and never read stale results. Each caller gets its own shallow copy of
+    the memoized result, so that changing it doesn't change the impacts of other jobs."""
+    return dict(_llm_impacts_dag_evaluation(**dag_inputs))
 
-models = ModelRepository.from_json()
 
 ecologits_source = Source("Ecologits", "https://github.com/genai-impact/ecologits")
 llm_impacts_function_source = Source(
@@ -66,19 +87,26 @@ class EcoLogitsGenAIExternalAPI(ExternalAPI):
         "model_name": SourceObject("claude-opus-4-5")
     }
 
-    sorted_provider_names = sorted(list(dict.fromkeys([model.provider.name for model in models.list_models()])))
-    list_values = {"provider": [SourceObject(provider_name) for provider_name in sorted_provider_names]}
+    @lazy_class_attribute
+    def sorted_provider_names(cls):
+        return sorted(list(dict.fromkeys([model.provider.name for model in ecologits_models().list_models()])))
+
+    @lazy_class_attribute
+    def list_values(cls):
+        return {"provider": [SourceObject(provider_name) for provider_name in cls.sorted_provider_names]}
 
     @staticmethod
     def generate_conditional_list_values(list_values):
         values = {}
         for provider in list_values["provider"]:
-            values[provider] = [SourceObject(model.name) for model in models.list_models()
+            values[provider] = [SourceObject(model.name) for model in ecologits_models().list_models()
                                 if model.provider.name == provider.value]
 
         return {"model_name": {"depends_on": "provider", "conditional_list_values": values}}
 
-    conditional_list_values = generate_conditional_list_values(list_values)
+    @lazy_class_attribute
+    def conditional_list_values(cls):
+        return cls.generate_conditional_list_values(cls.list_values)
 
     def __init__(self, name: str, provider: ExplainableObject, model_name: ExplainableObject):
         super().__init__(name=name)
@@ -98,7 +126,7 @@ class EcoLogitsGenAIExternalAPI(ExternalAPI):
 
 
     def _get_model_or_raise(self):
-        model = models.find_model(provider=self.provider.value, model_name=self.model_name.value)
+        model = ecologits_models().find_model(provider=self.provider.value, model_name=self.model_name.value)
         if model is None:
             raise ValueError(
                 f"Could not find model `{self.model_name.value}` for {self.provider.value} provider."
@@ -268,7 +296,7 @@ class EcoLogitsGenAIExternalAPIJob(ExternalAPIJob):
         """Cached EcoLogits impact dictionary for one call, computed from the model parameters, output token count, and grid carbon intensity. Subsequent updates extract individual fields from this dictionary."""
         datacenter_wue = mean_value_or_range(PROVIDER_CONFIG_MAP[self.external_api.provider.value].datacenter_wue)
 
-        impacts = compute_llm_impacts_dag(
+        impacts = memoized_llm_impacts_dag(
             model_active_parameter_count=self.external_api.model_active_params.value.magnitude,
             model_total_parameter_count=self.external_api.model_total_params.value.magnitude,
             output_token_count=self.output_token_count.value.magnitude,
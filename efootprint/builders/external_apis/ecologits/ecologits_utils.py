@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache
 
 from ecologits.impacts.llm import dag as llm_dag
 from ecologits.impacts.video import dag as video_dag
@@ -14,6 +15,7 @@ ECOLOGITS_LLM_DEPENDENCY_GRAPH = llm_dag._DAG__dependencies
 ECOLOGITS_VIDEO_DEPENDENCY_GRAPH = video_dag._DAG__dependencies
 
 
+@lru_cache(maxsize=None)
 def get_formula(dag, task_name: str) -> str:
     task = dag._DAG__tasks.get(task_name)
     task_code = inspect.getsource(task)
@@ -1,9 +1,6 @@
 from copy import deepcopy
-from time import perf_counter
 
 from efootprint.abstract_modeling_classes.explainable_dict import ExplainableDict
-
-start = perf_counter()
 from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject, Source
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
@@ -15,20 +12,25 @@ from efootprint.core.hardware.server import Server
 from efootprint.core.hardware.server_base import ServerTypes
 from efootprint.core.hardware.storage import Storage
 from efootprint.logger import logger
+from efootprint.utils.tools import lazy_class_attribute
+
+
+def get_all_boavizta_cloud_providers():
+    return [SourceObject(cloud_provider) for cloud_provider in call_boaviztapi(
+        "https://api.boavizta.org/v1/cloud/instance/all_providers")]
 
-boavizta_cloud_providers_request_result = call_boaviztapi(
-        "https://api.boavizta.org/v1/cloud/instance/all_providers")
-all_boavizta_cloud_providers = []
-for cloud_provider in boavizta_cloud_providers_request_result:
-    all_boavizta_cloud_providers.append(SourceObject(cloud_provider))
-instance_types_conditional_list_values_dict = {"depends_on": "provider", "conditional_list_values": {}}
-for cloud_provider in boavizta_cloud_providers_request_result:
-    provider_instance_types = call_boaviztapi(
-            f"https://api.boavizta.org/v1/cloud/instance/all_instances",
-            params={"provider": cloud_provider}
-    )
-    instance_types_conditional_list_values_dict["conditional_list_values"][SourceObject(cloud_provider)] = [
-        SourceObject(instance_type) for instance_type in provider_instance_types]
+
+def get_instance_types_conditional_list_values_dict():
+    instance_types_conditional_list_values_dict = {"depends_on": "provider", "conditional_list_values": {}}
+    for cloud_provider in call_boaviztapi("https://api.boavizta.org/v1/cloud/instance/all_providers"):
+        provider_instance_types = call_boaviztapi(
+                f"https://api.boavizta.org/v1/cloud/instance/all_instances",
+                params={"provider": cloud_provider}
+        )
+        instance_types_conditional_list_values_dict["conditional_list_values"][SourceObject(cloud_provider)] = [
+            SourceObject(instance_type) for instance_type in provider_instance_types]
+
+    return instance_types_conditional_list_values_dict
 
 
 class BoaviztaCloudServer(Server):
@@ -64,15 +66,20 @@ class BoaviztaCloudServer(Server):
         }
 
 
-    server_list_values = deepcopy(Server.list_values)
-    server_list_values.update({"provider": all_boavizta_cloud_providers})
+    # Provider and instance type catalogs are only looked up when list values are first needed, not at import
+    @lazy_class_attribute
+    def list_values(cls):
+        server_list_values = deepcopy(Server.list_values)
+        server_list_values.update({"provider": get_all_boavizta_cloud_providers()})
 
-    list_values = server_list_values
+        return server_list_values
 
-    server_conditional_list_values = deepcopy(Server.conditional_list_values)
-    server_conditional_list_values.update({"instance_type": instance_types_conditional_list_values_dict})
+    @lazy_class_attribute
+    def conditional_list_values(cls):
+        server_conditional_list_values = deepcopy(Server.conditional_list_values)
+        server_conditional_list_values.update({"instance_type": get_instance_types_conditional_list_values_dict()})
 
-    conditional_list_values = server_conditional_list_values
+        return server_conditional_list_values
 
     def __init__(
             self, name: str, provider: ExplainableObject, instance_type: ExplainableObject, server_type: ExplainableObject,
@@ -151,15 +158,14 @@ class BoaviztaCloudServer(Server):
             nb_vcpu * u.cpu_core, "Compute",
             left_parent=self.api_call_response, operator="data extraction from", source=self.api_call_response.source)
 
-logger.info(f"Imported BoaviztaCloudServer in {perf_counter() - start:.5f} seconds.")
-
 
 if __name__ == "__main__":
     from efootprint.abstract_modeling_classes.explainable_object_base_class import \
         retrieve_update_function_from_mod_obj_and_attr_name
 
-    for provider in all_boavizta_cloud_providers:
-        for instance_type in instance_types_conditional_list_values_dict["conditional_list_values"][provider]:
+    for provider in BoaviztaCloudServer.list_values["provider"]:
+        for instance_type in BoaviztaCloudServer.conditional_list_values["instance_type"]["conditional_list_values"][
+                provider]:
             try:
                 cloud_server = BoaviztaCloudServer(name=f"test_{provider}_{instance_type}",
                                     provider=SourceObject(provider.value), instance_type=SourceObject(instance_type.value),
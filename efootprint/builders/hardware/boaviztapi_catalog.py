@@ -0,0 +1,95 @@
+"""Refresh the Boavizta API catalog snapshot shipped with e-footprint:
+
+    python -m efootprint.builders.hardware.boaviztapi_catalog [--from-package-dependency] [--output PATH]
+
+The snapshot holds the responses of every catalog request e-footprint makes (cloud providers and their instance types,
+server archetypes and their configs) and of the impact requests of every cloud instance type and server archetype, so
+that imports and default objects never need the network.
+
+The shipped snapshot is generated with --from-package-dependency: its values come from the installed boaviztapi
+package, whose version is recorded in the snapshot metadata, rather than from api.boavizta.org."""
+import argparse
+from datetime import datetime, timezone
+
+import orjson
+import zstandard
+
+from efootprint.builders.hardware.boaviztapi_utils import (
+    BOAVIZTAPI_CATALOG_PATH, BOAVIZTAPI_CATALOG_FORMAT_VERSION, _make_cache_key, dumps_boaviztapi_response,
+    call_boaviztapi_from_web_request, call_boaviztapi_from_package_dependency)
+from efootprint.logger import logger
+
+CLOUD_PROVIDERS_URL = "https://api.boavizta.org/v1/cloud/instance/all_providers"
+CLOUD_INSTANCE_TYPES_URL = "https://api.boavizta.org/v1/cloud/instance/all_instances"
+CLOUD_INSTANCE_IMPACT_URL = "https://api.boavizta.org/v1/cloud/instance"
+SERVER_ARCHETYPES_URL = "https://api.boavizta.org/v1/server/archetypes"
+SERVER_ARCHETYPE_CONFIG_URL = "https://api.boavizta.org/v1/server/archetype_config"
+SERVER_IMPACT_URL = "https://api.boavizta.org/v1/server/"
+
+
+def generate_boaviztapi_catalog(from_package_dependency=False) -> dict:
+    def call(url, params=None):
+        # Params are copied because package dependency calls add their default criteria to them
+        params_copy = dict(params) if params is not None else None
+        if from_package_dependency:
+            return call_boaviztapi_from_package_dependency(url, params=params_copy)
+        return call_boaviztapi_from_web_request(url, params=params_copy)
+
+    responses = {}
+
+    def add_response(url, params=None, skip_errors=False):
+        try:
+            response = call(url, params)
+        except Exception as e:
+            if not skip_errors:
+                raise
+            logger.warning(f"Leaving {url} with params {params} out of the Boavizta API catalog: {e}")
+            return None
+        cache_key = _make_cache_key(url, "GET", params, None).decode("utf-8")
+        responses[cache_key] = dumps_boaviztapi_response(response).decode("utf-8")
+
+        return response
+
+    for cloud_provider in add_response(CLOUD_PROVIDERS_URL):
+        instance_types = add_response(CLOUD_INSTANCE_TYPES_URL, {"provider": cloud_provider})
+        logger.info(f"Adding {len(instance_types)} {cloud_provider} instance types to the Boavizta API catalog")
+        for instance_type in instance_types:
+            add_response(
+                CLOUD_INSTANCE_IMPACT_URL, {"provider": cloud_provider, "instance_type": instance_type},
+                skip_errors=True)
+    archetypes = add_response(SERVER_ARCHETYPES_URL)
+    logger.info(f"Adding {len(archetypes)} server archetypes to the Boavizta API catalog")
+    for archetype in archetypes:
+        add_response(SERVER_ARCHETYPE_CONFIG_URL, {"archetype": archetype}, skip_errors=True)
+        add_response(SERVER_IMPACT_URL, {"archetype": archetype}, skip_errors=True)
+
+    metadata = {
+        "format_version": BOAVIZTAPI_CATALOG_FORMAT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": "boaviztapi package" if from_package_dependency else "https://api.boavizta.org"}
+    if from_package_dependency:
+        from importlib.metadata import version
+        metadata["boaviztapi_version"] = version("boaviztapi")
+
+    return {"metadata": metadata, "responses": responses}
+
+
+def write_boaviztapi_catalog(catalog: dict, output_filepath=BOAVIZTAPI_CATALOG_PATH):
+    with open(output_filepath, "wb") as file:
+        file.write(zstandard.ZstdCompressor(level=19).compress(orjson.dumps(catalog, option=orjson.OPT_SORT_KEYS)))
+    logger.info(f"Wrote {len(catalog['responses'])} Boavizta API responses to {output_filepath}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh the Boavizta API catalog snapshot shipped with e-footprint.")
+    parser.add_argument(
+        "--from-package-dependency", action="store_true",
+        help="Compute responses with the boaviztapi package instead of requesting the web API.")
+    parser.add_argument("--output", default=BOAVIZTAPI_CATALOG_PATH, help="Path of the catalog file to write.")
+    args = parser.parse_args(argv)
+
+    write_boaviztapi_catalog(generate_boaviztapi_catalog(args.from_package_dependency), args.output)
+
+
+if __name__ == "__main__":
+    main()
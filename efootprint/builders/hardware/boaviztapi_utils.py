@@ -1,9 +1,12 @@
 import os
+import sqlite3
 import time
 from collections import OrderedDict
+from functools import lru_cache
 
 import orjson
 import requests
+import zstandard
 
 from efootprint.logger import logger
 
@@ -13,12 +16,28 @@ _BOAVIZTAPI_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
 _boaviztapi_cache = OrderedDict()
 _boaviztapi_cache_size_bytes = 0
 
+# Versioned snapshot of the Boavizta API catalog (cloud providers and instance types, server archetypes and their
+# configs) and of its impact responses, shipped with the package and refreshed with
+# python -m efootprint.builders.hardware.boaviztapi_catalog
+# The shipped snapshot is generated with --from-package-dependency, so its values come from the boaviztapi package
+# version recorded in its metadata, and may differ from what api.boavizta.org serves. Unlike the in-memory and disk
+# caches, its entries never expire: they change when the snapshot is refreshed.
+BOAVIZTAPI_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "boaviztapi_catalog.json.zst")
+BOAVIZTAPI_CATALOG_FORMAT_VERSION = 1
+# Persistent cache shared across processes, set to an empty string to disable it
+BOAVIZTAPI_DISK_CACHE_PATH_ENV_VAR = "EFOOTPRINT_BOAVIZTAPI_CACHE_PATH"
+
 
 def _make_cache_key(url, method, params, json_payload):
     cache_payload = {"url": url, "method": method, "params": params or {}, "json": json_payload}
     return orjson.dumps(cache_payload, option=orjson.OPT_SORT_KEYS, default=str)
 
 
+def dumps_boaviztapi_response(response) -> bytes:
+    # Responses computed by the boaviztapi package may hold numpy scalars
+    return orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 def _estimate_cache_entry_size(cache_key, value):
     try:
         value_bytes = len(orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str))
@@ -57,7 +76,90 @@ def _cache_set(cache_key, value):
     _boaviztapi_cache_size_bytes += entry_size
 
 
+@lru_cache(maxsize=1)
+def boaviztapi_catalog() -> dict:
+    """Shipped Boavizta API catalog snapshot, as {"metadata": {...}, "responses": {...}}. Empty if it is missing or of
+    another format version."""
+    empty_catalog = {"metadata": {}, "responses": {}}
+    if not os.path.isfile(BOAVIZTAPI_CATALOG_PATH):
+        return empty_catalog
+    with open(BOAVIZTAPI_CATALOG_PATH, "rb") as file:
+        catalog = orjson.loads(zstandard.ZstdDecompressor().decompress(file.read()))
+    catalog_format_version = catalog["metadata"]["format_version"]
+    if catalog_format_version != BOAVIZTAPI_CATALOG_FORMAT_VERSION:
+        logger.warning(
+            f"Ignoring Boavizta API catalog of format version {catalog_format_version}, expected "
+            f"{BOAVIZTAPI_CATALOG_FORMAT_VERSION}. Please refresh it.")
+        return empty_catalog
+
+    return catalog
+
+
+def boaviztapi_catalog_responses() -> dict:
+    """{cache key: JSON encoded response} of the shipped Boavizta API catalog snapshot. Responses are only decoded
+    when looked up."""
+    return boaviztapi_catalog()["responses"]
+
+
+def boaviztapi_disk_cache_path():
+    disk_cache_path = os.getenv(BOAVIZTAPI_DISK_CACHE_PATH_ENV_VAR)
+    if disk_cache_path is None:
+        cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        disk_cache_path = os.path.join(cache_home, "efootprint", "boaviztapi_cache.sqlite3")
+
+    return disk_cache_path or None
+
+
+def _connect_to_disk_cache(disk_cache_path):
+    os.makedirs(os.path.dirname(os.path.abspath(disk_cache_path)), exist_ok=True)
+    connection = sqlite3.connect(disk_cache_path, timeout=10)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS responses (key BLOB PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)")
+
+    return connection
+
+
+def _disk_cache_get(cache_key):
+    disk_cache_path = boaviztapi_disk_cache_path()
+    if disk_cache_path is None or not os.path.isfile(disk_cache_path):
+        return None
+    try:
+        connection = _connect_to_disk_cache(disk_cache_path)
+        try:
+            row = connection.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (cache_key, time.time())).fetchone()
+        finally:
+            connection.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Couldn’t read Boavizta API disk cache {disk_cache_path}: {e}")
+        return None
+
+    return orjson.loads(row[0]) if row is not None else None
+
+
+def _disk_cache_set(cache_key, value):
+    disk_cache_path = boaviztapi_disk_cache_path()
+    if disk_cache_path is None:
+        return
+    try:
+        connection = _connect_to_disk_cache(disk_cache_path)
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (cache_key, dumps_boaviztapi_response(value), time.time() + _BOAVIZTAPI_CACHE_TTL_SECONDS))
+        finally:
+            connection.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Couldn’t write to Boavizta API disk cache {disk_cache_path}: {e}")
+
+
 def call_boaviztapi(url, method="GET", params=None, json=None):
+    """Boavizta API response, looked up in turn in the in-memory cache, the shipped catalog snapshot and the disk cache
+    shared across processes, and only requested from the web API (or the boaviztapi package if it fails) on a miss.
+
+    Catalog snapshot responses come from the boaviztapi package rather than the web API and don't expire, so catalog
+    hits are logged with the source and generation date of the snapshot."""
     if os.getenv("USE_BOAVIZTAPI_PACKAGE"):
         return call_boaviztapi_from_package_dependency(url, method, params, json)
     cache_key = _make_cache_key(url, method, params, json)
@@ -65,15 +167,29 @@ def call_boaviztapi(url, method="GET", params=None, json=None):
     if cached_response is not None:
         logger.info(f"Fetched {method} {url} params {params} Boavizta API response from cache.")
         return cached_response
-    try:
-        response = call_boaviztapi_from_web_request(url, method, params, json)
+    catalog_response = boaviztapi_catalog_responses().get(cache_key.decode("utf-8"))
+    if catalog_response is not None:
+        catalog_metadata = boaviztapi_catalog()["metadata"]
+        logger.info(
+            f"Fetched {method} {url} params {params} Boavizta API response from catalog snapshot generated from "
+            f"{catalog_metadata.get('source')} on {catalog_metadata.get('generated_at')}.")
+        response = orjson.loads(catalog_response)
         _cache_set(cache_key, response)
         return response
+    disk_cached_response = _disk_cache_get(cache_key)
+    if disk_cached_response is not None:
+        logger.info(f"Fetched {method} {url} params {params} Boavizta API response from disk cache.")
+        _cache_set(cache_key, disk_cached_response)
+        return disk_cached_response
+    try:
+        response = call_boaviztapi_from_web_request(url, method, params, json)
     except Exception as e:
         logger.warning(f"Boavizta API call failed with error {e}. Trying to call Boavizta API via package dependency.")
         response = call_boaviztapi_from_package_dependency(url, method, params, json)
-        _cache_set(cache_key, response)
-        return response
+    _cache_set(cache_key, response)
+    _disk_cache_set(cache_key, response)
+
+    return response
 
 
 def call_boaviztapi_from_web_request(url, method="GET", params=None, json=None):
@@ -4,6 +4,7 @@ from typing import List, TYPE_CHECKING
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.abstract_modeling_classes.modeling_object_topology import topology_memoized
 from efootprint.utils.tools import get_init_signature_params
 
 if TYPE_CHECKING:
@@ -70,6 +71,7 @@ class Service(ModelingObject):
         return [self.server] + self.jobs
 
     @property
+    @topology_memoized
     def systems(self) -> List:
         return self.server.systems
 
@@ -2,8 +2,9 @@ from copy import deepcopy, copy
 from datetime import datetime
 from typing import Literal
 import numpy as np
-from pint import Quantity
-from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+from efootprint.abstract_modeling_classes.compact_hourly_quantities import RunLengthHourlyQuantities
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities, \
+    read_only_view
 from efootprint.abstract_modeling_classes.explainable_object_base_class import Source, ExplainableObject
 from efootprint.constants.units import u
 
@@ -16,7 +17,8 @@ class ExplainableHourlyQuantitiesFromFormInputs(ExplainableHourlyQuantities):
     - start_date, modeling_duration, initial_volume, net_growth_rate
 
     Stores form inputs in JSON so they can be edited later.
-    Computes timeseries lazily when .value is first accessed.
+    Holds the timeseries as a compact daily-step series computed from the form inputs, only materialized when .value
+    is first accessed.
     """
 
     @classmethod
@@ -39,11 +41,9 @@ class ExplainableHourlyQuantitiesFromFormInputs(ExplainableHourlyQuantities):
         """
         self.form_inputs = form_inputs
 
-        # Don't compute value yet - will be computed lazily
-        # Initialize parent with None value, will be computed in property
         super().__init__(
-            value={}, start_date=datetime.strptime(form_inputs["start_date"], "%Y-%m-%d"),
-            label=label, left_parent=left_parent,
+            value=self._compute_hourly_timeseries(),
+            start_date=datetime.strptime(form_inputs["start_date"], "%Y-%m-%d"), label=label, left_parent=left_parent,
             right_parent=right_parent, operator=operator, source=source,
             confidence=confidence, comment=comment
         )
@@ -52,21 +52,25 @@ class ExplainableHourlyQuantitiesFromFormInputs(ExplainableHourlyQuantities):
 
     @property
     def value(self):
-        """Lazy computation of hourly timeseries from form inputs."""
-        if self._value is None:
-            self._value = self._compute_hourly_timeseries()
+        """Lazy materialization of hourly timeseries from form inputs."""
+        if self.is_compact:
+            self._value = self.compact_value.to_quantity()
+            self.compact_value = None
 
         return self._value
 
     @value.setter
     def value(self, new_value):
         self._value = new_value
+        self.compact_value = None
 
     @value.deleter
     def value(self):
+        """Drop the materialized values, going back to the compact series computed from the form inputs."""
         self._value = None
+        self.compact_value = self._compute_hourly_timeseries()
 
-    def _compute_hourly_timeseries(self) -> Quantity:
+    def _compute_hourly_timeseries(self) -> RunLengthHourlyQuantities:
         """
         Compute hourly timeseries from form inputs using exponential growth.
         Logic adapted from TimeseriesForm.generate_hourly_starts().
@@ -102,10 +106,8 @@ class ExplainableHourlyQuantitiesFromFormInputs(ExplainableHourlyQuantities):
         days = np.arange(num_days)
         daily_values = first_daily_volume * (daily_growth_rate ** days)
 
-        # Convert to hourly values (constant within each day)
-        hourly_values = np.repeat(daily_values / 24, 24).astype(np.float32)
-
-        return Quantity(hourly_values, volume_unit)
+        # Hourly values are constant within each day
+        return RunLengthHourlyQuantities.daily_steps(daily_values / 24, volume_unit)
 
     def to_json(self, save_calculated_attributes=False):
         output_dict = {"form_inputs": self.form_inputs}
@@ -118,3 +120,9 @@ class ExplainableHourlyQuantitiesFromFormInputs(ExplainableHourlyQuantities):
         return ExplainableHourlyQuantitiesFromFormInputs(
             deepcopy(self.form_inputs), label=copy(self.label), source=copy(self.source),
             confidence=self.confidence, comment=self.comment)
+
+    def copy_sharing_value(self):
+        value_copy = copy(self)
+        value_copy.value = read_only_view(self.value)
+
+        return value_copy
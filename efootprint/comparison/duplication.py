@@ -1,9 +1,8 @@
 import uuid
 
+from efootprint.abstract_modeling_classes.graph_clone import clone_system
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
 from efootprint.abstract_modeling_classes.utils import css_escape
-from efootprint.api_utils.json_to_system import json_to_system
-from efootprint.api_utils.system_to_json import system_to_json
 
 
 def assign_fresh_system_id(system) -> "System":
@@ -24,11 +23,8 @@ def assign_fresh_system_id(system) -> "System":
 def duplicate_system(system) -> "System":
     """Return a deep copy of ``system`` with a fresh System id and every object id preserved.
 
-    Serialize→deserialize round-trip: the JSON carries the original ids, so the copy's objects keep them
-    (which lets the comparison diff pair objects by identity), and only the System gets a new id.
+    In-memory graph clone (see ``graph_clone.clone_system``): the copy's objects keep the original ids (which lets
+    the comparison diff pair objects by identity) and its calculated attributes, so nothing is serialized or
+    recomputed, and only the System gets a new id. Hourly arrays are shared with the original as read-only views.
     """
-    system_dict = system_to_json(system, save_calculated_attributes=False)
-    class_obj_dict, _, _ = json_to_system(system_dict)
-    duplicated_system = next(iter(class_obj_dict["System"].values()))
-
-    return assign_fresh_system_id(duplicated_system)
+    return assign_fresh_system_id(clone_system(system))
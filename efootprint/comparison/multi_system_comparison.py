@@ -0,0 +1,240 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
+from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.all_classes_in_order import OBJECT_CATEGORIES
+from efootprint.comparison.system_comparison import (
+    PHASES, SystemComparison, _attribute_value_str, _count_value_str)
+from efootprint.constants.units import u
+from efootprint.utils.plot_baseline_and_simulation_data import get_time_axis
+
+CATEGORIES = tuple(OBJECT_CATEGORIES)
+
+
+@dataclass(frozen=True)
+class StackedTimeSeries:
+    """Hourly footprints (kg) of N systems on one shared calendar axis, as a (system × category × phase × hour)
+    array. Categories follow ``CATEGORIES`` and phases ``PHASES``; hours outside a system's modeling
+    period are zero."""
+    start_date: Optional[datetime]
+    values: np.ndarray
+
+    @property
+    def hours(self) -> np.ndarray:
+        return get_time_axis(self.start_date, self.values.shape[-1])
+
+    @property
+    def totals(self) -> np.ndarray:
+        """(system × hour) total footprints."""
+        return self.values.sum(axis=(1, 2))
+
+    @property
+    def phase_totals(self) -> np.ndarray:
+        """(system × phase × hour) footprints summed over categories."""
+        return self.values.sum(axis=1)
+
+    @property
+    def cumulative(self) -> np.ndarray:
+        return np.cumsum(self.totals, axis=-1)
+
+
+@dataclass(frozen=True)
+class MultiAttributeDiff:
+    """One input attribute of objects paired across systems whose value isn't the same in every system holding
+    the object. Tuples have one element per system, ``None`` where the system doesn't hold the object or
+    attribute."""
+    object_class: str
+    object_names: Tuple[Optional[str], ...]
+    attribute: str
+    values: Tuple[Optional[str], ...]
+    sources: Tuple[Optional[str], ...]
+    confidences: Tuple[Optional[str], ...]
+
+
+@dataclass(frozen=True)
+class ObjectPresence:
+    """An object held by some of the systems only."""
+    object_class: str
+    object_name: str
+    object_id: str
+    present_in: Tuple[bool, ...]
+
+
+@dataclass(frozen=True)
+class MultiInputDiff:
+    changed: List[MultiAttributeDiff]
+    partially_present: List[ObjectPresence]
+
+
+def _same_input(value_a, value_b) -> bool:
+    if value_a is None or value_b is None:
+        return value_a is None and value_b is None
+    return value_a == value_b
+
+
+class _PairedObject:
+    """Objects of the compared systems standing for the same modeling object, paired id-first then by (name, type)
+    as in SystemComparison."""
+    def __init__(self, nb_systems: int):
+        self.members: List[Optional[ModelingObject]] = [None] * nb_systems
+
+    @property
+    def reference(self) -> ModelingObject:
+        return next(member for member in self.members if member is not None)
+
+    @property
+    def present_in(self) -> Tuple[bool, ...]:
+        return tuple(member is not None for member in self.members)
+
+
+class MultiSystemComparison:
+    """Comparison of N e-footprint {class:System}s at once, e.g. 20 design alternatives of a same service.
+
+    Reads the per-category hourly footprints each system already exposes once, places all of them on one shared
+    hourly axis in a single allocation (``time_series``), derives the (system × category × phase) totals from the
+    same array, and pairs the objects of all systems once for an N-way ``input_diff``, instead of running and
+    realigning the N² pairwise {class:SystemComparison}s. ``pairwise(i, j)`` still gives the two-system view."""
+
+    def __init__(self, systems: List):
+        if len(systems) < 2:
+            raise ValueError("MultiSystemComparison needs at least two systems.")
+        self.systems = list(systems)
+
+    @property
+    def system_names(self) -> List[str]:
+        return [system.name for system in self.systems]
+
+    def pairwise(self, index_a: int, index_b: int) -> SystemComparison:
+        return SystemComparison(self.systems[index_a], self.systems[index_b])
+
+    @cached_property
+    def time_series(self) -> StackedTimeSeries:
+        phase_footprints_per_system = [
+            {"energy": system.total_energy_footprints, "fabrication": system.total_fabrication_footprints}
+            for system in self.systems]
+        series = []
+        for system_index, phase_footprints in enumerate(phase_footprints_per_system):
+            for phase_index, phase in enumerate(PHASES):
+                for category_index, category in enumerate(CATEGORIES):
+                    footprint = phase_footprints[phase].get(category, EmptyExplainableObject())
+                    if not isinstance(footprint, EmptyExplainableObject):
+                        series.append((system_index, category_index, phase_index, footprint.start_date,
+                                       footprint.value.to(u.kg).magnitude))
+
+        axis_start = min((start_date for _, _, _, start_date, _ in series), default=None)
+        axis_end = max((start_date + timedelta(hours=len(magnitude)) for _, _, _, start_date, magnitude in series),
+                       default=axis_start)
+        axis_length = int((axis_end - axis_start).total_seconds() // 3600) if series else 0
+
+        values = np.zeros((len(self.systems), len(CATEGORIES), len(PHASES), axis_length), dtype=np.float32)
+        for system_index, category_index, phase_index, start_date, magnitude in series:
+            offset = int((start_date - axis_start).total_seconds() // 3600)
+            values[system_index, category_index, phase_index, offset:offset + len(magnitude)] = magnitude
+
+        return StackedTimeSeries(start_date=axis_start, values=values)
+
+    @property
+    def totals_by_category_and_phase(self) -> np.ndarray:
+        """(system × category × phase) footprints summed over the modeling period, in kg."""
+        return self.time_series.values.sum(axis=-1, dtype=np.float64)
+
+    @property
+    def totals(self) -> np.ndarray:
+        """(system) total footprints summed over the modeling period, in kg."""
+        return self.totals_by_category_and_phase.sum(axis=(1, 2))
+
+    def deltas_from(self, baseline_index: int = 0) -> np.ndarray:
+        """(system × category × phase) differences with the baseline system, in kg."""
+        totals = self.totals_by_category_and_phase
+        return totals - totals[baseline_index]
+
+    def _paired_objects(self) -> List[_PairedObject]:
+        paired_objects = []
+        by_id = {}
+        by_name_type = {}
+        for system_index, system in enumerate(self.systems):
+            for obj in system.all_linked_objects:
+                paired_object = by_id.get(obj.id) or by_name_type.get((obj.name, obj.efootprint_class))
+                if paired_object is None or paired_object.members[system_index] is not None:
+                    paired_object = _PairedObject(len(self.systems))
+                    paired_objects.append(paired_object)
+                paired_object.members[system_index] = obj
+                by_id.setdefault(obj.id, paired_object)
+                by_name_type.setdefault((obj.name, obj.efootprint_class), paired_object)
+
+        return paired_objects
+
+    @staticmethod
+    def _comparable_inputs(obj: ModelingObject, is_member_kept) -> Dict[str, Tuple[object, Optional[str]]]:
+        """{attribute label: (comparable value, displayed value)} of the object's inputs: its explainable inputs,
+        one count per dict relationship key and one presence per list relationship element. Relationship members
+        that aren't kept (not held by every system holding obj) are left to their presence row."""
+        inputs = {attribute: (value, _attribute_value_str(value))
+                  for attribute, value in SystemComparison._input_attributes(obj).items()}
+        for attribute, dict_input in SystemComparison._dict_input_attributes(obj).items():
+            weight_label = obj.weight_labels.get(attribute, attribute)
+            for key, count in dict_input.items():
+                if is_member_kept(key):
+                    count_str = _count_value_str(count)
+                    inputs[f"{weight_label} ({getattr(key, 'name', str(key))})"] = (count_str, count_str)
+        for attribute, list_input in SystemComparison._list_input_attributes(obj).items():
+            for element in list_input:
+                if is_member_kept(element):
+                    inputs[f"{attribute} ({element.name})"] = ("present", "present")
+
+        return inputs
+
+    @property
+    def input_diff(self) -> MultiInputDiff:
+        paired_objects = self._paired_objects()
+        paired_object_by_id = {}
+        for paired_object in paired_objects:
+            for member in paired_object.members:
+                if member is not None:
+                    paired_object_by_id[member.id] = paired_object
+
+        changed = []
+        for paired_object in paired_objects:
+            def is_member_kept(member):
+                if not isinstance(member, ModelingObject) or member.id not in paired_object_by_id:
+                    return True
+                member_present_in = paired_object_by_id[member.id].present_in
+                return all(member_present_in[index] for index, present in enumerate(paired_object.present_in)
+                           if present)
+
+            inputs_per_system = [
+                self._comparable_inputs(member, is_member_kept) if member is not None else None
+                for member in paired_object.members]
+            attributes = list(dict.fromkeys(
+                attribute for inputs in inputs_per_system if inputs is not None for attribute in inputs))
+            for attribute in attributes:
+                held_values = [inputs.get(attribute, (None, None))[0] for inputs in inputs_per_system
+                               if inputs is not None]
+                if all(_same_input(held_values[0], value) for value in held_values[1:]):
+                    continue
+                explainables = [inputs.get(attribute, (None, None))[0] if inputs is not None else None
+                                for inputs in inputs_per_system]
+                changed.append(MultiAttributeDiff(
+                    object_class=paired_object.reference.class_as_simple_str,
+                    object_names=tuple(member.name if member is not None else None
+                                       for member in paired_object.members),
+                    attribute=attribute,
+                    values=tuple(inputs.get(attribute, (None, None))[1] if inputs is not None else None
+                                 for inputs in inputs_per_system),
+                    sources=tuple(getattr(getattr(value, "source", None), "name", None)
+                                  if isinstance(value, ExplainableObject) else None for value in explainables),
+                    confidences=tuple(getattr(value, "confidence", None)
+                                      if isinstance(value, ExplainableObject) else None for value in explainables)))
+
+        partially_present = [
+            ObjectPresence(paired_object.reference.class_as_simple_str, paired_object.reference.name,
+                           paired_object.reference.id, paired_object.present_in)
+            for paired_object in paired_objects if not all(paired_object.present_in)]
+
+        return MultiInputDiff(changed=changed, partially_present=partially_present)
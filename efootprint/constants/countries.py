@@ -1,6 +1,7 @@
 from copy import copy
 import csv
 import os
+from functools import lru_cache
 
 import pytz
 
@@ -25,7 +26,9 @@ def country_generator(country_name, country_short_name, country_avg_carbon_int,
     return return_country
 
 
-def country_generator_from_csv(country_name):
+@lru_cache(maxsize=None)
+def country_data_from_csv(country_name):
+    # Read on first use of a country rather than for every country at import
     with open(countries_data_file, newline="", encoding="utf-8") as f:
         countries_data_dict = csv.DictReader(f)
         for row in countries_data_dict:
@@ -39,7 +42,15 @@ def country_generator_from_csv(country_name):
                 timezone = tz(row["Timezone"])
                 break
 
-    return country_generator(country_name, country_short_name, copy(country_carbon_int), copy(timezone))
+    return country_short_name, country_carbon_int, timezone
+
+
+def country_generator_from_csv(country_name):
+    def return_country():
+        country_short_name, country_carbon_int, timezone = country_data_from_csv(country_name)
+        return Country(country_name, country_short_name, copy(country_carbon_int), copy(timezone))
+
+    return return_country
 
 
 class Countries:
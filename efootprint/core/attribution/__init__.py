@@ -11,24 +11,38 @@ operation — group atoms by a key and sum:
 - exclude a source          = filter its atoms out (no rescale)
 - conservation              = Σ(atoms of a stream) == that stream's footprint   (structural)
 
+Every fold runs on the system's atoms PACKED once per phase (``packed_atoms``): distinct chain nodes
+get integer indexes, chains become an integer matrix, and each atom is reduced once to its kg period total
+and its kg hourly array — so groupings are ``bincount``-style reductions instead of per-atom dict and
+explainable arithmetic.
+
 Caching is two-tier, matching what depends on what: atom values depend only on (source, phase) —
-memoized at that key — while groupings depend on the query, so folded results are memoized per
-(phase, visible levels, exclude). Both tiers live in each owner's ``render_cache`` (a flushed
-cached property), never as model state: they are wiped wholesale by the system-wide
-cached-property flush after every ModelingUpdate and after the initial build.
+memoized at that key, and packed per (system, phase) — while groupings depend on the query, so folded
+results are memoized per (phase, visible levels, exclude). Both tiers live in each owner's ``render_cache`` (a flushed
+cached property), never as model state. Each memo records the attributes and memos it reads
+(``projection_reads``): a ModelingUpdate only flushes the memos reading a replaced attribute, and those reading
+them, so the atoms of untouched sources stay warm. Updates changing links between modeling objects and the initial
+build wipe them wholesale with the system-wide cached-property flush.
 
 Invariant: calculated attributes never read attribution results — the one-way rule that makes
-wholesale lazy flushing correct.
+lazy flushing correct.
 """
 import inspect
 from dataclasses import dataclass
 from functools import wraps
-from itertools import pairwise
 
+import numpy as np
+
+from efootprint.abstract_modeling_classes.columnar_hourly_store import utc_hour_index
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.abstract_modeling_classes.projection_reads import (
+    note_projection_read, recording_attribute_reads, store_projection_reads)
 from efootprint.constants.units import u
 from efootprint.core.lifecycle_phases import LifeCyclePhases
+from efootprint.utils import profiling
 
 
 @dataclass(frozen=True, eq=False)
@@ -51,6 +65,10 @@ class Atom:
     recn: ModelingObject = None
     redn: ModelingObject = None
 
+    @property
+    def journey(self):
+        return self.up.usage_journey if hasattr(self.up, "usage_journey") else self.up.edge_usage_journey
+
     def chain(self):
         """Ordered nodes this atom climbs through, source-ward -> System-ward.
 
@@ -59,10 +77,8 @@ class Atom:
         device cell      : [source, step, up.usage_journey, up, up.country]
         edge device cell : [source, recn, redn, ef, up.edge_usage_journey, up, up.country]
         """
-        journey = (self.up.usage_journey if hasattr(self.up, "usage_journey")
-                   else self.up.edge_usage_journey)
         nodes = (self.source, self.job, self.recn, self.rsn, self.redn, self.ef, self.step,
-                 journey, self.up, self.up.country)
+                 self.journey, self.up, self.up.country)
 
         return [node for node in nodes if node is not None]
 
@@ -73,7 +89,8 @@ def _hashable(arg):
 
 def flushed_memo(func):
     """Memoize on the first argument's ``render_cache`` — the per-ModelingObject scratch dict wiped by the
-    system-wide cached-property flush — keyed by function name + remaining (hashable) args."""
+    system-wide cached-property flush — keyed by function name + remaining (hashable) args. The attributes and
+    memos each computation reads are recorded, so that modeling updates only flush the memos they affect."""
     signature = inspect.signature(func)
 
     @wraps(func)
@@ -84,7 +101,11 @@ def flushed_memo(func):
         cache = cache_owner.render_cache
         key = (func.__name__, *normalized_args)
         if key not in cache:
-            cache[key] = func(cache_owner, *normalized_args)
+            with profiling.profiled_phase(profiling.ATTRIBUTION_FOLD, func.__name__, cache_owner), \
+                    recording_attribute_reads() as reads:
+                cache[key] = func(cache_owner, *normalized_args)
+            store_projection_reads(cache_owner, key, reads)
+        note_projection_read(cache_owner, key)
         return cache[key]
 
     return wrapper
@@ -111,32 +132,174 @@ def atoms(system, phase, exclude: tuple = ()):
         yield from atoms_of(source, phase)
 
 
+@dataclass(frozen=True, eq=False)
+class PackedAtoms:
+    """A system's atoms for one phase, packed for grouped reductions.
+
+    ``chains`` holds, per atom, the integer indexes in ``nodes`` of its ``chain()`` (padded with -1), so that
+    level membership is tested once per distinct node and folds are vectorized over atoms. Hourly arrays stay
+    per atom (a dense atoms x hours matrix would weigh gigabytes on multi-year systems): hourly folds add them
+    into one matrix row per group."""
+    atoms: tuple
+    nodes: tuple
+    chains: np.ndarray  # (nb atoms, max chain length) int node indexes, -1 padded
+    source_node_indexes: np.ndarray
+    totals_kg: np.ndarray  # float64 period total of each atom
+    hourly_values_kg: tuple  # float32 kg array of each atom, None for empty atoms
+    start_hours: np.ndarray  # UTC hour index of each atom's first value
+
+    def node_mask(self, node_filter) -> np.ndarray:
+        """Boolean mask over node indexes, with a trailing False entry so that -1 padding indexes it."""
+        return np.array([node_filter(node) for node in self.nodes] + [False], dtype=bool)
+
+    def included_atom_indexes(self, exclude: tuple) -> np.ndarray:
+        if not exclude:
+            return np.arange(len(self.atoms))
+        excluded_nodes = self.node_mask(lambda node: isinstance(node, exclude))
+        return np.flatnonzero(~excluded_nodes[self.source_node_indexes])
+
+    def first_node_at_level(self, atom_indexes: np.ndarray, level) -> tuple:
+        """(atom indexes, node indexes) of the atoms that have a chain node at ``level``, with that node."""
+        chains = self.chains[atom_indexes]
+        level_mask = self.node_mask(lambda node: isinstance(node, level))[chains]
+        has_node_at_level = level_mask.any(axis=1)
+        first_positions = level_mask.argmax(axis=1)[has_node_at_level]
+        return atom_indexes[has_node_at_level], chains[has_node_at_level, first_positions]
+
+    def hourly_sums(self, atom_indexes: np.ndarray, group_keys: list) -> dict:
+        """{group key: kg ExplainableHourlyQuantities (or Empty)} summing the hourly atom values of each group,
+        each over the window its atoms span — the result of summing the atoms' hourly explainables, with the same
+        calculation-graph ancestry (see ``_sum_parents``)."""
+        atom_indexes_per_group = {}
+        for atom_index, group_key in zip(atom_indexes.tolist(), group_keys):
+            atom_indexes_per_group.setdefault(group_key, []).append(atom_index)
+
+        output = {}
+        for group_key, group_atom_indexes in atom_indexes_per_group.items():
+            non_empty_atom_indexes = [
+                atom_index for atom_index in group_atom_indexes if self.hourly_values_kg[atom_index] is not None]
+            left_parent, right_parent, operator = _sum_parents(
+                [self.atoms[atom_index].value for atom_index in group_atom_indexes])
+            if not non_empty_atom_indexes:
+                output[group_key] = EmptyExplainableObject(
+                    left_parent=left_parent, right_parent=right_parent, operator=operator)
+                continue
+            start_hours = self.start_hours[non_empty_atom_indexes]
+            group_start_hour = start_hours.min()
+            group_end_hour = max(
+                start_hour + len(self.hourly_values_kg[atom_index])
+                for start_hour, atom_index in zip(start_hours.tolist(), non_empty_atom_indexes))
+            group_values = np.zeros(group_end_hour - group_start_hour, dtype=np.float32)
+            for start_hour, atom_index in zip(start_hours.tolist(), non_empty_atom_indexes):
+                atom_values = self.hourly_values_kg[atom_index]
+                offset = start_hour - group_start_hour
+                group_values[offset:offset + len(atom_values)] += atom_values
+            first_atom = self.atoms[non_empty_atom_indexes[int(start_hours.argmin())]]
+            output[group_key] = ExplainableHourlyQuantities(
+                group_values * u.kg, start_date=first_atom.value.start_date,
+                label=f"Attributed footprint of {len(group_atom_indexes)} atoms", left_parent=left_parent,
+                right_parent=right_parent, operator=operator)
+
+        return output
+
+
+def _sum_parents(values: list) -> tuple:
+    """(left parent, right parent, operator) giving a value computed outside explainable arithmetic the ancestry of
+    ``sum(values)``: every value becomes a direct ancestor, chained through value-less "+" nodes as in
+    ``ColumnarHourlyStore.explainable_sum``."""
+    if len(values) == 1:
+        return values[0], None, None
+    left_parent = values[0]
+    for value in values[1:-1]:
+        left_parent = ExplainableObject(None, left_parent=left_parent, right_parent=value, operator="+")
+
+    return left_parent, values[-1], "+"
+
+
+def _kg_hourly_values(atom_value):
+    if isinstance(atom_value, EmptyExplainableObject):
+        return None
+    quantity = atom_value.value
+    if quantity.units != u.kg:
+        quantity = quantity.to(u.kg)
+    return quantity.magnitude
+
+
+@flushed_memo
+def packed_atoms(system, phase) -> PackedAtoms:
+    """TIER 1 — all the system's atoms for a phase, packed once per render (see ``PackedAtoms``)."""
+    all_atoms = tuple(atoms(system, phase))
+    node_indexes = {}
+    journey_and_country_per_up = {}
+    chains = []
+    for atom in all_atoms:
+        if atom.up not in journey_and_country_per_up:
+            journey_and_country_per_up[atom.up] = (atom.journey, atom.up.country)
+        journey, country = journey_and_country_per_up[atom.up]
+        chain_nodes = (atom.source, atom.job, atom.recn, atom.rsn, atom.redn, atom.ef, atom.step,
+                       journey, atom.up, country)
+        chains.append([node_indexes.setdefault(node, len(node_indexes))
+                       for node in chain_nodes if node is not None])
+
+    max_chain_length = max((len(chain) for chain in chains), default=0)
+    chains_matrix = np.full((len(chains), max_chain_length), -1, dtype=np.int64)
+    for atom_index, chain in enumerate(chains):
+        chains_matrix[atom_index, :len(chain)] = chain
+    hourly_values_kg = tuple(_kg_hourly_values(atom.value) for atom in all_atoms)
+
+    return PackedAtoms(
+        atoms=all_atoms, nodes=tuple(node_indexes), chains=chains_matrix,
+        source_node_indexes=chains_matrix[:, 0] if len(chains) else np.zeros(0, dtype=np.int64),
+        totals_kg=np.array([0.0 if values is None else float(np.sum(values, dtype=np.float64))
+                            for values in hourly_values_kg], dtype=np.float64),
+        hourly_values_kg=hourly_values_kg,
+        start_hours=np.array([0 if values is None else utc_hour_index(atom.value.start_date)
+                              for atom, values in zip(all_atoms, hourly_values_kg)], dtype=np.int64))
+
+
+def _sums_in_order_of_first_appearance(keys: np.ndarray, weights: np.ndarray) -> tuple:
+    """(distinct keys in order of first appearance, summed weights of each)."""
+    unique_keys, first_positions, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    sums = np.bincount(inverse, weights=weights, minlength=len(unique_keys))
+    order = np.argsort(first_positions, kind="stable")
+    return unique_keys[order], sums[order]
+
+
 @flushed_memo
 def node_totals_and_links(system, phase, visible_levels: tuple, exclude: tuple = ()):
     """TIER 2 — the Sankey feed: ``({node: kg Quantity}, {(finer, coarser): kg Quantity})`` for one
     life-cycle phase. Values are period-total pint Quantities in kg, not hourly explainables: the Sankey
-    renders sums only and reads magnitudes, so each atom is reduced to a kg float once (``.to(u.kg)``
-    raises on a non-mass atom value) and accumulated as plain floats — no explainable ancestry, no pint
-    arithmetic in the hot loop (the folds run cold on every render; see ``footprint_per_node`` for the
-    hourly explainable read).
+    renders sums only and reads magnitudes, so each atom is reduced to a kg float once when packed
+    (``.to(u.kg)`` raises on a non-mass atom value) and the fold is a pair of grouped float reductions —
+    no explainable ancestry, no pint arithmetic (the folds run cold on every render; see
+    ``footprint_per_node`` for the hourly explainable read).
 
     ``visible_levels`` is a tuple of ModelingObject classes; a chain node is visible iff it is an instance
     of one of them — skipping a column = leaving its classes out (adjacent visible nodes link directly).
     Each atom contributes its value to every visible node of its chain and to the link between each
     consecutive pair, so Σ incoming == node total == Σ outgoing holds at every node BY CONSTRUCTION —
-    no normalization, no rescaling, anywhere. Returned dicts are memoized — treat them as read-only."""
-    node_totals, links = {}, {}
-    for atom in atoms(system, phase, exclude):
-        chain = [node for node in atom.chain() if isinstance(node, visible_levels)]
-        summed = atom.value.sum()
-        value = 0.0 if isinstance(summed, EmptyExplainableObject) else summed.value.to(u.kg).magnitude
-        for node in chain:
-            node_totals[node] = node_totals.get(node, 0.0) + value
-        for finer, coarser in pairwise(chain):
-            links[(finer, coarser)] = links.get((finer, coarser), 0.0) + value
-
-    return ({node: total * u.kg for node, total in node_totals.items()},
-            {pair: total * u.kg for pair, total in links.items()})
+    no normalization, no rescaling, anywhere. Dicts are ordered by first appearance in atom order.
+    Returned dicts are memoized — treat them as read-only."""
+    packed = packed_atoms(system, phase)
+    atom_indexes = packed.included_atom_indexes(exclude)
+    chains = packed.chains[atom_indexes]
+    visible_mask = packed.node_mask(lambda node: isinstance(node, visible_levels))[chains]
+    # Row-major nonzero keeps each atom's visible nodes contiguous and in chain order
+    visible_atom_positions, visible_chain_positions = np.nonzero(visible_mask)
+    visible_node_indexes = chains[visible_atom_positions, visible_chain_positions]
+    visible_atom_totals = packed.totals_kg[atom_indexes][visible_atom_positions]
+
+    node_indexes, node_sums = _sums_in_order_of_first_appearance(visible_node_indexes, visible_atom_totals)
+    is_link = visible_atom_positions[1:] == visible_atom_positions[:-1]
+    nb_nodes = len(packed.nodes)
+    link_codes, link_sums = _sums_in_order_of_first_appearance(
+        visible_node_indexes[:-1][is_link] * nb_nodes + visible_node_indexes[1:][is_link],
+        visible_atom_totals[1:][is_link])
+
+    nodes = packed.nodes
+    return ({nodes[node_index]: total * u.kg for node_index, total in zip(node_indexes.tolist(), node_sums.tolist())},
+            {(nodes[link_code // nb_nodes], nodes[link_code % nb_nodes]): total * u.kg
+             for link_code, total in zip(link_codes.tolist(), link_sums.tolist())})
 
 
 @flushed_memo
@@ -144,13 +307,11 @@ def footprint_per_node(system, level, phase, exclude: tuple = ()):
     """Programmatic per-level read: ``{node: hourly}`` grouping each atom by its chain node at ``level``
     (a ModelingObject class or tuple of classes). Atoms with no node at that level don't contribute.
     The returned dict is memoized — treat it as read-only."""
-    totals = {}
-    for atom in atoms(system, phase, exclude):
-        node = next((node for node in atom.chain() if isinstance(node, level)), None)
-        if node is not None:
-            totals[node] = totals.get(node, EmptyExplainableObject()) + atom.value
+    packed = packed_atoms(system, phase)
+    atom_indexes, node_indexes = packed.first_node_at_level(packed.included_atom_indexes(exclude), level)
+    nodes = packed.nodes
 
-    return totals
+    return packed.hourly_sums(atom_indexes, [nodes[node_index] for node_index in node_indexes.tolist()])
 
 
 @flushed_memo
@@ -158,14 +319,13 @@ def footprint_per_node_per_source(system, level, phase, exclude: tuple = ()):
     """Per-source variant of ``footprint_per_node``: ``{(source, node): hourly}`` — the footprint of any
     container at ``level`` due to any source, not just leaves.
     The returned dict is memoized — treat it as read-only."""
-    totals = {}
-    for atom in atoms(system, phase, exclude):
-        node = next((node for node in atom.chain() if isinstance(node, level)), None)
-        if node is not None:
-            key = (atom.source, node)
-            totals[key] = totals.get(key, EmptyExplainableObject()) + atom.value
-
-    return totals
+    packed = packed_atoms(system, phase)
+    atom_indexes, node_indexes = packed.first_node_at_level(packed.included_atom_indexes(exclude), level)
+    nodes = packed.nodes
+
+    return packed.hourly_sums(
+        atom_indexes, [(nodes[source_index], nodes[node_index]) for source_index, node_index
+                       in zip(packed.source_node_indexes[atom_indexes].tolist(), node_indexes.tolist())])
 
 
 def attributed_footprint(obj: ModelingObject, phase: LifeCyclePhases):
@@ -5,6 +5,7 @@ from efootprint.abstract_modeling_classes.explainable_object_dict import Explain
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.constants.sources import Sources
 from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.constants.units import u
 from efootprint.core.attribution import Atom
 from efootprint.core.hardware.hardware_base import HardwareBase
@@ -122,6 +123,7 @@ class Device(HardwareBase):
         "instances_fabrication_footprint",
     ] + HardwareBase.calculated_attributes
 
+    @temporal_footprint()
     def update_dict_element_in_energy_footprint_per_usage_pattern(self, usage_pattern: "UsagePattern"):
         energy_spent_over_one_full_hour_by_one_device = self.power * ExplainableQuantity(1 * u.hour, "one full hour")
         instances_energy = (
@@ -138,6 +140,7 @@ class Device(HardwareBase):
         for usage_pattern in self.usage_patterns:
             self.update_dict_element_in_energy_footprint_per_usage_pattern(usage_pattern)
 
+    @temporal_footprint()
     def update_energy_footprint(self):
         """Total hourly carbon emissions caused by the device's electricity use, summed across all usage patterns that run on this device."""
         self.energy_footprint = sum(
@@ -150,6 +153,7 @@ class Device(HardwareBase):
                 / (self.lifespan * self.fraction_of_usage_time)).to(u.g).set_label(
             "Fabrication footprint over one hour")
 
+    @temporal_footprint()
     def update_dict_element_in_instances_fabrication_footprint_per_usage_pattern(self, usage_pattern: "UsagePattern"):
         self.instances_fabrication_footprint_per_usage_pattern[usage_pattern] = (
             usage_pattern.usage_journey.nb_usage_journeys_in_parallel_per_usage_pattern[usage_pattern]
@@ -162,6 +166,7 @@ class Device(HardwareBase):
         for usage_pattern in self.usage_patterns:
             self.update_dict_element_in_instances_fabrication_footprint_per_usage_pattern(usage_pattern)
 
+    @temporal_footprint()
     def update_instances_fabrication_footprint(self):
         """Total hourly fabrication-phase emissions of all devices in use, summed across all usage patterns that run on this device."""
         self.instances_fabrication_footprint = sum(
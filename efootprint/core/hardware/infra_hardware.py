@@ -3,7 +3,9 @@ from typing import List
 
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.modeling_object_topology import topology_memoized
 from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.constants.units import u
 from efootprint.core.hardware.hardware_base import HardwareBase
 
@@ -40,9 +42,11 @@ class InfraHardware(HardwareBase):
         pass
 
     @property
+    @topology_memoized
     def systems(self) -> List:
         return list(dict.fromkeys(sum([job.systems for job in self.jobs], start=[])))
 
+    @temporal_footprint()
     def update_instances_fabrication_footprint(self):
         """Hourly fabrication-phase emissions of all instances, equal to the embodied carbon of one instance amortised over its lifespan and multiplied by the number of instances active in each hour."""
         instances_fabrication_footprint = (
@@ -52,6 +56,7 @@ class InfraHardware(HardwareBase):
         self.instances_fabrication_footprint = instances_fabrication_footprint.to(u.kg).set_label(
                 f"Hourly instances fabrication footprint")
 
+    @temporal_footprint()
     def update_energy_footprint(self):
         """Hourly carbon emissions caused by the electricity consumed by this hardware, equal to its hourly energy use times the local grid carbon intensity."""
         if getattr(self, "average_carbon_intensity", None) is None:
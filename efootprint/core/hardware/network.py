@@ -5,6 +5,7 @@ from efootprint.abstract_modeling_classes.explainable_quantity import Explainabl
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
 from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.constants.sources import Sources
 from efootprint.constants.units import u
 from efootprint.core.attribution import Atom
@@ -87,6 +88,7 @@ class Network(ModelingObject):
         """Network fabrication footprint, currently always empty: e-footprint does not account for the embodied carbon of network infrastructure since it is shared across countless services."""
         self.instances_fabrication_footprint = EmptyExplainableObject()
 
+    @temporal_footprint()
     def update_dict_element_in_energy_footprint_per_job(self, job: "JobBase"):
         energy_footprint = EmptyExplainableObject()
         for usage_pattern in [up for up in job.usage_patterns if up in self.usage_patterns]:
@@ -100,6 +102,7 @@ class Network(ModelingObject):
         for job in self.jobs:
             self.update_dict_element_in_energy_footprint_per_job(job)
 
+    @temporal_footprint()
     def update_energy_footprint(self):
         """Total hourly carbon emissions caused by network traffic, summed across all jobs that route through this network."""
         self.energy_footprint = sum(self.energy_footprint_per_job.values(), start=EmptyExplainableObject()).set_label(
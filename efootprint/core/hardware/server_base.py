@@ -5,6 +5,7 @@ from abc import abstractmethod
 import numpy as np
 from pint import Quantity
 
+from efootprint.abstract_modeling_classes.compact_hourly_quantities import ConstantHourlyQuantities
 from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
 from efootprint.abstract_modeling_classes.explainable_hourly_quantities import (
     ExplainableHourlyQuantities, divide_or_fallback)
@@ -16,6 +17,7 @@ from efootprint.core.hardware.infra_hardware import InfraHardware
 from efootprint.core.hardware.hardware_base import InsufficientCapacityError
 from efootprint.core.lifecycle_phases import LifeCyclePhases
 from efootprint.abstract_modeling_classes.source_objects import SOURCE_VALUE_DEFAULT_NAME, SourceObject
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.constants.units import u
 from efootprint.core.hardware.storage import Storage
 
@@ -241,10 +243,12 @@ class ServerBase(InfraHardware):
 
         return hour_by_hour_resource_needs.to(resource_unit).set_label(f"Hour by hour {resource} need")
 
+    @temporal_footprint()
     def update_hour_by_hour_ram_need(self):
         """Hourly RAM demand placed on the server by all of its jobs combined."""
         self.hour_by_hour_ram_need = self.compute_hour_by_hour_resource_need("ram")
 
+    @temporal_footprint()
     def update_hour_by_hour_compute_need(self):
         """Hourly compute demand placed on the server by all of its jobs combined."""
         self.hour_by_hour_compute_need = self.compute_hour_by_hour_resource_need("compute")
@@ -286,6 +290,7 @@ class ServerBase(InfraHardware):
         self.available_compute_per_instance = available_compute_per_instance.set_label(
             f"Available CPU per instance")
 
+    @temporal_footprint()
     def update_raw_nb_of_instances(self):
         """Hourly number of instances strictly required to serve hourly demand, taking the maximum across the RAM and compute dimensions, before rounding to whole instances."""
         nb_of_servers_based_on_ram_alone = (
@@ -311,6 +316,7 @@ class ServerBase(InfraHardware):
         return ((self.power - self.idle_power) * self.power_usage_effectiveness
                 * ExplainableQuantity(1 * u.hour, "one hour"))
 
+    @temporal_footprint()
     def update_instances_energy(self):
         """Hourly energy consumed by all running instances, decomposed into idle baseline energy plus the extra energy drawn while serving load, with PUE applied."""
         server_energy = (
@@ -319,6 +325,7 @@ class ServerBase(InfraHardware):
 
         self.instances_energy = server_energy.to(u.kWh).set_label(f"Hourly energy consumed by instances")
 
+    @temporal_footprint()
     def update_idle_energy_footprint(self):
         """Hourly carbon emissions of the idle baseline energy drawn by all provisioned instances (idle power times PUE times number of instances times grid carbon intensity) — the usage-phase component that rides the provisioned attribution stream."""
         idle_energy_footprint = (
@@ -327,6 +334,7 @@ class ServerBase(InfraHardware):
 
         self.idle_energy_footprint = idle_energy_footprint.to(u.kg).set_label(f"Hourly idle energy footprint")
 
+    @temporal_footprint()
     def update_load_energy_footprint(self):
         """Hourly carbon emissions of the extra energy drawn while serving load (power above idle times PUE times raw number of instances times grid carbon intensity) — the usage-phase component that rides the dynamic attribution stream."""
         load_energy_footprint = (
@@ -335,6 +343,7 @@ class ServerBase(InfraHardware):
 
         self.load_energy_footprint = load_energy_footprint.to(u.kg).set_label(f"Hourly load energy footprint")
 
+    @temporal_footprint()
     def update_energy_footprint(self):
         """Hourly carbon emissions caused by the electricity consumed by the server, equal to the sum of its idle and load energy footprints."""
         self.energy_footprint = (self.idle_energy_footprint + self.load_energy_footprint).to(u.kg).set_label(
@@ -363,16 +372,14 @@ class ServerBase(InfraHardware):
                     raise InsufficientCapacityError(
                         self, "number of instances", self.fixed_nb_of_instances, max_nb_of_instances)
                 else:
-                    fixed_nb_of_instances_np = Quantity(
-                        np.full(len(self.raw_nb_of_instances), np.float32(self.fixed_nb_of_instances.magnitude)),
-                        u.concurrent)
+                    fixed_nb_of_instances_np = ConstantHourlyQuantities(
+                        self.fixed_nb_of_instances.magnitude, len(self.raw_nb_of_instances), u.concurrent)
                     nb_of_instances = ExplainableHourlyQuantities(
                         fixed_nb_of_instances_np, self.raw_nb_of_instances.start_date, "Nb of instances",
                         left_parent=self.raw_nb_of_instances, right_parent=self.fixed_nb_of_instances)
             else:
-                nb_of_instances_np = Quantity(
-                    np.float32(max_nb_of_instances.magnitude) * np.ones(len(self.raw_nb_of_instances), dtype=np.float32),
-                    u.concurrent)
+                nb_of_instances_np = ConstantHourlyQuantities(
+                    max_nb_of_instances.magnitude, len(self.raw_nb_of_instances), u.concurrent)
 
                 nb_of_instances = ExplainableHourlyQuantities(
                     nb_of_instances_np, self.raw_nb_of_instances.start_date,f"Hourly number of instances",
@@ -382,6 +389,8 @@ class ServerBase(InfraHardware):
         self.nb_of_instances = nb_of_instances.generate_explainable_object_with_logical_dependency(
             self.server_type).set_label(f"Hourly number of instances")
 
+    # On-premise servers are sized on the peak of the whole modeling period
+    @temporal_footprint(applies=lambda server: server.server_type != ServerTypes.on_premise())
     def update_nb_of_instances(self):
         """Hourly number of instances actually billed, computed differently per server type: ceiled to whole instances for autoscaling, mirrored from raw demand for serverless, and held flat at peak (or the user-fixed count) for on-premise."""
         logic_mapping = {
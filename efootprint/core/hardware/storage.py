@@ -6,6 +6,7 @@ from typing import List, TYPE_CHECKING, Optional
 import numpy as np
 from pint import Quantity
 
+from efootprint.abstract_modeling_classes.compact_hourly_quantities import ConstantHourlyQuantities
 from efootprint.abstract_modeling_classes.explainable_object_dict import ExplainableObjectDict
 from efootprint.constants.sources import Sources
 from efootprint.core.attribution import Atom
@@ -16,6 +17,7 @@ from efootprint.abstract_modeling_classes.explainable_hourly_quantities import (
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.constants.units import u
 from efootprint.core.lifecycle_phases import LifeCyclePhases
 
@@ -211,11 +213,14 @@ class Storage(InfraHardware):
             self.full_cumulative_storage_need = all_cumulatives.set_label(
                 f"Full cumulative storage need")
 
+    @temporal_footprint()
     def update_raw_nb_of_instances(self):
         """Hourly storage instances strictly required to hold the cumulative storage need, before rounding."""
         raw_nb_of_instances = (self.full_cumulative_storage_need / self.storage_capacity).to(u.concurrent)
         self.raw_nb_of_instances = raw_nb_of_instances.set_label(f"Hourly raw number of instances")
 
+    # Fixed numbers of instances are checked against the peak of the whole modeling period
+    @temporal_footprint(applies=lambda storage: isinstance(storage.fixed_nb_of_instances, EmptyExplainableObject))
     def update_nb_of_instances(self):
         """Hourly storage instances actually attributed: fractional for serverless backends (only used capacity is billed), held to the user-fixed count if set, otherwise ceiled to whole instances."""
         from efootprint.core.hardware.server_base import ServerTypes
@@ -230,11 +235,9 @@ class Storage(InfraHardware):
                 raise InsufficientCapacityError(
                     self, "number of instances", self.fixed_nb_of_instances, max_nb_of_instances)
             else:
-                fixed_nb_of_instances_quantity = Quantity(
-                    np.full(
-                        len(self.raw_nb_of_instances),
-                        np.float32(self.fixed_nb_of_instances.to(u.concurrent).magnitude)
-                    ), u.concurrent)
+                fixed_nb_of_instances_quantity = ConstantHourlyQuantities(
+                    self.fixed_nb_of_instances.to(u.concurrent).magnitude, len(self.raw_nb_of_instances),
+                    u.concurrent)
                 fixed_nb_of_instances = ExplainableHourlyQuantities(
                     fixed_nb_of_instances_quantity, self.raw_nb_of_instances.start_date, "Nb of instances",
                     left_parent=self.raw_nb_of_instances, right_parent=self.fixed_nb_of_instances)
@@ -1,8 +1,11 @@
 from datetime import timedelta
 from typing import Dict, List, Optional
 
+from efootprint.abstract_modeling_classes.columnar_hourly_store import ColumnarHourlyStore
 from efootprint.abstract_modeling_classes.explainable_object_dict import ExplainableObjectDict
-from efootprint.abstract_modeling_classes.modeling_object import ModelingObject, optimize_mod_objs_computation_chain
+from efootprint.abstract_modeling_classes.modeling_object import (
+    ModelingObject, flush_cached_properties_system_wide, optimize_mod_objs_computation_chain)
+from efootprint.abstract_modeling_classes.modeling_object_topology import topology_memoized
 from efootprint.builders.external_apis.external_api_base_class import ExternalAPI, ExternalAPIServer
 from efootprint.builders.external_apis.external_api_job_base_class import ExternalAPIJob
 from efootprint.builders.services.service_base_class import Service
@@ -24,7 +27,10 @@ from efootprint.core.usage.usage_journey import UsageJourney
 from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.logger import logger
+from efootprint.utils import profiling
 from efootprint.utils.display import best_display_unit, human_readable_unit, display_quantity_as_str
 
 
@@ -44,6 +50,13 @@ class System(ModelingObject):
             "purely web systems."),
     }
 
+    # Opt-in, see enable_columnar_hourly_store. Class-level default so that systems loaded from json, which skip
+    # __init__, have it too.
+    columnar_hourly_store: Optional[ColumnarHourlyStore] = None
+    # When True, calculated attributes are only marked as stale by modeling updates (and by the initial build if
+    # set at class level before construction) and are computed on first read. See materialize.
+    lazy_evaluation: bool = False
+
     def __init__(self, name: str, usage_patterns: List[UsagePattern], edge_usage_patterns: List[EdgeUsagePattern],):
         super().__init__(name)
         self.total_footprint = EmptyExplainableObject()
@@ -65,6 +78,24 @@ class System(ModelingObject):
         self.initial_total_energy_footprints_sum_over_period = ExplainableObjectDict()
         self.initial_total_fabrication_footprints_sum_over_period = ExplainableObjectDict()
 
+    def snapshot_footprints_before_change(self, changes_list):
+        """Keep the footprints summed over the modeling period before a modeling update as previous footprints, and
+        record the change. Lazily evaluated systems take their initial footprints before their first change, and
+        only snapshot footprints that are already evaluated, since evaluating them would compute every stale
+        calculated attribute: snapshots of footprints left stale are None."""
+        if self.lazy_evaluation and "total_footprint" in self.stale_calculated_attribute_names:
+            previous_footprints = None, None
+        else:
+            previous_footprints = (
+                self.total_energy_footprint_sum_over_period, self.total_fabrication_footprint_sum_over_period)
+        self.previous_total_energy_footprints_sum_over_period, \
+            self.previous_total_fabrication_footprints_sum_over_period = previous_footprints
+        if self.lazy_evaluation and not self.all_changes:
+            self.initial_total_energy_footprints_sum_over_period, \
+                self.initial_total_fabrication_footprints_sum_over_period = previous_footprints
+        self.previous_change = changes_list
+        self.all_changes += changes_list
+
     def compute_calculated_attributes(self):
         self.check_no_object_to_link_is_already_linked_to_another_system()
         super().compute_calculated_attributes()
@@ -77,7 +108,8 @@ class System(ModelingObject):
                 + ["all_changes", "previous_change", "previous_total_energy_footprints_sum_over_period",
                    "previous_total_fabrication_footprints_sum_over_period",
                    "initial_total_energy_footprints_sum_over_period",
-                   "initial_total_fabrication_footprints_sum_over_period", "simulation"])
+                   "initial_total_fabrication_footprints_sum_over_period", "simulation", "columnar_hourly_store",
+                   "lazy_evaluation"])
 
     def check_no_object_to_link_is_already_linked_to_another_system(self):
         for mod_obj in self.all_linked_objects:
@@ -93,6 +125,7 @@ class System(ModelingObject):
     def systems(self) -> List:
         return [self]
 
+    @profiling.profiled(profiling.SYSTEM_BUILD, first_arg_is_profiled_object=True)
     def after_init(self):
         from time import perf_counter
         start = perf_counter()
@@ -101,6 +134,20 @@ class System(ModelingObject):
         optimized_chain = optimize_mod_objs_computation_chain(mod_obj_computation_chain_excluding_self)
         if len(optimized_chain) == 0 or optimized_chain[-1] != self:
             optimized_chain.append(self)
+        if self.lazy_evaluation:
+            # lazy_evaluation may only be set at class level while the system is built, so it is pinned on the
+            # instance for its later modeling updates
+            self.__dict__["lazy_evaluation"] = True
+            # Initial footprints are only known once evaluated, see snapshot_footprints_before_change
+            self.initial_total_energy_footprints_sum_over_period = None
+            self.initial_total_fabrication_footprints_sum_over_period = None
+            self.check_no_object_to_link_is_already_linked_to_another_system()
+            for mod_obj in optimized_chain:
+                mod_obj.mark_calculated_attributes_as_stale()
+            flush_cached_properties_system_wide(optimized_chain)
+            logger.info(f"{self.name} is lazily evaluated, calculated attributes will be computed on first read")
+            self.trigger_modeling_updates = True
+            return
         self.launch_mod_objs_computation_chain(optimized_chain)
         all_objects = self.all_linked_objects
         nb_of_calculated_attributes = sum([len(obj.calculated_attributes) for obj in all_objects])
@@ -153,6 +200,7 @@ class System(ModelingObject):
         return all_modeling_objects
 
     @property
+    @topology_memoized
     def all_linked_objects(self):
         return (self.networks + self.jobs + self.servers + self.services + self.external_apis
                 + self.external_api_servers + self.countries
@@ -160,63 +208,77 @@ class System(ModelingObject):
                 + self.get_objects_linked_to_edge_usage_patterns(self.edge_usage_patterns))
 
     @property
+    @topology_memoized
     def usage_journeys(self) -> List[UsageJourney]:
         return list(dict.fromkeys([up.usage_journey for up in self.usage_patterns]))
 
     @property
+    @topology_memoized
     def edge_usage_journeys(self) -> List[EdgeUsageJourney]:
         return list(dict.fromkeys([eup.edge_usage_journey for eup in self.edge_usage_patterns]))
 
     @property
+    @topology_memoized
     def devices(self) -> List[Device]:
         return list(dict.fromkeys(sum([up.devices for up in self.usage_patterns], start=[])))
 
     @property
+    @topology_memoized
     def countries(self) -> List[Country]:
         countries = list(dict.fromkeys([up.country for up in self.usage_patterns]
                              + [eup.country for eup in self.edge_usage_patterns]))
         return countries
 
     @property
+    @topology_memoized
     def networks(self) -> List[Network]:
         return list(dict.fromkeys([up.network for up in self.usage_patterns] + [eup.network for eup in self.edge_usage_patterns]))
 
     @property
+    @topology_memoized
     def jobs(self) -> List[JobBase]:
         jobs_from_usage_patterns = sum([up.jobs for up in self.usage_patterns], start=[])
         jobs_from_edge_usage_patterns = sum([eup.jobs for eup in self.edge_usage_patterns], start=[])
         return list(dict.fromkeys(jobs_from_usage_patterns + jobs_from_edge_usage_patterns))
 
     @property
+    @topology_memoized
     def servers(self) -> List[Server]:
         # Every JobBase subclass exposes `server` (Job/GPUJob direct, ServiceJob and ExternalAPIJob via property).
         return list(dict.fromkeys([job.server for job in self.jobs if isinstance(job.server, ServerBase)]))
 
     @property
+    @topology_memoized
     def services(self) -> List[Service]:
         return list(dict.fromkeys(sum([server.installed_services for server in self.servers], start=[])))
 
     @property
+    @topology_memoized
     def external_apis(self) -> List[ExternalAPI]:
         return list(dict.fromkeys([job.external_api for job in self.jobs if isinstance(job, ExternalAPIJob)]))
 
     @property
+    @topology_memoized
     def external_api_servers(self) -> List[ExternalAPIServer]:
         return list(dict.fromkeys([external_api.server for external_api in self.external_apis]))
 
     @property
+    @topology_memoized
     def edge_devices(self) -> List[EdgeDevice]:
         return list(dict.fromkeys(sum([euj.edge_devices for euj in self.edge_usage_journeys], start=[])))
 
     @property
+    @topology_memoized
     def edge_computers(self) -> List[EdgeComputer]:
         return [hw for hw in self.edge_devices if isinstance(hw, EdgeComputer)]
 
     @property
+    @topology_memoized
     def storages(self) -> List[Storage]:
         return list(dict.fromkeys([server.storage for server in self.servers]))
 
     @property
+    @topology_memoized
     def edge_storages(self) -> List[EdgeStorage]:
         edge_storages = []
         for edge_device in self.edge_devices:
@@ -233,6 +295,8 @@ class System(ModelingObject):
                 return efootprint_obj
         return None
 
+    @topology_memoized(copy=lambda objects_by_category: {
+        category: list(objs) for category, objs in objects_by_category.items()})
     def _objects_by_category(self):
         from efootprint.all_classes_in_order import OBJECT_CATEGORIES
         result = {category: [] for category in OBJECT_CATEGORIES}
@@ -318,12 +382,9 @@ class System(ModelingObject):
 
         return ExplainableObjectDict(energy_footprints)
 
+    @temporal_footprint()
     def update_total_footprint(self):
         """Total system carbon footprint as an hourly timeseries, summing fabrication and energy footprints across every category of object (servers, storages, devices, networks, edge components)."""
-        # Snapshot the category breakdown once. Without this, `self.fabrication_footprints` and
-        # `self.energy_footprints` each rebuild `_objects_by_category()` (which walks `all_linked_objects`
-        # and re-derives jobs/servers/etc. from scratch), and the `for key in self.fabrication_footprints`
-        # iteration would do it a third time. Each rebuild costs ~3 ms on a system of ~200 objects.
         categories = self._objects_by_category()
         fab = {category: [obj.instances_fabrication_footprint for obj in objs
                           if hasattr(obj, "instances_fabrication_footprint")]
@@ -331,13 +392,79 @@ class System(ModelingObject):
         energy = {category: [obj.energy_footprint for obj in objs
                              if hasattr(obj, "energy_footprint")]
                   for category, objs in categories.items()}
-        total_footprint = sum(
-            [sum(fab[key]) + sum(energy[key]) for key in fab],
-            start=EmptyExplainableObject(),
-        ).to(u.kg).set_label("Total carbon footprint")
+        if self.columnar_hourly_store is not None:
+            total_footprint = self.columnar_hourly_store.explainable_sum(
+                [footprint for key in fab for footprint in fab[key] + energy[key]]
+            ).to(u.kg).set_label("Total carbon footprint")
+        else:
+            total_footprint = sum(
+                [sum(fab[key]) + sum(energy[key]) for key in fab],
+                start=EmptyExplainableObject(),
+            ).to(u.kg).set_label("Total carbon footprint")
 
         self.total_footprint = round(total_footprint, 4)
 
+    def materialize(self):
+        """Compute every calculated attribute left stale by lazy evaluation, e.g. before exporting the system with
+        its calculated attributes. Errors raised by update functions surface here instead of at update time."""
+        for mod_obj in self.all_linked_objects + [self]:
+            for attr_name in mod_obj.stale_calculated_attribute_names:
+                getattr(mod_obj, attr_name)
+
+        return self
+
+    def enable_columnar_hourly_store(self) -> ColumnarHourlyStore:
+        """Move every calculated hourly timeseries of the system into a single {class:ColumnarHourlyStore} matrix on
+        a shared UTC hour axis, then keep it up to date on each modeling update. Alignment between stored series
+        becomes an offset lookup and the total footprint a single masked reduction, which pays off on systems with
+        many objects and long modeling periods."""
+        hourly_quantities = []
+        for mod_obj in self.all_linked_objects + [self]:
+            for attr_name in mod_obj.calculated_attributes:
+                attr_value = getattr(mod_obj, attr_name)
+                attr_values = attr_value.values() if isinstance(attr_value, dict) else [attr_value]
+                hourly_quantities += [value for value in attr_values if isinstance(value, ExplainableHourlyQuantities)]
+        if not hourly_quantities:
+            raise ValueError(f"{self.name} has no computed hourly quantities to store columnarly.")
+        self.columnar_hourly_store = ColumnarHourlyStore.from_hourly_quantities(hourly_quantities)
+        self.update_total_footprint()
+
+        return self.columnar_hourly_store
+
+    def sweep(self, param_grid: List[List[ExplainableObject | List[ExplainableObject]]]):
+        """Evaluate variants of input values of the system, without changing it, and return a tidy pandas DataFrame
+        of total footprints summed over the modeling period, with one row per variant, category and footprint type.
+
+        ``param_grid`` pairs each input with its list of variant values, the i-th variant setting every input to the
+        i-th value of its list: ``[[server.power, [SourceValue(100 * u.W), SourceValue(200 * u.W)]]]``. See
+        efootprint.abstract_modeling_classes.scenario_batch.ScenarioBatch."""
+        from efootprint.abstract_modeling_classes.scenario_batch import ScenarioBatch
+        scenario_batch = ScenarioBatch(param_grid)
+        for input_value in scenario_batch.inputs:
+            if self not in input_value.modeling_obj_container.systems:
+                raise ValueError(
+                    f"{input_value.attr_name_in_mod_obj_container} of {input_value.modeling_obj_container.name} "
+                    f"isn’t linked to {self.name}.")
+
+        def read_totals():
+            return {"Electricity": self.total_energy_footprint_sum_over_period,
+                    "Fabrication": self.total_fabrication_footprint_sum_over_period}
+
+        rows_as_dicts = []
+        for variant_index, totals in enumerate(scenario_batch.evaluate(read_totals)):
+            input_columns = {
+                f"{input_value.attr_name_in_mod_obj_container} of {input_value.modeling_obj_container.name}":
+                    variant_values[variant_index].value
+                for input_value, variant_values in zip(scenario_batch.inputs, scenario_batch.variants_per_input)}
+            for footprint_type, totals_by_category in totals.items():
+                for category, total in totals_by_category.items():
+                    rows_as_dicts.append({
+                        "Variant": variant_index, **input_columns, "Type": footprint_type, "Category": category,
+                        "kg CO2 emissions": total.to(u.kg).magnitude})
+
+        import pandas as pd
+        return pd.DataFrame.from_records(rows_as_dicts)
+
     def compare_to(self, other: "System"):
         """Return a {class:SystemComparison} of this system against ``other`` — the notebook entry point for the comparison capability (totals + deltas, per-(category, phase) decomposition, aligned/cumulative time-series, input diff)."""
         from efootprint.comparison.system_comparison import SystemComparison
@@ -452,6 +579,12 @@ class System(ModelingObject):
             emissions_dict__old = [self.previous_total_energy_footprints_sum_over_period,
                                    self.previous_total_fabrication_footprints_sum_over_period]
 
+        if emissions_dict__old[0] is None:
+            raise ValueError(
+                f"{self.name} footprints weren't evaluated before the change, so there is no diff to plot. On lazily "
+                f"evaluated systems, read the system footprints or call System.materialize() before modeling updates "
+                f"to plot their diffs.")
+
         emissions_dict__new = [self.total_energy_footprint_sum_over_period,
                                self.total_fabrication_footprint_sum_over_period]
 
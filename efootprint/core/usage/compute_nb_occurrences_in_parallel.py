@@ -1,23 +1,52 @@
 import numpy as np
 
 from pint import Quantity
-from scipy.signal import fftconvolve
 
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
 from efootprint.constants.units import u
 
 
+# Beyond this many hours, boxcar sums are computed as differences of a cumulative sum rather than as shifted additions
+MAX_NB_SHIFTED_ADDITIONS = 12
+
+
+def boxcar_sums(values: np.ndarray, nb_hours: int) -> np.ndarray:
+    """
+    Full convolution of values with a boxcar of nb_hours ones along the last axis, i.e. the sum of the last nb_hours
+    values at each hour, in float32.
+
+    Short boxcars are summed as nb_hours shifted additions, long ones as the difference of a float64 cumulative sum
+    taken nb_hours apart, so the cost doesn't grow with the boxcar length. Both are exact up to float rounding, unlike
+    an FFT convolution, which needs a transform plan for each input length and leaves numerical noise on zero hours.
+    """
+    nb_values = values.shape[-1]
+    result_shape = values.shape[:-1] + (nb_values + nb_hours - 1,)
+    if nb_hours <= MAX_NB_SHIFTED_ADDITIONS:
+        result = np.zeros(result_shape, dtype=np.float32)
+        for shift in range(nb_hours):
+            result[..., shift:shift + nb_values] += values
+
+        return result
+
+    # Cumulative sums padded with nb_hours zeros before and the total after, so that the sum of the nb_hours values
+    # ending at hour h is cumulative_sums[h + nb_hours] - cumulative_sums[h].
+    cumulative_sums = np.zeros(values.shape[:-1] + (nb_values + 2 * nb_hours - 1,), dtype=np.float64)
+    np.cumsum(values, axis=-1, out=cumulative_sums[..., nb_hours:nb_values + nb_hours])
+    cumulative_sums[..., nb_values + nb_hours:] = cumulative_sums[..., nb_values + nb_hours - 1:nb_values + nb_hours]
+
+    return (cumulative_sums[..., nb_hours:] - cumulative_sums[..., :nb_values + nb_hours - 1]).astype(np.float32)
+
+
 def compute_nb_avg_hourly_occurrences(hourly_occurrences_starts, event_duration):
     """
     Compute the average number of hourly occurrences running in parallel
     for events of a given duration.
 
-    This function replaces a slow Python loop with a single convolution:
-    - The loop version repeatedly shifts and sums the hourly occurrences array.
-    - Mathematically, this is equivalent to a convolution with a "boxcar"
-      (a vector of ones of length = event duration in hours).
-    - Using convolution makes the code both much faster and easier to maintain.
+    This is a convolution of the hourly occurrence starts with a "boxcar"
+    (a vector of ones of length = number of full hours in the event duration),
+    computed by boxcar_sums, plus the starts shifted by the number of full hours
+    and weighted by the remaining fraction of an hour.
 
     Parameters
     ----------
@@ -40,8 +69,7 @@ def compute_nb_avg_hourly_occurrences(hourly_occurrences_starts, event_duration)
     values = hourly_occurrences_starts.value.magnitude.astype(np.float32, copy=False)
 
     if nb_full_hours > 0:
-        kernel = np.ones(nb_full_hours, dtype=np.float32)
-        result = fftconvolve(values, kernel, mode="full")
+        result = boxcar_sums(values, nb_full_hours)
     else:
         result = None
 
@@ -51,11 +79,10 @@ def compute_nb_avg_hourly_occurrences(hourly_occurrences_starts, event_duration)
         if result is None:
             result = values * rest_f32
         else:
-            initial_values_padded = np.pad(result, (0, 1), constant_values=np.float32(0))
-            shifted_values = np.pad(values, (nb_full_hours, 0), constant_values=np.float32(0))
-            result = initial_values_padded + shifted_values * rest_f32
+            result = np.pad(result, (0, 1), constant_values=np.float32(0))
+            result[nb_full_hours:] += values * rest_f32
 
-    # Clip FFT numerical noise and avoid negative values that could lead to NegativeCumulativeStorageNeedError.
+    # Avoid negative values that could lead to NegativeCumulativeStorageNeedError.
     np.maximum(result, 0, out=result)
 
     return ExplainableHourlyQuantities(
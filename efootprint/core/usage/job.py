@@ -11,6 +11,7 @@ from efootprint.abstract_modeling_classes.explainable_quantity import Explainabl
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
 from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.constants.units import u
 from efootprint.core.attribution import flushed_memo
 from efootprint.core.hardware.gpu_server import GPUServer
@@ -146,6 +147,10 @@ class JobBase(ModelingObject):
     def networks(self) -> List["Network"]:
         return list(dict.fromkeys(up.network for up in self.usage_patterns))
 
+    # Journey starts are shifted by the delay between journey start and job, at most the journey duration
+    @temporal_footprint(
+        lookback_hours=lambda job, usage_pattern: usage_pattern.usage_journey.duration,
+        applies=lambda job, usage_pattern: hasattr(usage_pattern, "usage_journey"))
     def update_dict_element_in_hourly_occurrences_per_usage_pattern(
             self, usage_pattern: "UsagePattern | EdgeUsagePattern"):
         from efootprint.core.usage.usage_pattern import UsagePattern
@@ -182,6 +187,7 @@ class JobBase(ModelingObject):
         for up in self.usage_patterns:
             self.update_dict_element_in_hourly_occurrences_per_usage_pattern(up)
 
+    @temporal_footprint(lookback_hours=lambda job, usage_pattern: job.request_duration)
     def update_dict_element_in_hourly_avg_occurrences_per_usage_pattern(
             self, usage_pattern: "UsagePattern | EdgeUsagePattern"):
         hourly_avg_job_occurrences = compute_nb_avg_hourly_occurrences(
@@ -210,6 +216,7 @@ class JobBase(ModelingObject):
         return hourly_data_exchange.set_label(
                 f"Hourly {data_exchange_type.replace('_', ' ')} in {usage_pattern.name}").to(target_unit)
 
+    @temporal_footprint()
     def update_dict_element_in_hourly_data_transferred_per_usage_pattern(
             self, usage_pattern: "UsagePattern | EdgeUsagePattern"):
         self.hourly_data_transferred_per_usage_pattern[usage_pattern] = \
@@ -221,6 +228,7 @@ class JobBase(ModelingObject):
         for up in self.usage_patterns:
             self.update_dict_element_in_hourly_data_transferred_per_usage_pattern(up)
 
+    @temporal_footprint()
     def update_dict_element_in_hourly_data_stored_per_usage_pattern(
             self, usage_pattern: "UsagePattern | EdgeUsagePattern"):
         self.hourly_data_stored_per_usage_pattern[usage_pattern] = \
@@ -241,16 +249,19 @@ class JobBase(ModelingObject):
         return hourly_calc_attr_summed_across_ups.set_label(
                 f"Hourly {calculated_attribute_label} across usage patterns")
 
+    @temporal_footprint()
     def update_hourly_avg_occurrences_across_usage_patterns(self):
         """Total hourly count of duration-averaged job invocations summed over every usage pattern."""
         self.hourly_avg_occurrences_across_usage_patterns = self.sum_calculated_attribute_across_usage_patterns(
             "hourly_avg_occurrences_per_usage_pattern", "average occurrences").to(u.concurrent)
 
+    @temporal_footprint()
     def update_hourly_data_transferred_across_usage_patterns(self):
         """Total hourly volume of data transferred over the network by this job, summed over every usage pattern."""
         self.hourly_data_transferred_across_usage_patterns = self.sum_calculated_attribute_across_usage_patterns(
             "hourly_data_transferred_per_usage_pattern", "data transferred")
 
+    @temporal_footprint()
     def update_hourly_data_stored_across_usage_patterns(self):
         """Total hourly net change in storage volume caused by this job, summed over every usage pattern."""
         self.hourly_data_stored_across_usage_patterns = self.sum_calculated_attribute_across_usage_patterns(
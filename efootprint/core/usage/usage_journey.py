@@ -4,6 +4,7 @@ from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyE
 from efootprint.abstract_modeling_classes.explainable_object_dict import (
     ExplainableObjectDict, WeightedExplainableObjectDict, to_weighted_explainable_object_dict)
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 from efootprint.constants.units import u
 from efootprint.core.hardware.server import Server
 from efootprint.core.hardware.storage import Storage
@@ -76,6 +77,7 @@ class UsageJourney(ModelingObject):
 
         self.duration = user_time_spent_sum.set_label(f"Duration")
 
+    @temporal_footprint(lookback_hours=lambda usage_journey, usage_pattern: usage_journey.duration)
     def update_dict_element_in_nb_usage_journeys_in_parallel_per_usage_pattern(self, usage_pattern: "UsagePattern"):
         nb_of_usage_journeys_in_parallel = compute_nb_avg_hourly_occurrences(
             usage_pattern.utc_hourly_usage_journey_starts, self.duration)
@@ -10,6 +10,7 @@ from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
 from efootprint.abstract_modeling_classes.explainable_hourly_quantities import (
     ExplainableHourlyQuantities)
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.temporal_footprint import temporal_footprint
 
 
 class UsagePattern(ModelingObject):
@@ -58,6 +59,8 @@ class UsagePattern(ModelingObject):
     def jobs(self) -> List[Job]:
         return self.usage_journey.jobs
 
+    # Local to UTC conversion rolls journey starts by at most 14 hours
+    @temporal_footprint(lookback_hours=14, lookahead_hours=14, circular=True)
     def update_utc_hourly_usage_journey_starts(self):
         """Hourly journey starts converted from the country's local timezone to UTC, so that downstream calculations can be combined across patterns in different timezones."""
         utc_hourly_usage_journey_starts = self.hourly_usage_journey_starts.convert_to_utc(
@@ -0,0 +1,69 @@
+"""Import paths of the concrete e-footprint classes, so that a class is only imported from its name when it is
+needed. json_to_system resolves the classes of the systems it loads through this registry, so that loading a system
+without EcoLogits or Boavizta objects never imports them."""
+from functools import lru_cache
+from importlib import import_module
+
+# Every concrete ModelingObject class, in all_classes_in_order.ALL_EFOOTPRINT_CLASSES order
+EFOOTPRINT_CLASS_IMPORT_PATHS = {
+    "UsageJourneyStep": "efootprint.core.usage.usage_journey_step",
+    "UsageJourney": "efootprint.core.usage.usage_journey",
+    "Device": "efootprint.core.hardware.device",
+    "Country": "efootprint.core.country",
+    "UsagePattern": "efootprint.core.usage.usage_pattern",
+    "EdgeUsageJourney": "efootprint.core.usage.edge.edge_usage_journey",
+    "EdgeFunction": "efootprint.core.usage.edge.edge_function",
+    "EdgeUsagePattern": "efootprint.core.usage.edge.edge_usage_pattern",
+    "RecurrentEdgeStorageNeed": "efootprint.core.usage.edge.recurrent_edge_storage_need",
+    "EdgeRAMComponent": "efootprint.core.hardware.edge.edge_ram_component",
+    "EdgeCPUComponent": "efootprint.core.hardware.edge.edge_cpu_component",
+    "EdgeWorkloadComponent": "efootprint.core.hardware.edge.edge_workload_component",
+    "EdgeStorage": "efootprint.core.hardware.edge.edge_storage",
+    "EdgeComputerRAMComponent": "efootprint.builders.hardware.edge.edge_computer",
+    "EdgeComputerCPUComponent": "efootprint.builders.hardware.edge.edge_computer",
+    "EdgeApplianceComponent": "efootprint.builders.hardware.edge.edge_appliance",
+    "EdgeDevice": "efootprint.core.hardware.edge.edge_device",
+    "EdgeDeviceGroup": "efootprint.core.hardware.edge.edge_device_group",
+    "EdgeAppliance": "efootprint.builders.hardware.edge.edge_appliance",
+    "EdgeComputer": "efootprint.builders.hardware.edge.edge_computer",
+    "VideoStreaming": "efootprint.builders.services.video_streaming",
+    "BoaviztaCloudServer": "efootprint.builders.hardware.boavizta_cloud_server",
+    "EcoLogitsGenAIExternalAPI": "efootprint.builders.external_apis.ecologits.ecologits_external_api",
+    "EcoLogitsVideoGenExternalAPI": "efootprint.builders.external_apis.ecologits.ecologits_video_external_api",
+    "Job": "efootprint.core.usage.job",
+    "GPUJob": "efootprint.core.usage.job",
+    "RecurrentEdgeDeviceNeed": "efootprint.core.usage.edge.recurrent_edge_device_need",
+    "RecurrentServerNeed": "efootprint.core.usage.edge.recurrent_server_need",
+    "RecurrentEdgeComponentNeed": "efootprint.core.usage.edge.recurrent_edge_component_need",
+    "RecurrentEdgeProcessRAMNeed": "efootprint.builders.usage.edge.recurrent_edge_process",
+    "RecurrentEdgeProcessCPUNeed": "efootprint.builders.usage.edge.recurrent_edge_process",
+    "RecurrentEdgeProcessStorageNeed": "efootprint.builders.usage.edge.recurrent_edge_process",
+    "RecurrentEdgeWorkloadNeed": "efootprint.builders.usage.edge.recurrent_edge_workload",
+    "RecurrentEdgeProcess": "efootprint.builders.usage.edge.recurrent_edge_process",
+    "RecurrentEdgeWorkload": "efootprint.builders.usage.edge.recurrent_edge_workload",
+    "VideoStreamingJob": "efootprint.builders.services.video_streaming",
+    "EcoLogitsGenAIExternalAPIJob": "efootprint.builders.external_apis.ecologits.ecologits_external_api",
+    "EcoLogitsVideoGenExternalAPIJob": "efootprint.builders.external_apis.ecologits.ecologits_video_external_api",
+    "Network": "efootprint.core.hardware.network",
+    "Server": "efootprint.core.hardware.server",
+    "GPUServer": "efootprint.core.hardware.gpu_server",
+    "EcoLogitsGenAIExternalAPIServer": "efootprint.builders.external_apis.ecologits.ecologits_external_api",
+    "EcoLogitsVideoGenExternalAPIServer": "efootprint.builders.external_apis.ecologits.ecologits_video_external_api",
+    "Storage": "efootprint.core.hardware.storage",
+    "System": "efootprint.core.system",
+}
+
+@lru_cache(maxsize=None)
+def import_efootprint_class(class_name: str):
+    return getattr(import_module(EFOOTPRINT_CLASS_IMPORT_PATHS[class_name]), class_name)
+
+
+def efootprint_classes_dict_from_class_names(class_names=None):
+    """{class name: class} of the given class names that are e-footprint classes, in ALL_EFOOTPRINT_CLASSES order.
+    All classes if class_names is None."""
+    if class_names is None:
+        class_names = EFOOTPRINT_CLASS_IMPORT_PATHS
+    class_names = set(class_names)
+
+    return {class_name: import_efootprint_class(class_name) for class_name in EFOOTPRINT_CLASS_IMPORT_PATHS
+            if class_name in class_names}
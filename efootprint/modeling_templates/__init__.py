@@ -55,7 +55,7 @@ def load_template_system(template_id: str):
     from efootprint.api_utils.json_to_system import json_to_system
     tpl = get_template(template_id)
     with open(tpl.json_path) as f:
-        class_obj_dict, _, _ = json_to_system(json.load(f))
+        class_obj_dict, _, _ = json_to_system(json.load(f), upgrade_in_place=True)
     return next(iter(class_obj_dict["System"].values()))
 
 
@@ -64,5 +64,5 @@ def load_introductory_template_system(template_id: str):
     from efootprint.api_utils.json_to_system import json_to_system
     tpl = get_introductory_template(template_id)
     with open(tpl.json_path) as f:
-        class_obj_dict, _, _ = json_to_system(json.load(f))
+        class_obj_dict, _, _ = json_to_system(json.load(f), upgrade_in_place=True)
     return next(iter(class_obj_dict["System"].values()))
@@ -78,6 +78,13 @@ class ImpactRepartitionSankey:
         self._category_node_indices: set[int] = set()
         self._leaf_node_indices: set[int] = set()
         self._breakdown_node_indices: set[int] = set()
+        # Kept between builds so that refresh() only redoes what a modeling update changed
+        self._fold_outputs: dict[LifeCyclePhases, tuple[dict, dict]] = {}
+        self._source_totals: dict[tuple[str, LifeCyclePhases], tuple[Any, Quantity, list]] = {}
+        self._read_source_totals: dict[tuple[str, LifeCyclePhases], ModelingObject] = {}
+        self._layout_signature: tuple | None = None
+        self._layout_node_columns: dict[int, int] = {}
+        self._layout_column_information: list[ColumnInformation] = []
 
     @property
     def node_labels(self) -> list[str]:
@@ -204,6 +211,7 @@ class ImpactRepartitionSankey:
         self._category_node_indices = set()
         self._leaf_node_indices = set()
         self._breakdown_node_indices = set()
+        self._read_source_totals = {}
 
     def _add_node(
             self, label: str, key: NodeKey, color_key: str | None = None, obj: ModelingObject | None = None) -> int:
@@ -224,6 +232,22 @@ class ImpactRepartitionSankey:
             return value.value
         raise TypeError(f"Unsupported footprint value type: {type(value)}")
 
+    def _get_source_totals(self, source: ModelingObject, phase: LifeCyclePhases) -> tuple[Quantity, list]:
+        """Period totals of the source's phase footprint and of its breakdown by source, kept across builds as long
+        as the source's phase footprint is the same object: modeling updates replace recomputed values rather than
+        mutate them, and the breakdown is computed from the same inputs as the footprint."""
+        source_phase_footprint = self._get_source_phase_footprint(source, phase)
+        key = (source.id, phase)
+        cached = self._source_totals.get(key)
+        if cached is None or cached[0] is not source_phase_footprint:
+            cached = (source_phase_footprint, self._get_total_value(source_phase_footprint), [
+                (breakdown_source, self._get_total_value(breakdown_value))
+                for breakdown_source, breakdown_value in self._get_footprint_breakdown_by_source(source, phase).items()])
+            self._source_totals[key] = cached
+        self._read_source_totals[key] = source
+
+        return cached[1], cached[2]
+
     def _get_phases(self) -> list[LifeCyclePhases]:
         if self.lifecycle_phase_filter is not None:
             return [self.lifecycle_phase_filter]
@@ -280,14 +304,14 @@ class ImpactRepartitionSankey:
         """Decorate a flow into ``source`` with its breakdown-by-source children (e.g. EdgeDevice →
         EdgeComponent, the orthogonal hardware axis), scaled by the flow's share of the source's eager
         phase footprint."""
-        source_phase_footprint = self._get_total_value(self._get_source_phase_footprint(source, phase))
+        source_phase_footprint, breakdown_totals = self._get_source_totals(source, phase)
         if not self._is_positive(source_phase_footprint):
             return
 
-        for breakdown_source, breakdown_value in self._get_footprint_breakdown_by_source(source, phase).items():
+        for breakdown_source, breakdown_total in breakdown_totals:
             if breakdown_source is source or self._is_excluded(breakdown_source) or self._should_skip_object(breakdown_source):
                 continue
-            breakdown_source_value = self._get_total_value(breakdown_value) * flow_value / source_phase_footprint
+            breakdown_source_value = breakdown_total * flow_value / source_phase_footprint
             if not self._is_positive(breakdown_source_value):
                 continue
             breakdown_idx = self._add_node(
@@ -368,21 +392,55 @@ class ImpactRepartitionSankey:
             else:
                 self._add_link(coarser_idx, container_indices[finer], value)
 
+    def _current_fold_outputs(self) -> dict[LifeCyclePhases, tuple[dict, dict]]:
+        visible_levels = self._fold_visible_levels()
+        excluded_sources = self._fold_excluded_sources()
+        return {phase: node_totals_and_links(self.system, phase, visible_levels, exclude=excluded_sources)
+                for phase in self._get_phases()}
+
+    def _is_up_to_date(self, fold_outputs: dict[LifeCyclePhases, tuple[dict, dict]]) -> bool:
+        """Whether the last build read the same fold outputs and source footprints as the system now exposes. Fold
+        outputs are memoized and only flushed when a modeling update replaces a value they read, so an identical
+        fold output object means unchanged flows."""
+        if fold_outputs.keys() != self._fold_outputs.keys() or any(
+                fold_output[index] is not self._fold_outputs[phase][index]
+                for phase, fold_output in fold_outputs.items() for index in (0, 1)):
+            return False
+        return all(self._get_source_phase_footprint(source, key[1]) is self._source_totals[key][0]
+                   for key, source in self._read_source_totals.items())
+
+    @time_it
+    def refresh(self) -> bool:
+        """Bring the Sankey up to date with its system after modeling updates, e.g. after each slider move of an
+        interactive front end, and return whether it had to be rebuilt.
+
+        Nothing is redone if the attribution fold outputs and source footprints the last build read are unchanged.
+        Otherwise the Sankey is rebuilt on the new fold outputs, reusing the period sums of unchanged hourly
+        footprints and, when the nodes and links are the same as in the last build (only their values changed),
+        its column layout."""
+        fold_outputs = self._current_fold_outputs()
+        if self._built and self._is_up_to_date(fold_outputs):
+            return False
+        self._built = False
+        self._build(fold_outputs)
+        return True
+
     @time_it
     def build(self) -> None:
         if self._built:
             return
+        self._build(self._current_fold_outputs())
+
+    def _build(self, fold_outputs: dict[LifeCyclePhases, tuple[dict, dict]]) -> None:
         self._reset_build_state()
+        self._fold_outputs = fold_outputs
 
         phases = self._get_phases()
-        visible_levels = self._fold_visible_levels()
-        excluded_sources = self._fold_excluded_sources()
         source_classes = self._source_level_classes()
         phase_data = {}
         phase_totals = {}
         for phase in phases:
-            fold_node_totals, fold_links = node_totals_and_links(
-                self.system, phase, visible_levels, exclude=excluded_sources)
+            fold_node_totals, fold_links = fold_outputs[phase]
             node_totals = {node: self._get_total_value(value) for node, value in fold_node_totals.items()}
             links = {pair: self._get_total_value(value) for pair, value in fold_links.items()}
             phase_data[phase] = (node_totals, links)
@@ -426,8 +484,20 @@ class ImpactRepartitionSankey:
         for phase in phases:
             self._render_phase(phase, phase_parents[phase], *phase_data[phase])
 
-        self._assign_columns()
-        self._assign_category_leaf_and_breakdown_columns()
+        layout_signature = (
+            tuple(self._graph.node_indices), tuple(zip(self.link_sources, self.link_targets)),
+            frozenset(self._category_node_indices), frozenset(self._leaf_node_indices),
+            frozenset(self._breakdown_node_indices), tuple(self._node_columns.items()))
+        if layout_signature == self._layout_signature:
+            self._node_columns = dict(self._layout_node_columns)
+            self._manual_column_information = list(self._layout_column_information)
+        else:
+            self._assign_columns()
+            self._assign_category_leaf_and_breakdown_columns()
+            self._layout_signature = layout_signature
+            self._layout_node_columns = dict(self._node_columns)
+            self._layout_column_information = list(self._manual_column_information)
+        self._source_totals = {key: self._source_totals[key] for key in self._read_source_totals}
         self._aggregate_small_nodes_by_column()
         self._insert_spacer_nodes()
         self._built = True
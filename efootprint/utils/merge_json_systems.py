@@ -20,22 +20,15 @@ def merge_json_systems(system_dicts, merged_system_name="Merged system"):
         raise ValueError("merge_json_systems requires at least one input system dict.")
 
     efootprint_class_keys = set(ALL_CONCRETE_EFOOTPRINT_CLASSES_DICT.keys())
-    upgraded_systems = [upgrade_system_dict_to_current_version(deepcopy(sd)) for sd in system_dicts]
+    upgraded_systems = [upgrade_system_dict_to_current_version(sd) for sd in system_dicts]
     for idx, sd in enumerate(upgraded_systems):
         if not sd.get("System"):
             raise ValueError(f"System dict at index {idx} has no 'System' class entry; cannot merge.")
 
-    id_occurrences = {}
     per_system_ids = [_all_ids_in_system(sd, efootprint_class_keys) for sd in upgraded_systems]
-    for idx, ids in enumerate(per_system_ids):
-        for obj_id in ids:
-            id_occurrences.setdefault(obj_id, []).append(idx)
-    colliding_ids = {obj_id for obj_id, indexes in id_occurrences.items() if len(indexes) > 1}
-
-    renamed_systems = []
-    for idx, sd in enumerate(upgraded_systems):
-        rename_map = {obj_id: f"{obj_id}-{idx}" for obj_id in per_system_ids[idx] if obj_id in colliding_ids}
-        renamed_systems.append(_apply_rename_map(sd, rename_map, efootprint_class_keys))
+    renamed_systems = [
+        _apply_rename_map(sd, rename_map, efootprint_class_keys)
+        for sd, rename_map in zip(upgraded_systems, _rename_maps(per_system_ids))]
 
     output_dict = {"efootprint_version": efootprint.__version__}
     merged_usage_patterns = []
@@ -49,7 +42,8 @@ def merge_json_systems(system_dicts, merged_system_name="Merged system"):
                 continue
             output_dict.setdefault(class_key, {}).update(class_dict)
 
-    merged_system_id = _derive_merged_system_id(system_dicts)
+    merged_system_id = _derive_merged_system_id(
+        [system_id for sd in system_dicts for system_id in (sd.get("System") or {}).keys()])
     output_dict["System"] = {
         merged_system_id: {
             "name": merged_system_name,
@@ -61,6 +55,58 @@ def merge_json_systems(system_dicts, merged_system_name="Merged system"):
     return output_dict
 
 
+def merge_systems(systems, merged_system_name="Merged system"):
+    """In-memory counterpart of merge_json_systems: merge e-footprint Systems into a new System.
+
+    The objects of the input systems are cloned (see graph_clone), with their calculated attributes, under the id
+    renaming rules of merge_json_systems, so that only the merged System footprints are computed. The input systems
+    are left untouched.
+    """
+    from efootprint.abstract_modeling_classes.graph_clone import clone_modeling_objects, objects_saved_with
+    from efootprint.core.system import System
+    if not systems:
+        raise ValueError("merge_systems requires at least one input system.")
+
+    per_system_objects = [[mod_obj for mod_obj in objects_saved_with(system) if mod_obj is not system]
+                          for system in systems]
+    per_system_ids = [{mod_obj.id for mod_obj in mod_objs} for mod_objs in per_system_objects]
+    clones_by_id = {}
+    merged_usage_patterns = []
+    merged_edge_usage_patterns = []
+    for system, mod_objs, rename_map in zip(systems, per_system_objects, _rename_maps(per_system_ids)):
+        clones = clone_modeling_objects(mod_objs, rename_map)
+        clones_by_id.update({clone.id: clone for clone in clones.values()})
+        merged_usage_patterns += [rename_map.get(up.id, up.id) for up in system.usage_patterns]
+        merged_edge_usage_patterns += [rename_map.get(eup.id, eup.id) for eup in system.edge_usage_patterns]
+
+    merged_system_id = _derive_merged_system_id([system.id for system in systems])
+    merged_system, _ = System.from_json_dict(
+        {"name": merged_system_name, "id": merged_system_id, "usage_patterns": merged_usage_patterns,
+         "edge_usage_patterns": merged_edge_usage_patterns}, clones_by_id)
+    merged_system.set_initial_and_previous_footprints()
+    merged_system.compute_calculated_attributes()
+    merged_system.initial_total_energy_footprints_sum_over_period = \
+        merged_system.total_energy_footprint_sum_over_period
+    merged_system.initial_total_fabrication_footprints_sum_over_period = \
+        merged_system.total_fabrication_footprint_sum_over_period
+    merged_system.trigger_modeling_updates = True
+
+    return merged_system
+
+
+def _rename_maps(per_system_ids):
+    """One {id: renamed id} map per system, renaming the ids found in several systems to `id-X`, X being the index of
+    the system."""
+    id_occurrences = {}
+    for idx, ids in enumerate(per_system_ids):
+        for obj_id in ids:
+            id_occurrences.setdefault(obj_id, []).append(idx)
+    colliding_ids = {obj_id for obj_id, indexes in id_occurrences.items() if len(indexes) > 1}
+
+    return [{obj_id: f"{obj_id}-{idx}" for obj_id in ids if obj_id in colliding_ids}
+            for idx, ids in enumerate(per_system_ids)]
+
+
 def _all_ids_in_system(system_dict, efootprint_class_keys):
     ids = set()
     for class_key, class_dict in system_dict.items():
@@ -99,10 +145,7 @@ def _rewrite_refs(value, rename_map):
     return value
 
 
-def _derive_merged_system_id(system_dicts):
-    original_ids = []
-    for sd in system_dicts:
-        original_ids.extend((sd.get("System") or {}).keys())
+def _derive_merged_system_id(original_ids):
     hash_suffix = hashlib.md5("|".join(original_ids).encode()).hexdigest()[:6]
     return f"merged-system-{hash_suffix}"
 
@@ -1,5 +1,3 @@
-from pyvis.network import Network
-
 from efootprint.utils.graph_tools import WIDTH, HEIGHT, set_string_max_width
 
 COLOR_MAP = {
@@ -50,6 +48,8 @@ def get_node_color(input_mod_obj):
 def build_object_relationships_graph(
         input_mod_obj, input_graph=None, visited_python_ids=None, classes_to_ignore=None, width=WIDTH, height=HEIGHT,
         notebook=False):
+    from pyvis.network import Network
+
     cdn_resources = "local"
     if notebook:
         cdn_resources = "in_line"
@@ -0,0 +1,158 @@
+import json
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+# Calculation phases recorded by the profiler
+SYSTEM_BUILD = "System build"
+MODELING_UPDATE = "ModelingUpdate"
+JSON_LOAD = "JSON load"
+JSON_SAVE = "JSON save"
+ATTRIBUTION_FOLD = "Attribution fold"
+UPDATE_FUNCTION = "Update function"
+
+# Report collecting records, set by profile(). Read by every hook, so that they cost a single lookup when no profiling
+# is going on.
+active_report = None
+
+
+def array_nbytes(value) -> int:
+    """Number of bytes of the numpy arrays or compact series held by an explainable object or by the values of a
+    dict of them."""
+    if isinstance(value, dict):
+        return sum(array_nbytes(elt) for elt in value.values())
+    compact_value = getattr(value, "compact_value", None)
+    if compact_value is not None and getattr(value, "_value", None) is None:
+        return int(compact_value.nbytes)
+    magnitude = getattr(getattr(value, "_value", None), "magnitude", None)
+
+    return int(getattr(magnitude, "nbytes", 0))
+
+
+class ProfileReport:
+    """Wall time, output array bytes and number of calls of update functions and calculation phases, recorded within
+    a profile() block. Records are aggregated per (phase, class, function, object) in ``stats`` and kept one by one
+    in ``events`` for trace exports."""
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.stats = {}
+        self.events = []
+        self.open_phases = []
+        self.lock = threading.Lock()
+
+    def record(self, category: str, function_name: str, mod_obj, start: float, end: float, nbytes: int = 0):
+        # class_as_simple_str sees through ContextualModelingObjectAttribute wrappers
+        class_name = getattr(mod_obj, "class_as_simple_str", type(mod_obj).__name__) if mod_obj is not None else None
+        object_id = getattr(mod_obj, "id", None)
+        phase = self.open_phases[-1] if self.open_phases else None
+        with self.lock:
+            key = (phase, category, class_name, function_name, object_id)
+            if key not in self.stats:
+                self.stats[key] = {"object_name": getattr(mod_obj, "name", None), "wall_time": 0, "nbytes": 0,
+                                   "nb_calls": 0}
+            stat = self.stats[key]
+            stat["wall_time"] += end - start
+            stat["nbytes"] += nbytes
+            stat["nb_calls"] += 1
+            self.events.append({
+                "category": category, "name": function_name, "class_name": class_name, "object_id": object_id,
+                "start": start, "end": end, "nbytes": nbytes, "thread_id": threading.get_ident()})
+
+    def to_dataframe(self, per_object=True):
+        """Flat table of the records, one row per (phase, category, class, function, object), sorted by decreasing
+        wall time. With per_object set to False, rows of a same function are summed over objects."""
+        from pandas import DataFrame
+        rows = [
+            {"Phase": phase, "Category": category, "Class": class_name, "Function": function_name,
+             "Object id": object_id, "Object name": stat["object_name"], "Wall time (s)": stat["wall_time"],
+             "Array bytes": stat["nbytes"], "Calls": stat["nb_calls"]}
+            for (phase, category, class_name, function_name, object_id), stat in self.stats.items()]
+        columns = ["Phase", "Category", "Class", "Function", "Object id", "Object name", "Wall time (s)",
+                   "Array bytes", "Calls"]
+        df = DataFrame(rows, columns=columns)
+        if not per_object:
+            df = df.drop(columns=["Object id", "Object name"]).groupby(
+                ["Phase", "Category", "Class", "Function"], dropna=False, as_index=False).sum()
+
+        return df.sort_values("Wall time (s)", ascending=False, ignore_index=True)
+
+    def to_chrome_trace(self, output_filepath=None) -> dict:
+        """Records as complete events of the Chrome trace event format, which chrome://tracing, Perfetto and
+        speedscope all open. Written to output_filepath if given."""
+        trace_events = []
+        for event in self.events:
+            trace_event_name = event["name"] if event["class_name"] is None \
+                else f"{event['class_name']}.{event['name']}"
+            trace_events.append({
+                "name": trace_event_name, "cat": event["category"], "ph": "X", "pid": 0, "tid": event["thread_id"],
+                "ts": round(1e6 * (event["start"] - self.start), 3),
+                "dur": round(1e6 * (event["end"] - event["start"]), 3),
+                "args": {"object_id": event["object_id"], "nbytes": event["nbytes"]}})
+        trace = {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+        if output_filepath is not None:
+            with open(output_filepath, "w") as file:
+                json.dump(trace, file)
+
+        return trace
+
+
+@contextmanager
+def profile():
+    """Record calculation times within the block: ``with efootprint.profile() as report:``. Profiling blocks can be
+    nested, the innermost one receiving the records."""
+    global active_report
+    previous_report = active_report
+    report = ProfileReport()
+    active_report = report
+    try:
+        yield report
+    finally:
+        active_report = previous_report
+
+
+@contextmanager
+def profiled_phase(phase: str, function_name: str, mod_obj=None):
+    report = active_report
+    if report is None:
+        yield
+        return
+    report.open_phases.append(phase)
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        report.open_phases.pop()
+        report.record(phase, function_name, mod_obj, start, perf_counter())
+
+
+def profiled(phase: str, first_arg_is_profiled_object=False):
+    """Decorator recording each call of a function as a phase, attributed to its first argument (a ModelingObject) if
+    first_arg_is_profiled_object is set."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if active_report is None:
+                return func(*args, **kwargs)
+            with profiled_phase(phase, func.__name__, args[0] if first_arg_is_profiled_object else None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def call_update_function(update_function, mod_obj, attr_name: str, *args):
+    """Call the update function of a calculated attribute (with the dict key as argument for dict elements), recording
+    it if a profile() block is open."""
+    report = active_report
+    if report is None:
+        return update_function(*args)
+    start = perf_counter()
+    update_function(*args)
+    end = perf_counter()
+    value = mod_obj.__dict__.get(attr_name)
+    if args and isinstance(value, dict):
+        value = value.get(args[0])
+    report.record(UPDATE_FUNCTION, update_function.__name__, mod_obj, start, end, array_nbytes(value))
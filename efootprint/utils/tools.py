@@ -28,3 +28,23 @@ def time_it(func):
             logger.info(f"Function {func.__name__} took {diff*1000:.1f} ms to execute.")
         return result
     return wrapper
+
+
+class lazy_class_attribute:
+    """Class attribute computed by the decorated function on first access, through the class or an instance, and
+    then stored on the class in place of the descriptor. Used for catalogs (EcoLogits models, Boavizta instance
+    types…) that would otherwise be loaded when their module is imported."""
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        value = self.func(self.owner)
+        setattr(self.owner, self.name, value)
+
+        return value
@@ -0,0 +1,83 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from efootprint.abstract_modeling_classes.calculation_graph_index import (
+    CalculationGraphIndex, ancestors_of, calculation_graph_version, descendants_of,
+    invalidate_calculation_graph_closures)
+
+
+def create_node(node_id):
+    node = MagicMock(id=node_id)
+    node.direct_ancestors_with_id = []
+    node.direct_children_with_id = []
+
+    return node
+
+
+def link(parent, child):
+    parent.direct_children_with_id.append(child)
+    child.direct_ancestors_with_id.append(parent)
+
+
+class TestCalculationGraphIndex(TestCase):
+    def setUp(self):
+        # Diamond: root -> left, right -> bottom, plus a shortcut root -> bottom
+        self.root = create_node("root")
+        self.left = create_node("left")
+        self.right = create_node("right")
+        self.bottom = create_node("bottom")
+        link(self.root, self.left)
+        link(self.root, self.right)
+        link(self.left, self.bottom)
+        link(self.right, self.bottom)
+        link(self.root, self.bottom)
+
+    def test_ancestors_of_walks_in_pre_order_and_deduplicates(self):
+        self.assertEqual([self.left, self.root, self.right], ancestors_of([self.bottom]))
+
+    def test_ancestors_of_several_values_matches_concatenation_deduplicated(self):
+        # left ancestors are [root], bottom ancestors are [left, root, right]
+        self.assertEqual([self.root, self.left, self.right], ancestors_of([self.left, self.bottom]))
+
+    def test_ancestors_of_visits_each_node_once_on_deep_diamond_chains(self):
+        # Exhaustive ancestry walks are exponential in the number of stacked diamonds
+        top = create_node("top")
+        current = top
+        for level in range(60):
+            left, right, bottom = (create_node(f"{name}_{level}") for name in ("left", "right", "bottom"))
+            link(current, left)
+            link(current, right)
+            link(left, bottom)
+            link(right, bottom)
+            current = bottom
+
+        self.assertEqual(3 * 60, len(ancestors_of([current])))
+
+    def test_descendants_of(self):
+        self.assertEqual([self.left, self.right, self.bottom], descendants_of(self.root))
+
+    def test_index_deduplicates_nodes_by_id(self):
+        duplicate_left = create_node("left")
+        index = CalculationGraphIndex([self.root, self.left, duplicate_left, self.bottom])
+
+        self.assertEqual([self.root, self.left, self.bottom], index.nodes)
+        self.assertEqual([[1, 2], [2], []], index.children)
+        self.assertEqual([[], [0], [1, 0]], index.ancestors)
+
+    def test_updates_chain_puts_every_node_after_its_ancestors(self):
+        index = CalculationGraphIndex.from_descendants_of(self.root)
+
+        self.assertEqual([self.left, self.right, self.bottom], index.updates_chain())
+
+    def test_updates_chain_ignores_ancestors_outside_of_index(self):
+        outsider = create_node("outsider")
+        link(outsider, self.bottom)
+        index = CalculationGraphIndex.from_descendants_of(self.left)
+
+        self.assertEqual([self.bottom], index.updates_chain())
+
+    def test_invalidate_calculation_graph_closures_bumps_version(self):
+        version = calculation_graph_version()
+        invalidate_calculation_graph_closures()
+
+        self.assertEqual(version + 1, calculation_graph_version())
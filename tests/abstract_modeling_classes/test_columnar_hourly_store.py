@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+import numpy as np
+from pint import Quantity
+
+from efootprint.abstract_modeling_classes.columnar_hourly_store import (
+    ColumnarHourlyStore, align_store_backed_arrays, store_owning_array, utc_hour_index)
+from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import (
+    ExplainableHourlyQuantities, align_temporally_quantity_arrays)
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.constants.units import u
+from efootprint.core.hardware.server import Server
+from tests.utils import build_system, create_mod_obj_mock
+
+
+def linked_hourly(values, start_date, unit=u.kg, attr_name="energy_footprint", container_name="server"):
+    hourly = ExplainableHourlyQuantities(Quantity(np.array(values, dtype=np.float32), unit), start_date, attr_name)
+    hourly.set_modeling_obj_container(create_mod_obj_mock(Server, container_name, **{attr_name: hourly}), attr_name)
+
+    return hourly
+
+
+class TestColumnarHourlyStore(TestCase):
+    def setUp(self):
+        self.start_date = datetime(2025, 1, 1)
+        self.first = linked_hourly([1, 2, 3], self.start_date, container_name="server 1")
+        self.second = linked_hourly([10, 20], self.start_date + timedelta(hours=2), container_name="server 2")
+        self.store = ColumnarHourlyStore.from_hourly_quantities([self.first, self.second])
+
+    def test_ingestion_repoints_values_to_rows_of_a_single_matrix(self):
+        """Test registered hourly quantities become views of the store matrix with unchanged values."""
+        self.assertIs(self.store, store_owning_array(self.first.magnitude))
+        self.assertIs(self.store, store_owning_array(self.second.magnitude))
+        self.assertEqual([1, 2, 3], self.first.value_as_float_list)
+        self.assertEqual([10, 20], self.second.value_as_float_list)
+        self.assertEqual(4, self.store.nb_hours)
+        self.assertEqual([0, 0, 10, 20], self.store.matrix[self.store.row_by_key[self.second.id]].tolist())
+
+    def test_alignment_of_stored_series_is_an_offset_lookup(self):
+        """Test aligning two stored series returns row views over the union window without copying."""
+        first_array, second_array, common_start = align_store_backed_arrays(
+            self.first.magnitude, self.first.start_date, self.second.magnitude, self.second.start_date)
+
+        self.assertEqual([1, 2, 3, 0], first_array.tolist())
+        self.assertEqual([0, 0, 10, 20], second_array.tolist())
+        self.assertEqual(self.start_date, common_start)
+        self.assertIs(self.store.matrix, first_array.base)
+
+    def test_alignment_fast_path_gives_same_result_as_padding(self):
+        """Test align_temporally_quantity_arrays gives identical results for stored and unstored operands."""
+        stored_result = align_temporally_quantity_arrays(
+            self.first.value, self.first.start_date, self.second.value, self.second.start_date)
+        padded_result = align_temporally_quantity_arrays(
+            self.first.value.copy(), self.first.start_date, self.second.value.copy(), self.second.start_date)
+
+        for stored_array, padded_array in zip(stored_result[:2], padded_result[:2]):
+            self.assertEqual(padded_array.tolist(), stored_array.tolist())
+        self.assertEqual(padded_result[2], stored_result[2])
+        self.assertEqual([1, 2, 13, 20], (self.first + self.second).value_as_float_list)
+
+    def test_alignment_of_a_sliced_row_falls_back_to_padding(self):
+        """Test aligning a sub-slice of a stored row ignores the row values before the slice start."""
+        first = linked_hourly([1, 2, 3, 4, 5], self.start_date, container_name="server 3")
+        second = linked_hourly([10, 20, 30, 40, 50], self.start_date, container_name="server 4")
+        self.store.ingest_all([first, second])
+        sliced_first = first.value[3:]
+
+        self.assertIsNone(align_store_backed_arrays(
+            sliced_first.magnitude, self.start_date + timedelta(hours=3), second.magnitude, self.start_date))
+        first_array, second_array, common_start = align_temporally_quantity_arrays(
+            sliced_first, self.start_date + timedelta(hours=3), second.value, self.start_date)
+
+        self.assertEqual([0, 0, 0, 4, 5], first_array.tolist())
+        self.assertEqual([10, 20, 30, 40, 50], second_array.tolist())
+        self.assertEqual(self.start_date, common_start)
+
+    def test_reingesting_a_key_never_overwrites_rows_shared_with_derived_values(self):
+        """Test replacing a stored value allocates a fresh row and leaves values sharing the old row intact."""
+        shared = EmptyExplainableObject() + self.first
+        replacement = linked_hourly([7, 7, 7], self.start_date, container_name="server 1")
+
+        self.store.ingest(replacement)
+
+        self.assertEqual([1, 2, 3], shared.value_as_float_list)
+        self.assertEqual([7, 7, 7], replacement.value_as_float_list)
+        self.assertEqual(1, self.store.nb_retired_rows)
+
+    def test_ingesting_outside_the_axis_extends_it(self):
+        """Test a series starting before the store axis triggers a rebuild keeping stored values."""
+        earlier = linked_hourly([5, 5], self.start_date - timedelta(hours=2), container_name="server 3")
+
+        self.store.ingest(earlier)
+
+        self.assertEqual(utc_hour_index(self.start_date - timedelta(hours=2)), self.store.start_hour)
+        self.assertEqual([1, 2, 3], self.first.value_as_float_list)
+        self.assertEqual([10, 20], self.second.value_as_float_list)
+        self.assertIs(self.store, store_owning_array(self.first.magnitude))
+
+    def test_sum_converts_units_and_spans_the_union_window(self):
+        """Test the masked reduction converts every row to the first unit before summing."""
+        in_grams = linked_hourly([1000, 1000], self.start_date + timedelta(hours=3), u.g, container_name="server 3")
+
+        summed_quantity, start_date = self.store.sum([self.first, self.second, in_grams])
+
+        self.assertEqual(u.kg, summed_quantity.units)
+        self.assertEqual(self.start_date, start_date)
+        self.assertEqual([1, 2, 13, 21, 1], summed_quantity.magnitude.tolist())
+
+    def test_explainable_sum_keeps_every_value_as_direct_ancestor(self):
+        """Test explainable_sum exposes the same ancestors as the python sum it replaces."""
+        values = [self.first, EmptyExplainableObject(), self.second]
+
+        store_sum = self.store.explainable_sum(values, label="total")
+        python_sum = sum(values, start=EmptyExplainableObject())
+
+        self.assertEqual(python_sum.value_as_float_list, store_sum.value_as_float_list)
+        self.assertEqual({ancestor.id for ancestor in python_sum.direct_ancestors_with_id},
+                         {ancestor.id for ancestor in store_sum.direct_ancestors_with_id})
+
+    def test_ingesting_unlinked_value_raises(self):
+        """Test values outside the calculation graph can't be stored since they have no key."""
+        unlinked = ExplainableHourlyQuantities(
+            Quantity(np.ones(2, dtype=np.float32), u.kg), self.start_date, "unlinked")
+
+        with self.assertRaises(ValueError):
+            self.store.ingest(unlinked)
+
+
+class TestSystemColumnarHourlyStore(TestCase):
+    def test_total_footprint_matches_default_computation_and_follows_updates(self):
+        """Test a system with the columnar store enabled keeps the same total footprint through updates."""
+        reference_system = build_system("reference", "reference server")
+        stored_system = build_system("stored", "stored server")
+
+        stored_system.enable_columnar_hourly_store()
+
+        self.assertTrue(np.allclose(reference_system.total_footprint.magnitude,
+                                    stored_system.total_footprint.magnitude, rtol=1e-5))
+        server = stored_system.servers[0]
+        self.assertTrue(stored_system.columnar_hourly_store.is_registered(server.energy_footprint))
+
+        for system in (reference_system, stored_system):
+            system.servers[0].power = SourceValue(500 * u.W)
+
+        self.assertTrue(np.allclose(reference_system.total_footprint.magnitude,
+                                    stored_system.total_footprint.magnitude, rtol=1e-5))
+        self.assertTrue(stored_system.columnar_hourly_store.is_registered(server.energy_footprint))
@@ -0,0 +1,197 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytz
+from pint import Quantity
+
+from efootprint.abstract_modeling_classes.compact_hourly_quantities import (
+    ConstantHourlyQuantities, PeriodicHourlyQuantities, RunLengthHourlyQuantities, WEEK_IN_HOURS)
+from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
+from efootprint.abstract_modeling_classes.explainable_recurrent_quantities import ExplainableRecurrentQuantities
+from efootprint.abstract_modeling_classes.explainable_timezone import ExplainableTimezone
+from efootprint.constants.units import u
+
+LENGTH = 3 * WEEK_IN_HOURS + 37
+
+
+def build_compact_series():
+    rng = np.random.default_rng(0)
+    return {
+        "constant": ConstantHourlyQuantities(3, LENGTH, u.W),
+        "periodic": PeriodicHourlyQuantities(rng.random(WEEK_IN_HOURS) + 1, 5, LENGTH, u.W),
+        "daily_periodic": PeriodicHourlyQuantities(rng.random(24) + 1, 3, LENGTH, u.W, head=[7, 8], tail=[9]),
+        "run_length": RunLengthHourlyQuantities(rng.random(5) + 1, [24, 100, 1, LENGTH - 200, 75], u.W),
+    }
+
+
+class TestCompactHourlyQuantities(unittest.TestCase):
+    def setUp(self):
+        self.series = build_compact_series()
+
+    def test_reductions_match_materialized_values(self):
+        for name, series in self.series.items():
+            with self.subTest(name):
+                values = series.to_array()
+                self.assertEqual(LENGTH, len(values))
+                self.assertEqual(np.float32, values.dtype)
+                self.assertAlmostEqual(values.sum(dtype=np.float64), series.sum(), places=3)
+                self.assertEqual(values.max(), series.max())
+                self.assertEqual(values.min(), series.min())
+                self.assertFalse(series.any_zero())
+
+    def test_roll_matches_np_roll(self):
+        for name, series in self.series.items():
+            for nb_hours in (0, 1, 9, -5, -14, LENGTH - 2):
+                with self.subTest(name=name, nb_hours=nb_hours):
+                    rolled = series.roll(nb_hours)
+                    self.assertIsNotNone(rolled)
+                    self.assertIs(type(series), type(rolled))
+                    np.testing.assert_array_equal(np.roll(series.to_array(), -nb_hours), rolled.to_array())
+
+    def test_window_matches_array_slice(self):
+        for name, series in self.series.items():
+            for start, stop in ((0, LENGTH), (0, 1), (3, 30), (24, 125), (124, 125), (100, LENGTH)):
+                with self.subTest(name=name, start=start, stop=stop):
+                    window = series.window(start, stop)
+                    self.assertIs(type(series), type(window))
+                    np.testing.assert_array_equal(series.to_array()[start:stop], window.to_array())
+
+    def test_combinations_match_dense_computation_and_stay_compact_when_kinds_allow(self):
+        expected_kinds = {
+            ("constant", "periodic"): PeriodicHourlyQuantities,
+            ("periodic", "daily_periodic"): PeriodicHourlyQuantities,
+            ("run_length", "constant"): RunLengthHourlyQuantities,
+            ("run_length", "run_length"): RunLengthHourlyQuantities,
+            ("constant", "constant"): ConstantHourlyQuantities,
+            ("periodic", "run_length"): None,
+        }
+        for (first_name, second_name), expected_kind in expected_kinds.items():
+            first, second = self.series[first_name], self.series[second_name]
+            for func in (np.add, np.multiply, np.divide, np.maximum):
+                with self.subTest(first=first_name, second=second_name, func=func.__name__):
+                    combination = first.combine(second, func, u.W)
+                    if expected_kind is None:
+                        self.assertIsNone(combination)
+                        continue
+                    self.assertIsInstance(combination, expected_kind)
+                    np.testing.assert_allclose(
+                        func(first.to_array(), second.to_array()), combination.to_array(), rtol=1e-6)
+
+    def test_periodic_combination_with_too_long_combined_period_returns_none(self):
+        five_hours_period = PeriodicHourlyQuantities(np.arange(1, 6), 0, LENGTH, u.W)
+
+        self.assertIsNone(self.series["periodic"].combine(five_hours_period, np.add, u.W))
+
+    def test_unit_conversion(self):
+        converted = self.series["periodic"].to(u.kW)
+
+        self.assertEqual(u.kW, converted.units)
+        np.testing.assert_allclose(self.series["periodic"].to_array() / 1000, converted.to_array(), rtol=1e-6)
+
+
+class TestExplainableHourlyQuantitiesWithCompactValues(unittest.TestCase):
+    def setUp(self):
+        self.start_date = datetime(2025, 1, 1, tzinfo=pytz.utc)
+        self.series = build_compact_series()
+
+    def hourly(self, name):
+        return ExplainableHourlyQuantities(self.series[name], self.start_date, name)
+
+    def dense(self, name):
+        return ExplainableHourlyQuantities(self.series[name].to_quantity(), self.start_date, name)
+
+    def test_compact_operations_give_same_results_as_dense_ones_and_stay_compact(self):
+        scalar = ExplainableQuantity(2 * u.h, "scalar")
+        operations = {
+            "constant times periodic": lambda get: get("constant") * get("periodic"),
+            "periodic plus daily periodic": lambda get: get("periodic") + get("daily_periodic"),
+            "run length minus constant": lambda get: get("run_length") - get("constant"),
+            "periodic divided by constant": lambda get: get("periodic") / get("constant"),
+            "periodic times scalar": lambda get: get("periodic") * scalar,
+            "scalar divided by run length": lambda get: scalar / get("run_length"),
+            "scalar minus periodic": lambda get: ExplainableQuantity(2 * u.kW, "kW scalar") - get("periodic"),
+            "max with empty": lambda get: get("periodic").np_compared_with(EmptyExplainableObject(), "max"),
+            "ceil": lambda get: get("daily_periodic").ceil(),
+        }
+        for name, operation in operations.items():
+            with self.subTest(name):
+                compact_result = operation(self.hourly)
+                dense_result = operation(self.dense)
+                self.assertTrue(compact_result.is_compact)
+                self.assertFalse(dense_result.is_compact)
+                self.assertEqual(dense_result.unit, compact_result.unit)
+                np.testing.assert_allclose(dense_result.magnitude, compact_result.magnitude, rtol=1e-6)
+
+    def test_reductions_do_not_materialize(self):
+        periodic = self.hourly("periodic")
+
+        self.assertAlmostEqual(float(self.dense("periodic").sum().magnitude), float(periodic.sum().magnitude),
+                               places=1)
+        self.assertEqual(self.dense("periodic").max(), periodic.max())
+        self.assertEqual(LENGTH, len(periodic))
+        self.assertEqual(self.dense("periodic").end_date, periodic.end_date)
+        self.assertTrue(periodic.is_compact)
+
+    def test_mixing_with_dense_series_gives_dense_result_and_leaves_operand_compact(self):
+        periodic = self.hourly("periodic")
+        result = periodic * self.dense("run_length")
+
+        self.assertFalse(result.is_compact)
+        self.assertTrue(periodic.is_compact)
+        np.testing.assert_allclose(
+            self.series["periodic"].to_array() * self.series["run_length"].to_array(), result.magnitude, rtol=1e-6)
+
+    def test_compact_operand_of_several_dense_operations_is_expanded_once(self):
+        periodic = self.hourly("periodic")
+        dense_run_length = self.dense("run_length")
+
+        with patch.object(PeriodicHourlyQuantities, "values_at", autospec=True,
+                          side_effect=PeriodicHourlyQuantities.values_at) as values_at_mock:
+            product = periodic * dense_run_length
+            total = periodic + dense_run_length
+
+        self.assertEqual(1, values_at_mock.call_count)
+        self.assertTrue(periodic.is_compact)
+        self.assertFalse(periodic.operand_value.magnitude.flags.writeable)
+        np.testing.assert_allclose(
+            self.series["periodic"].to_array() + self.series["run_length"].to_array(), total.magnitude, rtol=1e-6)
+        self.assertTrue(product.magnitude.flags.writeable)
+
+    def test_reading_value_materializes_and_drops_compact_value(self):
+        periodic = self.hourly("periodic")
+        periodic.magnitude[:3] = 0
+
+        self.assertFalse(periodic.is_compact)
+        self.assertEqual(0, periodic.min().magnitude)
+
+    def test_division_by_compact_series_with_zeros_raises(self):
+        zeros = ExplainableHourlyQuantities(ConstantHourlyQuantities(0, LENGTH, u.W), self.start_date, "zeros")
+
+        with self.assertRaises(ZeroDivisionError):
+            self.hourly("periodic") / zeros
+
+    def test_recurrent_quantities_expansion_is_compact_and_matches_rolled_week(self):
+        week_values = np.arange(WEEK_IN_HOURS, dtype=np.float32)
+        recurrent = ExplainableRecurrentQuantities(Quantity(week_values, u.W), "week")
+        timespan = ExplainableHourlyQuantities(ConstantHourlyQuantities(1, LENGTH, u.W), self.start_date, "timespan")
+        for timezone_name in ("Europe/Paris", "America/New_York", "UTC"):
+            with self.subTest(timezone_name):
+                local_timezone = ExplainableTimezone(pytz.timezone(timezone_name), "timezone")
+                expanded = recurrent.generate_hourly_quantities_over_timespan(timespan, local_timezone)
+                naive_start = self.start_date.replace(tzinfo=None)
+                offset_hours = round(
+                    local_timezone.value.localize(naive_start).utcoffset().total_seconds() / 3600)
+                start_offset_in_week = naive_start.weekday() * 24
+                expected_values = np.roll(
+                    week_values[(start_offset_in_week + np.arange(LENGTH)) % WEEK_IN_HOURS], -offset_hours)
+
+                self.assertTrue(expanded.is_compact)
+                np.testing.assert_array_equal(expected_values, expanded.magnitude)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ from efootprint.abstract_modeling_classes.explainable_hourly_quantities import E
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.explainable_object_base_class import ExplainableObject
+from efootprint.abstract_modeling_classes.source_objects import SourceHourlyValues
 from efootprint.constants.units import u
 
 
@@ -406,6 +407,20 @@ class TestExplainableHourlyQuantities(unittest.TestCase):
         self.assertEqual(u.GB, duplicated.unit)
         self.assertEqual(start_date, duplicated.start_date)
 
+    def test_copy_sharing_value_shares_a_read_only_view_of_the_array(self):
+        start_date = datetime.strptime("2025-01-01", "%Y-%m-%d")
+        hourly_usage_data = SourceHourlyValues(
+            Quantity(np.array([1.5] * 24, dtype=np.float32), u.GB), start_date=start_date, label="test")
+
+        shared_copy = hourly_usage_data.copy_sharing_value()
+
+        self.assertIsInstance(shared_copy, SourceHourlyValues)
+        self.assertEqual(hourly_usage_data, shared_copy)
+        self.assertEqual(start_date, shared_copy.start_date)
+        self.assertTrue(np.shares_memory(hourly_usage_data.magnitude, shared_copy.magnitude))
+        self.assertFalse(shared_copy.magnitude.flags.writeable)
+        self.assertTrue(hourly_usage_data.magnitude.flags.writeable)
+
     def test_np_compared_with(self):
         usage_to_compare = [0.5, 1.5] * 12
         start_date = datetime.strptime("2025-01-01", "%Y-%m-%d")
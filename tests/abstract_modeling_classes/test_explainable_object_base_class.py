@@ -193,6 +193,21 @@ class TestExplainableObjectBaseClass(TestCase):
         self.assertEqual(len(ancestors), 4)
         self.assertListEqual(ancestors_labels, ["parent1", "grandparent1", "parent2", "grandparent2"])
 
+    def test_all_ancestors_with_id_cache_is_invalidated_by_calculation_graph_changes(self):
+        descendant = ExplainableObject(0, "descendant")
+        parent = ExplainableObject(1, "parent")
+        parent.modeling_obj_container = MagicMock(id="parent_mod_obj_container")
+        parent.attr_name_in_mod_obj_container = "parent"
+        descendant.direct_ancestors_with_id = [parent]
+
+        self.assertEqual([parent], descendant.all_ancestors_with_id)
+
+        grandparent = ExplainableObject(2, "grandparent")
+        grandparent.set_modeling_obj_container(MagicMock(id="grandparent_mod_obj_container"), "grandparent")
+        parent.direct_ancestors_with_id = [grandparent]
+
+        self.assertEqual([parent, grandparent], descendant.all_ancestors_with_id)
+
     def test_direct_children(self):
         left_parent = ExplainableObject(value=3, label="Label L")
         right_parent = ExplainableObject(value=4, label="Label R")
@@ -473,7 +488,7 @@ Label L + Label R
 
     def test_copy_propagates_confidence_and_comment(self):
         form_inputs_hourly = {
-            "start_date": "2024-01-01", "modeling_duration": 1, "modeling_duration_unit": "year",
+            "start_date": "2024-01-01", "modeling_duration_value": 1, "modeling_duration_unit": "year",
             "initial_volume": 10, "initial_volume_unit": "occurrence", "initial_volume_timespan": "day",
             "net_growth_rate_in_percentage": 0, "net_growth_rate_timespan": "month",
         }
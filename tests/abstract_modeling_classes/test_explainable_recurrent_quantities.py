@@ -140,6 +140,19 @@ class TestExplainableRecurrentQuantities(unittest.TestCase):
         self.assertEqual(obj.unit, u.W)
         self.assertEqual(obj.value_as_float_list, [1.0, 2.0, 3.0])
 
+    def test_json_round_trip_with_nan_and_inf_values(self):
+        recurring_quantity = ExplainableRecurrentQuantities(
+            Quantity(np.array([1.5, np.nan, np.inf, -np.inf], dtype=np.float32), u.W), "With nan")
+
+        json_data = recurring_quantity.to_json()
+        self.assertEqual("[1.5, nan, inf, -inf]", json_data["recurring_values"])
+        obj = ExplainableObject.from_json_dict(json_data)
+
+        self.assertEqual(np.float32, obj.magnitude.dtype)
+        self.assertEqual(1.5, obj.magnitude[0])
+        self.assertTrue(np.isnan(obj.magnitude[1]))
+        self.assertEqual([np.inf, -np.inf], obj.magnitude[2:].tolist())
+
     def test_from_json_dict_with_source(self):
         from efootprint.abstract_modeling_classes.explainable_object_base_class import Source, explainable_object_from_json
         source = Source("test_source", "http://test.com")
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import numpy as np
+
+from efootprint.abstract_modeling_classes.graph_clone import clone_modeling_objects, clone_system
+from efootprint.abstract_modeling_classes.modeling_update import ModelingUpdate
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.api_utils.system_to_json import system_to_json
+from efootprint.constants.units import u
+from tests.utils import build_system
+
+
+class TestGraphClone(TestCase):
+    def setUp(self):
+        self.system = build_system("graph clone system", "graph clone server")
+        self.clone = clone_system(self.system)
+
+    def test_clone_holds_the_same_objects_and_calculated_attributes(self):
+        self.assertIsNot(self.clone, self.system)
+        self.assertEqual(system_to_json(self.system, save_calculated_attributes=True),
+                         system_to_json(self.clone, save_calculated_attributes=True))
+        self.assertTrue(all(
+            clone_obj is not obj for clone_obj, obj in zip(self.clone.all_linked_objects, self.system.all_linked_objects)))
+
+    def test_clone_shares_hourly_arrays_as_read_only_views(self):
+        original_array = self.system.servers[0].energy_footprint.value.magnitude
+        cloned_array = self.clone.servers[0].energy_footprint.value.magnitude
+
+        self.assertTrue(np.shares_memory(original_array, cloned_array))
+        self.assertFalse(cloned_array.flags.writeable)
+        with self.assertRaises(ValueError):
+            cloned_array[0] = 0
+
+    def test_modeling_updates_of_the_clone_leave_the_original_untouched(self):
+        original_json = system_to_json(self.system, save_calculated_attributes=True)
+        original_total = self.system.total_footprint.sum().to(u.kg).magnitude
+        cloned_server = self.clone.servers[0]
+
+        ModelingUpdate([[cloned_server.power, SourceValue(10 * cloned_server.power.value)]])
+
+        self.assertEqual(original_json, system_to_json(self.system, save_calculated_attributes=True))
+        self.assertGreater(self.clone.total_footprint.sum().to(u.kg).magnitude, original_total)
+        self.assertEqual(len(self.clone.all_changes), 1)
+        self.assertEqual(len(self.system.all_changes), 0)
+
+    def test_id_map_renames_cloned_objects(self):
+        server = self.system.servers[0]
+
+        clones = clone_modeling_objects([server, server.storage], id_map={server.id: "renamed server"})
+
+        self.assertEqual(clones[server.id].id, "renamed server")
+        self.assertEqual(clones[server.storage.id].id, server.storage.id)
+        self.assertIs(clones[server.storage.id].server, clones[server.id])
@@ -0,0 +1,85 @@
+from unittest import TestCase
+
+from efootprint.abstract_modeling_classes.modeling_object_topology import (
+    invalidate_topology_memos, topology_memoized, topology_version)
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.constants.units import u
+from efootprint.core.hardware.server import Server, ServerTypes
+from efootprint.core.hardware.storage import Storage
+from efootprint.core.usage.job import Job
+from tests.utils import build_system
+
+
+class QueriedObject:
+    def __init__(self):
+        self.nb_of_queries = 0
+
+    @topology_memoized
+    def linked_objects(self):
+        self.nb_of_queries += 1
+        return ["linked object"]
+
+
+class TestTopologyMemoized(TestCase):
+    def test_query_is_run_once_per_topology_version_and_returns_copies(self):
+        queried_object = QueriedObject()
+
+        first_result = queried_object.linked_objects()
+        first_result.append("other object")
+
+        self.assertEqual(["linked object"], queried_object.linked_objects())
+        self.assertEqual(1, queried_object.nb_of_queries)
+
+        version = topology_version()
+        invalidate_topology_memos()
+
+        self.assertEqual(version + 1, topology_version())
+        self.assertEqual(["linked object"], queried_object.linked_objects())
+        self.assertEqual(2, queried_object.nb_of_queries)
+
+
+class TestContainmentQueriesFollowLinkChanges(TestCase):
+    def setUp(self):
+        self.system = build_system("topology", "topology server")
+        self.uj_step = list(self.system.usage_journeys[0].uj_steps)[0]
+        self.job = list(self.uj_step.jobs)[0]
+        self.server = self.system.servers[0]
+        storage = Storage.from_defaults("other topology storage")
+        self.other_server = Server.from_defaults(
+            "other topology server", server_type=ServerTypes.on_premise(), storage=storage)
+        self.other_job = Job.from_defaults("other topology job", server=self.other_server)
+
+    def test_queries_are_memoized_between_link_changes(self):
+        self.system.servers
+        servers_memo = self.system.topology_memos["servers"]
+        self.system.servers
+
+        self.assertIs(servers_memo, self.system.topology_memos["servers"])
+
+    def test_adding_dict_key_updates_system_and_container_queries(self):
+        self.assertEqual([], self.other_server.systems)
+
+        self.uj_step.jobs[self.other_job] = SourceValue(1 * u.dimensionless)
+
+        self.assertEqual([self.server, self.other_server], self.system.servers)
+        self.assertIn(self.other_job, self.system.all_linked_objects)
+        self.assertEqual([self.system], self.other_server.systems)
+        self.assertEqual([self.uj_step], self.other_job.modeling_obj_containers)
+
+    def test_removing_dict_key_unlinks_removed_objects(self):
+        self.uj_step.jobs[self.other_job] = SourceValue(1 * u.dimensionless)
+
+        del self.uj_step.jobs[self.job]
+
+        self.assertEqual([self.other_server], self.system.servers)
+        self.assertNotIn(self.job, self.system.all_linked_objects)
+        self.assertEqual([], self.job.modeling_obj_containers)
+        self.assertEqual([], self.server.systems)
+
+    def test_replacing_modeling_object_attribute_updates_queries(self):
+        self.job.server = self.other_server
+
+        self.assertEqual([self.other_server], self.system.servers)
+        self.assertEqual([self.other_server.storage], self.system.storages)
+        self.assertEqual([], self.server.modeling_obj_containers)
+        self.assertEqual([self.system], self.other_server.systems)
@@ -2,6 +2,7 @@ import unittest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch, PropertyMock
 
+import numpy as np
 import pytz
 
 from efootprint.abstract_modeling_classes.contextual_modeling_object_attribute import ContextualModelingObjectAttribute
@@ -11,9 +12,13 @@ from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyE
 from efootprint.abstract_modeling_classes.list_linked_to_modeling_obj import ListLinkedToModelingObj
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject, ABCAfterInitMeta
 from efootprint.abstract_modeling_classes.modeling_update import (
-    compute_attr_updates_chain_from_mod_objs_computation_chain, ModelingUpdate)
+    compute_attr_updates_chain_from_mod_objs_computation_chain, level_attr_updates_chain, ModelingUpdate)
 from efootprint.abstract_modeling_classes.object_linked_to_modeling_obj import ObjectLinkedToModelingObj
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.abstract_modeling_classes.temporal_footprint import splice_hour_window
 from efootprint.builders.time_builders import create_source_hourly_values_from_list
+from efootprint.constants.units import u
+from tests.utils import build_system
 
 
 class TestModelingUpdateFunctions(unittest.TestCase):
@@ -32,6 +37,38 @@ class TestModelingUpdateFunctions(unittest.TestCase):
 
         self.assertEqual(["attr_1_value", "attr_2_value", "attr_3_value"], result)
 
+    @staticmethod
+    def _chain_value(value_id, mod_obj_id, ancestors=()):
+        value = MagicMock(spec=ExplainableObject)
+        value.id = value_id
+        value.modeling_obj_container.id = mod_obj_id
+        value.direct_ancestors_with_id = list(ancestors)
+        return value
+
+    def test_level_attr_updates_chain_groups_independent_values(self):
+        """Test values depending only on previous levels share a level, own-object values are sequenced."""
+        source = self._chain_value("source", "country")
+        server_1 = self._chain_value("server_1", "server 1", [source])
+        server_2 = self._chain_value("server_2", "server 2", [source])
+        server_1_other_attr = self._chain_value("server_1_other", "server 1")
+        total = self._chain_value("total", "system", [server_1, server_2])
+
+        levels = level_attr_updates_chain([source, server_1, server_2, server_1_other_attr, total])
+
+        self.assertEqual([[0], [1, 2], [3, 4]], levels)
+
+    def test_level_attr_updates_chain_ignores_unlinked_ancestors(self):
+        """Test replaced source values, already unlinked from their container, don't constrain levels."""
+        replaced_source = MagicMock(spec=ExplainableObject)
+        replaced_source.modeling_obj_container = None
+        value = self._chain_value("value", "server", [replaced_source])
+
+        self.assertEqual([[0]], level_attr_updates_chain([value]))
+
+    def test_level_attr_updates_chain_returns_none_for_whole_dicts(self):
+        """Test chains containing whole dicts fall back to the sequential order."""
+        self.assertIsNone(level_attr_updates_chain([MagicMock()]))
+
 
 class TestModelingUpdate(unittest.TestCase):
     def test_compute_new_and_old_source_values_and_mod_obj_link_lists_wrong_input_types_raises_value_error(self):
@@ -132,7 +169,7 @@ class TestModelingUpdate(unittest.TestCase):
         mock_old_sourcevalues.return_value = []
 
         value_1 = MagicMock()
-        value_1.all_ancestors_with_id = []
+        value_1.direct_ancestors_with_id = []
         value_1.id = 1
 
         modeling_update.values_to_recompute = [value_1]
@@ -154,8 +191,10 @@ class TestModelingUpdate(unittest.TestCase):
         value_4 = MagicMock(spec=ExplainableHourlyQuantities)
         value_4.id = 4
 
-        value_1.all_ancestors_with_id = [value_2, value_3, value_4]
-        value_2.all_ancestors_with_id = [value_1, value_4]
+        value_1.direct_ancestors_with_id = [value_2, value_3, value_4]
+        value_2.direct_ancestors_with_id = [value_1, value_4]
+        value_3.direct_ancestors_with_id = []
+        value_4.direct_ancestors_with_id = []
 
         modeling_update.values_to_recompute = [value_1, value_2]
 
@@ -339,5 +378,87 @@ class TestModelingUpdate(unittest.TestCase):
                          modeling_update.filtered_hourly_quantities[1].start_date)
 
 
+class TestParallelRecomputation(unittest.TestCase):
+    def test_parallel_recomputation_matches_sequential_recomputation(self):
+        """Test recomputing levels on a thread pool gives the same footprints as the sequential recomputation."""
+        sequential_system = build_system("sequential", "sequential server")
+        parallel_system = build_system("parallel", "parallel server")
+
+        sequential_system.usage_patterns[0].country.average_carbon_intensity = SourceValue(200 * u.g / u.kWh)
+        with patch.object(ModelingUpdate, "nb_recompute_workers", 4):
+            parallel_system.usage_patterns[0].country.average_carbon_intensity = SourceValue(200 * u.g / u.kWh)
+
+        self.assertEqual(sequential_system.total_footprint.value_as_float_list,
+                         parallel_system.total_footprint.value_as_float_list)
+
+
+class TestIncrementalHourlyRecomputation(unittest.TestCase):
+    nb_hours = 60 * 24
+
+    def edit_hourly_starts(self, system_name, edited_hours, incremental):
+        hourly_starts = [1 + (hour * 7) % 13 for hour in range(self.nb_hours)]
+        system = build_system(system_name, f"{system_name} server", hourly_starts=hourly_starts)
+        edited_hourly_starts = [
+            1e6 * (3 * nb_starts if hour in edited_hours else nb_starts) for hour, nb_starts in enumerate(hourly_starts)]
+        with patch.object(ModelingUpdate, "incremental_hourly_recompute", incremental), \
+                patch("efootprint.abstract_modeling_classes.modeling_update.splice_hour_window",
+                      wraps=splice_hour_window) as splice_mock:
+            system.usage_patterns[0].hourly_usage_journey_starts = create_source_hourly_values_from_list(
+                edited_hourly_starts, datetime(2025, 1, 1))
+
+        return system, splice_mock
+
+    def assert_same_hourly_calculated_attributes(self, first_system, second_system):
+        for first_obj, second_obj in zip(
+                [first_system] + first_system.all_linked_objects, [second_system] + second_system.all_linked_objects):
+            for attr_name in first_obj.calculated_attributes:
+                first_value, second_value = getattr(first_obj, attr_name), getattr(second_obj, attr_name)
+                if isinstance(first_value, dict):
+                    value_pairs = list(zip(first_value.values(), second_value.values()))
+                else:
+                    value_pairs = [(first_value, second_value)]
+                for first_elt, second_elt in value_pairs:
+                    if not isinstance(first_elt, ExplainableHourlyQuantities):
+                        continue
+                    with self.subTest(obj=first_obj.name, attr_name=attr_name):
+                        self.assertEqual(second_elt.start_date, first_elt.start_date)
+                        self.assertEqual(second_elt.unit, first_elt.unit)
+                        np.testing.assert_allclose(
+                            second_elt.magnitude, first_elt.magnitude, rtol=1e-5,
+                            atol=1e-6 * float(np.abs(second_elt.magnitude).max()))
+
+    def test_edit_of_a_few_days_only_recomputes_their_hours_and_matches_full_recomputation(self):
+        """Test hourly values downstream of a mid-period edit are spliced and equal a full recomputation."""
+        # Summer hours, whose UTC offset differs from the one of the series start in France
+        edited_hours = range(40 * 24, 43 * 24)
+        incremental_system, splice_mock = self.edit_hourly_starts("incremental", edited_hours, True)
+        full_system, full_splice_mock = self.edit_hourly_starts("full", edited_hours, False)
+
+        self.assertGreater(splice_mock.call_count, 10)
+        full_splice_mock.assert_not_called()
+        self.assert_same_hourly_calculated_attributes(incremental_system, full_system)
+
+    def test_edits_reaching_period_bounds_fall_back_to_full_recomputation(self):
+        """Test local to UTC conversion, which wraps around period bounds, is fully recomputed for edits near them."""
+        for edited_hours in (range(0, 5), range(self.nb_hours - 5, self.nb_hours)):
+            with self.subTest(edited_hours=edited_hours):
+                incremental_system, splice_mock = self.edit_hourly_starts("incremental", edited_hours, True)
+                full_system, _ = self.edit_hourly_starts("full", edited_hours, False)
+
+                splice_mock.assert_not_called()
+                self.assert_same_hourly_calculated_attributes(incremental_system, full_system)
+
+    def test_values_downstream_of_global_update_functions_are_fully_recomputed(self):
+        """Test cumulative storage need, which depends on whole periods, is not spliced nor are its descendants."""
+        system, splice_mock = self.edit_hourly_starts("incremental", range(40 * 24, 41 * 24), True)
+        storage = system.servers[0].storage
+        spliced_value_ids = {call.args[1].id for call in splice_mock.call_args_list}
+
+        self.assertIn(system.servers[0].raw_nb_of_instances.id, spliced_value_ids)
+        self.assertNotIn(storage.full_cumulative_storage_need.id, spliced_value_ids)
+        self.assertNotIn(storage.nb_of_instances.id, spliced_value_ids)
+        self.assertNotIn(system.total_footprint.id, spliced_value_ids)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.abstract_modeling_classes.projection_reads import (
+    RecordedCachedProperty, note_projection_read, recording_attribute_reads)
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.constants.units import u
+from efootprint.core.usage.usage_journey_step import UsageJourneyStep
+
+
+class TestProjectionReads(TestCase):
+    def setUp(self):
+        self.step = UsageJourneyStep("projection reads step", SourceValue(10 * u.min), [])
+
+    def test_recording_hook_is_only_installed_during_recordings(self):
+        self.assertNotIn("__getattribute__", vars(ModelingObject))
+        with recording_attribute_reads():
+            with recording_attribute_reads():
+                self.assertIn("__getattribute__", vars(ModelingObject))
+            self.assertIn("__getattribute__", vars(ModelingObject))
+
+        self.assertNotIn("__getattribute__", vars(ModelingObject))
+
+    def test_nested_recordings_only_record_into_innermost_recording(self):
+        with recording_attribute_reads() as outer_reads:
+            self.step.name
+            with recording_attribute_reads() as inner_reads:
+                self.step.user_time_spent
+                note_projection_read(self.step, ("memo", 1))
+
+        self.assertIn((id(self.step), "name"), outer_reads)
+        self.assertNotIn((id(self.step), "user_time_spent"), outer_reads)
+        self.assertIn((id(self.step), "user_time_spent"), inner_reads)
+        self.assertIn((id(self.step), ("memo", 1)), inner_reads)
+
+    def test_cached_properties_of_modeling_objects_record_their_reads(self):
+        self.assertIsInstance(vars(UsageJourneyStep)["hourly_avg_occurrences_per_usage_pattern"],
+                              RecordedCachedProperty)
+
+        self.step.hourly_avg_occurrences_per_usage_pattern
+
+        self.assertIn((id(self.step), "usage_patterns"),
+                      self.step.projection_reads["hourly_avg_occurrences_per_usage_pattern"])
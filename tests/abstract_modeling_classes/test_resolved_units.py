@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+import numpy as np
+from pint import DimensionalityError, Quantity
+
+from efootprint.abstract_modeling_classes.resolved_units import (
+    conversion_factor, converted, product_or_quotient, quantity_from_magnitude, sum_or_difference, units_of)
+from efootprint.constants.units import u
+
+
+class TestResolvedUnits(TestCase):
+    def test_conversion_factor_is_pint_factor(self):
+        self.assertAlmostEqual(conversion_factor(u.W * u.hour, u.kWh), 1e-3)
+        self.assertEqual(conversion_factor(u.kg, u.kg), 1.0)
+
+    def test_conversion_factor_raises_on_incompatible_units(self):
+        with self.assertRaises(DimensionalityError):
+            conversion_factor(u.kg, u.W)
+
+    def test_units_of_is_memoized(self):
+        self.assertIs(units_of(Quantity(1.0, u.kg)), units_of(Quantity(2.0, u.kg)))
+
+    def test_quantity_from_magnitude_matches_pint_constructor(self):
+        magnitude = np.array([1, 2, 3], dtype=np.float32)
+
+        quantity = quantity_from_magnitude(magnitude, units_of(Quantity(1.0, u.kWh)))
+
+        self.assertIsInstance(quantity, Quantity)
+        self.assertIs(quantity.magnitude, magnitude)
+        self.assertEqual(quantity.units, u.kWh)
+        self.assertTrue(np.array_equal(Quantity(magnitude, u.kWh).to(u.Wh).magnitude, quantity.to(u.Wh).magnitude))
+
+    def test_converted_matches_pint(self):
+        quantity = Quantity(np.array([1, 2, 3], dtype=np.float32), u.W * u.hour)
+
+        result = converted(quantity, u.kWh)
+
+        self.assertEqual(result.units, u.kWh)
+        self.assertEqual(result.magnitude.dtype, np.float32)
+        np.testing.assert_allclose(result.magnitude, quantity.to(u.kWh).magnitude)
+
+    def test_converted_to_same_unit_returns_quantity(self):
+        quantity = Quantity(3.0, u.kg)
+
+        self.assertIs(converted(quantity, u.kg), quantity)
+
+    def test_converted_to_quantity_target_is_left_to_pint(self):
+        quantity = Quantity(3.0, u.kWh)
+
+        self.assertEqual(converted(quantity, Quantity(1, u.Wh)), quantity.to(Quantity(1, u.Wh)))
+
+    def test_sum_and_difference_are_in_unit_of_first_value(self):
+        first, second = Quantity(1.0, u.kg), Quantity(500.0, u.g)
+
+        self.assertEqual(sum_or_difference(first, second), first + second)
+        self.assertEqual(sum_or_difference(first, second, -1), first - second)
+        self.assertEqual(sum_or_difference(first, second).units, u.kg)
+
+    def test_product_and_quotient_match_pint(self):
+        first, second = Quantity(2.0, u.kWh), Quantity(0.1, u.kg / u.kWh)
+
+        self.assertEqual(product_or_quotient(first, second).to(u.kg), (first * second).to(u.kg))
+        self.assertEqual(product_or_quotient(first, second, divide=True), first / second)
@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from efootprint.abstract_modeling_classes.scenario_batch import ScenarioBatch
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.constants.units import u
+from tests.utils import build_system
+
+
+class TestScenarioBatch(TestCase):
+    def setUp(self):
+        self.system = build_system("system", "server")
+        self.server = self.system.servers[0]
+        self.job = self.system.jobs[0]
+
+    def test_variants_give_same_totals_as_sequential_modeling_updates(self):
+        reference_system = build_system("reference", "reference server")
+        reference_server = reference_system.servers[0]
+        reference_job = reference_system.jobs[0]
+        powers = [100, 300, 600]
+        data_transferred = [1, 5, 20]
+        expected_totals = []
+        for power, data in zip(powers, data_transferred):
+            reference_server.power = SourceValue(power * u.W)
+            reference_job.data_transferred = SourceValue(data * u.MB)
+            expected_totals.append(reference_system.total_footprint.sum())
+
+        scenario_batch = ScenarioBatch([
+            [self.server.power, [SourceValue(power * u.W) for power in powers]],
+            [self.job.data_transferred, [SourceValue(data * u.MB) for data in data_transferred]]])
+        totals = scenario_batch.evaluate(lambda: self.system.total_footprint.sum())
+
+        self.assertEqual(expected_totals, totals)
+        self.assertNotEqual(totals[0], totals[1])
+
+    def test_system_is_left_unchanged(self):
+        initial_power = self.server.power
+        initial_total_footprint = self.system.total_footprint
+        initial_energy_footprint = self.server.energy_footprint
+
+        ScenarioBatch([[self.server.power, [SourceValue(1000 * u.W)]]]).evaluate(lambda: None)
+
+        self.assertIs(initial_power, self.server.power)
+        self.assertIs(initial_total_footprint, self.system.total_footprint)
+        self.assertIs(initial_energy_footprint, self.server.energy_footprint)
+        self.assertTrue(any(child is initial_energy_footprint
+                            for child in self.server.load_energy_footprint.direct_children_with_id))
+
+        self.server.power = SourceValue(1000 * u.W)
+        self.assertNotEqual(initial_total_footprint, self.system.total_footprint)
+
+    def test_system_is_left_unchanged_when_reading_results_fails(self):
+        initial_power = self.server.power
+        initial_total_footprint = self.system.total_footprint
+
+        def read_results():
+            raise RuntimeError("read error")
+
+        with self.assertRaises(RuntimeError):
+            ScenarioBatch([[self.server.power, [SourceValue(1000 * u.W)]]]).evaluate(read_results)
+
+        self.assertIs(initial_power, self.server.power)
+        self.assertIs(initial_total_footprint, self.system.total_footprint)
+
+    def test_attr_updates_chain_is_computed_once_from_inputs(self):
+        scenario_batch = ScenarioBatch([[self.server.power, [SourceValue(1000 * u.W)]]])
+
+        self.assertEqual(
+            [value.id for value in self.server.power.attr_updates_chain],
+            [value.id for value in scenario_batch.values_to_recompute])
+
+    def test_inputs_with_different_numbers_of_variants_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            ScenarioBatch([
+                [self.server.power, [SourceValue(100 * u.W), SourceValue(200 * u.W)]],
+                [self.job.data_transferred, [SourceValue(1 * u.MB)]]])
+
+    def test_calculated_attribute_input_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ScenarioBatch([[self.server.energy_footprint, [SourceValue(1 * u.kg)]]])
+
+    def test_variant_with_wrong_unit_raises_error(self):
+        with self.assertRaises(Exception):
+            ScenarioBatch([[self.server.power, [SourceValue(1 * u.kg)]]])
@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+import numpy as np
+
+from efootprint.abstract_modeling_classes.modeling_update import ModelingUpdate
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.constants.units import u
+from tests.utils import build_system
+
+SIMULATION_DATE = datetime(2025, 1, 1, 3, tzinfo=timezone.utc)
+
+
+class TestSimulationOverlay(TestCase):
+    def setUp(self):
+        self.system = build_system("system", "server")
+        self.server = self.system.servers[0]
+        self.initial_total_footprint = self.system.total_footprint
+
+    def simulate_power(self, power_in_watts):
+        return ModelingUpdate([[self.server.power, SourceValue(power_in_watts * u.W)]], SIMULATION_DATE)
+
+    def test_overlay_holds_recomputed_values_keyed_by_baseline_value(self):
+        simulation = self.simulate_power(500)
+
+        self.assertEqual(len(simulation.values_to_recompute), len(simulation.overlay))
+        self.assertIn(self.system.total_footprint, simulation.overlay)
+        simulated_total_footprint = simulation.overlay[self.system.total_footprint]
+        self.assertIs(self.system.total_footprint.simulation_twin, simulated_total_footprint)
+        self.assertIs(self.system.total_footprint, simulated_total_footprint.baseline_twin)
+        self.assertIs(simulated_total_footprint, simulation.overlay.value_of(self.system.total_footprint))
+        self.assertIs(self.server.power, simulation.overlay.value_of(self.server.power))
+        self.assertGreater(simulation.overlay.nbytes, 0)
+
+    def test_filtered_hourly_quantities_share_read_only_arrays_with_baseline(self):
+        simulation = self.simulate_power(500)
+
+        self.assertTrue(simulation.filtered_hourly_quantities)
+        for hourly_quantities, filtered_hourly_quantities in zip(
+                simulation.hourly_quantities_to_filter, simulation.filtered_hourly_quantities):
+            self.assertEqual(SIMULATION_DATE, filtered_hourly_quantities.start_date)
+            self.assertTrue(np.shares_memory(hourly_quantities.magnitude, filtered_hourly_quantities.magnitude))
+            self.assertFalse(filtered_hourly_quantities.magnitude.flags.writeable)
+
+    def test_only_direct_ancestors_of_recomputed_values_are_filtered_or_copied(self):
+        simulation = self.simulate_power(500)
+        recomputed_value_ids = {value.id for value in simulation.values_to_recompute}
+
+        for ancestor in simulation.ancestors_not_in_computation_chain:
+            self.assertTrue(any(child.id in recomputed_value_ids for child in ancestor.direct_children_with_id))
+
+    def test_drop_unlinks_twins_and_releases_simulation(self):
+        simulation = self.simulate_power(500)
+        total_footprint = self.system.total_footprint
+
+        simulation.drop()
+
+        self.assertIsNone(total_footprint.simulation_twin)
+        self.assertIsNone(self.system.simulation)
+        self.assertEqual(0, len(simulation.overlay))
+        self.assertEqual([], simulation.recomputed_values)
+        self.assertEqual([], simulation.replaced_ancestors_copies)
+        self.assertEqual(self.initial_total_footprint, self.system.total_footprint)
+
+    def test_dropping_a_simulation_leaves_more_recent_simulation_untouched(self):
+        first_simulation = self.simulate_power(500)
+        second_simulation = self.simulate_power(1000)
+        total_footprint = self.system.total_footprint
+        second_simulated_total_footprint = second_simulation.overlay[total_footprint]
+
+        first_simulation.drop()
+
+        self.assertIs(self.system.simulation, second_simulation)
+        self.assertIs(second_simulated_total_footprint, total_footprint.simulation_twin)
+        self.assertNotEqual(self.initial_total_footprint, second_simulated_total_footprint)
+        second_simulation.set_updated_values()
+        self.assertEqual(second_simulated_total_footprint, self.system.total_footprint)
+        second_simulation.reset_values()
+        self.assertEqual(self.initial_total_footprint, self.system.total_footprint)
@@ -0,0 +1,110 @@
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytz
+from pint import Quantity
+
+from efootprint.abstract_modeling_classes.compact_hourly_quantities import PeriodicHourlyQuantities
+from efootprint.abstract_modeling_classes.explainable_hourly_quantities import ExplainableHourlyQuantities
+from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
+from efootprint.abstract_modeling_classes.explainable_timezone import ExplainableTimezone
+from efootprint.abstract_modeling_classes.temporal_footprint import (
+    TemporalFootprint, dirty_hour_window, footprint_of, hour_span, restricted_to_hour_window, splice_hour_window,
+    temporal_footprint, union_of_hour_windows)
+from efootprint.constants.units import u
+
+
+class TestTemporalFootprint(unittest.TestCase):
+    def setUp(self):
+        self.start_date = datetime(2025, 1, 1, tzinfo=pytz.utc)
+        self.first_hour = hour_span(ExplainableHourlyQuantities(
+            Quantity(np.zeros(1, dtype=np.float32), u.W), self.start_date, "one hour"))[0]
+
+    def hourly(self, values, start_date=None):
+        return ExplainableHourlyQuantities(
+            Quantity(np.array(values, dtype=np.float32), u.W), start_date or self.start_date, "values")
+
+    def test_resolve_converts_durations_to_hours_with_a_margin(self):
+        footprint = TemporalFootprint(
+            lookback_hours=lambda mod_obj, key: ExplainableQuantity(90 * u.min, "duration"), lookahead_hours=2)
+
+        self.assertEqual((3, 2), footprint.resolve(None, "key"))
+
+    def test_resolve_returns_none_for_global_calls(self):
+        self.assertIsNone(TemporalFootprint(lookback_hours=lambda mod_obj: None).resolve(None))
+        self.assertIsNone(TemporalFootprint(applies=lambda mod_obj: False).resolve(None))
+        self.assertEqual((0, 0), TemporalFootprint(applies=lambda mod_obj: True).resolve(None))
+
+    def test_decorator_declares_footprint_on_update_function_and_its_bound_methods(self):
+        class ModelingObjectStub:
+            @temporal_footprint(lookback_hours=3)
+            def update_value(self):
+                pass
+
+            def update_other_value(self):
+                pass
+
+        self.assertEqual((3, 0), footprint_of(ModelingObjectStub().update_value).resolve(None))
+        self.assertIsNone(footprint_of(ModelingObjectStub().update_other_value))
+
+    def test_dirty_hour_window(self):
+        previous = self.hourly([1, 2, 3, 4, 5])
+
+        self.assertEqual((self.first_hour + 1, self.first_hour + 4),
+                         dirty_hour_window(previous, self.hourly([1, 0, 3, 0, 5])))
+        self.assertEqual((self.first_hour, self.first_hour), dirty_hour_window(previous, self.hourly([1, 2, 3, 4, 5])))
+        self.assertIsNone(dirty_hour_window(previous, self.hourly([1, 2, 3, 4])))
+        self.assertIsNone(dirty_hour_window(
+            previous, self.hourly([1, 2, 3, 4, 5], self.start_date + timedelta(hours=1))))
+
+    def test_union_of_hour_windows_ignores_empty_windows(self):
+        self.assertEqual((2, 9), union_of_hour_windows([(5, 9), (3, 3), (2, 4)]))
+        self.assertIsNone(union_of_hour_windows([(3, 3)]))
+
+    def test_restricted_to_hour_window_windows_dense_and_compact_values_then_restores_them(self):
+        dense = self.hourly(np.arange(48))
+        compact = ExplainableHourlyQuantities(
+            PeriodicHourlyQuantities(np.arange(24), 0, 48, u.W), self.start_date, "compact")
+        window = (self.first_hour + 10, self.first_hour + 20)
+
+        with restricted_to_hour_window([dense, compact, dense], window):
+            self.assertTrue(compact.is_compact)
+            self.assertFalse(dense.magnitude.flags.writeable)
+            for hourly in (dense, compact):
+                self.assertEqual(window, hour_span(hourly))
+                np.testing.assert_array_equal(np.arange(10, 20), hourly.magnitude)
+
+        self.assertTrue(compact.is_compact)
+        for hourly in (dense, compact):
+            self.assertEqual(self.start_date, hourly.start_date)
+            np.testing.assert_array_equal(np.arange(48) % (48 if hourly is dense else 24), hourly.magnitude)
+
+    def test_restricted_local_to_utc_conversion_uses_utc_offset_of_whole_series(self):
+        local_timezone = ExplainableTimezone(pytz.timezone("Europe/Paris"), "timezone")
+        naive_start = datetime(2025, 1, 1)
+        hourly = self.hourly(np.arange(200 * 24), naive_start)
+        whole_conversion = hourly.convert_to_utc(local_timezone)
+        # Summer window, whose UTC offset differs from the one of the series start
+        window_start = hour_span(hourly)[0] + 180 * 24
+
+        with restricted_to_hour_window([hourly], (window_start, window_start + 48)):
+            restricted_conversion = hourly.convert_to_utc(local_timezone)
+
+        np.testing.assert_array_equal(
+            whole_conversion.magnitude[180 * 24 + 1:180 * 24 + 47], restricted_conversion.magnitude[1:47])
+        self.assertEqual(window_start, hour_span(restricted_conversion)[0])
+
+    def test_splice_hour_window_keeps_previous_values_outside_window(self):
+        previous = self.hourly([1, 2, 3, 4, 5])
+        windowed = ExplainableHourlyQuantities(
+            Quantity(np.array([20, 30, 40], dtype=np.float32), u.W), self.start_date + timedelta(hours=1), "windowed")
+
+        spliced = splice_hour_window(previous, windowed, (self.first_hour + 2, self.first_hour + 4))
+
+        np.testing.assert_array_equal([1, 2, 30, 40, 5], spliced.magnitude)
+        self.assertEqual([1, 2, 3, 4, 5], previous.value_as_float_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+from copy import deepcopy
+from unittest import TestCase
+
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.api_utils.json_to_system import json_to_system
+from efootprint.api_utils.snapshot_to_system import snapshot_to_system
+from efootprint.api_utils.system_to_json import system_to_json
+from efootprint.api_utils.system_to_snapshot import system_to_snapshot
+from efootprint.constants.units import u
+
+API_UTILS_TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestLazyHydration(TestCase):
+    def setUp(self):
+        with open(os.path.join(API_UTILS_TEST_DIR, "base_system.json"), "rb") as file:
+            base_system_dict = json.load(file)
+        class_obj_dict, _, _ = json_to_system(base_system_dict)
+        self.system_dict = system_to_json(
+            next(iter(class_obj_dict["System"].values())), save_calculated_attributes=True)
+
+    def load(self, lazy_hydration):
+        class_obj_dict, flat_obj_dict, _ = json_to_system(
+            deepcopy(self.system_dict), launch_system_computations=False, lazy_hydration=lazy_hydration)
+
+        return class_obj_dict, flat_obj_dict
+
+    def test_calculated_attributes_are_only_hydrated_when_read(self):
+        class_obj_dict, flat_obj_dict = self.load(lazy_hydration=True)
+        system = next(iter(class_obj_dict["System"].values()))
+        server = next(iter(class_obj_dict["Server"].values()))
+
+        for mod_obj in flat_obj_dict.values():
+            self.assertEqual(sorted(mod_obj.calculated_attributes), sorted(mod_obj.calculated_attribute_names_to_hydrate))
+            for calculated_attribute_name in mod_obj.calculated_attributes:
+                self.assertNotIn(calculated_attribute_name, mod_obj.__dict__)
+
+        total_footprint = system.total_footprint
+
+        self.assertIn("total_footprint", system.__dict__)
+        self.assertEqual([], system.calculated_attribute_names_to_hydrate)
+        self.assertIn("energy_footprint", server.calculated_attribute_names_to_hydrate)
+        self.assertIs(system, total_footprint.modeling_obj_container)
+
+    def test_hydrated_values_and_calculation_graph_match_eager_loading(self):
+        lazy_class_obj_dict, _ = self.load(lazy_hydration=True)
+        eager_class_obj_dict, _ = self.load(lazy_hydration=False)
+        lazy_server = next(iter(lazy_class_obj_dict["Server"].values()))
+        eager_server = next(iter(eager_class_obj_dict["Server"].values()))
+
+        self.assertEqual(eager_server.energy_footprint, lazy_server.energy_footprint)
+        self.assertEqual(
+            [ancestor.id for ancestor in eager_server.energy_footprint.direct_ancestors_with_id],
+            [ancestor.id for ancestor in lazy_server.energy_footprint.direct_ancestors_with_id])
+        self.assertEqual(
+            [child.id for child in eager_server.energy_footprint.direct_children_with_id],
+            [child.id for child in lazy_server.energy_footprint.direct_children_with_id])
+
+    def test_json_round_trip_gives_same_json_as_eager_loading(self):
+        lazy_class_obj_dict, _ = self.load(lazy_hydration=True)
+        eager_class_obj_dict, _ = self.load(lazy_hydration=False)
+
+        self.assertEqual(
+            json.dumps(system_to_json(
+                next(iter(eager_class_obj_dict["System"].values())), save_calculated_attributes=True), sort_keys=True),
+            json.dumps(system_to_json(
+                next(iter(lazy_class_obj_dict["System"].values())), save_calculated_attributes=True), sort_keys=True))
+
+    def test_lazily_hydrated_system_updates_like_eagerly_loaded_system(self):
+        lazy_class_obj_dict, _ = self.load(lazy_hydration=True)
+        eager_class_obj_dict, _ = self.load(lazy_hydration=False)
+        initial_total_footprint = next(iter(eager_class_obj_dict["System"].values())).total_footprint
+        for class_obj_dict in (lazy_class_obj_dict, eager_class_obj_dict):
+            next(iter(class_obj_dict["Job"].values())).data_transferred = SourceValue(100 * u.GB)
+
+        lazy_system = next(iter(lazy_class_obj_dict["System"].values()))
+        eager_system = next(iter(eager_class_obj_dict["System"].values()))
+        self.assertEqual(eager_system.total_footprint, lazy_system.total_footprint)
+        self.assertNotEqual(initial_total_footprint, lazy_system.total_footprint)
+
+    def test_lazily_hydrated_and_lazily_evaluated_system_updates_like_eagerly_loaded_system(self):
+        lazy_class_obj_dict, _ = self.load(lazy_hydration=True)
+        eager_class_obj_dict, _ = self.load(lazy_hydration=False)
+        lazy_system = next(iter(lazy_class_obj_dict["System"].values()))
+        lazy_system.lazy_evaluation = True
+        for class_obj_dict in (lazy_class_obj_dict, eager_class_obj_dict):
+            next(iter(class_obj_dict["Server"].values())).power = SourceValue(1000 * u.W)
+
+        eager_system = next(iter(eager_class_obj_dict["System"].values()))
+        self.assertEqual(eager_system.total_footprint, lazy_system.total_footprint)
+
+    def test_snapshot_can_be_loaded_with_lazy_hydration(self):
+        class_obj_dict, _ = self.load(lazy_hydration=False)
+        system = next(iter(class_obj_dict["System"].values()))
+        snapshot_filepath = os.path.join(tempfile.mkdtemp(), "system.efpsnap")
+        system_to_snapshot(system, snapshot_filepath)
+        try:
+            snapshot_class_obj_dict, _, _ = snapshot_to_system(snapshot_filepath, lazy_hydration=True)
+        finally:
+            os.remove(snapshot_filepath)
+            os.rmdir(os.path.dirname(snapshot_filepath))
+        snapshot_system = next(iter(snapshot_class_obj_dict["System"].values()))
+
+        self.assertEqual(["total_footprint"], snapshot_system.calculated_attribute_names_to_hydrate)
+        self.assertEqual(system.total_footprint, snapshot_system.total_footprint)
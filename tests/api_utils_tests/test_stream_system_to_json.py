@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+from copy import deepcopy
+from unittest import TestCase
+
+from efootprint.api_utils.json_to_system import json_to_system
+from efootprint.api_utils.system_to_json import system_to_json, stream_system_to_json
+
+API_UTILS_TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestStreamSystemToJson(TestCase):
+    def setUp(self):
+        with open(os.path.join(API_UTILS_TEST_DIR, "base_system.json"), "rb") as file:
+            self.base_system_dict = json.load(file)
+        class_obj_dict, _, _ = json_to_system(deepcopy(self.base_system_dict))
+        self.system = next(iter(class_obj_dict["System"].values()))
+        self.tmp_dir = tempfile.mkdtemp()
+        self.expected_filepath = os.path.join(self.tmp_dir, "expected.json")
+        self.streamed_filepath = os.path.join(self.tmp_dir, "streamed.json")
+
+    def tearDown(self):
+        for filename in os.listdir(self.tmp_dir):
+            os.remove(os.path.join(self.tmp_dir, filename))
+        os.rmdir(self.tmp_dir)
+
+    def read(self, filepath):
+        with open(filepath) as file:
+            return file.read()
+
+    def test_compatibility_mode_writes_same_file_as_system_to_json(self):
+        for save_calculated_attributes in [True, False]:
+            for indent in [4, 2, None]:
+                system_to_json(self.system, save_calculated_attributes, self.expected_filepath, indent=indent)
+                stream_system_to_json(self.system, save_calculated_attributes, self.streamed_filepath, indent=indent)
+
+                self.assertEqual(self.read(self.expected_filepath), self.read(self.streamed_filepath))
+
+    def test_compatibility_mode_on_lazily_hydrated_system(self):
+        system_dict = system_to_json(self.system, save_calculated_attributes=True)
+        lazy_systems = []
+        for _ in range(2):
+            class_obj_dict, _, _ = json_to_system(deepcopy(system_dict), lazy_hydration=True)
+            lazy_systems.append(next(iter(class_obj_dict["System"].values())))
+
+        system_to_json(lazy_systems[0], True, self.expected_filepath)
+        stream_system_to_json(lazy_systems[1], True, self.streamed_filepath)
+
+        self.assertEqual(self.read(self.expected_filepath), self.read(self.streamed_filepath))
+
+    def test_orjson_mode_writes_same_json_and_loads_back(self):
+        system_dict = system_to_json(self.system, save_calculated_attributes=True)
+        stream_system_to_json(self.system, True, self.streamed_filepath, compatibility_mode=False)
+
+        with open(self.streamed_filepath) as file:
+            streamed_dict = json.load(file)
+        self.assertEqual(json.loads(json.dumps(system_dict)), streamed_dict)
+        class_obj_dict, _, _ = json_to_system(streamed_dict)
+        loaded_system = next(iter(class_obj_dict["System"].values()))
+        self.assertEqual(self.system.total_footprint.sum(), loaded_system.total_footprint.sum())
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+from copy import deepcopy
+from unittest import TestCase
+
+import numpy as np
+
+import efootprint
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.api_utils.json_to_system import json_to_system
+from efootprint.api_utils.snapshot_to_system import snapshot_to_system
+from efootprint.api_utils.system_to_json import system_to_json
+from efootprint.api_utils.system_to_snapshot import (
+    system_to_snapshot, SNAPSHOT_MAGIC, SNAPSHOT_HEADER_LENGTH_NB_BYTES)
+from efootprint.constants.units import u
+
+API_UTILS_TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestSystemSnapshot(TestCase):
+    def setUp(self):
+        with open(os.path.join(API_UTILS_TEST_DIR, "base_system.json"), "rb") as file:
+            base_system_dict = json.load(file)
+        class_obj_dict, _, _ = json_to_system(deepcopy(base_system_dict))
+        self.system = next(iter(class_obj_dict["System"].values()))
+        self.snapshot_filepath = os.path.join(tempfile.mkdtemp(), "system.efpsnap")
+        system_to_snapshot(self.system, self.snapshot_filepath)
+
+    def tearDown(self):
+        os.remove(self.snapshot_filepath)
+        os.rmdir(os.path.dirname(self.snapshot_filepath))
+
+    def test_snapshot_round_trip_gives_same_json_as_original_system(self):
+        class_obj_dict, flat_obj_dict, _ = snapshot_to_system(self.snapshot_filepath)
+        loaded_system = next(iter(class_obj_dict["System"].values()))
+
+        self.assertEqual(
+            json.dumps(system_to_json(self.system, save_calculated_attributes=True), sort_keys=True),
+            json.dumps(system_to_json(loaded_system, save_calculated_attributes=True), sort_keys=True))
+
+    def test_hourly_values_are_memory_mapped_from_snapshot(self):
+        class_obj_dict, _, _ = snapshot_to_system(self.snapshot_filepath)
+        loaded_system = next(iter(class_obj_dict["System"].values()))
+        server = next(iter(class_obj_dict["Server"].values()))
+
+        self.assertIsInstance(server.energy_footprint.magnitude.base, np.memmap)
+        self.assertEqual(self.system.total_footprint, loaded_system.total_footprint)
+
+    def test_system_loaded_from_snapshot_updates_like_system_loaded_from_json(self):
+        snapshot_class_obj_dict, _, _ = snapshot_to_system(self.snapshot_filepath)
+        json_class_obj_dict, _, _ = json_to_system(
+            system_to_json(self.system, save_calculated_attributes=True), launch_system_computations=False)
+        for class_obj_dict in (snapshot_class_obj_dict, json_class_obj_dict):
+            next(iter(class_obj_dict["Job"].values())).data_transferred = SourceValue(100 * u.GB)
+
+        snapshot_system = next(iter(snapshot_class_obj_dict["System"].values()))
+        json_system = next(iter(json_class_obj_dict["System"].values()))
+        self.assertEqual(json_system.total_footprint, snapshot_system.total_footprint)
+        self.assertNotEqual(self.system.total_footprint, snapshot_system.total_footprint)
+
+    def test_loading_file_that_is_not_a_snapshot_raises_value_error(self):
+        with open(self.snapshot_filepath, "wb") as file:
+            file.write(b"{}")
+
+        with self.assertRaises(ValueError):
+            snapshot_to_system(self.snapshot_filepath)
+
+    def test_loading_snapshot_from_other_major_version_raises_value_error(self):
+        with open(self.snapshot_filepath, "rb") as file:
+            file.seek(len(SNAPSHOT_MAGIC))
+            header_length = int.from_bytes(file.read(SNAPSHOT_HEADER_LENGTH_NB_BYTES), "little")
+            header_bytes = file.read(header_length)
+        older_version = f"{int(efootprint.__version__.split('.')[0]) - 1}.0.0"
+        patched_header_bytes = header_bytes.replace(
+            f'"efootprint_version":"{efootprint.__version__}"'.encode("utf-8"),
+            f'"efootprint_version":"{older_version}"'.encode("utf-8").ljust(
+                len(f'"efootprint_version":"{efootprint.__version__}"'), b" "), 1)
+        with open(self.snapshot_filepath, "r+b") as file:
+            file.seek(len(SNAPSHOT_MAGIC) + SNAPSHOT_HEADER_LENGTH_NB_BYTES)
+            file.write(patched_header_bytes)
+
+        with self.assertRaises(ValueError):
+            snapshot_to_system(self.snapshot_filepath)
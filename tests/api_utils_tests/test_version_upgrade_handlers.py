@@ -1,13 +1,16 @@
 import copy
 import json
 import os
+import tempfile
 import uuid as _uuid
 from unittest import TestCase
 from unittest.mock import patch
 
+import efootprint
 from efootprint.all_classes_in_order import ALL_EFOOTPRINT_CLASSES
-from efootprint.api_utils.json_to_system import json_to_system
-from efootprint.api_utils.version_upgrade_handlers import upgrade_version_9_to_10, upgrade_version_10_to_11, \
+from efootprint.api_utils.json_to_system import json_to_system, upgrade_system_dict_to_current_version, \
+    upgrade_system_json_file
+from efootprint.api_utils.version_upgrade_handlers import copy_for_upgrade, upgrade_version_9_to_10, upgrade_version_10_to_11, \
     upgrade_version_11_to_12, upgrade_version_12_to_13, upgrade_version_13_to_14, upgrade_version_14_to_15, \
     upgrade_version_15_to_16, upgrade_version_16_to_17, upgrade_version_18_to_19, upgrade_version_19_to_20, \
     upgrade_version_20_to_21, upgrade_version_21_to_22
@@ -1091,3 +1094,40 @@ class TestVersionUpgradeHandlers(TestCase):
         input_dict = {"UsageJourney": {"uj_1": {"name": "uj 1", "id": "uj_1", "uj_steps": copy.deepcopy(already_dict)}}}
         output_dict = upgrade_version_21_to_22(copy.deepcopy(input_dict))
         self.assertEqual(already_dict, output_dict["UsageJourney"]["uj_1"]["uj_steps"])
+
+    def test_copy_for_upgrade_copies_dicts_and_shares_lists_of_scalars(self):
+        input_dict = {"Job": {"job_1": {
+            "name": "job 1", "data_stored": {"values": [1.0, 2.0], "unit": "GB"},
+            "explain": [{"source": {"name": "user data"}}]}}}
+
+        copied_dict = copy_for_upgrade(input_dict)
+
+        self.assertEqual(input_dict, copied_dict)
+        input_job, copied_job = input_dict["Job"]["job_1"], copied_dict["Job"]["job_1"]
+        self.assertIsNot(input_job["data_stored"], copied_job["data_stored"])
+        self.assertIs(input_job["data_stored"]["values"], copied_job["data_stored"]["values"])
+        self.assertIsNot(input_job["explain"][0], copied_job["explain"][0])
+
+    def test_upgrade_to_current_version_leaves_input_untouched_and_marks_current_version(self):
+        with open(os.path.join(API_UTILS_TEST_DIR, "base_system_v9.json"), "rb") as file:
+            input_dict = json.load(file)
+        saved_input_dict = copy.deepcopy(input_dict)
+
+        output_dict = upgrade_system_dict_to_current_version(input_dict)
+
+        self.assertEqual(saved_input_dict, input_dict)
+        self.assertEqual(efootprint.__version__, output_dict["efootprint_version"])
+        self.assertIs(output_dict, upgrade_system_dict_to_current_version(output_dict))
+
+    def test_upgrade_system_json_file_saves_the_upgraded_system(self):
+        output_filepath = os.path.join(tempfile.mkdtemp(), "upgraded_system.json")
+
+        self.assertTrue(upgrade_system_json_file(
+            os.path.join(API_UTILS_TEST_DIR, "base_system_v9.json"), output_filepath))
+        self.assertFalse(upgrade_system_json_file(output_filepath))
+
+        with open(output_filepath, "rb") as file:
+            upgraded_dict = json.load(file)
+        self.assertEqual(efootprint.__version__, upgraded_dict["efootprint_version"])
+        class_obj_dict, _, _ = json_to_system(upgraded_dict)
+        self.assertEqual(1, len(class_obj_dict["System"]))
@@ -14,7 +14,8 @@ from efootprint.abstract_modeling_classes.explainable_quantity import Explainabl
 from efootprint.abstract_modeling_classes.source_objects import SourceObject, SourceValue
 from efootprint.builders.external_apis.ecologits.ecologits_explainable_quantity import EcoLogitsExplainableQuantity
 from efootprint.builders.external_apis.ecologits.ecologits_external_api import (
-    EcoLogitsGenAIExternalAPI, EcoLogitsGenAIExternalAPIJob, ecologits_calculated_attributes)
+    EcoLogitsGenAIExternalAPI, EcoLogitsGenAIExternalAPIJob, ecologits_calculated_attributes,
+    _llm_impacts_dag_evaluation)
 from efootprint.constants.units import u
 from efootprint.core.lifecycle_phases import LifeCyclePhases
 from efootprint.core.usage.job import JobAttributionCell
@@ -287,6 +288,44 @@ class TestEcoLogitsGenAIExternalAPIJob(TestCase):
         self.assertIsNotNone(self.job.impacts)
         self.assertGreater(len(self.job.impacts.value), 0)
 
+    def test_jobs_with_same_inputs_share_one_impacts_dag_evaluation(self):
+        other_job = EcoLogitsGenAIExternalAPIJob(
+            name="Other Job", external_api=self.external_api, output_token_count=SourceValue(1000 * u.dimensionless))
+        other_job.trigger_modeling_updates = False
+        _llm_impacts_dag_evaluation.cache_clear()
+
+        self.job.update_impacts()
+        other_job.update_impacts()
+
+        self.assertEqual(1, _llm_impacts_dag_evaluation.cache_info().misses)
+        self.assertEqual(1, _llm_impacts_dag_evaluation.cache_info().hits)
+        self.assertEqual(self.job.impacts.value, other_job.impacts.value)
+        self.assertIsNot(self.job.impacts.value, other_job.impacts.value)
+        self.assertIn(other_job.output_token_count, other_job.impacts.direct_ancestors_with_id)
+
+    def test_changing_the_impacts_of_a_job_leaves_jobs_with_same_inputs_untouched(self):
+        other_job = EcoLogitsGenAIExternalAPIJob(
+            name="Other Job", external_api=self.external_api, output_token_count=SourceValue(1000 * u.dimensionless))
+        other_job.trigger_modeling_updates = False
+        self.job.update_impacts()
+        other_job.update_impacts()
+        request_energy = other_job.impacts.value["request_energy"]
+
+        self.job.impacts.value["request_energy"] = None
+
+        self.assertIs(request_energy, other_job.impacts.value["request_energy"])
+        other_job.update_impacts()
+        self.assertIs(request_energy, other_job.impacts.value["request_energy"])
+
+    def test_impacts_dag_is_evaluated_again_when_inputs_change(self):
+        self.job.update_impacts()
+        previous_request_energy = self.job.impacts.value["request_energy"]
+
+        self.job.output_token_count = SourceValue(2000 * u.dimensionless)
+        self.job.update_impacts()
+
+        self.assertNotEqual(previous_request_energy, self.job.impacts.value["request_energy"])
+
     def test_compute_calculated_attributes_computes_ecologits_calculated_attributes(self):
         """Test that all calculated attributes are computed without errors."""
         self.job.compute_calculated_attributes()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -44,6 +45,14 @@ class TestBoaviztaUtilsCache(TestCase):
         boaviztapi_utils._boaviztapi_cache.clear()
         boaviztapi_utils._boaviztapi_cache_size_bytes = 0
         os.environ.pop("USE_BOAVIZTAPI_PACKAGE", None)
+        # Only the in-memory cache is tested here, see TestBoaviztaCatalogAndDiskCache
+        catalog_patcher = patch(
+            "efootprint.builders.hardware.boaviztapi_utils.boaviztapi_catalog_responses", return_value={})
+        catalog_patcher.start()
+        self.addCleanup(catalog_patcher.stop)
+        disk_cache_patcher = patch.dict(os.environ, {boaviztapi_utils.BOAVIZTAPI_DISK_CACHE_PATH_ENV_VAR: ""})
+        disk_cache_patcher.start()
+        self.addCleanup(disk_cache_patcher.stop)
 
     def test_cache_hit_avoids_second_request(self):
         response = Mock(status_code=200)
@@ -103,3 +112,85 @@ class TestBoaviztaUtilsCache(TestCase):
         self.assertEqual(result, {"ok": True})
         self.assertEqual(package_mock.call_count, 1)
         self.assertEqual(len(boaviztapi_utils._boaviztapi_cache), 0)
+
+
+class TestBoaviztaCatalogAndDiskCache(TestCase):
+    def setUp(self):
+        boaviztapi_utils._boaviztapi_cache.clear()
+        boaviztapi_utils._boaviztapi_cache_size_bytes = 0
+        os.environ.pop("USE_BOAVIZTAPI_PACKAGE", None)
+        self.disk_cache_path = os.path.join(tempfile.mkdtemp(), "boaviztapi_cache.sqlite3")
+        disk_cache_patcher = patch.dict(
+            os.environ, {boaviztapi_utils.BOAVIZTAPI_DISK_CACHE_PATH_ENV_VAR: self.disk_cache_path})
+        disk_cache_patcher.start()
+        self.addCleanup(disk_cache_patcher.stop)
+
+    def tearDown(self):
+        if os.path.isfile(self.disk_cache_path):
+            os.remove(self.disk_cache_path)
+        os.rmdir(os.path.dirname(self.disk_cache_path))
+
+    def test_catalog_lookups_never_call_web_api_nor_package(self):
+        with patch("efootprint.builders.hardware.boaviztapi_utils.call_boaviztapi_from_web_request") as web_mock, \
+                patch("efootprint.builders.hardware.boaviztapi_utils.call_boaviztapi_from_package_dependency") \
+                as package_mock:
+            providers = boaviztapi_utils.call_boaviztapi("https://api.boavizta.org/v1/cloud/instance/all_providers")
+            instance_types = boaviztapi_utils.call_boaviztapi(
+                "https://api.boavizta.org/v1/cloud/instance/all_instances", params={"provider": "scaleway"})
+            impact = boaviztapi_utils.call_boaviztapi(
+                "https://api.boavizta.org/v1/cloud/instance", params={"provider": "scaleway", "instance_type": "ent1-s"})
+            archetype_config = boaviztapi_utils.call_boaviztapi(
+                "https://api.boavizta.org/v1/server/archetype_config", params={"archetype": "platform_compute_low"})
+
+        self.assertEqual(0, web_mock.call_count)
+        self.assertEqual(0, package_mock.call_count)
+        self.assertIn("scaleway", providers)
+        self.assertIn("ent1-s", instance_types)
+        self.assertIn("gwp", impact["impacts"])
+        self.assertIn("CPU", archetype_config)
+        self.assertFalse(os.path.isfile(self.disk_cache_path))
+
+    def test_catalog_snapshot_is_of_current_format_version(self):
+        import orjson
+        import zstandard
+        with open(boaviztapi_utils.BOAVIZTAPI_CATALOG_PATH, "rb") as file:
+            catalog = orjson.loads(zstandard.ZstdDecompressor().decompress(file.read()))
+
+        self.assertEqual(boaviztapi_utils.BOAVIZTAPI_CATALOG_FORMAT_VERSION, catalog["metadata"]["format_version"])
+
+    def test_catalog_hits_log_source_and_generation_date_of_snapshot(self):
+        catalog_metadata = boaviztapi_utils.boaviztapi_catalog()["metadata"]
+        with self.assertLogs(logger, level="INFO") as logs:
+            boaviztapi_utils.call_boaviztapi("https://api.boavizta.org/v1/cloud/instance/all_providers")
+
+        self.assertEqual(1, len(logs.output))
+        self.assertIn(catalog_metadata["source"], logs.output[0])
+        self.assertIn(catalog_metadata["generated_at"], logs.output[0])
+
+    def test_responses_outside_catalog_are_shared_through_disk_cache(self):
+        response = Mock(status_code=200)
+        response.json.return_value = {"ok": True}
+        url = "https://api.boavizta.org/v1/server/"
+        with patch("efootprint.builders.hardware.boaviztapi_utils.requests.post", return_value=response) as post_mock:
+            boaviztapi_utils.call_boaviztapi(url, method="POST", json={"model": "a"})
+            # Another process starts with an empty in-memory cache
+            boaviztapi_utils._boaviztapi_cache.clear()
+            boaviztapi_utils._boaviztapi_cache_size_bytes = 0
+            result = boaviztapi_utils.call_boaviztapi(url, method="POST", json={"model": "a"})
+
+        self.assertEqual({"ok": True}, result)
+        self.assertEqual(1, post_mock.call_count)
+
+    def test_expired_disk_cache_entries_are_requested_again(self):
+        response = Mock(status_code=200)
+        response.json.return_value = {"ok": True}
+        url = "https://api.boavizta.org/v1/server/"
+        with patch("efootprint.builders.hardware.boaviztapi_utils._BOAVIZTAPI_CACHE_TTL_SECONDS", -1):
+            with patch("efootprint.builders.hardware.boaviztapi_utils.requests.post", return_value=response) \
+                    as post_mock:
+                boaviztapi_utils.call_boaviztapi(url, method="POST", json={"model": "a"})
+                boaviztapi_utils._boaviztapi_cache.clear()
+                boaviztapi_utils._boaviztapi_cache_size_bytes = 0
+                boaviztapi_utils.call_boaviztapi(url, method="POST", json={"model": "a"})
+
+        self.assertEqual(2, post_mock.call_count)
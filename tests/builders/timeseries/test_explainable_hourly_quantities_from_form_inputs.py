@@ -43,3 +43,27 @@ class CalculusGraphTest(TestCase):
         calculus_graph.cdn_resources = "remote"
         html = calculus_graph.generate_html()
         self.assertGreater(len(html), 0)
+
+
+class TestExplainableHourlyQuantitiesFromFormInputs(TestCase):
+    def setUp(self):
+        self.hourly_starts = ExplainableHourlyQuantitiesFromFormInputs(
+            {"start_date": "2024-01-01", "modeling_duration_value": 1, "modeling_duration_unit": "year",
+             "net_growth_rate_in_percentage": 10, "net_growth_rate_timespan": "year",
+             "initial_volume": 1000, "initial_volume_timespan": "month"})
+
+    def test_compact_value_is_computed_at_init_and_is_compact_leaves_it_untouched(self):
+        compact_value = self.hourly_starts.compact_value
+
+        self.assertIsNotNone(compact_value)
+        self.assertTrue(self.hourly_starts.is_compact)
+        self.assertIs(compact_value, self.hourly_starts.compact_value)
+
+    def test_deleting_value_goes_back_to_compact_series_from_form_inputs(self):
+        values = self.hourly_starts.value_as_float_list
+        self.assertFalse(self.hourly_starts.is_compact)
+
+        del self.hourly_starts.value
+
+        self.assertTrue(self.hourly_starts.is_compact)
+        self.assertEqual(values, self.hourly_starts.value_as_float_list)
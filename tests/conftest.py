@@ -1,5 +1,12 @@
+import os
+import tempfile
+
 from efootprint.abstract_modeling_classes.explainable_object_base_class import Source
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
 
 ModelingObject._use_name_as_id = True
 Source._use_name_as_id = True
+
+# Keep test runs from reading or filling the Boavizta API disk cache of the user
+os.environ.setdefault(
+    "EFOOTPRINT_BOAVIZTAPI_CACHE_PATH", os.path.join(tempfile.mkdtemp(), "boaviztapi_cache.sqlite3"))
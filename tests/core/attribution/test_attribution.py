@@ -10,7 +10,8 @@ from efootprint.abstract_modeling_classes.source_objects import SourceValue
 from efootprint.builders.time_builders import create_source_hourly_values_from_list
 from efootprint.constants.units import u
 from efootprint.core.attribution import (
-    atoms, atoms_of, attributed_footprint, footprint_per_node, footprint_per_node_per_source, node_totals_and_links)
+    atoms, atoms_of, attributed_footprint, footprint_per_node, footprint_per_node_per_source, node_totals_and_links,
+    packed_atoms)
 from efootprint.core.country import Country
 from efootprint.core.hardware.device import Device
 from efootprint.core.hardware.network import Network
@@ -172,6 +173,42 @@ class TestAttributionFold(TestCase):
             per_up_per_source[(self.tracked_device, self.up1)])
         self.assertNotIn((self.tracked_device, self.up2), per_up_per_source)
 
+    def test_packed_atoms_chains_index_each_atom_chain(self):
+        """Test that the packed integer chain of every atom points to the nodes of its chain(), in order."""
+        for phase in LifeCyclePhases:
+            packed = packed_atoms(self.system, phase)
+            self.assertEqual(len(list(atoms(self.system, phase))), len(packed.atoms))
+            for atom, chain in zip(packed.atoms, packed.chains.tolist()):
+                self.assertEqual(atom.chain(), [packed.nodes[node_index] for node_index in chain if node_index >= 0])
+
+    def test_footprint_per_node_equals_summing_atom_values_per_node(self):
+        """Test that the packed hourly fold equals summing each node's atom explainables one by one, excluded
+        sources left out."""
+        phase = LifeCyclePhases.USAGE
+        expected_per_step = {}
+        for atom in atoms(self.system, phase, exclude=(TrackedDevice,)):
+            expected_per_step[atom.step] = expected_per_step.get(atom.step, EmptyExplainableObject()) + atom.value
+        per_step = footprint_per_node(self.system, UsageJourneyStep, phase, exclude=(TrackedDevice,))
+
+        self.assertEqual(set(expected_per_step), set(per_step))
+        for step, expected_value in expected_per_step.items():
+            self.assertEqual(expected_value.start_date, per_step[step].start_date)
+            self.assertEqual(len(expected_value), len(per_step[step]))
+            assert_hourly_quantities_equal(self, expected_value, per_step[step])
+
+    def test_footprint_per_node_keeps_ancestry_of_summing_atom_values_per_node(self):
+        """Test that folded footprints have the direct ancestors they would get from summing their atom
+        explainables, so that they stay explainable."""
+        phase = LifeCyclePhases.USAGE
+        expected_per_up = {}
+        for atom in atoms(self.system, phase):
+            expected_per_up[atom.up] = expected_per_up.get(atom.up, EmptyExplainableObject()) + atom.value
+        per_up = footprint_per_node(self.system, UsagePattern, phase)
+
+        for up, expected_value in expected_per_up.items():
+            self.assertTrue(expected_value.direct_ancestor_ids)
+            self.assertEqual(set(expected_value.direct_ancestor_ids), set(per_up[up].direct_ancestor_ids))
+
     def test_country_groups_usage_patterns_orthogonally_to_journeys(self):
         """Test that a country node sums the per-pattern totals of its patterns across different journeys."""
         per_up = footprint_per_node(self.system, UsagePattern, LifeCyclePhases.USAGE)
@@ -188,25 +225,56 @@ class TestAttributionFold(TestCase):
             node_totals_and_links(self.system, phase, ALL_LEVELS),
             node_totals_and_links(self.system, phase, list(ALL_LEVELS)))
 
-    def test_modeling_update_flushes_attribution_memos_and_cached_primitives(self):
-        """Test that an input change wipes every render cache and cached primitive system-wide, so the next
-        query rebuilds atoms that conserve the new eager totals."""
+    def test_modeling_update_flushes_attribution_memos_reading_changed_inputs(self):
+        """Test that an input change flushes the memos and cached primitives reading it, directly or through other
+        memos, so the next query rebuilds atoms that conserve the new eager totals, and keeps the others warm."""
         phase = LifeCyclePhases.USAGE
         stale_atoms = atoms_of(self.device, phase)
+        tracked_device_atoms = atoms_of(self.tracked_device, phase)
         node_totals_and_links(self.system, phase, ALL_LEVELS)
-        self.assertIn("render_cache", self.device.__dict__)
+        step_occurrences = self.step_a.hourly_avg_occurrences_per_usage_pattern
         initial_power = self.device.power
         try:
             self.device.power = SourceValue(100 * u.W)
-            self.assertNotIn("render_cache", self.device.__dict__)
-            self.assertNotIn("render_cache", self.system.__dict__)
-            self.assertNotIn("hourly_avg_occurrences_per_usage_pattern", self.step_a.__dict__)
+            self.assertNotIn(("atoms_of", phase), self.device.render_cache)
+            self.assertNotIn(("packed_atoms", phase), self.system.render_cache)
+            self.assertNotIn(("node_totals_and_links", phase, ALL_LEVELS, ()), self.system.render_cache)
+            self.assertIs(tracked_device_atoms, atoms_of(self.tracked_device, phase))
+            self.assertIs(step_occurrences, self.step_a.hourly_avg_occurrences_per_usage_pattern)
             fresh_atoms = atoms_of(self.device, phase)
             self.assertIsNot(stale_atoms, fresh_atoms)
             assert_hourly_quantities_equal(self, self.device.energy_footprint, sum_atom_values(fresh_atoms))
         finally:
             self.device.power = initial_power
 
+    def test_modeling_update_flushes_cached_primitives_reading_changed_inputs(self):
+        """Test that a change of an input read by a cached primitive flushes it, along with the atoms built on it."""
+        phase = LifeCyclePhases.USAGE
+        atoms_of(self.device, phase)
+        self.step_a.hourly_avg_occurrences_per_usage_pattern
+        initial_user_time_spent = self.step_a.user_time_spent
+        try:
+            self.step_a.user_time_spent = SourceValue(25 * u.min)
+            self.assertNotIn("hourly_avg_occurrences_per_usage_pattern", self.step_a.__dict__)
+            self.assertNotIn(("atoms_of", phase), self.device.render_cache)
+            assert_hourly_quantities_equal(
+                self, self.device.energy_footprint, sum_atom_values(atoms_of(self.device, phase)))
+        finally:
+            self.step_a.user_time_spent = initial_user_time_spent
+
+    def test_modeling_update_changing_links_flushes_every_memo(self):
+        """Test that updates changing links between modeling objects wipe every render cache system-wide."""
+        phase = LifeCyclePhases.USAGE
+        atoms_of(self.tracked_device, phase)
+        node_totals_and_links(self.system, phase, ALL_LEVELS)
+        initial_devices = list(self.up3.devices)
+        try:
+            self.up3.devices = initial_devices + [self.tracked_device]
+            self.assertNotIn("render_cache", self.tracked_device.__dict__)
+            self.assertNotIn("render_cache", self.system.__dict__)
+        finally:
+            self.up3.devices = initial_devices
+
     def test_attributed_footprint_equals_footprint_per_node_entry(self):
         """Test that the attributed_footprint convenience read is an exact delegation: each object's value
         equals its node entry in footprint_per_node at its own class level, for each phase."""
@@ -225,10 +293,11 @@ class TestAttributionFold(TestCase):
         reflects the new inputs."""
         initial_power = self.device.power
         _ = attributed_footprint(self.up1, LifeCyclePhases.USAGE)
-        self.assertIn("render_cache", self.system.__dict__)
+        fold_memo_key = ("footprint_per_node", UsagePattern, LifeCyclePhases.USAGE, ())
+        self.assertIn(fold_memo_key, self.system.render_cache)
         try:
             self.device.power = SourceValue(100 * u.W)
-            self.assertNotIn("render_cache", self.system.__dict__)
+            self.assertNotIn(fold_memo_key, self.system.render_cache)
             assert_hourly_quantities_equal(
                 self, footprint_per_node(self.system, UsagePattern, LifeCyclePhases.USAGE)[self.up1],
                 attributed_footprint(self.up1, LifeCyclePhases.USAGE))
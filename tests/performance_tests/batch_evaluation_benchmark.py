@@ -0,0 +1,34 @@
+import os
+import tempfile
+from time import perf_counter
+
+from efootprint.api_utils.system_to_json import system_to_json
+from efootprint.batch import evaluate_many
+from efootprint.logger import logger
+from tests.performance_tests.generate_big_system import generate_big_system
+
+# Benchmarks evaluate_many against one after another evaluation over a portfolio of generated big systems.
+nb_systems = 8
+nb_workers = min(max(os.cpu_count() or 1, 2), nb_systems)
+
+if __name__ == "__main__":
+    tmp_dir = tempfile.mkdtemp()
+    system_paths = []
+    for system_index in range(nb_systems):
+        system = generate_big_system(
+            nb_of_servers_of_each_type=1, nb_of_uj_per_each_server_type=2, nb_of_uj_steps_per_uj=3, nb_of_up_per_uj=2,
+            nb_of_edge_usage_patterns=2, nb_of_edge_processes_and_server_needs_per_edge_computer=2, nb_years=3)
+        system_path = os.path.join(tmp_dir, f"system_{system_index}.json")
+        system_to_json(system, save_calculated_attributes=False, output_filepath=system_path)
+        system_paths.append(system_path)
+
+    for workers in [1, nb_workers]:
+        start = perf_counter()
+        for result in evaluate_many(system_paths, workers=workers):
+            assert result.succeeded, result.error
+        logger.info(f"Evaluated {nb_systems} systems with {workers} workers in {round(perf_counter() - start, 2)} "
+                    f"seconds")
+
+    for system_path in system_paths:
+        os.remove(system_path)
+    os.rmdir(tmp_dir)
@@ -17,6 +17,8 @@ start = perf_counter()
 import os
 
 from efootprint.api_utils.system_to_json import system_to_json
+from efootprint.utils import profiling
+from efootprint.utils.profiling import profile
 from efootprint.utils.tools import time_it
 from efootprint.abstract_modeling_classes.source_objects import SourceValue, SourceRecurrentValues
 from efootprint.builders.hardware.boavizta_cloud_server import BoaviztaCloudServer
@@ -250,51 +252,50 @@ def timed_system_to_json(system, *args, **kwargs):
 
 if __name__ == "__main__":
     # Live system editions benchmarking
-    nb_years = 5
-    system = generate_big_system(
-        nb_of_servers_of_each_type=2, nb_of_uj_per_each_server_type=2, nb_of_uj_steps_per_uj=4, nb_of_up_per_uj=3,
-        nb_of_edge_usage_patterns=3, nb_of_edge_processes_and_server_needs_per_edge_computer=3,
-        nb_of_jobs_per_server_need=1, nb_years=nb_years)
-
-    edition_iterations = 10
-    start = perf_counter()
-    edited_job = list(list(system.usage_patterns[0].usage_journey.uj_steps)[0].jobs)[1]
-    for i in range(edition_iterations):
-        edited_job.data_transferred = SourceValue(100 * u.MB)
-        edited_job.data_transferred = SourceValue(30 * u.MB)
-    end = perf_counter()
-    compute_time_per_edition = round(1000 * (end - start) / (edition_iterations * 2), 1)
-    logger.info(f"edition took {compute_time_per_edition} ms on average per data transferred edition")
-
-    start = perf_counter()
-    for i in range(edition_iterations):
-        system.usage_patterns[0].hourly_usage_journey_starts = form_inputs_hourly_starts(
-            nb_years, initial_volume=2000 if i % 2 == 0 else 3000)
-    end = perf_counter()
-    compute_time_per_edition = round(1000 * (end - start) / edition_iterations, 1)
-    logger.info(f"edition took {compute_time_per_edition} ms on average per hourly usage journey starts edition")
-
-    start = perf_counter()
-    for i in range(edition_iterations):
-        system.edge_usage_patterns[0].hourly_edge_usage_journey_starts = form_inputs_hourly_starts(
-            nb_years, initial_volume=2000 if i % 2 == 0 else 3000)
-    end = perf_counter()
-    compute_time_per_edition = round(1000 * (end - start) / edition_iterations, 1)
-    logger.info(f"edition took {compute_time_per_edition} ms on average per edge hourly usage journey starts edition")
-
-    from efootprint.abstract_modeling_classes.modeling_object import compute_times
-    total_time = 0
-    for data in compute_times.values():
-        total_time += data["total_duration"]
-    nb_update_functions = len(compute_times)
+    with profile() as report:
+        nb_years = 5
+        system = generate_big_system(
+            nb_of_servers_of_each_type=2, nb_of_uj_per_each_server_type=2, nb_of_uj_steps_per_uj=4, nb_of_up_per_uj=3,
+            nb_of_edge_usage_patterns=3, nb_of_edge_processes_and_server_needs_per_edge_computer=3,
+            nb_of_jobs_per_server_need=1, nb_years=nb_years)
+
+        edition_iterations = 10
+        start = perf_counter()
+        edited_job = list(list(system.usage_patterns[0].usage_journey.uj_steps)[0].jobs)[1]
+        for i in range(edition_iterations):
+            edited_job.data_transferred = SourceValue(100 * u.MB)
+            edited_job.data_transferred = SourceValue(30 * u.MB)
+        end = perf_counter()
+        compute_time_per_edition = round(1000 * (end - start) / (edition_iterations * 2), 1)
+        logger.info(f"edition took {compute_time_per_edition} ms on average per data transferred edition")
+
+        start = perf_counter()
+        for i in range(edition_iterations):
+            system.usage_patterns[0].hourly_usage_journey_starts = form_inputs_hourly_starts(
+                nb_years, initial_volume=2000 if i % 2 == 0 else 3000)
+        end = perf_counter()
+        compute_time_per_edition = round(1000 * (end - start) / edition_iterations, 1)
+        logger.info(f"edition took {compute_time_per_edition} ms on average per hourly usage journey starts edition")
+
+        start = perf_counter()
+        for i in range(edition_iterations):
+            system.edge_usage_patterns[0].hourly_edge_usage_journey_starts = form_inputs_hourly_starts(
+                nb_years, initial_volume=2000 if i % 2 == 0 else 3000)
+        end = perf_counter()
+        compute_time_per_edition = round(1000 * (end - start) / edition_iterations, 1)
+        logger.info(f"edition took {compute_time_per_edition} ms on average per edge hourly usage journey starts edition")
+
+    update_function_stats = report.to_dataframe(per_object=False)
+    update_function_stats = update_function_stats[update_function_stats["Category"] == profiling.UPDATE_FUNCTION]
+    total_time = update_function_stats["Wall time (s)"].sum()
+    nb_update_functions = len(update_function_stats)
     print(f"Total time in update functions: {round(total_time, 3)}s, nb_update_functions: {nb_update_functions}, "
           f"avg %: {round(100 / nb_update_functions, 2)}")
     cumulated_time = 0
-    i = 0
-    for update_function_name, update_function_dict in sorted(compute_times.items(), key=lambda x: -x[1]["total_duration"]):
-        i += 1
-        update_function_time = update_function_dict.get("total_duration")
+    for i, (_, row) in enumerate(update_function_stats.iterrows(), start=1):
+        update_function_time = row["Wall time (s)"]
         cumulated_time += update_function_time
         time_pct = round(100 * update_function_time / total_time, 2)
         cum_time_pct = round(100 * cumulated_time / total_time, 2)
-        print(f"{i}: {update_function_time:.3f}s ({time_pct}%, cum {cum_time_pct}%) for {update_function_dict["nb_calls"]} calls of {update_function_name}")
+        print(f"{i}: {update_function_time:.3f}s ({time_pct}%, cum {cum_time_pct}%) for "
+              f"{row['Calls']} calls of {row['Class']}.{row['Function']} during {row['Phase']}")
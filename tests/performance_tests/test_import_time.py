@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+from efootprint.api_utils.system_to_json import system_to_json
+from tests.utils import build_system
+
+# Importing json_to_system took about 3 s when it imported every builder, and about 0.5 s since it resolves classes
+# on demand. The budget leaves room for slower machines while still catching a heavy import sneaking back in.
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+NB_IMPORT_TIME_MEASURES = 3
+HEAVY_MODULES = [
+    "ecologits", "efootprint.builders.hardware.boavizta_cloud_server", "scipy.signal", "IPython", "pyvis",
+    "matplotlib", "plotly"]
+
+IMPORT_AND_LOAD_SCRIPT = """
+import json
+import sys
+from time import perf_counter
+
+start = perf_counter()
+from efootprint.api_utils.json_to_system import json_to_system
+import_time = perf_counter() - start
+if len(sys.argv) > 1:
+    with open(sys.argv[1], "r") as file:
+        json_to_system(json.load(file), launch_system_computations=False)
+print(json.dumps({"import_time": import_time, "loaded_modules": sorted(sys.modules)}))
+"""
+
+
+def run_in_fresh_interpreter(*args):
+    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=root_dir)
+    completed_process = subprocess.run(
+        [sys.executable, "-c", IMPORT_AND_LOAD_SCRIPT, *args], capture_output=True, text=True, env=env, check=True)
+
+    return json.loads(completed_process.stdout.splitlines()[-1])
+
+
+class TestImportTime(TestCase):
+    def test_json_to_system_import_time_stays_within_budget(self):
+        import_time = min(run_in_fresh_interpreter()["import_time"] for _ in range(NB_IMPORT_TIME_MEASURES))
+
+        self.assertLess(import_time, IMPORT_TIME_BUDGET_SECONDS)
+
+    def test_loading_system_without_builders_imports_no_heavy_module(self):
+        system_filepath = os.path.join(tempfile.mkdtemp(), "system.json")
+        system_to_json(build_system("system", "server"), save_calculated_attributes=True,
+                       output_filepath=system_filepath)
+        try:
+            loaded_modules = run_in_fresh_interpreter(system_filepath)["loaded_modules"]
+        finally:
+            os.remove(system_filepath)
+            os.rmdir(os.path.dirname(system_filepath))
+
+        for heavy_module in HEAVY_MODULES:
+            self.assertNotIn(heavy_module, loaded_modules)
+
+    def test_timeseries_builders_are_registered_once_json_to_system_is_imported(self):
+        loaded_modules = run_in_fresh_interpreter()["loaded_modules"]
+
+        self.assertIn("efootprint.builders.timeseries", loaded_modules)
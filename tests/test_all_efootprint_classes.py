@@ -9,6 +9,9 @@ from unittest import TestCase
 from efootprint import core
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
 from efootprint.all_classes_in_order import ALL_EFOOTPRINT_CLASSES
+from efootprint.api_utils.json_to_system import compute_classes_generation_order, registered_classes_generation_order
+from efootprint.efootprint_class_registry import (
+    EFOOTPRINT_CLASS_IMPORT_PATHS, efootprint_classes_dict_from_class_names)
 
 
 def get_subclasses_in_package(package: ModuleType, base_class: Type) -> List[Type]:
@@ -34,3 +37,32 @@ class TestAllEfootprintClasses(TestCase):
             if not inspect.isabstract(efootprint_class):
                 self.assertIn(efootprint_class, ALL_EFOOTPRINT_CLASSES,
                               f"{efootprint_class.__name__} is not in ALL_EFOOTPRINT_CLASSES")
+
+    def test_class_registry_import_paths_point_to_their_class(self):
+        for class_name, import_path in EFOOTPRINT_CLASS_IMPORT_PATHS.items():
+            efootprint_class = importlib.import_module(import_path).__dict__[class_name]
+            self.assertEqual(class_name, efootprint_class.__name__)
+            self.assertEqual(import_path, efootprint_class.__module__)
+
+    def test_generation_order_of_registered_classes_follows_the_order_of_all_classes(self):
+        all_classes_order = compute_classes_generation_order(efootprint_classes_dict_from_class_names())
+
+        self.assertEqual(all_classes_order, list(registered_classes_generation_order(
+            frozenset(EFOOTPRINT_CLASS_IMPORT_PATHS))))
+        self.assertEqual(sorted(EFOOTPRINT_CLASS_IMPORT_PATHS), sorted(all_classes_order))
+
+    def test_generation_order_of_class_subset_generates_subclasses_of_annotated_classes_first(self):
+        classes_order = list(registered_classes_generation_order(frozenset(
+            ["System", "UsagePattern", "UsageJourney", "UsageJourneyStep", "VideoStreamingJob", "VideoStreaming",
+             "BoaviztaCloudServer", "Storage", "Network", "Device", "Country"])))
+
+        # VideoStreaming.server is annotated Server, which BoaviztaCloudServer subclasses
+        self.assertLess(classes_order.index("BoaviztaCloudServer"), classes_order.index("VideoStreaming"))
+        self.assertLess(classes_order.index("VideoStreaming"), classes_order.index("VideoStreamingJob"))
+        self.assertLess(classes_order.index("VideoStreamingJob"), classes_order.index("UsageJourneyStep"))
+        self.assertEqual("System", classes_order[-1])
+
+    def test_classes_dict_only_holds_requested_efootprint_classes_in_registry_order(self):
+        classes_dict = efootprint_classes_dict_from_class_names(["System", "Sources", "Server", "efootprint_version"])
+
+        self.assertEqual(["Server", "System"], list(classes_dict.keys()))
@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+from copy import deepcopy
+from unittest import TestCase
+
+from efootprint.abstract_modeling_classes.explainable_object_base_class import Source
+from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.api_utils.json_to_system import json_to_system
+from efootprint.batch import evaluate_many, evaluate_system_file
+from efootprint.constants.units import u
+
+API_UTILS_TEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "api_utils_tests")
+BASE_SYSTEM_PATH = os.path.join(API_UTILS_TEST_DIR, "base_system.json")
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        with open(BASE_SYSTEM_PATH, "rb") as file:
+            class_obj_dict, _, _ = json_to_system(deepcopy(json.load(file)))
+        self.system = next(iter(class_obj_dict["System"].values()))
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for filename in os.listdir(self.tmp_dir):
+            os.remove(os.path.join(self.tmp_dir, filename))
+        os.rmdir(self.tmp_dir)
+
+    def check_result_matches_system(self, result):
+        self.assertTrue(result.succeeded, result.error)
+        self.assertEqual(self.system.name, result.system_name)
+        self.assertAlmostEqual(self.system.total_footprint.sum().to(u.kg).magnitude, result.total_footprint,
+                               delta=1e-4 * result.total_footprint)
+        for category, footprint in self.system.total_energy_footprint_sum_over_period.items():
+            self.assertAlmostEqual(footprint.to(u.kg).magnitude, result.energy_footprint_by_category[category])
+
+    def test_evaluate_system_file_reads_footprints_and_saves_system(self):
+        result = evaluate_system_file(BASE_SYSTEM_PATH, output_dir=self.tmp_dir)
+
+        self.check_result_matches_system(result)
+        with open(result.saved_json_path) as file:
+            saved_system_dict = json.load(file)
+        self.assertIn("total_footprint", saved_system_dict["System"][self.system.id])
+
+    def test_failures_are_reported_without_stopping_the_batch(self):
+        corrupted_path = os.path.join(self.tmp_dir, "corrupted.json")
+        with open(corrupted_path, "w") as file:
+            file.write("{")
+
+        results = list(evaluate_many([corrupted_path, BASE_SYSTEM_PATH], workers=1))
+
+        self.assertFalse(results[0].succeeded)
+        self.assertIn("JSONDecodeError", results[0].error)
+        self.check_result_matches_system(results[1])
+
+    def test_global_state_is_reset_after_each_system(self):
+        initial_flags = (ModelingObject._use_name_as_id, Source._use_name_as_id)
+        list(evaluate_many([BASE_SYSTEM_PATH], workers=1))
+
+        self.assertEqual(initial_flags, (ModelingObject._use_name_as_id, Source._use_name_as_id))
+
+    def test_parallel_evaluation_yields_one_result_per_system(self):
+        results = list(evaluate_many([BASE_SYSTEM_PATH] * 3, workers=2))
+
+        self.assertEqual(3, len(results))
+        for result in results:
+            self.check_result_matches_system(result)
+
+    def test_inputs_sharing_a_file_name_are_rejected_when_saving_systems(self):
+        with self.assertRaises(ValueError):
+            list(evaluate_many([BASE_SYSTEM_PATH] * 2, workers=2, output_dir=self.tmp_dir))
+
+        self.assertEqual([], os.listdir(self.tmp_dir))
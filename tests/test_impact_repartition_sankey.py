@@ -331,6 +331,36 @@ class TestImpactRepartitionSankeyConservation(TestCase):
         self.assertIsNotNone(sankey.get_root_display_unit())
         self.assert_kg_equal(eager_system_total(system), sankey.total_system_value)
 
+    def test_refresh_without_modeling_update_keeps_the_build(self):
+        sankey = build_sankey(fixture_system("simple_edge"))
+        link_values = sankey.link_values
+
+        self.assertFalse(sankey.refresh())
+        self.assertIs(link_values, sankey.link_values)
+
+    def test_refresh_after_modeling_update_matches_a_fresh_build(self):
+        from efootprint.abstract_modeling_classes.source_objects import SourceValue
+        from tests.integration_tests.integration_simple_edge_system_base_class import (
+            IntegrationTestSimpleEdgeSystemBaseClass)
+        system = IntegrationTestSimpleEdgeSystemBaseClass.generate_simple_edge_system()[0]
+        sankey = build_sankey(system)
+        cpu_component = next(obj for obj in system.all_linked_objects if obj.class_as_simple_str == "EdgeCPUComponent")
+        total_before_update = sankey.total_system_value
+
+        cpu_component.power_per_unit = SourceValue(2 * cpu_component.power_per_unit.value)
+
+        self.assertTrue(sankey.refresh())
+        self.assertNotAlmostEqual(total_before_update.magnitude, sankey.total_system_value.to(
+            total_before_update.units).magnitude)
+        fresh_sankey = build_sankey(system)
+        self.assertEqual(fresh_sankey.full_node_labels, sankey.full_node_labels)
+        self.assertEqual(fresh_sankey.link_sources, sankey.link_sources)
+        self.assertEqual(fresh_sankey.link_targets, sankey.link_targets)
+        self.assertEqual(fresh_sankey._node_columns, sankey._node_columns)
+        for fresh_value, refreshed_value in zip(fresh_sankey.link_values, sankey.link_values):
+            self.assert_kg_equal(fresh_value, refreshed_value)
+        self.assert_kg_equal(eager_system_total(system), sankey.total_system_value)
+
 
 class TestImpactRepartitionSankeyPresentation(TestCase):
     """Presentation mechanics (aggregation, labels, columns, spacers, figure assembly) on manually-built
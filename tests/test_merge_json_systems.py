@@ -2,7 +2,11 @@ import unittest
 from unittest import TestCase
 
 import efootprint
-from efootprint.utils.merge_json_systems import merge_json_systems
+from efootprint.api_utils.system_to_json import system_to_json
+from efootprint.comparison.duplication import duplicate_system
+from efootprint.constants.units import u
+from efootprint.utils.merge_json_systems import merge_json_systems, merge_systems
+from tests.utils import build_system
 
 
 def _make_system_dict(system_id, usage_pattern_ids, extra_classes=None):
@@ -71,5 +75,24 @@ class TestMergeJsonSystems(TestCase):
         self.assertEqual({"up-0", "up-1"}, set(merged["UsagePattern"].keys()))
 
 
+class TestMergeSystems(TestCase):
+    def test_merges_cloned_systems_with_colliding_ids_suffixed(self):
+        """Test merge_systems clones the input systems, suffixes colliding ids and sums their footprints."""
+        system_0 = build_system("merged system 0", "merged server")
+        system_1 = duplicate_system(system_0)
+        system_0_json = system_to_json(system_0, save_calculated_attributes=True)
+
+        merged = merge_systems([system_0, system_1])
+
+        usage_pattern_id = system_0.usage_patterns[0].id
+        self.assertEqual("Merged system", merged.name)
+        self.assertEqual([f"{usage_pattern_id}-0", f"{usage_pattern_id}-1"], [up.id for up in merged.usage_patterns])
+        self.assertEqual(2 * len(system_0.all_linked_objects), len(merged.all_linked_objects))
+        self.assertAlmostEqual(
+            2 * system_0.total_footprint.sum().to(u.kg).magnitude, merged.total_footprint.sum().to(u.kg).magnitude,
+            places=3)
+        self.assertEqual(system_0_json, system_to_json(system_0, save_calculated_attributes=True))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+import numpy as np
+
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.comparison.duplication import duplicate_system
+from efootprint.comparison.multi_system_comparison import CATEGORIES, MultiSystemComparison
+from efootprint.comparison.system_comparison import PHASES
+from efootprint.constants.units import u
+from efootprint.core.hardware.server import Server
+from tests.utils import build_system
+
+
+class TestMultiSystemComparison(TestCase):
+    def setUp(self):
+        self.base_system = build_system("model A", "shared server")
+        self.variants = []
+        for power in [500, 700]:
+            variant = duplicate_system(self.base_system)
+            next(o for o in variant.all_linked_objects if isinstance(o, Server)).power = SourceValue(power * u.W)
+            self.variants.append(variant)
+        self.other_calendar_system = build_system("model C", "server C", start="2025-02-01")
+        self.systems = [self.base_system] + self.variants + [self.other_calendar_system]
+        self.comparison = MultiSystemComparison(self.systems)
+
+    def test_needs_at_least_two_systems(self):
+        with self.assertRaises(ValueError):
+            MultiSystemComparison([self.base_system])
+
+    def test_time_series_stacks_systems_categories_and_phases_on_one_axis(self):
+        time_series = self.comparison.time_series
+
+        self.assertEqual((len(self.systems), len(CATEGORIES), len(PHASES)), time_series.values.shape[:3])
+        self.assertEqual(len(time_series.hours), time_series.values.shape[-1])
+        self.assertGreater(time_series.values.shape[-1], len(self.base_system.total_footprint.value))
+        for system, cumulative in zip(self.systems, time_series.cumulative):
+            self.assertAlmostEqual(system.total_footprint.sum().to(u.kg).magnitude, float(cumulative[-1]), places=1)
+
+    def test_time_series_matches_pairwise_comparison(self):
+        pairwise_time_series = self.comparison.pairwise(0, 3).time_series
+        time_series = self.comparison.time_series
+
+        self.assertEqual(pairwise_time_series.start_date, time_series.start_date)
+        self.assertTrue(np.allclose(pairwise_time_series.values_a, time_series.totals[0], atol=1e-3))
+        self.assertTrue(np.allclose(pairwise_time_series.usage_b, time_series.phase_totals[3, 0], atol=1e-3))
+        self.assertTrue(np.allclose(
+            pairwise_time_series.fabrication_b, time_series.phase_totals[3, 1], atol=1e-3))
+
+    def test_totals_and_deltas_match_pairwise_decomposition(self):
+        deltas = self.comparison.deltas_from(0)
+        decomposition = self.comparison.pairwise(0, 1).decomposition
+
+        self.assertTrue(np.all(deltas[0] == 0))
+        for row in decomposition:
+            self.assertAlmostEqual(
+                row.delta.absolute,
+                deltas[1, CATEGORIES.index(row.category), PHASES.index(row.phase)], delta=1e-3)
+        self.assertAlmostEqual(self.comparison.pairwise(0, 2).total_b, self.comparison.totals[2], delta=1e-2)
+
+    def test_input_diff_gives_one_row_per_attribute_differing_across_systems(self):
+        diff = MultiSystemComparison([self.base_system] + self.variants).input_diff
+
+        self.assertEqual([], diff.partially_present)
+        self.assertEqual(1, len(diff.changed))
+        power_diff = diff.changed[0]
+        self.assertEqual(("Server", "power"), (power_diff.object_class, power_diff.attribute))
+        self.assertEqual(("300.0 watt", "500.0 watt", "700.0 watt"), power_diff.values)
+        self.assertEqual(("shared server",) * 3, power_diff.object_names)
+
+    def test_input_diff_reports_objects_held_by_some_systems_only(self):
+        diff = self.comparison.input_diff
+
+        other_server_presence = next(
+            presence for presence in diff.partially_present if presence.object_name == "server C")
+        self.assertEqual((False, False, False, True), other_server_presence.present_in)
+        power_diff = next(row for row in diff.changed if row.attribute == "power")
+        self.assertEqual(("300.0 watt", "500.0 watt", "700.0 watt", None), power_diff.values)
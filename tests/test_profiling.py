@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+import efootprint
+from efootprint.abstract_modeling_classes.source_objects import SourceValue
+from efootprint.api_utils.json_to_system import json_to_system
+from efootprint.api_utils.system_to_json import system_to_json
+from efootprint.constants.units import u
+from efootprint.core.lifecycle_phases import LifeCyclePhases
+from efootprint.core.attribution import footprint_per_node
+from efootprint.utils import profiling
+from tests.utils import build_system
+
+
+class TestProfiling(TestCase):
+    def test_system_build_records_every_update_function_of_every_object(self):
+        with efootprint.profile() as report:
+            system = build_system("system", "server")
+
+        df = report.to_dataframe()
+        update_functions = df[(df["Category"] == profiling.UPDATE_FUNCTION) & (df["Phase"] == profiling.SYSTEM_BUILD)]
+        nb_calculated_attributes = sum(
+            len(mod_obj.calculated_attributes) for mod_obj in system.all_linked_objects + [system])
+        self.assertEqual(nb_calculated_attributes, update_functions["Calls"].sum())
+        server = system.servers[0]
+        server_rows = update_functions[update_functions["Object id"] == server.id]
+        self.assertEqual(
+            sorted(f"update_{attr_name}" for attr_name in server.calculated_attributes),
+            sorted(server_rows["Function"]))
+        self.assertEqual({"Server"}, set(server_rows["Class"]))
+        self.assertGreater(update_functions["Array bytes"].sum(), 0)
+        self.assertEqual(1, len(df[df["Category"] == profiling.SYSTEM_BUILD]))
+
+    def test_modeling_update_json_and_attribution_phases_are_recorded(self):
+        system = build_system("system", "server")
+        with efootprint.profile() as report:
+            system.servers[0].power = SourceValue(1000 * u.W)
+            json_to_system(system_to_json(system, save_calculated_attributes=True), launch_system_computations=False)
+            footprint_per_node(system, type(system.servers[0]), LifeCyclePhases.USAGE)
+
+        df = report.to_dataframe()
+        for phase in (profiling.MODELING_UPDATE, profiling.JSON_SAVE, profiling.JSON_LOAD,
+                      profiling.ATTRIBUTION_FOLD):
+            self.assertIn(phase, set(df["Category"]))
+        recomputations = df[(df["Category"] == profiling.UPDATE_FUNCTION)
+                            & (df["Phase"] == profiling.MODELING_UPDATE)]
+        self.assertIn("update_energy_footprint", set(recomputations["Function"]))
+
+    def test_per_update_function_table_sums_over_objects(self):
+        with efootprint.profile() as report:
+            build_system("system", "server")
+
+        per_object = report.to_dataframe()
+        per_function = report.to_dataframe(per_object=False)
+
+        self.assertNotIn("Object id", per_function.columns)
+        self.assertEqual(per_object["Calls"].sum(), per_function["Calls"].sum())
+        self.assertEqual(
+            len(per_function), len(per_object.groupby(["Phase", "Category", "Class", "Function"], dropna=False)))
+
+    def test_chrome_trace_export(self):
+        with efootprint.profile() as report:
+            build_system("system", "server")
+        trace_filepath = os.path.join(tempfile.mkdtemp(), "trace.json")
+        try:
+            trace = report.to_chrome_trace(trace_filepath)
+            with open(trace_filepath, "r") as file:
+                self.assertEqual(trace, json.load(file))
+        finally:
+            os.remove(trace_filepath)
+            os.rmdir(os.path.dirname(trace_filepath))
+
+        self.assertEqual(len(report.events), len(trace["traceEvents"]))
+        self.assertIn("Server.update_energy_footprint", {event["name"] for event in trace["traceEvents"]})
+        for event in trace["traceEvents"]:
+            self.assertEqual("X", event["ph"])
+            self.assertGreaterEqual(event["dur"], 0)
+
+    def test_nothing_is_recorded_outside_profile_blocks(self):
+        with efootprint.profile() as report:
+            pass
+        build_system("system", "server")
+
+        self.assertIsNone(profiling.active_report)
+        self.assertEqual({}, report.stats)
+
+    def test_nested_profile_blocks_record_in_innermost_report(self):
+        with efootprint.profile() as outer_report:
+            with efootprint.profile() as inner_report:
+                build_system("system", "server")
+            self.assertIs(outer_report, profiling.active_report)
+
+        self.assertEqual({}, outer_report.stats)
+        self.assertGreater(len(inner_report.stats), 0)
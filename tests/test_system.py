@@ -4,6 +4,8 @@ from unittest.mock import MagicMock, patch, PropertyMock
 import unittest
 
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.abstract_modeling_classes.modeling_object_topology import invalidate_topology_memos
+from efootprint.abstract_modeling_classes.modeling_update import ModelingUpdate
 from efootprint.abstract_modeling_classes.explainable_quantity import ExplainableQuantity
 from efootprint.abstract_modeling_classes.empty_explainable_object import EmptyExplainableObject
 from efootprint.abstract_modeling_classes.list_linked_to_modeling_obj import ListLinkedToModelingObj
@@ -28,7 +30,7 @@ from efootprint.builders.hardware.edge.edge_computer import EdgeComputer
 from efootprint.core.usage.edge.edge_function import EdgeFunction
 from efootprint.core.usage.edge.recurrent_edge_device_need import RecurrentEdgeDeviceNeed
 from tests import root_test_dir
-from tests.utils import create_mod_obj_mock
+from tests.utils import build_system, create_mod_obj_mock
 
 
 class TestSystem(TestCase):
@@ -267,6 +269,8 @@ class TestSystem(TestCase):
         api_job.external_api = external_api
         api_job.server = external_api.server
         self.usage_pattern.jobs = [api_job]
+        # Mocks are linked without going through modeling object link hooks
+        invalidate_topology_memos()
 
         fab_footprints = self.system.fabrication_footprints
         energy_footprints = self.system.energy_footprints
@@ -551,6 +555,7 @@ class TestSystem(TestCase):
         base_objects = self.system.all_linked_objects
         with patch.object(System, "all_linked_objects", new_callable=PropertyMock) as mock_all:
             mock_all.return_value = base_objects + [edge_computer]
+            invalidate_topology_memos()
             fab_footprints = self.system.fabrication_footprints
 
             expected_dict["EdgeDevices"] = {edge_computer: edge_computer.instances_fabrication_footprint}
@@ -569,6 +574,7 @@ class TestSystem(TestCase):
 
         with patch.object(System, "edge_devices", new_callable=PropertyMock) as mock_edge_devices:
             mock_edge_devices.return_value = [edge_computer]
+            invalidate_topology_memos()
             energy_footprints = self.system.energy_footprints
 
             expected_dict["EdgeDevices"] = {edge_computer: edge_computer.energy_footprint}
@@ -583,6 +589,7 @@ class TestSystem(TestCase):
         base_objects = self.system.all_linked_objects
         with patch.object(System, "all_linked_objects", new_callable=PropertyMock) as mock_all:
             mock_all.return_value = base_objects + [edge_computer]
+            invalidate_topology_memos()
             total_fab_footprints = self.system.total_fabrication_footprints
 
             self.assertEqual("EdgeDevices total fabrication footprint", total_fab_footprints["EdgeDevices"].label)
@@ -597,6 +604,7 @@ class TestSystem(TestCase):
         base_objects = self.system.all_linked_objects
         with patch.object(System, "all_linked_objects", new_callable=PropertyMock) as mock_all:
             mock_all.return_value = base_objects + [edge_computer]
+            invalidate_topology_memos()
             total_energy_footprints = self.system.total_energy_footprints
 
             self.assertEqual("EdgeDevices total energy footprint", total_energy_footprints["EdgeDevices"].label)
@@ -622,6 +630,7 @@ class TestSystem(TestCase):
 
         with patch.object(System, "edge_devices", new_callable=PropertyMock) as mock_edge_devices:
             mock_edge_devices.return_value = [edge_computer]
+            invalidate_topology_memos()
             total_fab_sum = self.system.total_fabrication_footprint_sum_over_period
 
             self.assertIn("EdgeDevices", total_fab_sum)
@@ -647,6 +656,7 @@ class TestSystem(TestCase):
 
         with patch.object(System, "edge_devices", new_callable=PropertyMock) as mock_edge_devices:
             mock_edge_devices.return_value = [edge_computer]
+            invalidate_topology_memos()
             total_energy_sum = self.system.total_energy_footprint_sum_over_period
 
             self.assertIn("EdgeDevices", total_energy_sum)
@@ -724,5 +734,126 @@ class TestSystem(TestCase):
         self.assertEqual(8, len(linked_objects))
 
 
+class TestLazyEvaluation(TestCase):
+    def build_lazy_system(self, system_name, server_name):
+        with patch.object(System, "lazy_evaluation", True):
+            return build_system(system_name, server_name)
+
+    def test_lazy_build_only_computes_what_is_read(self):
+        """Test a lazily evaluated system leaves calculated attributes stale until they are read."""
+        eager_system = build_system("eager", "eager server")
+        lazy_system = self.build_lazy_system("lazy", "lazy server")
+        lazy_server = lazy_system.servers[0]
+
+        self.assertTrue(lazy_system.lazy_evaluation)
+        self.assertFalse(System.lazy_evaluation)
+        self.assertIn("energy_footprint", lazy_server.stale_calculated_attribute_names)
+        self.assertNotIn("energy_footprint", lazy_server.__dict__)
+
+        self.assertEqual(eager_system.servers[0].energy_footprint, lazy_server.energy_footprint)
+        self.assertNotIn("energy_footprint", lazy_server.stale_calculated_attribute_names)
+        self.assertIn("energy_footprint", lazy_server.__dict__)
+
+    def test_modeling_update_marks_downstream_attributes_as_stale(self):
+        """Test an input change on a lazy system is only propagated on read, with the same result as eagerly."""
+        eager_system = build_system("eager", "eager server")
+        lazy_system = self.build_lazy_system("lazy", "lazy server")
+        lazy_system.materialize()
+
+        for system in (eager_system, lazy_system):
+            system.servers[0].power = SourceValue(500 * u.W)
+
+        lazy_server = lazy_system.servers[0]
+        self.assertIn("energy_footprint", lazy_server.stale_calculated_attribute_names)
+        self.assertIn("total_footprint", lazy_system.stale_calculated_attribute_names)
+        self.assertNotIn("instances_fabrication_footprint", lazy_server.stale_calculated_attribute_names)
+        self.assertEqual(eager_system.total_footprint, lazy_system.total_footprint)
+
+    def test_reset_values_marks_attributes_read_since_update_as_stale_again(self):
+        """Test resetting a modeling update on a lazy system restores the footprint of the initial inputs."""
+        lazy_system = self.build_lazy_system("lazy", "lazy server")
+        initial_footprint = lazy_system.total_footprint
+        server = lazy_system.servers[0]
+
+        modeling_update = ModelingUpdate([[server.power, SourceValue(500 * u.W)]])
+        self.assertNotEqual(initial_footprint, lazy_system.total_footprint)
+        modeling_update.reset_values()
+
+        self.assertIn("total_footprint", lazy_system.stale_calculated_attribute_names)
+        self.assertEqual(initial_footprint, lazy_system.total_footprint)
+
+    def test_from_start_emission_diffs_compare_with_footprints_before_first_change(self):
+        """Test a lazy system read before its changes plots from_start diffs against its initial footprints."""
+        eager_system = build_system("eager", "eager server")
+        lazy_system = self.build_lazy_system("lazy", "lazy server")
+        self.assertIsNone(lazy_system.initial_total_energy_footprints_sum_over_period)
+        lazy_system.total_footprint
+
+        for system in (eager_system, lazy_system):
+            server = system.servers[0]
+            server.power = SourceValue(500 * u.W)
+            server.idle_power = SourceValue(100 * u.W)
+
+        self.assertEqual(eager_system.initial_total_energy_footprints_sum_over_period,
+                         lazy_system.initial_total_energy_footprints_sum_over_period)
+        self.assertEqual(eager_system.initial_total_fabrication_footprints_sum_over_period,
+                         lazy_system.initial_total_fabrication_footprints_sum_over_period)
+        with patch("efootprint.utils.plot_emission_diffs.EmissionPlotter") as emission_plotter:
+            lazy_system.plot_emission_diffs(from_start=True)
+        old_footprints = emission_plotter.call_args.args[1]
+        self.assertEqual([eager_system.initial_total_energy_footprints_sum_over_period,
+                          eager_system.initial_total_fabrication_footprints_sum_over_period], old_footprints)
+
+    def test_emission_diffs_raise_when_footprints_werent_evaluated_before_change(self):
+        lazy_system = self.build_lazy_system("lazy", "lazy server")
+
+        lazy_system.servers[0].power = SourceValue(500 * u.W)
+
+        self.assertIn("total_footprint", lazy_system.stale_calculated_attribute_names)
+        with self.assertRaises(ValueError):
+            lazy_system.plot_emission_diffs()
+
+    def test_materialize_computes_every_stale_attribute(self):
+        """Test materialize leaves no stale calculated attribute in the system."""
+        lazy_system = self.build_lazy_system("lazy", "lazy server")
+
+        self.assertIs(lazy_system, lazy_system.materialize())
+
+        for mod_obj in lazy_system.all_linked_objects + [lazy_system]:
+            self.assertEqual([], mod_obj.stale_calculated_attribute_names)
+
+
+class TestSweep(TestCase):
+    def test_sweep_returns_totals_per_variant_category_and_type(self):
+        """Test sweep gives one row per variant, category and footprint type, matching the system totals."""
+        system = build_system("system", "server")
+        server = system.servers[0]
+        initial_energy_totals = system.total_energy_footprint_sum_over_period
+
+        results = system.sweep([[server.power, [SourceValue(100 * u.W), SourceValue(500 * u.W)]]])
+
+        nb_categories = len(initial_energy_totals)
+        self.assertEqual(2 * 2 * nb_categories, len(results))
+        self.assertEqual(
+            ["Variant", f"power of {server.name}", "Type", "Category", "kg CO2 emissions"], list(results.columns))
+        self.assertEqual(500 * u.W, results[f"power of {server.name}"].iloc[-1])
+        server_energy = results[(results["Type"] == "Electricity") & (results["Category"] == "Servers")]
+        self.assertLess(server_energy["kg CO2 emissions"].iloc[0], server_energy["kg CO2 emissions"].iloc[1])
+        self.assertEqual(initial_energy_totals, system.total_energy_footprint_sum_over_period)
+
+        server.power = SourceValue(500 * u.W)
+        self.assertAlmostEqual(
+            system.total_energy_footprint_sum_over_period["Servers"].to(u.kg).magnitude,
+            server_energy["kg CO2 emissions"].iloc[1], places=5)
+
+    def test_sweep_on_input_of_other_system_raises_value_error(self):
+        """Test sweep refuses inputs that aren't linked to the swept system."""
+        system = build_system("system", "server")
+        other_system = build_system("other system", "other server")
+
+        with self.assertRaises(ValueError):
+            system.sweep([[other_system.servers[0].power, [SourceValue(100 * u.W)]]])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,8 @@ import unittest
 import numpy as np
 
 from efootprint.abstract_modeling_classes.source_objects import SourceValue, SourceHourlyValues
-from efootprint.core.usage.compute_nb_occurrences_in_parallel import compute_nb_avg_hourly_occurrences
+from efootprint.core.usage.compute_nb_occurrences_in_parallel import (
+    MAX_NB_SHIFTED_ADDITIONS, boxcar_sums, compute_nb_avg_hourly_occurrences)
 from efootprint.builders.time_builders import create_source_hourly_values_from_list
 from efootprint.constants.units import u
 
@@ -36,3 +37,21 @@ class TestUsagePattern(unittest.TestCase):
         event_duration = SourceValue(150 * u.min)
         result = compute_nb_avg_hourly_occurrences(input_occs_starts_hvals, event_duration)
         self.assertTrue(np.allclose([20, 30, 34, 34, 22, 7.5], result.magnitude))
+
+    def test_compute_nb_occurrences_in_parallel_longer_than_input(self):
+        input_occs_starts = [20, 10, 14, 15]
+        input_occs_starts_hvals = create_source_hourly_values_from_list(input_occs_starts)
+        event_duration = SourceValue((MAX_NB_SHIFTED_ADDITIONS + 2) * u.hour)
+        result = compute_nb_avg_hourly_occurrences(input_occs_starts_hvals, event_duration)
+        expected = np.convolve(input_occs_starts, np.ones(MAX_NB_SHIFTED_ADDITIONS + 2))
+        self.assertTrue(np.allclose(expected, result.magnitude))
+
+    def test_boxcar_sums_match_convolution_for_short_and_long_boxcars(self):
+        values = np.random.default_rng(0).random((3, 200)).astype(np.float32)
+        for nb_hours in [1, MAX_NB_SHIFTED_ADDITIONS, MAX_NB_SHIFTED_ADDITIONS + 1, 150, 500]:
+            with self.subTest(nb_hours=nb_hours):
+                result = boxcar_sums(values, nb_hours)
+                self.assertEqual(np.float32, result.dtype)
+                for row_values, row_result in zip(values, result):
+                    self.assertTrue(np.allclose(np.convolve(row_values, np.ones(nb_hours)), row_result, atol=1e-4))
+                    self.assertTrue(np.array_equal(boxcar_sums(row_values, nb_hours), row_result))
@@ -1,8 +1,19 @@
+from datetime import datetime
 from typing import List
 from unittest.mock import MagicMock
 
 from efootprint.abstract_modeling_classes.modeling_object import ModelingObject
+from efootprint.builders.time_builders import create_source_hourly_values_from_list
+from efootprint.constants.countries import Countries
+from efootprint.core.hardware.device import Device
+from efootprint.core.hardware.network import Network
+from efootprint.core.hardware.server import Server, ServerTypes
+from efootprint.core.hardware.storage import Storage
 from efootprint.core.system import System
+from efootprint.core.usage.job import Job
+from efootprint.core.usage.usage_journey import UsageJourney
+from efootprint.core.usage.usage_journey_step import UsageJourneyStep
+from efootprint.core.usage.usage_pattern import UsagePattern
 
 
 def set_modeling_obj_containers(efootprint_obj: ModelingObject, mod_obj_containers_to_set: List):
@@ -60,3 +71,21 @@ def check_all_calculus_graph_dependencies_consistencies(system: System):
                         f"attribute '{attr}' depending on calculated ancestor object {ancestor_obj.name} of class "
                         f"{ancestor_obj.class_as_simple_str} (canonical index {ancestor_canonical_index})."
                     )
+
+
+def build_system(system_name, server_name, hourly_starts=None, start="2025-01-01"):
+    """Build a minimal but complete web system. Distinct names per object so ids stay unique under
+    the test name-as-id convention."""
+    storage = Storage.from_defaults(f"{server_name} storage")
+    server = Server.from_defaults(server_name, server_type=ServerTypes.on_premise(), storage=storage)
+    job = Job.from_defaults(f"{server_name} job", server=server)
+    uj_step = UsageJourneyStep.from_defaults(f"{system_name} step", jobs=[job])
+    uj = UsageJourney(f"{system_name} journey", uj_steps=[uj_step])
+    network = Network.from_defaults(f"{system_name} network")
+    start_date = datetime.strptime(start, "%Y-%m-%d")
+    hourly_starts = hourly_starts if hourly_starts is not None else [1, 2, 4, 5, 8, 12, 2, 2, 3]
+    usage_pattern = UsagePattern(
+        f"{system_name} usage pattern", uj, [Device.laptop()], network, Countries.FRANCE(),
+        create_source_hourly_values_from_list([elt * 1000000 for elt in hourly_starts], start_date))
+
+    return System(system_name, [usage_pattern], edge_usage_patterns=[])